@@ -0,0 +1,51 @@
+"""Lazy package exports (PEP 562).
+
+Package __init__ modules list what they export instead of importing it, so
+`from holocene.research import ArxivClient` only loads arxiv_client:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "ArxivClient": ".arxiv_client",
+    })
+"""
+
+import importlib
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str],
+    optional: Iterable[str] = (),
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ that import exports on first use.
+
+    Args:
+        package: The package's __name__
+        exports: Exported name -> relative module that defines it
+        optional: Names that resolve to None if their module can't be imported
+            (optional dependencies)
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package
+    """
+    namespace = importlib.import_module(package).__dict__
+    optional = set(optional)
+
+    def __getattr__(name: str):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        try:
+            value = getattr(importlib.import_module(module_name, package), name)
+        except ImportError:
+            if name not in optional:
+                raise
+            value = None
+        namespace[name] = value  # Later lookups skip __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,199 @@
+"""Database maintenance CLI commands."""
+
+import click
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+from holocene.config import load_config
+from holocene.storage.database import Database
+from holocene.storage.maintenance import DatabaseMaintenance, RETENTION_POLICIES
+
+console = Console()
+
+
+def _format_bytes(size: int) -> str:
+    """Human-readable byte count."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+@click.group()
+def db():
+    """Maintain the Holocene database."""
+    pass
+
+
+@db.command()
+@click.option("--analyze/--no-analyze", default=True, help="Run a full ANALYZE (default) or only PRAGMA optimize")
+@click.option("--no-retention", is_flag=True, help="Keep old rows (skip retention policies)")
+@click.option("--dry-run", is_flag=True, help="Only show what retention would remove")
+def maintain(analyze, no_retention, dry_run):
+    """Prune old rows, vacuum, analyze and checkpoint the database.
+
+    holod does this nightly (see the maintenance section of the config);
+    run it by hand after a large import or cleanup.
+
+    \b
+    Examples:
+        holo db maintain
+        holo db maintain --dry-run
+        holo db maintain --no-retention --no-analyze
+    """
+    config = load_config()
+    database = Database(config.db_path)
+    maintenance = DatabaseMaintenance(database, config.maintenance)
+
+    with console.status("[cyan]Running database maintenance..."):
+        report = maintenance.run(analyze=analyze, retention=not no_retention, dry_run=dry_run)
+    database.close()
+
+    if report["retention"]:
+        table = Table(title="Retention" + (" (dry run)" if dry_run else ""), box=box.ROUNDED)
+        table.add_column("Table", style="cyan")
+        table.add_column("Older than", justify="right")
+        table.add_column("Removed", justify="right", style="green")
+        table.add_column("Archived", justify="right", style="yellow")
+        table.add_column("Policy", style="dim")
+        for name, result in report["retention"].items():
+            table.add_row(
+                name,
+                f"{result['days']} days",
+                str(result["removed"]),
+                str(result["archived"]),
+                RETENTION_POLICIES[name].description,
+            )
+        console.print(table)
+        if any(result["archived"] for result in report["retention"].values()):
+            console.print(f"[dim]Archived rows: {maintenance.archive_path}[/dim]")
+        console.print()
+
+    before, after = report["before"], report["after"]
+    stats = Table(title="Database", box=box.ROUNDED)
+    stats.add_column("", style="cyan")
+    stats.add_column("Before", justify="right")
+    stats.add_column("After", justify="right", style="green")
+    stats.add_row("File size", _format_bytes(before["file_bytes"]), _format_bytes(after["file_bytes"]))
+    stats.add_row("WAL size", _format_bytes(before["wal_bytes"]), _format_bytes(after["wal_bytes"]))
+    stats.add_row("Pages", f"{before['page_count']:,}", f"{after['page_count']:,}")
+    stats.add_row("Free pages", f"{before['freelist_count']:,}", f"{after['freelist_count']:,}")
+    console.print(stats)
+
+    console.print(
+        f"\nPage size {after['page_size']:,} B, page cache {after['cache_pages']:,} pages "
+        f"({_format_bytes(after['cache_bytes'])}) per connection, "
+        f"journal {after['journal_mode']}, auto_vacuum {after['auto_vacuum']}"
+    )
+
+    if dry_run:
+        return
+
+    if after["auto_vacuum"] != "incremental":
+        console.print("[yellow]auto_vacuum is not incremental - free pages stay in the file[/yellow]")
+    if report["checkpoint"]["busy"]:
+        console.print("[yellow]WAL checkpoint was blocked by another reader (is holod busy?)[/yellow]")
+    console.print(f"[green]✓ Reclaimed {_format_bytes(report['reclaimed_bytes'])}[/green]")
+
+
+@db.command()
+@click.option("--top", default=15, help="Statements to show")
+@click.option(
+    "--sort",
+    type=click.Choice(["total_ms", "calls", "avg_ms", "max_ms", "rows", "slow"]),
+    default="total_ms",
+    help="Rank statements by",
+)
+@click.option("--slow", "show_slow", is_flag=True, help="Also show the slow-query log with query plans")
+@click.option("--reset", is_flag=True, help="Clear the profile after showing it")
+@click.option("--url", default="http://localhost:5555", help="holod API URL")
+@click.option("--token", envvar="HOLOCENE_API_TOKEN", help="API token (or HOLOCENE_API_TOKEN)")
+def profile(top, sort, show_slow, reset, url, token):
+    """Show which SQL holod spends its time on.
+
+    With profiler.enabled set in the config, holod times every statement:
+    totals per normalized statement, per plugin/job/endpoint, and a log of
+    slow queries with their EXPLAIN QUERY PLAN. Prometheus can scrape the
+    same figures from /metrics.
+
+    \b
+    Examples:
+        holo db profile
+        holo db profile --sort max_ms --slow
+        holo db profile --reset
+    """
+    import requests
+
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    try:
+        response = requests.get(
+            f"{url.rstrip('/')}/db/profile", params={"top": top, "sort": sort}, headers=headers, timeout=10
+        )
+    except requests.RequestException as e:
+        console.print(f"[red]✗[/red] Could not reach holod at {url}: {e}")
+        console.print("Start it with: [cyan]holo daemon start[/cyan]")
+        raise SystemExit(1)
+
+    if response.status_code == 401:
+        console.print("[red]✗[/red] holod needs an API token: pass --token or set HOLOCENE_API_TOKEN")
+        console.print("Create one with: [cyan]holo auth token create --name CLI[/cyan]")
+        raise SystemExit(1)
+    data = response.json()
+    if response.status_code != 200:
+        console.print(f"[red]✗[/red] {data.get('error', response.text)}")
+        raise SystemExit(1)
+
+    totals = data["totals"]
+    console.print(
+        f"[bold]{totals['calls']:,}[/bold] statements ({totals['statements']:,} distinct) "
+        f"in [bold]{totals['total_ms'] / 1000:.1f}s[/bold] since {data['since']}, "
+        f"{totals['slow']:,} slower than {data['slow_query_ms']:g} ms\n"
+    )
+
+    table = Table(title=f"Top statements by {sort}", box=box.ROUNDED)
+    table.add_column("ID", style="dim", no_wrap=True)
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right", style="green")
+    table.add_column("Avg", justify="right")
+    table.add_column("Max", justify="right", style="yellow")
+    table.add_column("Rows", justify="right")
+    table.add_column("Top caller", style="cyan")
+    table.add_column("SQL", overflow="fold")
+    for statement in data["statements"]:
+        callers = statement["callers"]
+        table.add_row(
+            statement["id"],
+            f"{statement['calls']:,}",
+            f"{statement['total_ms']:,.0f} ms",
+            f"{statement['avg_ms']:.2f} ms",
+            f"{statement['max_ms']:,.0f} ms",
+            f"{statement['rows']:,}",
+            max(callers, key=callers.get) if callers else "",
+            statement["sql"][:200],
+        )
+    console.print(table)
+
+    callers_table = Table(title="Time by caller", box=box.ROUNDED)
+    callers_table.add_column("Caller", style="cyan")
+    callers_table.add_column("Statements", justify="right")
+    callers_table.add_column("Total", justify="right", style="green")
+    for caller in data["callers"][:top]:
+        callers_table.add_row(caller["caller"], f"{caller['calls']:,}", f"{caller['total_ms']:,.0f} ms")
+    console.print(callers_table)
+
+    if show_slow:
+        console.print(f"\n[bold]Slow queries[/bold] (newest first, {len(data['slow_queries'])} kept)")
+        for entry in data["slow_queries"]:
+            console.print(
+                f"\n[yellow]{entry['duration_ms']:,.0f} ms[/yellow] {entry['at']} "
+                f"[cyan]{entry['caller']}[/cyan] ({entry['rows']:,} rows) [dim]{entry['id']}[/dim]"
+            )
+            console.print(f"  {entry['sql'][:500]}")
+            for line in entry.get("plan") or []:
+                style = "red" if line.startswith("SCAN") or "TEMP B-TREE" in line else "dim"
+                console.print(f"    [{style}]{line}[/{style}]")
+
+    if reset:
+        requests.post(f"{url.rstrip('/')}/db/profile/reset", headers=headers, timeout=10)
+        console.print("\n[green]✓ Profile cleared[/green]")
@@ -0,0 +1,54 @@
+"""Collection export CLI commands."""
+
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from holocene.config import load_config
+from holocene.storage.database import Database
+from holocene.storage.export import COLLECTIONS, EXPORT_FORMATS, HAS_PYARROW, export_filename, export_to_path
+
+console = Console()
+
+
+@click.command()
+@click.argument("collection", type=click.Choice(list(COLLECTIONS)))
+@click.option("--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="csv", show_default=True,
+              help="Output format")
+@click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path),
+              help="Output file (default: <collection>_export_<timestamp>.<format> in the current directory)")
+@click.option("--query", "-q", help="Only export items matching this text")
+@click.option("--limit", type=int, help="Maximum items to export (default: all)")
+@click.option("--gzip", "compress", is_flag=True, help="Gzip-compress the output")
+def export(collection, fmt, output, query, limit, compress):
+    """Export a collection (books, links or papers) to CSV, JSONL or Parquet.
+
+    Rows are streamed in batches, so full exports of large collections
+    run in constant memory.
+
+    Examples:
+        holo export links
+        holo export links --format jsonl --gzip -o links.jsonl.gz
+        holo export papers -q "basalt" --format parquet
+    """
+    if fmt == "parquet" and not HAS_PYARROW:
+        console.print("[red]Parquet export requires pyarrow[/red]")
+        console.print("[dim]Install with: pip install holocene\\[parquet][/dim]")
+        raise SystemExit(1)
+
+    config = load_config()
+    db = Database(config.db_path)
+    output = output or Path(export_filename(collection, fmt, compress))
+
+    try:
+        with console.status(f"Exporting {collection}...") as status:
+            count = export_to_path(
+                db.conn, collection, output,
+                fmt=fmt, query=query, limit=limit, compress=compress,
+                progress=lambda n: status.update(f"Exporting {collection}... {n:,} rows"),
+            )
+    finally:
+        db.close()
+
+    console.print(f"[green]✓[/green] Exported {count:,} {collection} to {output}")
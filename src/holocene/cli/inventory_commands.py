@@ -75,18 +75,30 @@ def add(name: str, description: str, category: str, location: str,
 @click.option("--category", "-c", help="Filter by category")
 @click.option("--status", "-s", help="Filter by status (owned, wishlist, etc.)")
 @click.option("--location", "-l", help="Filter by location")
+@click.option("--search", "-q", help="Fuzzy search name, description and category")
 @click.option("--limit", "-n", type=int, default=50, help="Max results")
-def list_items(category: str, status: str, location: str, limit: int):
+def list_items(category: str, status: str, location: str, search: str, limit: int):
     """List inventory items."""
     config = load_config()
     db = Database(config.db_path)
 
-    items = db.get_items(
-        category=category,
-        status=status,
-        location=location,
-        limit=limit,
-    )
+    if search:
+        from holocene.core.search_index import SearchIndex
+
+        # Best matches first; other filters apply to the matches
+        items = [
+            item for item in SearchIndex(db).search_rows(search, "item", limit=max(limit, 200))
+            if (not category or item['category'] == category)
+            and (not status or item['status'] == status)
+            and (not location or location.strip("%").lower() in (item['location'] or "").lower())
+        ][:limit]
+    else:
+        items = db.get_items(
+            category=category,
+            status=status,
+            location=location,
+            limit=limit,
+        )
 
     if not items:
         console.print("[yellow]No items found.[/yellow]")
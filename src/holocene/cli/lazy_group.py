@@ -0,0 +1,83 @@
+"""Click group that imports subcommand modules only when they're invoked."""
+
+import importlib
+from typing import Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """A click.Group whose subcommands are "module:attribute" import paths.
+
+    `holo log ...` then never imports laney_tools, holod or the MercadoLivre
+    scraper. Listing commands (`holo --help`) still imports them all, since
+    click needs each command's help text.
+
+        @click.group(cls=LazyGroup, lazy_subcommands={
+            "stats": "holocene.cli.stats_commands:stats",
+        })
+        def cli(): ...
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        optional_subcommands: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            lazy_subcommands: Command name -> "module:attribute"
+            optional_subcommands: Like lazy_subcommands, for commands whose
+                module needs optional dependencies; value is the pip extra
+                named in the error shown if the import fails
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+        self.optional_subcommands = dict(optional_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            command = self._load(cmd_name)
+            if command is not None:
+                # Cache as a regular subcommand
+                self.add_command(command, cmd_name)
+                del self.lazy_subcommands[cmd_name]
+                return command
+            return self._unavailable(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> Optional[click.Command]:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            if cmd_name not in self.optional_subcommands:
+                raise
+            return None
+
+        command = getattr(module, attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attribute} is not a click command")
+        return command
+
+    def _unavailable(self, cmd_name: str) -> click.Command:
+        """Placeholder for an optional command whose dependencies are missing."""
+        extra = self.optional_subcommands[cmd_name]
+
+        @click.command(
+            cmd_name,
+            context_settings={"ignore_unknown_options": True, "allow_extra_args": True},
+            short_help=f"(unavailable: pip install holocene[{extra}])",
+            add_help_option=False,
+        )
+        def unavailable():
+            raise click.ClickException(
+                f"'{cmd_name}' needs optional dependencies: pip install holocene[{extra}]"
+            )
+
+        return unavailable
@@ -13,29 +13,35 @@ from ..core.sanitizer import PrivacySanitizer
 from ..storage.database import Database
 from ..config import load_config, save_config, get_config_path, DEFAULT_CONFIG
 
-# Import command groups
-from .config_commands import config
-from .stats_commands import stats
-from .inventory_commands import inventory
-from .ml_inventory_commands import ml_inventory
-from .daemon_commands import daemon
-from .ask_commands import ask_shortcut
-from .auth_commands import auth
-from .monitor_commands import monitor
-from .laney_commands import laney
-
-# Optional: MercadoLivre (requires beautifulsoup4)
-try:
-    from .mercadolivre_commands import mercadolivre
-    MERCADOLIVRE_CLI_AVAILABLE = True
-except ImportError:
-    mercadolivre = None
-    MERCADOLIVRE_CLI_AVAILABLE = False
+from .lazy_group import LazyGroup
 
 console = Console()
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    # Command groups in their own modules are imported only when invoked
+    lazy_subcommands={
+        "config": "holocene.cli.config_commands:config",
+        "stats": "holocene.cli.stats_commands:stats",
+        "export": "holocene.cli.export_commands:export",
+        "auth": "holocene.cli.auth_commands:auth",
+        "monitor": "holocene.cli.monitor_commands:monitor",
+        "mercadolivre": "holocene.cli.mercadolivre_commands:mercadolivre",
+        "inventory": "holocene.cli.inventory_commands:inventory",
+        "ml-inventory": "holocene.cli.ml_inventory_commands:ml_inventory",
+        "daemon": "holocene.cli.daemon_commands:daemon",
+        "db": "holocene.cli.db_commands:db",
+        "ask": "holocene.cli.ask_commands:ask_shortcut",
+        "laney": "holocene.cli.laney_commands:laney",
+        "print": "holocene.cli.print_commands:print_group",
+    },
+    # Optional: MercadoLivre (requires beautifulsoup4), print (requires paperang deps)
+    optional_subcommands={
+        "mercadolivre": "mercadolivre",
+        "print": "paperang",
+    },
+)
 @click.version_option(version="0.1.0")
 def cli():
     """
@@ -46,20 +52,6 @@ def cli():
     pass
 
 
-# Register command groups
-cli.add_command(config)
-cli.add_command(stats)
-cli.add_command(auth)
-cli.add_command(monitor)
-if MERCADOLIVRE_CLI_AVAILABLE:
-    cli.add_command(mercadolivre)
-cli.add_command(inventory)
-cli.add_command(ml_inventory)
-cli.add_command(daemon)
-cli.add_command(ask_shortcut, name="ask")
-cli.add_command(laney)
-
-
 @cli.command()
 def init():
     """Initialize Holocene configuration and database."""
@@ -125,12 +117,7 @@ def log(description: str, tags: str, activity_type: str, context: str, duration:
     )
 
     # Sanitize for privacy
-    sanitizer = PrivacySanitizer(
-        blacklist_domains=config.privacy.blacklist_domains,
-        blacklist_keywords=config.privacy.blacklist_keywords,
-        blacklist_paths=config.privacy.blacklist_paths,
-        whitelist_domains=config.privacy.whitelist_domains,
-    )
+    sanitizer = PrivacySanitizer.from_config(config)
 
     sanitized = sanitizer.sanitize_activity(activity)
 
@@ -318,6 +305,18 @@ def analyze(today: bool, week: bool, cheap: bool, no_journel: bool, xkcd: bool):
         db.close()
         return
 
+    # Re-apply current privacy filters before anything goes to the LLM
+    # (filters may have changed since the activities were logged)
+    logged_count = len(activities)
+    activities = PrivacySanitizer.from_config(config).sanitize_activities(activities)
+    if len(activities) < logged_count:
+        console.print(f"[dim]Privacy filters blocked {logged_count - len(activities)} activities[/dim]")
+
+    if not activities:
+        console.print(f"[yellow]No shareable activities for {period}.[/yellow]")
+        db.close()
+        return
+
     # Get journel context if enabled
     journel_context = ""
     journel_projects = []
@@ -339,7 +338,8 @@ def analyze(today: bool, week: bool, cheap: bool, no_journel: bool, xkcd: bool):
         try:
             git_scanner = GitScanner(
                 scan_path=config.integrations.github_scan_path,
-                github_token=config.integrations.github_token
+                github_token=config.integrations.github_token,
+                db=db,
             )
 
             # Get activity for the period
@@ -680,8 +680,13 @@ def scan(today: bool, week: bool, scan_all: bool, journel: bool):
 @links.command("import-bookmarks")
 @click.option("--browser", type=click.Choice(["auto", "edge", "chrome", "firefox"]), default="auto",
               help="Browser to import from")
-def import_bookmarks(browser: str):
-    """Import browser bookmarks into links database."""
+@click.option("--full", is_flag=True, help="Re-read all bookmarks, not just those changed since the last import")
+def import_bookmarks(browser: str, full: bool):
+    """Import browser bookmarks into links database.
+
+    Only bookmarks added or changed since the last import are read;
+    unchanged bookmark files are skipped entirely.
+    """
     from ..integrations import BookmarksReader
     from ..core.link_utils import should_archive_url
 
@@ -689,46 +694,50 @@ def import_bookmarks(browser: str):
     db = Database(config.db_path)
 
     reader = BookmarksReader()
+    state = {} if full else db.get_import_state("bookmarks")
 
     with console.status(f"[cyan]Reading {browser} bookmarks...", spinner="dots"):
-        bookmarks = reader.read_bookmarks(browser=browser)
+        bookmarks, new_state = reader.read_changed_bookmarks(browser=browser, state=state)
 
     if not bookmarks:
-        console.print(f"[yellow]No bookmarks found for {browser}[/yellow]")
-        console.print("Make sure browser is closed or try a different browser")
+        db.set_import_state("bookmarks", new_state)
+        if state:
+            console.print("[green]✓[/green] No new or changed bookmarks since last import")
+        else:
+            console.print(f"[yellow]No bookmarks found for {browser}[/yellow]")
+            console.print("Make sure browser is closed or try a different browser")
         db.close()
         return
 
-    console.print(f"[green]✓[/green] Found {len(bookmarks)} bookmarks")
+    console.print(f"[green]✓[/green] Found {len(bookmarks)} new or changed bookmark(s)")
 
-    # Filter and insert
-    valid_count = 0
-    new_count = 0
-    updated_count = 0
+    # Filter, then dedup against the links table in one indexed lookup
+    valid = [b for b in bookmarks if b.url and should_archive_url(b.url)]
+    existing_urls = db.get_existing_link_urls([b.url for b in valid])
 
-    existing_urls = {link["url"] for link in db.get_links()}
+    new_bookmarks = {}
+    existing_bookmarks = {}
+    for bookmark in valid:
+        target = existing_bookmarks if bookmark.url in existing_urls else new_bookmarks
+        target[bookmark.url] = bookmark
 
-    for bookmark in bookmarks:
-        if not bookmark.url or not should_archive_url(bookmark.url):
-            continue
-
-        valid_count += 1
-
-        if bookmark.url in existing_urls:
-            updated_count += 1
-        else:
-            new_count += 1
+    # Existing links only need last_seen/title updated (no URL unwrapping)
+    db.touch_links([{"url": b.url, "title": b.name} for b in existing_bookmarks.values()])
 
+    for bookmark in new_bookmarks.values():
         db.insert_link(
             url=bookmark.url,
             source="bookmarks",
             title=bookmark.name
         )
 
-    console.print(f"[green]✓[/green] Processed {valid_count} valid bookmarks")
-    console.print(f"[green]✓[/green] Added {new_count} new link(s)")
-    if updated_count > 0:
-        console.print(f"[blue]ℹ[/blue] Updated {updated_count} existing link(s)")
+    # Only advance the high-water marks once everything is stored
+    db.set_import_state("bookmarks", new_state)
+
+    console.print(f"[green]✓[/green] Processed {len(valid)} valid bookmarks")
+    console.print(f"[green]✓[/green] Added {len(new_bookmarks)} new link(s)")
+    if existing_bookmarks:
+        console.print(f"[blue]ℹ[/blue] Updated {len(existing_bookmarks)} existing link(s)")
 
     db.close()
 
@@ -1238,134 +1247,170 @@ def archive_queue(batch_size: int, delay: int, service: str, source: str, max_qu
     ia_client = None
     archivebox_client = None
 
-    if service == "archivebox":
-        if getattr(config.integrations, 'archivebox_enabled', False):
-            archivebox_client = ArchiveBoxClient(
-                ssh_host=config.integrations.archivebox_host,
-                ssh_user=config.integrations.archivebox_user,
-                data_dir=config.integrations.archivebox_data_dir,
-            )
+    try:
+        if service == "archivebox":
+            if getattr(config.integrations, 'archivebox_enabled', False):
+                archivebox_client = ArchiveBoxClient(
+                    ssh_host=config.integrations.archivebox_host,
+                    ssh_user=config.integrations.archivebox_user,
+                    data_dir=config.integrations.archivebox_data_dir,
+                )
 
-            # Check queue status before proceeding (unless --force)
-            if not force:
-                queue_status = archivebox_client.get_queue_status()
-                if not queue_status.get("available"):
-                    console.print(f"[red]Error:[/red] Cannot check ArchiveBox queue status")
-                    console.print("[dim]Use --force to skip this check[/dim]")
-                    db.close()
-                    return
-
-                pending = queue_status.get("pending_count", 0)
-                incomplete = queue_status.get("failed_count", 0)
-
-                console.print(f"[dim]ArchiveBox queue: {pending} pending, {incomplete} incomplete[/dim]")
-
-                if pending >= max_queue:
-                    console.print(f"[yellow]⚠[/yellow] Queue has {pending} pending items (max: {max_queue})")
-                    console.print("[dim]Skipping to avoid overloading. Use --force to override.[/dim]")
-                    db.close()
-                    return
-        else:
-            console.print("[red]Error:[/red] ArchiveBox not enabled in config")
-            db.close()
-            return
-    elif service == "local":
-        local_client = LocalArchiveClient()
-    elif service == "ia":
-        if getattr(config.integrations, 'internet_archive_enabled', False):
-            ia_client = InternetArchiveClient(
-                access_key=config.integrations.ia_access_key,
-                secret_key=config.integrations.ia_secret_key,
-                rate_limit=getattr(config.integrations, 'ia_rate_limit_seconds', 2.0)
-            )
-        else:
-            console.print("[red]Error:[/red] Internet Archive not enabled in config")
+                # Check queue status before proceeding (unless --force)
+                if not force:
+                    queue_status = archivebox_client.get_queue_status()
+                    if not queue_status.get("available"):
+                        console.print(f"[red]Error:[/red] Cannot check ArchiveBox queue status")
+                        console.print("[dim]Use --force to skip this check[/dim]")
+                        db.close()
+                        return
+
+                    pending = queue_status.get("pending_count", 0)
+                    incomplete = queue_status.get("failed_count", 0)
+
+                    console.print(f"[dim]ArchiveBox queue: {pending} pending, {incomplete} incomplete[/dim]")
+
+                    if pending >= max_queue:
+                        console.print(f"[yellow]⚠[/yellow] Queue has {pending} pending items (max: {max_queue})")
+                        console.print("[dim]Skipping to avoid overloading. Use --force to override.[/dim]")
+                        db.close()
+                        return
+            else:
+                console.print("[red]Error:[/red] ArchiveBox not enabled in config")
+                db.close()
+                return
+        elif service == "local":
+            local_client = LocalArchiveClient()
+        elif service == "ia":
+            if getattr(config.integrations, 'internet_archive_enabled', False):
+                ia_client = InternetArchiveClient(
+                    access_key=config.integrations.ia_access_key,
+                    secret_key=config.integrations.ia_secret_key,
+                    rate_limit=getattr(config.integrations, 'ia_rate_limit_seconds', 2.0)
+                )
+            else:
+                console.print("[red]Error:[/red] Internet Archive not enabled in config")
+                db.close()
+                return
+
+        archiving = ArchivingService(
+            db=db,
+            local_client=local_client,
+            ia_client=ia_client,
+            archivebox_client=archivebox_client
+        )
+
+        # Get unarchived links
+        filters = {"archived": False}
+        if source:
+            filters["source"] = source
+
+        # Get links without any successful archive snapshots
+        cursor = db.conn.cursor()
+        query = """
+            SELECT l.id, l.url, l.source
+            FROM links l
+            LEFT JOIN archive_snapshots a ON l.id = a.link_id AND a.status = 'success'
+            WHERE a.id IS NULL
+        """
+        params = []
+
+        if source:
+            query += " AND l.source = ?"
+            params.append(source)
+
+        query += " LIMIT ?"
+        params.append(batch_size)
+
+        cursor.execute(query, params)
+        links_to_archive = [{'id': row[0], 'url': row[1], 'source': row[2]} for row in cursor.fetchall()]
+
+        if not links_to_archive:
+            console.print("[green]✓[/green] No unarchived links in queue")
             db.close()
             return
 
-    archiving = ArchivingService(
-        db=db,
-        local_client=local_client,
-        ia_client=ia_client,
-        archivebox_client=archivebox_client
-    )
+        console.print(f"[cyan]Processing {len(links_to_archive)} link(s) with {delay}s delays[/cyan]")
+        console.print(f"[dim]Service: {service}[/dim]\n")
 
-    # Get unarchived links
-    filters = {"archived": False}
-    if source:
-        filters["source"] = source
+        success_count = 0
+        error_count = 0
 
-    # Get links without any successful archive snapshots
-    cursor = db.conn.cursor()
-    query = """
-        SELECT l.id, l.url, l.source
-        FROM links l
-        LEFT JOIN archive_snapshots a ON l.id = a.link_id AND a.status = 'success'
-        WHERE a.id IS NULL
-    """
-    params = []
+        for i, link in enumerate(links_to_archive, 1):
+            console.print(f"[{i}/{len(links_to_archive)}] {link['url'][:60]}...")
 
-    if source:
-        query += " AND l.source = ?"
-        params.append(source)
+            try:
+                # Archive using selected service
+                result = archiving.archive_url(
+                    link_id=link['id'],
+                    url=link['url'],
+                    local_format='monolith' if service == 'local' else None,
+                    use_ia=(service == 'ia'),
+                    use_archivebox=(service == 'archivebox')
+                )
 
-    query += " LIMIT ?"
-    params.append(batch_size)
+                if result.get('success'):
+                    console.print(f"  [green]✓[/green] Archived")
+                    success_count += 1
+                else:
+                    errors = ', '.join(result.get('errors', ['Unknown error']))
+                    console.print(f"  [red]✗[/red] {errors}")
+                    error_count += 1
 
-    cursor.execute(query, params)
-    links_to_archive = [{'id': row[0], 'url': row[1], 'source': row[2]} for row in cursor.fetchall()]
+            except Exception as e:
+                console.print(f"  [red]✗[/red] Exception: {e}")
+                error_count += 1
 
-    if not links_to_archive:
-        console.print("[green]✓[/green] No unarchived links in queue")
-        db.close()
-        return
+            # Delay between archives (except after last one)
+            if i < len(links_to_archive):
+                # Add random jitter (±20%) to avoid patterns
+                jitter = random.uniform(0.8, 1.2)
+                actual_delay = int(delay * jitter)
+                console.print(f"  [dim]Waiting {actual_delay}s...[/dim]")
+                time.sleep(actual_delay)
 
-    console.print(f"[cyan]Processing {len(links_to_archive)} link(s) with {delay}s delays[/cyan]")
-    console.print(f"[dim]Service: {service}[/dim]\n")
+        # Summary
+        console.print(f"\n[bold]Summary:[/bold]")
+        console.print(f"[green]✓[/green] Success: {success_count}")
+        console.print(f"[red]✗[/red] Errors: {error_count}")
+        console.print(f"\n[dim]Remaining: Check with 'holo links list --unarchived'[/dim]")
 
-    success_count = 0
-    error_count = 0
+        db.close()
+    finally:
+        if archivebox_client:
+            archivebox_client.close()  # Shared SSH connection
 
-    for i, link in enumerate(links_to_archive, 1):
-        console.print(f"[{i}/{len(links_to_archive)}] {link['url'][:60]}...")
 
-        try:
-            # Archive using selected service
-            result = archiving.archive_url(
-                link_id=link['id'],
-                url=link['url'],
-                local_format='monolith' if service == 'local' else None,
-                use_ia=(service == 'ia'),
-                use_archivebox=(service == 'archivebox')
-            )
+@links.command("archive-gc")
+@click.option("--dry-run", is_flag=True, help="Show what would be deleted without deleting")
+def links_archive_gc(dry_run: bool):
+    """Garbage-collect the local archive store.
 
-            if result.get('success'):
-                console.print(f"  [green]✓[/green] Archived")
-                success_count += 1
-            else:
-                errors = ', '.join(result.get('errors', ['Unknown error']))
-                console.print(f"  [red]✗[/red] {errors}")
-                error_count += 1
+    Deletes stored captures no longer referenced by any archive snapshot,
+    then chunks no remaining capture uses. Recently written data is kept.
+    """
+    from ..storage.archive_store import ArchiveStore
 
-        except Exception as e:
-            console.print(f"  [red]✗[/red] Exception: {e}")
-            error_count += 1
+    config = load_config()
+    db = Database(config.db_path)
+    store = ArchiveStore(Path.home() / ".holocene" / "archives" / "store")
 
-        # Delay between archives (except after last one)
-        if i < len(links_to_archive):
-            # Add random jitter (±20%) to avoid patterns
-            jitter = random.uniform(0.8, 1.2)
-            actual_delay = int(delay * jitter)
-            console.print(f"  [dim]Waiting {actual_delay}s...[/dim]")
-            time.sleep(actual_delay)
+    result = store.gc_against_db(db, dry_run=dry_run)
+    stats = store.stats()
+    db.close()
 
-    # Summary
-    console.print(f"\n[bold]Summary:[/bold]")
-    console.print(f"[green]✓[/green] Success: {success_count}")
-    console.print(f"[red]✗[/red] Errors: {error_count}")
-    console.print(f"\n[dim]Remaining: Check with 'holo links list --unarchived'[/dim]")
+    verb = "Would delete" if dry_run else "Deleted"
+    console.print(
+        f"[green]✓[/green] {verb} {result['blobs_deleted']} capture(s), "
+        f"{result['chunks_deleted']} chunk(s), {result['bytes_freed'] / 1024 / 1024:.1f} MB"
+    )
 
-    db.close()
+    ratio = f"{stats['ratio']:.1f}x" if stats['ratio'] else "n/a"
+    console.print(
+        f"[dim]Store: {stats['blobs']} captures, {stats['chunks']} chunks, "
+        f"{stats['logical_bytes'] / 1024 / 1024:.1f} MB logical → "
+        f"{stats['stored_bytes'] / 1024 / 1024:.1f} MB on disk ({ratio}, {stats['codec']})[/dim]"
+    )
 
 
 @links.command("check")
@@ -1900,11 +1945,15 @@ def books_list(limit: int, search: str, author: str, subject: str, by_dewey: boo
 @click.argument("query")
 @click.option("--limit", "-n", type=int, default=10, help="Number of results")
 def books_search(query: str, limit: int):
-    """Search your book collection."""
+    """Search your book collection (typos and partial words are fine)."""
+    from ..core.search_index import SearchIndex
+
     config = load_config()
     db = Database(config.db_path)
 
-    books_list = db.get_books(search=query, limit=limit)
+    books_list = SearchIndex(db).search_rows(query, "book", limit=limit)
+    if not books_list:
+        books_list = db.get_books(search=query, limit=limit)
 
     if not books_list:
         console.print(f"[yellow]No books found matching '{query}'[/yellow]")
@@ -1974,7 +2023,9 @@ def books_enrich(batch_size: int):
 @click.option("--all", "classify_all", is_flag=True, help="Classify all unclassified books")
 @click.option("--system", type=click.Choice(["UDC", "Dewey"]), default=None,
               help="Classification system to use (overrides config)")
-def classify_books(book_id, classify_all, system):
+@click.option("--batch-size", type=int, default=None,
+              help="Books per LLM prompt with --all (default: classification.batch_size)")
+def classify_books(book_id, classify_all, system, batch_size):
     """Classify books using configured classification system (Dewey or UDC)."""
     from holocene.research import UDCClassifier, DeweyClassifier
     from holocene.config import load_config
@@ -2013,50 +2064,48 @@ def classify_books(book_id, classify_all, system):
                 console.print("[green]✓[/green] All books are already classified!")
                 return
 
-            console.print(f"\n[cyan]Classifying {len(books)} books using {system_name}...[/cyan]\n")
-
-            for i, book in enumerate(books, 1):
-                console.print(f"[{i}/{len(books)}] {book['title']}")
-
-                # Classify the book
-                result = classifier.classify_book(
-                    title=book['title'],
-                    author=book['author'],
-                    subtitle=book['subtitle'],
-                    subjects=book['subjects'],
-                    publisher=book['publisher'],
-                    publication_year=book['publication_year'],
-                    enriched_summary=book.get('enriched_summary')
-                )
-
-                if "error" in result:
-                    console.print(f"  [red]✗[/red] {result['error']}")
-                    continue
-
-                # Update database
-                db.update_book_classification(
-                    book_id=book['id'],
-                    udc_number=result.get(number_key, result.get('udc_number')),
-                    classification_system=result['classification_system'],
-                    confidence=result['confidence'],
-                    cutter_number=result.get('cutter_number'),
-                    call_number=result.get('call_number')
-                )
-
-                # Display result
-                class_num = result.get(number_key, result.get('udc_number'))
-                class_label = result.get(label_key, result.get('udc_label'))
-                console.print(f"  [green]✓[/green] {class_num} - {class_label}")
+            batch = classifier.batch_classifier(batch_size)
+            console.print(
+                f"\n[cyan]Classifying {len(books)} books using {system_name} "
+                f"({batch.batch_size} per prompt)...[/cyan]\n"
+            )
 
-                if result.get('call_number'):
-                    console.print(f"    Call Number: [bold]{result['call_number']}[/bold]")
-                elif result.get('cutter_number'):
-                    console.print(f"    Cutter: {result['cutter_number']}")
+            titles = {book['id']: book['title'] for book in books}
+            done = 0
+            failed = 0
+            for results in batch.iter_batches(books):
+                for result_book_id, result in results.items():
+                    done += 1
+                    console.print(f"[{done}/{len(books)}] {titles[result_book_id]}")
+
+                    if "error" in result:
+                        failed += 1
+                        console.print(f"  [red]✗[/red] {result['error']}")
+                        continue
 
-                console.print(f"    Confidence: {result['confidence']}")
-                if result.get('reasoning'):
-                    console.print(f"    {result['reasoning']}")
-                console.print()
+                    # Update database
+                    db.update_book_classification(
+                        book_id=result_book_id,
+                        udc_number=result[number_key],
+                        classification_system=result['classification_system'],
+                        confidence=result['confidence'],
+                        cutter_number=result.get('cutter_number'),
+                        call_number=result.get('call_number')
+                    )
+
+                    # Display result
+                    console.print(f"  [green]✓[/green] {result[number_key]} - {result[label_key]}")
+                    if result.get('call_number'):
+                        console.print(f"    Call Number: [bold]{result['call_number']}[/bold]")
+                    elif result.get('cutter_number'):
+                        console.print(f"    Cutter: {result['cutter_number']}")
+                    console.print(f"    Confidence: {result['confidence']}")
+
+            console.print(
+                f"\n[green]✓[/green] Classified {done - failed}/{len(books)} books "
+                f"with {batch.prompts_sent} prompts"
+                + (f" ([red]{failed} failed[/red])" if failed else "")
+            )
 
         elif book_id:
             # Classify single book
@@ -2686,7 +2735,7 @@ def papers_download(doi: str, output: str):
 @click.option("--all-incomplete", is_flag=True, help="Analyze all papers not fully analyzed")
 @click.option("--filter-status", type=click.Choice(["to_read", "reading", "completed", "reference"]),
               help="Only analyze papers with this reading status")
-@click.option("--full-text", is_flag=True, help="Analyze entire PDF (slow)")
+@click.option("--full-text", is_flag=True, help="Analyze entire PDF, chunk by chunk (cached by PDF hash)")
 @click.option("--pages", type=int, default=15, help="Number of pages to analyze (default: 15)")
 def papers_analyze(paper_id: int, all_incomplete: bool, filter_status: str, full_text: bool, pages: int):
     """
@@ -2696,9 +2745,14 @@ def papers_analyze(paper_id: int, all_incomplete: bool, filter_status: str, full
         holo papers analyze 15                    # Analyze paper ID 15
         holo papers analyze --all-incomplete      # All papers without summaries
         holo papers analyze --filter-status=reading  # Only papers you're reading
+        holo papers analyze 15 --full-text        # Whole PDF, map-reduce summary
+
+    holod analyzes the full text of downloaded papers in the background
+    (papers.analyze_in_background).
     """
     from pathlib import Path
     from ..research import PDFMetadataExtractor
+    from ..research.paper_analysis import PaperAnalyzer
     from datetime import datetime
 
     config = load_config()
@@ -2742,7 +2796,8 @@ def papers_analyze(paper_id: int, all_incomplete: bool, filter_status: str, full
     total = len(papers_to_analyze)
     console.print(f"[cyan]Analyzing {total} paper(s) with DeepSeek V3...[/cyan]\n")
 
-    extractor = PDFMetadataExtractor(config)
+    extractor = PDFMetadataExtractor(config, db=db)
+    analyzer = PaperAnalyzer(extractor.llm_client, config, db=db)
     success_count = 0
     fail_count = 0
 
@@ -2761,13 +2816,32 @@ def papers_analyze(paper_id: int, all_incomplete: bool, filter_status: str, full
             continue
 
         try:
+            if full_text:
+                console.print("[cyan]Summarizing entire PDF chunk by chunk...[/cyan]")
+
+                def show_chunk(chunk, from_cache):
+                    source = "cached" if from_cache else "summarized"
+                    console.print(
+                        f"   [dim]Part {chunk.index + 1} ({', '.join(chunk.sections)}, "
+                        f"pages {chunk.start_page}-{chunk.end_page}): {source}[/dim]"
+                    )
+
+                result = analyzer.analyze_paper(paper, progress=show_chunk)
+                console.print(
+                    f"[green]✓[/green] Summary generated and saved "
+                    f"({result['analysis_pages']} pages, {result['chunks']} parts, "
+                    f"{result['cached_chunks']} from cache)"
+                )
+                console.print(f"   [dim]{result['summary'].split(chr(10))[0][:80]}...[/dim]")
+                success_count += 1
+                continue
+
             # Extract with summary
-            console.print(f"[cyan]Generating summary from {'entire PDF' if full_text else f'first {pages} pages'}...[/cyan]")
+            console.print(f"[cyan]Generating summary from first {pages} pages...[/cyan]")
 
             metadata = extractor.extract_metadata(
                 pdf_path,
                 max_pages=pages,
-                full_text=full_text,
                 extract_summary=True  # Always extract summary when analyzing
             )
 
@@ -3354,7 +3428,7 @@ def add_pdf(pdf_files: tuple, item_type: str, doi: str, isbn: str, reading_statu
             else:
                 console.print("[cyan]Extracting metadata with DeepSeek V3...[/cyan]")
 
-            extractor = PDFMetadataExtractor(config)
+            extractor = PDFMetadataExtractor(config, db=db)
 
             try:
                 metadata = extractor.extract_metadata(
@@ -3623,7 +3697,10 @@ def research():
 @click.option("--no-papers", is_flag=True, help="Don't search papers collection")
 @click.option("--no-vision", is_flag=True, help="Don't analyze figures")
 @click.option("--wikipedia", is_flag=True, help="Include Wikipedia background")
-def research_start(topic: str, depth: str, no_books: bool, no_papers: bool, no_vision: bool, wikipedia: bool):
+@click.option("--academic/--no-academic", default=None,
+              help="Search Crossref/OpenAlex/arXiv (default: on for deep and thorough)")
+def research_start(topic: str, depth: str, no_books: bool, no_papers: bool, no_vision: bool, wikipedia: bool,
+                   academic):
     """Start a research session on a topic."""
     from ..research import ResearchOrchestrator
 
@@ -3643,7 +3720,8 @@ def research_start(topic: str, depth: str, no_books: bool, no_papers: bool, no_v
             include_books=not no_books,
             include_papers=not no_papers,
             include_vision=not no_vision,
-            include_wikipedia=wikipedia
+            include_wikipedia=wikipedia,
+            include_academic=academic
         )
 
         console.print(f"\n[green]✓[/green] Research report ready!")
@@ -3902,187 +3980,5 @@ Status: {'[green]Enabled[/green]' if plugin.enabled else '[dim]Disabled[/dim]'}
     core.shutdown()
 
 
-@cli.group()
-def stats():
-    """View collection statistics and analytics."""
-    pass
-
-
-@stats.command("archives")
-def stats_archives():
-    """Show archive statistics and link health metrics.
-
-    Displays comprehensive statistics about link archiving:
-    - Internet Archive coverage
-    - Link health status
-    - Trust tier distribution
-    - Storage usage
-    - Recent archiving activity
-    """
-    from rich.table import Table
-    from rich.panel import Panel
-
-    config = load_config()
-    db = Database(config.db_path)
-
-    # Get archive statistics
-    cursor = db.conn.cursor()
-
-    # Total links
-    cursor.execute("SELECT COUNT(*) FROM links")
-    total_links = cursor.fetchone()[0]
-
-    if total_links == 0:
-        console.print("[yellow]No links tracked yet.[/yellow]")
-        console.print("Start tracking links with: [cyan]holo links scan[/cyan]")
-        db.close()
-        return
-
-    # Archived links
-    cursor.execute("SELECT COUNT(*) FROM links WHERE archived = 1")
-    archived_count = cursor.fetchone()[0]
-
-    # Failed links (with retry attempts)
-    cursor.execute("SELECT COUNT(*) FROM links WHERE archive_attempts > 0 AND archived = 0")
-    failed_count = cursor.fetchone()[0]
-
-    # Pending links (never attempted)
-    cursor.execute("SELECT COUNT(*) FROM links WHERE archived = 0 AND archive_attempts = 0")
-    pending_count = cursor.fetchone()[0]
-
-    # Link health status
-    cursor.execute("SELECT status, COUNT(*) FROM links WHERE status IS NOT NULL GROUP BY status")
-    status_counts = dict(cursor.fetchall())
-
-    # Trust tier distribution (archived links only)
-    cursor.execute("SELECT trust_tier, COUNT(*) FROM links WHERE archived = 1 AND trust_tier IS NOT NULL GROUP BY trust_tier")
-    trust_tier_counts = dict(cursor.fetchall())
-
-    # Recent archiving activity
-    cursor.execute("""
-        SELECT DATE(archive_date) as date, COUNT(*) as count
-        FROM links
-        WHERE archive_date IS NOT NULL
-        AND DATE(archive_date) >= DATE('now', '-7 days')
-        GROUP BY DATE(archive_date)
-        ORDER BY date DESC
-        LIMIT 7
-    """)
-    recent_archives = cursor.fetchall()
-
-    # Calculate percentages
-    archived_pct = (archived_count / total_links * 100) if total_links > 0 else 0
-    failed_pct = (failed_count / total_links * 100) if total_links > 0 else 0
-    pending_pct = (pending_count / total_links * 100) if total_links > 0 else 0
-
-    # Build statistics display
-    console.print()
-    console.print("╭──────────────── Archive Statistics ────────────────╮")
-    console.print("│                                                     │")
-    console.print(f"│ Total Links: [bold cyan]{total_links:,}[/bold cyan]                                  │")
-    console.print("│                                                     │")
-    console.print("│ Coverage:                                           │")
-
-    # Internet Archive coverage bar
-    bar_width = 30
-    archived_bar = int((archived_count / total_links) * bar_width) if total_links > 0 else 0
-    archived_bar_str = "█" * archived_bar + "░" * (bar_width - archived_bar)
-    console.print(f"│   Internet Archive:    [green]{archived_count:4}[/green] ([green]{archived_pct:5.1f}%[/green])  {archived_bar_str}   │")
-
-    # Failed links
-    failed_bar = int((failed_count / total_links) * bar_width) if total_links > 0 else 0
-    failed_bar_str = "█" * failed_bar + "░" * (bar_width - failed_bar)
-    console.print(f"│   Failed:              [red]{failed_count:4}[/red] ([red]{failed_pct:5.1f}%[/red])  {failed_bar_str}   │")
-
-    # Pending links
-    pending_bar = int((pending_count / total_links) * bar_width) if total_links > 0 else 0
-    pending_bar_str = "█" * pending_bar + "░" * (bar_width - pending_bar)
-    console.print(f"│   Pending:             [yellow]{pending_count:4}[/yellow] ([yellow]{pending_pct:5.1f}%[/yellow])  {pending_bar_str}   │")
-
-    console.print("│                                                     │")
-
-    # Link health section
-    if status_counts:
-        console.print("│ Link Health:                                        │")
-        alive = status_counts.get('alive', 0)
-        dead = status_counts.get('dead', 0)
-        timeout = status_counts.get('timeout', 0)
-        error = status_counts.get('connection_error', 0)
-        total_checked = alive + dead + timeout + error
-        unchecked = total_links - total_checked
-
-        if alive > 0:
-            alive_pct = (alive / total_links * 100) if total_links > 0 else 0
-            console.print(f"│   Alive:               [green]{alive:4}[/green] ([green]{alive_pct:5.1f}%[/green])                   │")
-        if dead > 0:
-            dead_pct = (dead / total_links * 100) if total_links > 0 else 0
-            console.print(f"│   Dead:                [red]{dead:4}[/red] ([red]{dead_pct:5.1f}%[/red])                   │")
-        if unchecked > 0:
-            unchecked_pct = (unchecked / total_links * 100) if total_links > 0 else 0
-            console.print(f"│   Unchecked:           [dim]{unchecked:4}[/dim] ([dim]{unchecked_pct:5.1f}%[/dim])                   │")
-
-        console.print("│                                                     │")
-
-    # Trust tier distribution
-    if trust_tier_counts:
-        console.print("│ Trust Tier Distribution (Archived):                │")
-        pre_llm = trust_tier_counts.get('pre-llm', 0)
-        early_llm = trust_tier_counts.get('early-llm', 0)
-        recent = trust_tier_counts.get('recent', 0)
-
-        if pre_llm > 0:
-            console.print(f"│   Pre-LLM:             [green]{pre_llm:4}[/green] (high value)                │")
-        if early_llm > 0:
-            console.print(f"│   Early-LLM:           [yellow]{early_llm:4}[/yellow] (medium value)             │")
-        if recent > 0:
-            console.print(f"│   Recent:              [red]{recent:4}[/red] (low value)                │")
-
-        console.print("│                                                     │")
-
-    # Recent activity
-    if recent_archives:
-        console.print("│ Recent Archiving Activity (last 7 days):           │")
-        for date, count in recent_archives[:5]:  # Show up to 5 days
-            console.print(f"│   {date}:  [cyan]{count:3}[/cyan] archived                         │")
-        console.print("│                                                     │")
-
-    # Last run info (approximate - check most recent archive date)
-    cursor.execute("SELECT MAX(archive_date) FROM links WHERE archive_date IS NOT NULL")
-    last_archive = cursor.fetchone()[0]
-    if last_archive:
-        from datetime import datetime
-        try:
-            last_dt = datetime.fromisoformat(last_archive)
-            time_ago = datetime.now() - last_dt
-            if time_ago.days > 0:
-                time_ago_str = f"{time_ago.days} days ago"
-            elif time_ago.seconds > 3600:
-                time_ago_str = f"{time_ago.seconds // 3600} hours ago"
-            else:
-                time_ago_str = f"{time_ago.seconds // 60} minutes ago"
-            console.print(f"│ Last Archive: [dim]{time_ago_str}[/dim]                         │")
-        except:
-            pass
-
-    console.print("╰─────────────────────────────────────────────────────╯")
-    console.print()
-
-    # Suggestions
-    if pending_count > 0:
-        console.print(f"[yellow]Tip:[/yellow] Run [cyan]holo links auto-archive[/cyan] to archive {pending_count} pending link(s)")
-    if failed_count > 0:
-        console.print(f"[yellow]Tip:[/yellow] {failed_count} failed link(s) will retry according to exponential backoff")
-
-    db.close()
-
-
-# Register print commands (optional: requires paperang dependencies)
-try:
-    from .print_commands import print_group
-    cli.add_command(print_group, name="print")
-except ImportError:
-    # Paperang dependencies not installed
-    pass
-
 if __name__ == "__main__":
     cli()
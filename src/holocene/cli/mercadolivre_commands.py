@@ -432,146 +432,109 @@ def note(item_id: str, notes: str):
 
 @mercadolivre.command()
 @click.option("--all", "enrich_all", is_flag=True, help="Enrich all favorites")
-@click.option("--delay", type=float, default=7.0, help="Delay between requests in seconds (default: 7.0)")
-@click.option("--batch-size", type=int, default=50, help="Items per batch before long break (default: 50)")
-@click.option("--batch-break", type=float, default=30.0, help="Break between batches in seconds (default: 30)")
+@click.option("--refresh", is_flag=True, help="Also re-fetch already enriched favorites (conditional GETs)")
+@click.option("--foreground", is_flag=True, help="Crawl now in this terminal instead of leaving it to holod")
+@click.option("--concurrency", type=int, help="Concurrent page fetches (default: from config)")
+@click.option("--delay", type=float, help="Seconds between requests to the same host (default: from config)")
 @click.option("--limit", "-n", type=int, help="Limit number of items to enrich")
+@click.option("--status", "show_status", is_flag=True, help="Show the enrichment queue")
 @click.argument("item_id", required=False)
-def enrich(item_id: str, enrich_all: bool, delay: float, batch_size: int, batch_break: float, limit: int):
-    """Fetch detailed product info from Mercado Livre pages."""
-    from holocene.integrations.mercadolivre import fetch_product_page
-    import json as jsonlib
-    import random
-    import time
+def enrich(item_id: str, enrich_all: bool, refresh: bool, foreground: bool, concurrency: int,
+           delay: float, limit: int, show_status: bool):
+    """Fetch detailed product info from Mercado Livre pages.
+
+    Favorites are queued in a persistent crawl frontier that holod's
+    mercadolivre_enricher plugin works through in the background (and
+    resumes after restarts). Use --foreground to crawl right away.
+    """
+    from holocene.integrations.mercadolivre import (
+        ENRICH_JOB, queue_enrichment, create_enrichment_crawler
+    )
 
     config = load_config()
     db = Database(config.db_path)
 
-    # Get items to enrich - SKIP ALREADY ENRICHED
+    if show_status:
+        stats = db.get_crawl_stats(ENRICH_JOB)
+        console.print(Panel.fit(
+            f"[cyan]Pending:[/cyan] {stats['pending']} ({stats['due']} due now)\n"
+            f"[cyan]In progress:[/cyan] {stats['in_progress']}\n"
+            f"[green]Done:[/green] {stats['done']}\n"
+            f"[red]Failed:[/red] {stats['failed']}",
+            title="🛒 Enrichment Queue"
+        ))
+        db.close()
+        return
+
     if enrich_all:
-        cursor = db.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM mercadolivre_favorites
-            WHERE enriched_at IS NULL
-            ORDER BY bookmarked_date DESC
-            LIMIT ?
-        """, (limit if limit else 999999,))
-        favorites = [dict(row) for row in cursor.fetchall()]
+        queued = queue_enrichment(db, refresh=refresh, limit=limit)
     elif item_id:
-        fav = db.get_mercadolivre_favorite(item_id)
-        favorites = [fav] if fav else []
+        if not db.get_mercadolivre_favorite(item_id):
+            console.print(f"[red]Favorite {item_id} not found[/red]")
+            db.close()
+            return
+        queued = queue_enrichment(db, item_ids=[item_id])
     else:
         console.print("[red]Error: Specify --all or provide an item_id[/red]")
         db.close()
         return
 
-    if not favorites:
+    stats = db.get_crawl_stats(ENRICH_JOB)
+    console.print(f"[cyan]Queued {queued} favorite(s)[/cyan] [dim]({stats['pending']} pending in total)[/dim]")
+
+    if not stats['pending'] and not stats['in_progress']:
         console.print("[green]✓ All favorites already enriched![/green]")
         db.close()
         return
 
-    # Add enriched columns if they don't exist
-    cursor = db.conn.cursor()
-    columns_to_add = [
-        ("description", "TEXT"),
-        ("original_price", "REAL"),
-        ("specifications", "TEXT"),  # JSON
-        ("seller_nickname", "TEXT"),
-        ("seller_reputation", "TEXT"),
-        ("reviews_rating", "REAL"),
-        ("reviews_total", "INTEGER"),
-        ("warranty", "TEXT"),
-        ("free_shipping", "BOOLEAN"),
-        ("enriched_at", "TEXT"),
-    ]
-
-    for col_name, col_type in columns_to_add:
-        try:
-            cursor.execute(f"ALTER TABLE mercadolivre_favorites ADD COLUMN {col_name} {col_type}")
-        except Exception:
-            pass  # Column already exists
-
-    db.conn.commit()
-
-    console.print(f"\n[cyan]Enriching {len(favorites)} favorite(s)...[/cyan]")
-    console.print(f"[dim]Delay: {delay}s ± 2s between requests[/dim]")
-    console.print(f"[dim]Batch size: {batch_size} items, then {batch_break}s break[/dim]\n")
-
-    enriched_count = 0
-    failed_count = 0
-
-    for idx, fav in enumerate(favorites, 1):
-        # Batch break
-        if idx > 1 and (idx - 1) % batch_size == 0:
-            console.print(f"\n[yellow]Taking {batch_break}s break after {batch_size} items...[/yellow]\n")
-            time.sleep(batch_break)
-        # Skip if no URL
-        if not fav.get('url'):
-            console.print(f"[yellow]✗ Skipped {fav['item_id']}: No URL[/yellow]")
-            continue
-
-        console.print(f"[cyan][{idx}/{len(favorites)}][/cyan] {fav['title'][:60]}...")
-
-        try:
-            # Fetch and parse product page with randomized delay
-            actual_delay = delay + random.uniform(-2, 2)  # ±2s jitter
-            with console.status("[dim]Fetching...", spinner="dots"):
-                enriched_data = fetch_product_page(fav['url'], delay=actual_delay)
-
-            # Update database
-            specs_json = jsonlib.dumps(enriched_data.get('specifications')) if enriched_data.get('specifications') else None
-            seller_info = enriched_data.get('seller_info', {})
-            reviews = enriched_data.get('reviews', {})
-            shipping = enriched_data.get('shipping', {})
-
-            cursor.execute(
-                """
-                UPDATE mercadolivre_favorites
-                SET description = ?,
-                    original_price = ?,
-                    specifications = ?,
-                    seller_nickname = ?,
-                    seller_reputation = ?,
-                    reviews_rating = ?,
-                    reviews_total = ?,
-                    warranty = ?,
-                    free_shipping = ?,
-                    enriched_at = ?
-                WHERE item_id = ?
-                """,
-                (
-                    enriched_data.get('description'),
-                    enriched_data.get('original_price'),
-                    specs_json,
-                    seller_info.get('nickname'),
-                    seller_info.get('reputation_level'),
-                    reviews.get('rating_average'),
-                    reviews.get('total'),
-                    enriched_data.get('warranty'),
-                    1 if shipping.get('free_shipping') else 0,
-                    enriched_data.get('fetched_at'),
-                    fav['item_id'],
-                ),
-            )
-            db.conn.commit()
+    if not foreground:
+        if config.mercadolivre.enrich_in_background:
+            console.print("[dim]holod's mercadolivre_enricher plugin will crawl them in the background.[/dim]")
+            console.print("[dim]Check progress with:[/dim] [cyan]holo mercadolivre enrich --status[/cyan]")
+        else:
+            console.print("[yellow]Background enrichment is disabled "
+                          "(mercadolivre.enrich_in_background) - run with --foreground[/yellow]")
+        db.close()
+        return
 
-            console.print(f"  [green]✓[/green] Enriched")
-            if enriched_data.get('original_price') and enriched_data.get('price'):
-                discount = (1 - enriched_data['price'] / enriched_data['original_price']) * 100
-                if discount > 0:
-                    console.print(f"    [yellow]{discount:.0f}% off[/yellow] (was R$ {enriched_data['original_price']:.2f})")
+    overrides = {}
+    if concurrency:
+        overrides['concurrency'] = concurrency
+    if delay is not None:
+        overrides['delay'] = delay
+    crawler = create_enrichment_crawler(db, config, **overrides)
+
+    console.print(f"\n[cyan]Crawling with {crawler.concurrency} worker(s), "
+                  f"{crawler.throttle.delay}s ± {crawler.throttle.jitter}s between requests per host[/cyan]")
+    console.print("[dim]Ctrl-C is safe: unfinished items are resumed next time.[/dim]\n")
+
+    def report(result):
+        entry = result['entry']
+        if result['cancelled']:
+            return
+        if result['ok']:
+            note = {"cache": " (cached HTML)", "not_modified": " (not modified)"}.get(result['source'], "")
+            console.print(f"  [green]✓[/green] {entry['key']}{note}")
+            reviews = (result['data'] or {}).get('reviews') or {}
             if reviews.get('rating_average'):
                 console.print(f"    [cyan]Rating: {reviews['rating_average']:.1f}[/cyan] ({reviews.get('total', 0)} reviews)")
+        else:
+            console.print(f"  [red]✗[/red] {entry['key']}: {result['error']}")
 
-            enriched_count += 1
-
-        except Exception as e:
-            console.print(f"  [red]✗ Failed: {e}[/red]")
-            failed_count += 1
+    try:
+        run_stats = crawler.run(limit=limit, on_result=report)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted - progress so far is saved.[/yellow]")
+        db.close()
+        return
 
-    console.print(f"\n[green]✓ Enriched {enriched_count}/{len(favorites)} favorites[/green]")
-    if failed_count > 0:
-        console.print(f"[yellow]⚠ {failed_count} failed[/yellow]")
+    console.print(f"\n[green]✓ Enriched {run_stats['saved']} favorites[/green] "
+                  f"[dim]({run_stats['fetched']} fetched, {run_stats['cached']} from HTML cache, "
+                  f"{run_stats['not_modified']} unchanged)[/dim]")
+    if run_stats['retrying']:
+        console.print(f"[yellow]⚠ {run_stats['retrying']} will be retried later[/yellow]")
+    if run_stats['failed']:
+        console.print(f"[yellow]⚠ {run_stats['failed']} failed[/yellow]")
 
     console.print("\n[dim]Next steps:[/dim]")
     console.print("  [cyan]holo mercadolivre classify --all[/cyan] - Classify with enriched descriptions")
@@ -1028,19 +991,7 @@ def enrich_proxy(limit: int, delay: int):
         db.close()
         return
 
-    # Ensure columns exist
     cursor = db.conn.cursor()
-    try:
-        cursor.execute("ALTER TABLE mercadolivre_favorites ADD COLUMN cached_html_path TEXT")
-        db.conn.commit()
-    except Exception:
-        pass  # Column already exists
-
-    try:
-        cursor.execute("ALTER TABLE mercadolivre_favorites ADD COLUMN brightdata_blocked BOOLEAN DEFAULT 0")
-        db.conn.commit()
-    except Exception:
-        pass  # Column already exists
 
     # Get unenriched favorites (excluding Bright Data blocked items)
     query = """
@@ -127,7 +127,10 @@ def import_favorites(enriched_only: bool, limit: int, dry_run: bool, auto_catego
             if suggestion['category']:
                 categorized_items[items_to_import[i]['item_id']] = suggestion
 
-        console.print(f"[green]✓ Categorized {len([s for s in suggestions if s['category']])} items[/green]\n")
+        alias_count = len([s for s in suggestions if s['method'] == 'alias'])
+        console.print(f"[green]✓ Categorized {len([s for s in suggestions if s['category']])} items[/green] "
+                      f"[dim]({alias_count} by taxonomy alias, "
+                      f"{len(suggestions) - alias_count} sent to DeepSeek in batches)[/dim]\n")
 
     # Import items
     console.print()
@@ -142,12 +145,15 @@ def import_favorites(enriched_only: bool, limit: int, dry_run: bool, auto_catego
         category = None
         confidence = None
         reasoning = None
+        category_source = 'deepseek'
 
         if fav['item_id'] in categorized_items:
             cat_data = categorized_items[fav['item_id']]
             category = cat_data['category']
             confidence = cat_data['confidence']
             reasoning = cat_data['reasoning']
+            if cat_data['method'] == 'alias':
+                category_source = 'taxonomy_alias'
 
         # Create inventory item
         item_id = db.insert_item(
@@ -165,7 +171,7 @@ def import_favorites(enriched_only: bool, limit: int, dry_run: bool, auto_catego
                 item_id,
                 'ai_category_confidence',
                 str(confidence),
-                source='deepseek',
+                source=category_source,
                 confidence=confidence,
                 confirmed=False
             )
@@ -174,7 +180,7 @@ def import_favorites(enriched_only: bool, limit: int, dry_run: bool, auto_catego
                     item_id,
                     'ai_category_reasoning',
                     reasoning,
-                    source='deepseek',
+                    source=category_source,
                     confirmed=False
                 )
 
@@ -27,9 +27,9 @@ def overview():
     config = load_config()
     db = Database(config.db_path)
 
-    # Get counts for each collection
-    # Note: This will need actual database queries once we have tables
-    # For now, showing the structure
+    # Exact counts; the daily rollups give the last day anything was added
+    counts = db.get_collection_counts()
+    rollups = db.get_daily_rollups()
 
     console.print(Panel.fit(
         "[bold cyan]Holocene Collection Overview[/bold cyan]",
@@ -42,15 +42,10 @@ def overview():
     table.add_column("Count", justify="right", style="green")
     table.add_column("Last Updated", style="yellow")
 
-    # TODO: Get actual counts from database
-    # For now, placeholder structure
-    collections = [
-        ("Books", 0, "Never"),
-        ("Papers", 0, "Never"),
-        ("Links", 0, "Never"),
-        ("Activities", 0, "Never"),
-        ("Research Reports", 0, "Never"),
-    ]
+    collections = []
+    for name, kind in [("Books", "books"), ("Papers", "papers"), ("Links", "links"), ("ML Favorites", "favorites")]:
+        days = [day for day, metrics in rollups.items() if metrics.get(f"{kind}.added")]
+        collections.append((name, counts[kind], days[-1] if days else "Never"))
 
     for name, count, last_updated in collections:
         table.add_row(name, str(count), last_updated)
@@ -75,6 +70,9 @@ def overview():
 def books():
     """Show book collection statistics."""
     config = load_config()
+    db = Database(config.db_path)
+    counts = db.get_collection_counts()
+    db.close()
 
     console.print(Panel.fit(
         "[bold cyan]Book Collection Statistics[/bold cyan]",
@@ -86,13 +84,9 @@ def books():
     stats_table.add_column("Metric", style="cyan")
     stats_table.add_column("Value", justify="right", style="green")
 
-    # TODO: Get actual stats from database
-    stats_table.add_row("Total Books", "0")
-    stats_table.add_row("With Dewey Classification", "0")
-    stats_table.add_row("With Cutter Numbers", "0")
-    stats_table.add_row("Missing Metadata", "0")
-    stats_table.add_row("From Internet Archive", "0")
-    stats_table.add_row("Linked to Calibre", "0")
+    stats_table.add_row("Total Books", str(counts["books"]))
+    stats_table.add_row("Enriched", str(counts["enriched_books"]))
+    stats_table.add_row("Classified", str(counts["classified_books"]))
 
     console.print(stats_table)
     console.print()
@@ -111,6 +105,9 @@ def books():
 def papers():
     """Show paper collection statistics."""
     config = load_config()
+    db = Database(config.db_path)
+    counts = db.get_collection_counts()
+    db.close()
 
     console.print(Panel.fit(
         "[bold cyan]Paper Collection Statistics[/bold cyan]",
@@ -122,13 +119,7 @@ def papers():
     stats_table.add_column("Metric", style="cyan")
     stats_table.add_column("Value", justify="right", style="green")
 
-    # TODO: Get actual stats from database
-    stats_table.add_row("Total Papers", "0")
-    stats_table.add_row("With DOI", "0")
-    stats_table.add_row("With arXiv ID", "0")
-    stats_table.add_row("With PDF", "0")
-    stats_table.add_row("Pre-LLM Era", "0")
-    stats_table.add_row("Recent (2024+)", "0")
+    stats_table.add_row("Total Papers", str(counts["papers"]))
 
     console.print(stats_table)
     console.print()
@@ -142,6 +133,9 @@ def papers():
 def links():
     """Show link collection statistics."""
     config = load_config()
+    db = Database(config.db_path)
+    counts = db.get_collection_counts()
+    db.close()
 
     console.print(Panel.fit(
         "[bold cyan]Link Collection Statistics[/bold cyan]",
@@ -153,13 +147,8 @@ def links():
     stats_table.add_column("Metric", style="cyan")
     stats_table.add_column("Value", justify="right", style="green")
 
-    # TODO: Get actual stats from database
-    stats_table.add_row("Total Links", "0")
-    stats_table.add_row("Archived (IA)", "0")
-    stats_table.add_row("Pre-LLM Era", "0")
-    stats_table.add_row("Trust Tier: High", "0")
-    stats_table.add_row("With Tags", "0")
-    stats_table.add_row("Dead Links", "0")
+    stats_table.add_row("Total Links", str(counts["links"]))
+    stats_table.add_row("Dead Links", str(counts["dead_links"]))
 
     console.print(stats_table)
     console.print()
@@ -169,6 +158,48 @@ def links():
     console.print("  (No links in collection yet)")
 
 
+@stats.command()
+@click.option("--days", default=14, show_default=True, help="Number of days to show")
+def activity(days):
+    """Show daily additions and background work."""
+    config = load_config()
+    db = Database(config.db_path)
+    since = (datetime.now().date() - timedelta(days=days - 1)).isoformat()
+    rollups = db.get_daily_rollups(since=since)
+    db.close()
+
+    console.print(Panel.fit(
+        "[bold cyan]Daily Activity[/bold cyan]",
+        border_style="cyan"
+    ))
+
+    if not rollups:
+        console.print(f"[yellow]No activity in the last {days} days[/yellow]")
+        return
+
+    columns = [
+        ("Books", "books.added"),
+        ("Papers", "papers.added"),
+        ("Links", "links.added"),
+        ("Favorites", "favorites.added"),
+        ("Enriched", "books.enriched"),
+        ("Classified", "books.classified"),
+        ("Link Checks", "links.checked"),
+        ("Dead Links", "links.dead"),
+    ]
+
+    table = Table(title=f"Last {days} Days", box=box.ROUNDED)
+    table.add_column("Day", style="cyan", no_wrap=True)
+    for name, _ in columns:
+        table.add_column(name, justify="right", style="green")
+
+    for day, metrics in rollups.items():
+        table.add_row(day, *(str(metrics.get(metric, 0)) for _, metric in columns))
+
+    console.print(table)
+    console.print("[dim]Dead Links is the net change (newly dead minus recovered)[/dim]")
+
+
 @stats.command()
 def dewey():
     """Show Dewey Decimal classification distribution."""
@@ -358,6 +389,170 @@ def storage():
     console.print(f"[bold]Total Storage:[/bold] {format_size(total_size)}")
 
 
+@stats.command("archives")
+def stats_archives():
+    """Show archive statistics and link health metrics.
+
+    Displays comprehensive statistics about link archiving:
+    - Internet Archive coverage
+    - Link health status
+    - Trust tier distribution
+    - Storage usage
+    - Recent archiving activity
+    """
+    config = load_config()
+    db = Database(config.db_path)
+
+    # Get archive statistics
+    cursor = db.conn.cursor()
+
+    # Total links
+    cursor.execute("SELECT COUNT(*) FROM links")
+    total_links = cursor.fetchone()[0]
+
+    if total_links == 0:
+        console.print("[yellow]No links tracked yet.[/yellow]")
+        console.print("Start tracking links with: [cyan]holo links scan[/cyan]")
+        db.close()
+        return
+
+    # Archived links
+    cursor.execute("SELECT COUNT(*) FROM links WHERE archived = 1")
+    archived_count = cursor.fetchone()[0]
+
+    # Failed links (with retry attempts)
+    cursor.execute("SELECT COUNT(*) FROM links WHERE archive_attempts > 0 AND archived = 0")
+    failed_count = cursor.fetchone()[0]
+
+    # Pending links (never attempted)
+    cursor.execute("SELECT COUNT(*) FROM links WHERE archived = 0 AND archive_attempts = 0")
+    pending_count = cursor.fetchone()[0]
+
+    # Link health status
+    cursor.execute("SELECT status, COUNT(*) FROM links WHERE status IS NOT NULL GROUP BY status")
+    status_counts = dict(cursor.fetchall())
+
+    # Trust tier distribution (archived links only)
+    cursor.execute("SELECT trust_tier, COUNT(*) FROM links WHERE archived = 1 AND trust_tier IS NOT NULL GROUP BY trust_tier")
+    trust_tier_counts = dict(cursor.fetchall())
+
+    # Recent archiving activity
+    cursor.execute("""
+        SELECT DATE(archive_date) as date, COUNT(*) as count
+        FROM links
+        WHERE archive_date IS NOT NULL
+        AND DATE(archive_date) >= DATE('now', '-7 days')
+        GROUP BY DATE(archive_date)
+        ORDER BY date DESC
+        LIMIT 7
+    """)
+    recent_archives = cursor.fetchall()
+
+    # Calculate percentages
+    archived_pct = (archived_count / total_links * 100) if total_links > 0 else 0
+    failed_pct = (failed_count / total_links * 100) if total_links > 0 else 0
+    pending_pct = (pending_count / total_links * 100) if total_links > 0 else 0
+
+    # Build statistics display
+    console.print()
+    console.print("╭──────────────── Archive Statistics ────────────────╮")
+    console.print("│                                                     │")
+    console.print(f"│ Total Links: [bold cyan]{total_links:,}[/bold cyan]                                  │")
+    console.print("│                                                     │")
+    console.print("│ Coverage:                                           │")
+
+    # Internet Archive coverage bar
+    bar_width = 30
+    archived_bar = int((archived_count / total_links) * bar_width) if total_links > 0 else 0
+    archived_bar_str = "█" * archived_bar + "░" * (bar_width - archived_bar)
+    console.print(f"│   Internet Archive:    [green]{archived_count:4}[/green] ([green]{archived_pct:5.1f}%[/green])  {archived_bar_str}   │")
+
+    # Failed links
+    failed_bar = int((failed_count / total_links) * bar_width) if total_links > 0 else 0
+    failed_bar_str = "█" * failed_bar + "░" * (bar_width - failed_bar)
+    console.print(f"│   Failed:              [red]{failed_count:4}[/red] ([red]{failed_pct:5.1f}%[/red])  {failed_bar_str}   │")
+
+    # Pending links
+    pending_bar = int((pending_count / total_links) * bar_width) if total_links > 0 else 0
+    pending_bar_str = "█" * pending_bar + "░" * (bar_width - pending_bar)
+    console.print(f"│   Pending:             [yellow]{pending_count:4}[/yellow] ([yellow]{pending_pct:5.1f}%[/yellow])  {pending_bar_str}   │")
+
+    console.print("│                                                     │")
+
+    # Link health section
+    if status_counts:
+        console.print("│ Link Health:                                        │")
+        alive = status_counts.get('alive', 0)
+        dead = status_counts.get('dead', 0)
+        timeout = status_counts.get('timeout', 0)
+        error = status_counts.get('connection_error', 0)
+        total_checked = alive + dead + timeout + error
+        unchecked = total_links - total_checked
+
+        if alive > 0:
+            alive_pct = (alive / total_links * 100) if total_links > 0 else 0
+            console.print(f"│   Alive:               [green]{alive:4}[/green] ([green]{alive_pct:5.1f}%[/green])                   │")
+        if dead > 0:
+            dead_pct = (dead / total_links * 100) if total_links > 0 else 0
+            console.print(f"│   Dead:                [red]{dead:4}[/red] ([red]{dead_pct:5.1f}%[/red])                   │")
+        if unchecked > 0:
+            unchecked_pct = (unchecked / total_links * 100) if total_links > 0 else 0
+            console.print(f"│   Unchecked:           [dim]{unchecked:4}[/dim] ([dim]{unchecked_pct:5.1f}%[/dim])                   │")
+
+        console.print("│                                                     │")
+
+    # Trust tier distribution
+    if trust_tier_counts:
+        console.print("│ Trust Tier Distribution (Archived):                │")
+        pre_llm = trust_tier_counts.get('pre-llm', 0)
+        early_llm = trust_tier_counts.get('early-llm', 0)
+        recent = trust_tier_counts.get('recent', 0)
+
+        if pre_llm > 0:
+            console.print(f"│   Pre-LLM:             [green]{pre_llm:4}[/green] (high value)                │")
+        if early_llm > 0:
+            console.print(f"│   Early-LLM:           [yellow]{early_llm:4}[/yellow] (medium value)             │")
+        if recent > 0:
+            console.print(f"│   Recent:              [red]{recent:4}[/red] (low value)                │")
+
+        console.print("│                                                     │")
+
+    # Recent activity
+    if recent_archives:
+        console.print("│ Recent Archiving Activity (last 7 days):           │")
+        for date, count in recent_archives[:5]:  # Show up to 5 days
+            console.print(f"│   {date}:  [cyan]{count:3}[/cyan] archived                         │")
+        console.print("│                                                     │")
+
+    # Last run info (approximate - check most recent archive date)
+    cursor.execute("SELECT MAX(archive_date) FROM links WHERE archive_date IS NOT NULL")
+    last_archive = cursor.fetchone()[0]
+    if last_archive:
+        try:
+            last_dt = datetime.fromisoformat(last_archive)
+            time_ago = datetime.now() - last_dt
+            if time_ago.days > 0:
+                time_ago_str = f"{time_ago.days} days ago"
+            elif time_ago.seconds > 3600:
+                time_ago_str = f"{time_ago.seconds // 3600} hours ago"
+            else:
+                time_ago_str = f"{time_ago.seconds // 60} minutes ago"
+            console.print(f"│ Last Archive: [dim]{time_ago_str}[/dim]                         │")
+        except:
+            pass
+
+    console.print("╰─────────────────────────────────────────────────────╯")
+    console.print()
+
+    # Suggestions
+    if pending_count > 0:
+        console.print(f"[yellow]Tip:[/yellow] Run [cyan]holo links auto-archive[/cyan] to archive {pending_count} pending link(s)")
+    if failed_count > 0:
+        console.print(f"[yellow]Tip:[/yellow] {failed_count} failed link(s) will retry according to exponential backoff")
+
+    db.close()
+
+
 def format_size(bytes: int) -> str:
     """Format bytes as human-readable size."""
     for unit in ["B", "KB", "MB", "GB", "TB"]:
@@ -47,6 +47,9 @@ class ClassificationConfig(BaseModel):
     generate_cutter_numbers: bool = True  # Generate Cutter numbers for unique shelf positions
     generate_full_call_numbers: bool = True  # Generate complete call numbers (e.g., "550.182 I73a")
     cutter_length: int = 3  # Number of characters in Cutter number (typically 2-4)
+    batch_size: int = 40  # Books per LLM prompt for batch classification
+    batch_retries: int = 2  # Extra attempts for books whose answer was missing or invalid
+    batch_delay: float = 10.0  # Seconds the classifier plugin collects new books before classifying
 
 
 class TelegramConfig(BaseModel):
@@ -69,7 +72,9 @@ class EmailConfig(BaseModel):
     smtp_port: int = 587
     username: Optional[str] = None
     password: Optional[str] = None
-    check_interval_seconds: int = 60  # How often to check for new emails
+    imap_ssl: bool = True  # IMAP over TLS (plain IMAP only for local bridges)
+    imap_idle: bool = True  # Push via IMAP IDLE on one long-lived connection
+    check_interval_seconds: int = 60  # How often to poll when IDLE is off or unsupported
     allowed_senders: List[str] = []  # Empty = allow all, or list of allowed email addresses
 
 
@@ -97,6 +102,59 @@ class MercadoLivreConfig(BaseModel):
     # HTML caching (for paid proxy services)
     cache_html: bool = True  # Cache fetched HTML to avoid re-fetching costs
 
+    # Product page enrichment crawler (holod works through queued favorites)
+    enrich_in_background: bool = True
+    enrich_concurrency: int = 2  # Concurrent page fetches
+    enrich_delay_seconds: float = 7.0  # Between requests to the same host (± jitter)
+    enrich_interval_seconds: int = 60  # How often holod checks the queue
+
+
+class ExecutorConfig(BaseModel):
+    """Background executor pools (see core/executor.py)."""
+
+    io_workers: int = 4  # Network and database work (default pool)
+    llm_workers: int = 2  # LLM calls
+    cpu_workers: int = 2  # Worker processes for CPU-bound work (PDF parsing)
+    interactive_workers: int = 2  # Work a user is waiting for (Telegram, API)
+    plugin_quota: float = 0.5  # Share of a pool one plugin may hold while others wait
+    plugin_quotas: Dict[str, int] = Field(default_factory=dict)  # Per-plugin worker limits, e.g. {book_enricher: 1}
+
+
+class PapersConfig(BaseModel):
+    """Paper full-text analysis (see research/paper_analysis.py)."""
+
+    analyze_in_background: bool = True  # holod drains the full_text_analyzed = 0 backlog
+    analysis_workers: int = 2  # Papers analyzed at once
+    analysis_interval_seconds: int = 600  # How often holod rescans the backlog
+    analysis_max_attempts: int = 3  # Failures before a paper is skipped until restart
+    chunk_chars: int = 12000  # Characters of PDF text per summarized chunk
+
+
+class MaintenanceConfig(BaseModel):
+    """Database maintenance (see storage/maintenance.py)."""
+
+    enabled: bool = True  # holod checkpoints, optimizes and prunes holocene.db
+    wal_checkpoint_mb: int = 64  # Checkpoint and truncate the WAL once it is this large
+    checkpoint_interval_seconds: int = 300  # How often holod checks the WAL size
+    optimize_interval_hours: int = 6  # How often holod runs PRAGMA optimize
+    schedule: str = "30 4 * * *"  # Cron for the full pass (retention, vacuum, ANALYZE)
+    vacuum_pages: int = 0  # Free pages returned per pass (0 = all)
+    retention_days: Dict[str, int] = Field(default_factory=lambda: {  # 0 = keep forever
+        "laney_messages": 365,
+        "api_cache": 90,
+        "archive_snapshots": 180,
+        "capture_jobs": 30,
+    })
+
+
+class ProfilerConfig(BaseModel):
+    """Query profiling for holod's database (see storage/profiler.py)."""
+
+    enabled: bool = False  # Time every statement (shown in /status, /metrics and 'holo db profile')
+    slow_query_ms: float = 100  # Statements at least this slow go to the slow-query log
+    slow_log_size: int = 100  # Slow queries kept
+    explain_slow_queries: bool = True  # Capture EXPLAIN QUERY PLAN for slow queries
+
 
 class IntegrationsConfig(BaseModel):
     """Integration settings for external services."""
@@ -146,6 +204,17 @@ class IntegrationsConfig(BaseModel):
     archivebox_user: str = "holocene"
     archivebox_data_dir: str = "/opt/archivebox/data"
 
+    # Archive scheduler (holod drains unarchived links across all backends)
+    archive_scheduler_enabled: bool = False
+    archive_scheduler_services: List[str] = Field(default_factory=list)  # Empty = all available
+    archive_scheduler_max_concurrent: int = 6  # Captures running at once across backends
+    archive_scheduler_interval_seconds: int = 300  # Backlog rescan interval
+
+    # Local capture workers (monolith/WARC run here, not on the core executor)
+    capture_workers: int = 4  # Captures running at once
+    capture_memory_mb: int = 1024  # Address-space limit per capture process
+    capture_cpu_seconds: int = 300  # CPU-time limit per capture process
+
     # Proxmox API (for monitoring and limited control)
     proxmox_enabled: bool = False
     proxmox_host: str = "192.168.1.101"
@@ -192,6 +261,10 @@ class Config(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig)
     classification: ClassificationConfig = Field(default_factory=ClassificationConfig)
     integrations: IntegrationsConfig = Field(default_factory=IntegrationsConfig)
+    executor: ExecutorConfig = Field(default_factory=ExecutorConfig)
+    papers: PapersConfig = Field(default_factory=PapersConfig)
+    maintenance: MaintenanceConfig = Field(default_factory=MaintenanceConfig)
+    profiler: ProfilerConfig = Field(default_factory=ProfilerConfig)
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
     email: EmailConfig = Field(default_factory=EmailConfig)
     mercadolivre: MercadoLivreConfig = Field(default_factory=MercadoLivreConfig)
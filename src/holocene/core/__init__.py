@@ -1,10 +1,24 @@
-"""Core models and business logic for Holocene."""
+"""Core models and business logic for Holocene.
 
-from .models import Activity, ActivityType, Context
-from .holocene_core import HoloceneCore
-from .channels import ChannelManager, Message
-from .plugin import Plugin
-from .plugin_registry import PluginRegistry
+Exports are imported on first use, so `import holocene.core.models` doesn't
+pull in HoloceneCore (and with it storage, config and the scheduler).
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .models import Activity, ActivityType, Context
+    from .holocene_core import HoloceneCore
+    from .channels import ChannelManager, Message
+    from .plugin import Plugin
+    from .plugin_registry import PluginRegistry
+    from .scheduler import Scheduler, IntervalTrigger, CronTrigger
+    from .executor import (
+        BackgroundExecutor, CancellationToken, TaskCancelled,
+        PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW,
+    )
 
 __all__ = [
     "Activity",
@@ -15,4 +29,33 @@ __all__ = [
     "Message",
     "Plugin",
     "PluginRegistry",
+    "Scheduler",
+    "IntervalTrigger",
+    "CronTrigger",
+    "BackgroundExecutor",
+    "CancellationToken",
+    "TaskCancelled",
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_LOW",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Activity": ".models",
+    "ActivityType": ".models",
+    "Context": ".models",
+    "HoloceneCore": ".holocene_core",
+    "ChannelManager": ".channels",
+    "Message": ".channels",
+    "Plugin": ".plugin",
+    "PluginRegistry": ".plugin_registry",
+    "Scheduler": ".scheduler",
+    "IntervalTrigger": ".scheduler",
+    "CronTrigger": ".scheduler",
+    "BackgroundExecutor": ".executor",
+    "CancellationToken": ".executor",
+    "TaskCancelled": ".executor",
+    "PRIORITY_HIGH": ".executor",
+    "PRIORITY_NORMAL": ".executor",
+    "PRIORITY_LOW": ".executor",
+})
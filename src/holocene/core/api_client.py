@@ -139,6 +139,13 @@ class BaseAPIClient:
 
         logger.warning(f"[BaseAPIClient] Request completed in {req_elapsed:.2f}s, status={response.status_code}")
 
+        # Feed status back so the limiter can back off on 429/503
+        if respect_rate_limit and self.rate_limiter:
+            retry_after = None
+            if response.status_code in rate_limiter.THROTTLE_STATUS_CODES:
+                retry_after = response.headers.get("Retry-After")
+            self.rate_limiter.record_response(url, response.status_code, retry_after)
+
         return response
 
     def get(self, endpoint: str, **kwargs) -> requests.Response:
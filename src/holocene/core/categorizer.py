@@ -1,9 +1,27 @@
-"""AI-powered categorization for inventory items."""
-
+"""AI-powered categorization for inventory items.
+
+Bulk categorization (batch_suggest_categories) avoids one LLM call per item:
+items with an unambiguous taxonomy alias in their title are categorized
+locally, and the rest go to the LLM in batches (many items per prompt,
+several prompts in flight). The taxonomy reference is built once per
+taxonomy and sent as an identical system prompt every time, so providers
+that cache prompt prefixes can reuse it.
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
 from holocene.llm.nanogpt import NanoGPTClient
 from holocene.core.taxonomy import InventoryTaxonomy
 
+# Confidence given to categories found by alias matching
+ALIAS_MATCH_CONFIDENCE = 0.9
+
+# Longest alias (in words) looked up in item titles
+MAX_ALIAS_WORDS = 3
+
 
 def suggest_category(
     title: str,
@@ -67,16 +85,7 @@ Response:"""
             temperature=0.1,  # Low temperature for consistent categorization
         )
 
-        # Parse JSON response
-        import json
-        # Extract JSON from response (handle code blocks)
-        json_text = response_text.strip()
-        if json_text.startswith("```"):
-            # Remove code block markers
-            lines = json_text.split("\n")
-            json_text = "\n".join(lines[1:-1]) if len(lines) > 2 else json_text
-
-        result = json.loads(json_text)
+        result = _parse_json_response(response_text)
 
         category = result.get("category")
         confidence = float(result.get("confidence", 0.0))
@@ -84,15 +93,10 @@ Response:"""
 
         # Validate category exists in taxonomy
         if category:
-            cat_info = taxonomy.get_category_info(category)
-            if not cat_info:
-                # Try to normalize it
-                normalized = taxonomy.normalize_category(category)
-                if normalized:
-                    category = normalized
-                else:
-                    # Invalid category
-                    return None, 0.0, f"Invalid category suggested: {category}"
+            valid = _validate_category(category, taxonomy)
+            if not valid:
+                return None, 0.0, f"Invalid category suggested: {category}"
+            category = valid
 
         return category, confidence, reasoning
 
@@ -100,9 +104,37 @@ Response:"""
         return None, 0.0, f"Error during categorization: {str(e)}"
 
 
+def _parse_json_response(response_text: str):
+    """Parse a JSON answer, tolerating code fences and surrounding chatter."""
+    json_text = response_text.strip()
+    if json_text.startswith("```"):
+        # Remove code block markers
+        lines = json_text.split("\n")
+        json_text = "\n".join(lines[1:-1]) if len(lines) > 2 else json_text
+
+    try:
+        return json.loads(json_text)
+    except json.JSONDecodeError:
+        # Fall back to the outermost array/object in the text
+        match = re.search(r"(\[.*\]|\{.*\})", json_text, re.DOTALL)
+        if not match:
+            raise
+        return json.loads(match.group(1))
+
+
+def _validate_category(category: str, taxonomy: InventoryTaxonomy) -> Optional[str]:
+    """Return the canonical code for an LLM-suggested category, or None if invalid."""
+    if taxonomy.get_category_info(category):
+        return category.upper()
+    return taxonomy.normalize_category(category)
+
+
+@lru_cache(maxsize=8)
 def _build_taxonomy_reference(taxonomy: InventoryTaxonomy, max_categories: int = 50) -> str:
     """Build a concise taxonomy reference for the prompt.
 
+    Cached per taxonomy instance (taxonomies don't change after loading).
+
     Args:
         taxonomy: Taxonomy instance
         max_categories: Maximum categories to include
@@ -142,63 +174,236 @@ def _build_taxonomy_reference(taxonomy: InventoryTaxonomy, max_categories: int =
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=8)
+def _alias_index(taxonomy: InventoryTaxonomy) -> Dict[str, str]:
+    """Map each unambiguous alias (lowercase) to its category code.
+
+    Aliases shared by several categories (e.g. "saw") are left out, as are
+    bare category codes, which collide with ordinary words ("cut").
+    """
+    codes_by_alias: Dict[str, set] = {}
+    for code, data in taxonomy.canonical_map.items():
+        for alias in data.get('aliases', []):
+            codes_by_alias.setdefault(alias.lower(), set()).add(code)
+
+    return {
+        alias: next(iter(codes))
+        for alias, codes in codes_by_alias.items()
+        if len(codes) == 1
+    }
+
+
+def match_category_by_alias(title: str, taxonomy: InventoryTaxonomy) -> Optional[Tuple[str, str]]:
+    """
+    Find a category from taxonomy aliases appearing in an item title.
+
+    Only confident matches are returned: the most specific matched category
+    must be a subcategory (not a top-level code), and every other match must
+    be one of its ancestors.
+
+    Args:
+        title: Item title
+        taxonomy: Taxonomy instance
+
+    Returns:
+        Tuple of (category_code, matched_alias) or None
+    """
+    index = _alias_index(taxonomy)
+    words = re.findall(r"\w+", title.lower())
+
+    matches = {}
+    for size in range(1, MAX_ALIAS_WORDS + 1):
+        for i in range(len(words) - size + 1):
+            phrase = " ".join(words[i:i + size])
+            if phrase in index:
+                matches.setdefault(index[phrase], phrase)
+
+    if not matches:
+        return None
+
+    deepest = max(matches, key=lambda code: code.count('-'))
+    if '-' not in deepest:
+        return None  # Only top-level matches ("tools") - too vague
+    if any(not (deepest == code or deepest.startswith(code + '-')) for code in matches):
+        return None  # Conflicting categories
+
+    return deepest, matches[deepest]
+
+
+def _build_batch_system_prompt(taxonomy: InventoryTaxonomy) -> str:
+    """Static instructions + taxonomy: identical for every batch."""
+    return f"""You are categorizing items for a personal inventory system.
+
+AVAILABLE CATEGORIES:
+{_build_taxonomy_reference(taxonomy)}
+
+You will receive a numbered list of items. Respond with ONLY a JSON array,
+one object per item, in this exact format:
+[
+  {{"id": 1, "category": "CATEGORY-CODE", "confidence": 0.95, "reasoning": "Brief explanation"}}
+]
+
+Rules:
+- Include every item id exactly once
+- Use the most specific category that fits (e.g., T-MEAS-CAL rather than T-MEAS)
+- Confidence should be 0.0 to 1.0 (0.8+ for clear matches, 0.5-0.8 for uncertain, below 0.5 for unclear)
+- If no good match exists, use confidence below 0.3 and explain why
+- Reasoning should be one short sentence"""
+
+
+def _suggest_categories_batch(
+    items: List[Dict],
+    taxonomy: InventoryTaxonomy,
+    llm_client: NanoGPTClient,
+    model: str
+) -> List[Tuple[Optional[str], float, str]]:
+    """
+    Categorize several items with one LLM call.
+
+    Args:
+        items: Item dicts with 'title' and optional 'description'
+        taxonomy: Taxonomy instance
+        llm_client: NanoGPT client
+        model: Model to use
+
+    Returns:
+        (category_code, confidence, reasoning) per item, in input order
+    """
+    lines = []
+    for number, item in enumerate(items, 1):
+        line = f"{number}. {item['title']}"
+        description = item.get('description')
+        if description:
+            # Batches share the context window - keep descriptions short
+            desc_preview = description[:200] + "..." if len(description) > 200 else description
+            line += f"\n   Description: {desc_preview}"
+        lines.append(line)
+
+    try:
+        response_text = llm_client.simple_prompt(
+            prompt="ITEMS TO CATEGORIZE:\n" + "\n".join(lines) + "\n\nResponse:",
+            model=model,
+            system=_build_batch_system_prompt(taxonomy),
+            temperature=0.1,
+        )
+        answers = _parse_json_response(response_text)
+        if isinstance(answers, dict):
+            answers = answers.get("items") or [answers]
+    except Exception as e:
+        return [(None, 0.0, f"Error during categorization: {str(e)}")] * len(items)
+
+    by_id = {}
+    for answer in answers:
+        if isinstance(answer, dict):
+            try:
+                by_id[int(answer.get("id"))] = answer
+            except (TypeError, ValueError):
+                continue
+
+    results = []
+    for number in range(1, len(items) + 1):
+        answer = by_id.get(number)
+        if answer is None:
+            results.append((None, 0.0, "No answer for this item"))
+            continue
+
+        category = answer.get("category")
+        try:
+            confidence = float(answer.get("confidence", 0.0))
+        except (TypeError, ValueError):
+            confidence = 0.0
+        reasoning = answer.get("reasoning", "")
+
+        if category:
+            valid = _validate_category(category, taxonomy)
+            if not valid:
+                results.append((None, 0.0, f"Invalid category suggested: {category}"))
+                continue
+            category = valid
+
+        results.append((category, confidence, reasoning))
+
+    return results
+
+
 def batch_suggest_categories(
     items: List[Dict],
     taxonomy: InventoryTaxonomy,
     llm_client: NanoGPTClient,
     confidence_threshold: float = 0.5,
-    model: str = "deepseek-ai/DeepSeek-V3.1"
+    model: str = "deepseek-ai/DeepSeek-V3.1",
+    batch_size: int = 25,
+    max_workers: int = 4,
+    use_aliases: bool = True
 ) -> List[Dict]:
     """
     Suggest categories for multiple items.
 
+    Items whose title contains an unambiguous taxonomy alias are categorized
+    without the LLM; the rest are sent in batches of batch_size items per
+    prompt, with up to max_workers prompts in flight.
+
     Args:
         items: List of item dicts with 'title' and optional 'description'
         taxonomy: Taxonomy instance
         llm_client: NanoGPT client
         confidence_threshold: Minimum confidence to include suggestion
         model: Model to use
+        batch_size: Items per LLM prompt
+        max_workers: Concurrent LLM prompts
+        use_aliases: Categorize obvious items by alias matching
 
     Returns:
         List of dicts with 'item', 'category', 'confidence', 'reasoning'
+        and 'method' ('alias', 'llm' or None), in input order
     """
-    results = []
+    results: List[Optional[Dict]] = [None] * len(items)
+    pending = []  # Indexes of items that need the LLM
 
-    for item in items:
+    for i, item in enumerate(items):
         title = item.get('title', '')
-        description = item.get('description')
 
         if not title:
-            results.append({
+            results[i] = {
                 'item': item,
                 'category': None,
                 'confidence': 0.0,
-                'reasoning': 'No title provided'
-            })
+                'reasoning': 'No title provided',
+                'method': None,
+            }
             continue
 
-        category, confidence, reasoning = suggest_category(
-            title=title,
-            description=description,
-            taxonomy=taxonomy,
-            llm_client=llm_client,
-            model=model
-        )
-
-        # Only include if meets threshold
-        if confidence >= confidence_threshold:
-            results.append({
+        match = match_category_by_alias(title, taxonomy) if use_aliases else None
+        if match:
+            category, alias = match
+            results[i] = {
                 'item': item,
                 'category': category,
-                'confidence': confidence,
-                'reasoning': reasoning
-            })
+                'confidence': ALIAS_MATCH_CONFIDENCE,
+                'reasoning': f"Title mentions '{alias}'",
+                'method': 'alias',
+            }
         else:
-            results.append({
-                'item': item,
-                'category': None,
-                'confidence': confidence,
-                'reasoning': reasoning
-            })
+            pending.append(i)
+
+    batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+
+    def run_batch(indexes: List[int]):
+        return _suggest_categories_batch(
+            [items[i] for i in indexes], taxonomy, llm_client, model
+        )
+
+    if batches:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as pool:
+            for indexes, suggestions in zip(batches, pool.map(run_batch, batches)):
+                for i, (category, confidence, reasoning) in zip(indexes, suggestions):
+                    # Only include if meets threshold
+                    results[i] = {
+                        'item': items[i],
+                        'category': category if confidence >= confidence_threshold else None,
+                        'confidence': confidence,
+                        'reasoning': reasoning,
+                        'method': 'llm',
+                    }
 
     return results
@@ -0,0 +1,363 @@
+"""Priority-aware background executor with named pools.
+
+All background work used to share one FIFO ThreadPoolExecutor, so a batch
+of 500 books.added enrichments queued ahead of a Telegram /ask. Work now
+goes to one of several named pools, each with its own workers:
+
+- io: network and database work (default)
+- llm: LLM calls, slow and rate limited
+- cpu: CPU-bound work, run in worker processes (the task must be picklable)
+- interactive: work a user is waiting for (Telegram commands, API requests)
+
+Within a pool lower priority values run first, FIFO among equals. While
+other plugins have work waiting, one plugin can hold at most its quota of
+a pool's workers, so a backlog from one plugin can't starve the rest.
+Every task has a CancellationToken linked to the executor's shutdown token:
+queued tasks whose token is cancelled are dropped, and long-running tasks
+can check theirs.
+
+    executor = BackgroundExecutor({"io": 4, "llm": 2, "cpu": 2, "interactive": 2})
+    future = executor.submit(task, pool="llm", priority=PRIORITY_LOW, owner="book_enricher")
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from ..storage.profiler import pop_caller, push_caller
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = 0  # A user is waiting
+PRIORITY_NORMAL = 50
+PRIORITY_LOW = 100  # Bulk/backfill work
+
+DEFAULT_POOLS = {"io": 4, "llm": 2, "cpu": 2, "interactive": 2}
+PROCESS_POOLS = {"cpu"}
+
+# Recent tasks kept per pool for latency metrics
+LATENCY_WINDOW = 500
+
+
+class TaskCancelled(Exception):
+    """Raised by CancellationToken.raise_if_cancelled()."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag; cancelling a token cancels its children."""
+
+    def __init__(self, parent: Optional["CancellationToken"] = None, event: Optional[threading.Event] = None):
+        """
+        Args:
+            parent: Token whose cancellation also cancels this one
+            event: Event to use as the flag (e.g. HoloceneCore._shutdown_event)
+        """
+        self._event = event or threading.Event()
+        self._children = weakref.WeakSet()
+        self._lock = threading.Lock()
+        if parent is not None:
+            parent._add_child(self)
+
+    def _add_child(self, child: "CancellationToken"):
+        with self._lock:
+            self._children.add(child)
+        if self.cancelled:
+            child.cancel()
+
+    def child(self) -> "CancellationToken":
+        """New token cancelled together with this one."""
+        return CancellationToken(parent=self)
+
+    def cancel(self):
+        self._event.set()
+        with self._lock:
+            children = list(self._children)
+        for child in children:
+            child.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise TaskCancelled()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep until cancelled or timeout; returns True if cancelled."""
+        return self._event.wait(timeout)
+
+
+class _Task:
+    __slots__ = ("fn", "future", "owner", "token", "callback", "error_handler", "submitted")
+
+    def __init__(self, fn, future, owner, token, callback, error_handler):
+        self.fn = fn
+        self.future = future
+        self.owner = owner
+        self.token = token
+        self.callback = callback
+        self.error_handler = error_handler
+        self.submitted = time.monotonic()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class _Pool:
+    """Worker threads draining one priority queue."""
+
+    def __init__(self, name: str, workers: int, quota: Callable[[str, int], int], use_processes: bool = False):
+        self.name = name
+        self.workers = workers
+        self._quota = quota
+        self._use_processes = use_processes
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+        self._queue: List[tuple] = []  # (priority, seq, task)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+
+        self._running = Counter()  # owner -> running tasks
+        self._queued = Counter()  # owner -> queued tasks
+        self._stats = Counter()
+        self._waits = deque(maxlen=LATENCY_WINDOW)
+        self._runtimes = deque(maxlen=LATENCY_WINDOW)
+
+    def submit(self, task: _Task, priority: int):
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            heapq.heappush(self._queue, (priority, next(self._seq), task))
+            self._queued[task.owner] += 1
+            self._stats["submitted"] += 1
+            if self._idle == 0 and len(self._threads) < self.workers:
+                thread = threading.Thread(
+                    target=self._worker, daemon=True, name=f"holocene-{self.name}-{len(self._threads)}"
+                )
+                self._threads.append(thread)
+                thread.start()
+            else:
+                self._cond.notify()
+
+    def _take(self) -> Optional[_Task]:
+        """Pop the best task whose owner is under quota (call with _cond held).
+
+        If every waiting task belongs to owners at quota, the best one runs
+        anyway - quotas only share workers, they never leave one idle.
+        """
+        skipped = []
+        chosen = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            task = entry[2]
+            if task.token.cancelled:
+                self._queued[task.owner] -= 1
+                if task.future.cancel():
+                    self._stats["cancelled"] += 1
+                continue
+            if task.owner is None or self._running[task.owner] < self._quota(task.owner, self.workers):
+                chosen = task
+                break
+            skipped.append(entry)
+
+        if chosen is None and skipped:
+            chosen = skipped.pop(0)[2]
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+
+        if chosen is not None:
+            self._queued[chosen.owner] -= 1
+            self._running[chosen.owner] += 1
+        return chosen
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                task = self._take()
+                while task is None:
+                    if self._shutdown:
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    task = self._take()
+
+            try:
+                self._run(task)
+            finally:
+                with self._cond:
+                    self._running[task.owner] -= 1
+                    self._cond.notify_all()  # Freed quota may unblock a skipped task
+
+    def _run(self, task: _Task):
+        if not task.future.set_running_or_notify_cancel():
+            with self._cond:
+                self._stats["cancelled"] += 1
+            return
+
+        started = time.monotonic()
+        self._waits.append(started - task.submitted)
+        push_caller(f"plugin:{task.owner}" if task.owner else None)
+        try:
+            result = self._call(task.fn)
+            if task.callback:
+                task.callback(result)
+        except BaseException as e:
+            logger.error(f"Background task failed ({self.name}): {e}", exc_info=True)
+            if task.error_handler:
+                try:
+                    task.error_handler(e)
+                except Exception as handler_error:
+                    logger.error(f"Background error handler failed: {handler_error}", exc_info=True)
+            task.future.set_exception(e)
+            outcome = "failed"
+        else:
+            task.future.set_result(result)
+            outcome = "completed"
+        finally:
+            pop_caller()
+
+        self._runtimes.append(time.monotonic() - started)
+        with self._cond:
+            self._stats[outcome] += 1
+
+    def _call(self, fn: Callable[[], Any]) -> Any:
+        if not self._use_processes:
+            return fn()
+        with self._cond:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.workers)
+        return self._processes.submit(fn).result()
+
+    def shutdown(self, wait: bool = True):
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for thread in list(self._threads):
+                thread.join()
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            waits = [w * 1000 for w in self._waits]
+            runtimes = [r * 1000 for r in self._runtimes]
+            owners = set(self._queued) | set(self._running)
+            return {
+                "workers": self.workers,
+                "queued": len(self._queue),
+                "running": sum(self._running.values()),
+                "submitted": self._stats["submitted"],
+                "completed": self._stats["completed"],
+                "failed": self._stats["failed"],
+                "cancelled": self._stats["cancelled"],
+                "wait_ms": {
+                    "avg": round(sum(waits) / len(waits), 1) if waits else 0.0,
+                    "p95": round(_percentile(waits, 0.95), 1),
+                    "max": round(max(waits), 1) if waits else 0.0,
+                },
+                "run_ms": {
+                    "avg": round(sum(runtimes) / len(runtimes), 1) if runtimes else 0.0,
+                    "p95": round(_percentile(runtimes, 0.95), 1),
+                },
+                "by_owner": {
+                    owner or "core": {"queued": self._queued[owner], "running": self._running[owner]}
+                    for owner in owners
+                    if self._queued[owner] or self._running[owner]
+                },
+            }
+
+
+class BackgroundExecutor:
+    """Named priority pools behind one submit()."""
+
+    def __init__(
+        self,
+        pools: Optional[Dict[str, int]] = None,
+        shutdown_token: Optional[CancellationToken] = None,
+        plugin_quota: float = 0.5,
+        plugin_quotas: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize executor (threads start on first use).
+
+        Args:
+            pools: Pool name -> worker count (default: DEFAULT_POOLS)
+            shutdown_token: Cancelled on shutdown(); parent of every task token
+            plugin_quota: Share of a pool's workers one owner may hold while others wait
+            plugin_quotas: Per-owner worker limits overriding plugin_quota
+        """
+        self.shutdown_token = shutdown_token or CancellationToken()
+        self.plugin_quota = plugin_quota
+        self.plugin_quotas = dict(plugin_quotas or {})
+        self._pools = {
+            name: _Pool(name, max(1, workers), self._quota, use_processes=name in PROCESS_POOLS)
+            for name, workers in (pools or DEFAULT_POOLS).items()
+        }
+
+    def _quota(self, owner: str, workers: int) -> int:
+        if owner in self.plugin_quotas:
+            return self.plugin_quotas[owner]
+        return max(1, int(workers * self.plugin_quota))
+
+    @property
+    def pools(self) -> List[str]:
+        return list(self._pools)
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        pool: str = "io",
+        priority: int = PRIORITY_NORMAL,
+        owner: Optional[str] = None,
+        token: Optional[CancellationToken] = None,
+        callback: Optional[Callable[[Any], None]] = None,
+        error_handler: Optional[Callable[[Exception], None]] = None,
+    ) -> Future:
+        """
+        Queue a task.
+
+        Args:
+            fn: Callable with no arguments (picklable for the cpu pool)
+            pool: Pool name
+            priority: Lower runs first (PRIORITY_HIGH/NORMAL/LOW)
+            owner: Plugin name, for quotas and metrics
+            token: Cancel the task while queued (default: child of shutdown_token)
+            callback: Called with the result, on the pool's thread
+            error_handler: Called with the exception, on the pool's thread
+
+        Returns:
+            Future for fn's result
+        """
+        if pool not in self._pools:
+            raise ValueError(f"Unknown pool '{pool}' (available: {', '.join(self._pools)})")
+
+        future = Future()
+        task = _Task(fn, future, owner, token or self.shutdown_token.child(), callback, error_handler)
+        self._pools[pool].submit(task, priority)
+        return future
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, throughput and latency per pool (for /status)."""
+        return {name: pool.metrics() for name, pool in self._pools.items()}
+
+    def shutdown(self, wait: bool = True):
+        """Cancel the shutdown token (dropping queued tasks) and stop the pools."""
+        self.shutdown_token.cancel()
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
@@ -1,10 +1,15 @@
 """
 Fuzzy string matching for search queries.
 
-Provides simple fuzzy matching using Python's difflib for typo-tolerant search.
+Provides simple fuzzy matching using Python's difflib for typo-tolerant search,
+plus token-level matching (bounded edit distance, prefixes) used to score
+candidates from the trigram search index (see core/search_index.py).
 """
 
+import re
+import unicodedata
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import List, Tuple, Any, Callable, Optional
 
 
@@ -69,12 +74,19 @@ def fuzzy_search(
     if not query:
         return []
 
-    # Calculate scores for all items
+    # Calculate scores for all items (cheap upper bounds skip most ratio() calls)
+    query_lower = query.lower()
     scored_items = []
     for item in items:
         text = key_func(item)
-        score = fuzzy_match_ratio(query, text)
+        if not text:
+            continue
 
+        matcher = SequenceMatcher(None, query_lower, text.lower())
+        if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+            continue
+
+        score = matcher.ratio()
         if score >= threshold:
             scored_items.append((item, score))
 
@@ -118,20 +130,25 @@ def fuzzy_search_multi_field(
         return []
 
     # Calculate weighted scores
+    query_lower = query.lower()
     scored_items = []
     for item in items:
-        weighted_score = 0.0
+        matchers = []
 
         for key_func, weight in key_funcs:
             try:
                 text = key_func(item)
                 if text:  # Only score non-empty fields
-                    score = fuzzy_match_ratio(query, text)
-                    weighted_score += score * (weight / total_weight)
+                    matchers.append((SequenceMatcher(None, query_lower, text.lower()), weight / total_weight))
             except (AttributeError, TypeError):
                 # Skip fields that don't exist or can't be converted to string
                 continue
 
+        # quick_ratio() bounds ratio() from above: skip items that can't reach threshold
+        if sum(matcher.quick_ratio() * weight for matcher, weight in matchers) < threshold:
+            continue
+
+        weighted_score = sum(matcher.ratio() * weight for matcher, weight in matchers)
         if weighted_score >= threshold:
             scored_items.append((item, weighted_score))
 
@@ -145,6 +162,128 @@ def fuzzy_search_multi_field(
     return scored_items
 
 
+def normalize_tokens(text: str) -> List[str]:
+    """
+    Split text into lowercase, accent-free word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens ("Café Società" -> ["cafe", "societa"])
+    """
+    if not text:
+        return []
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.findall(r"\w+", stripped)
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance, giving up once it must exceed max_distance.
+
+    Only a band of 2 * max_distance + 1 cells per row is computed, so the
+    cost is O(len * max_distance) instead of O(len²).
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        Edit distance, or max_distance + 1 if it is larger than max_distance
+    """
+    too_far = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return too_far
+    if len(a) > len(b):
+        a, b = b, a
+
+    previous = [j if j <= max_distance else too_far for j in range(len(b) + 1)]
+    for i, char in enumerate(a, 1):
+        current = [too_far] * (len(b) + 1)
+        if i <= max_distance:
+            current[0] = i
+        low = max(1, i - max_distance)
+        high = min(len(b), i + max_distance)
+        for j in range(low, high + 1):
+            cost = 0 if char == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost, too_far)
+        if min(current[low - 1:high + 1]) > max_distance:
+            return too_far
+        previous = current
+
+    return min(previous[len(b)], too_far)
+
+
+def _max_typos(token: str) -> int:
+    """Edits tolerated for a query token of this length."""
+    if len(token) <= 4:
+        return 1
+    if len(token) <= 8:
+        return 2
+    return 3
+
+
+@lru_cache(maxsize=65536)
+def token_similarity(query_token: str, text_token: str) -> float:
+    """
+    Similarity of two normalized tokens (1.0 equal, 0.0 unrelated).
+
+    Typos within _max_typos() score by edit distance; a query token of 3+
+    characters that starts the text token (search-as-you-type) scores 0.9.
+    """
+    if query_token == text_token:
+        return 1.0
+    if len(query_token) >= 3 and text_token.startswith(query_token):
+        return 0.9
+
+    max_distance = _max_typos(query_token)
+    distance = bounded_edit_distance(query_token, text_token, max_distance)
+    if distance > max_distance:
+        return 0.0
+    return 1.0 - distance / max(len(query_token), len(text_token))
+
+
+def token_match_ratio(query: str, text: str) -> float:
+    """
+    How well the words of query appear in text, in any order.
+
+    Each query token takes its best token_similarity() against the text's
+    tokens; the result is the mean over query tokens. Unlike
+    fuzzy_match_ratio() this doesn't penalize long texts, so "pyton" matches
+    "Fluent Python: Clear, Concise, and Effective Programming".
+
+    Args:
+        query: Search query
+        text: Text to match against
+
+    Returns:
+        Match ratio between 0.0 and 1.0
+    """
+    query_tokens = normalize_tokens(query)
+    text_tokens = set(normalize_tokens(text))
+    if not query_tokens or not text_tokens:
+        return 0.0
+
+    total = 0.0
+    for query_token in query_tokens:
+        if query_token in text_tokens:
+            total += 1.0
+            continue
+        max_distance = _max_typos(query_token)
+        total += max(
+            (
+                token_similarity(query_token, text_token)
+                for text_token in text_tokens
+                if len(text_token) >= len(query_token) - max_distance
+            ),
+            default=0.0,
+        )
+    return total / len(query_tokens)
+
+
 def contains_word(query: str, text: str, case_sensitive: bool = False) -> bool:
     """
     Check if text contains query as a whole word.
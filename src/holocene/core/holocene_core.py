@@ -6,12 +6,14 @@ Provides the core API that plugins use to interact with the system.
 import logging
 from pathlib import Path
 from typing import Optional
-from concurrent.futures import ThreadPoolExecutor
 import threading
 
 from ..storage.database import Database
+from ..storage.profiler import QueryProfiler
 from ..config import Config, load_config
 from .channels import ChannelManager
+from .executor import BackgroundExecutor, CancellationToken, PRIORITY_NORMAL
+from .scheduler import Scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,9 @@ class HoloceneCore:
     This class provides the core API that plugins interact with:
     - Database access
     - Channel messaging (pub/sub)
-    - Background task execution
+    - Background task execution (named priority pools)
+    - Job scheduling (cron/interval)
+    - Local capture workers (capture_pool)
     - Configuration access
     - LLM client access (future)
 
@@ -38,6 +42,10 @@ class HoloceneCore:
 
         # Background tasks
         core.run_in_background(expensive_task, callback=on_complete)
+        core.run_in_background(summarize, pool="llm", priority=PRIORITY_LOW)
+
+        # Scheduled jobs
+        core.scheduler.add_job('nightly', task, CronTrigger('0 3 * * *'))
     """
 
     def __init__(self, config: Optional[Config] = None, db: Optional[Database] = None):
@@ -55,18 +63,46 @@ class HoloceneCore:
             self.db = db
         else:
             db_path = self.config.data_dir / "holocene.db"
-            self.db = Database(db_path)
+            profiler_config = self.config.profiler
+            profiler = None
+            if profiler_config.enabled:
+                profiler = QueryProfiler(
+                    slow_query_ms=profiler_config.slow_query_ms,
+                    slow_log_size=profiler_config.slow_log_size,
+                    explain=profiler_config.explain_slow_queries,
+                )
+            self.db = Database(db_path, profiler=profiler)
 
         # Messaging system
         self.channels = ChannelManager()
 
-        # Background task executor
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="holocene-bg")
+        # Background task executor (tasks get child tokens of shutdown_token)
         self._shutdown_event = threading.Event()
+        self.shutdown_token = CancellationToken(event=self._shutdown_event)
+        executor_config = self.config.executor
+        self.executor = BackgroundExecutor(
+            pools={
+                "io": executor_config.io_workers,
+                "llm": executor_config.llm_workers,
+                "cpu": executor_config.cpu_workers,
+                "interactive": executor_config.interactive_workers,
+            },
+            shutdown_token=self.shutdown_token,
+            plugin_quota=executor_config.plugin_quota,
+            plugin_quotas=executor_config.plugin_quotas,
+        )
+
+        # Job scheduler (timer thread starts with the first job)
+        self.scheduler = Scheduler(self.run_in_background, db=self.db)
+
+        # Local capture workers (created on first use)
+        self._capture_pool = None
+        self._capture_pool_lock = threading.Lock()
 
         logger.info("HoloceneCore initialized")
 
-    def run_in_background(self, task, callback=None, error_handler=None):
+    def run_in_background(self, task, callback=None, error_handler=None,
+                          pool="io", priority=PRIORITY_NORMAL, owner=None, token=None):
         """Execute a task in the background.
 
         Non-blocking execution for expensive operations like LLM calls.
@@ -75,6 +111,10 @@ class HoloceneCore:
             task: Callable to execute
             callback: Optional callback on success, receives task result
             error_handler: Optional callback on error, receives exception
+            pool: "io", "llm", "cpu" (picklable tasks, run in a process) or "interactive"
+            priority: Lower runs first (PRIORITY_HIGH/NORMAL/LOW from core.executor)
+            owner: Plugin name, for per-plugin quotas and metrics
+            token: CancellationToken (default: cancelled on shutdown)
 
         Returns:
             Future object
@@ -92,30 +132,58 @@ class HoloceneCore:
                 callback=on_complete
             )
         """
-        def wrapper():
-            try:
-                result = task()
-                if callback:
-                    callback(result)
-                return result
-            except Exception as e:
-                logger.error(f"Background task failed: {e}", exc_info=True)
-                if error_handler:
-                    error_handler(e)
-                raise
-
-        future = self._executor.submit(wrapper)
-        return future
+        return self.executor.submit(
+            task,
+            pool=pool,
+            priority=priority,
+            owner=owner,
+            token=token,
+            callback=callback,
+            error_handler=error_handler,
+        )
+
+    @property
+    def capture_pool(self):
+        """Worker pool for local monolith/WARC captures (started on first use).
+
+        Captures hold a thread for minutes, so they run here rather than
+        on the run_in_background executor.
+        """
+        with self._capture_pool_lock:
+            if self._capture_pool is None:
+                from ..integrations.capture_process import ResourceLimits
+                from ..integrations.local_archive import LocalArchiveClient
+                from ..storage.capture_pool import CapturePool
+
+                integrations = self.config.integrations
+                limits = ResourceLimits(
+                    memory_mb=integrations.capture_memory_mb,
+                    cpu_seconds=integrations.capture_cpu_seconds,
+                )
+                self._capture_pool = CapturePool(
+                    self.db,
+                    LocalArchiveClient(limits=limits),
+                    max_workers=integrations.capture_workers,
+                )
+                self._capture_pool.start()
+            return self._capture_pool
 
     def shutdown(self):
         """Shutdown core and cleanup resources."""
         logger.info("Shutting down HoloceneCore...")
 
-        # Signal shutdown
-        self._shutdown_event.set()
+        # Signal shutdown (cancels queued and cooperative background tasks)
+        self.shutdown_token.cancel()
+
+        # Stop scheduling new runs
+        self.scheduler.shutdown()
+
+        # Kill running captures (link captures resume on next start)
+        if self._capture_pool is not None:
+            self._capture_pool.stop()
 
         # Shutdown executor
-        self._executor.shutdown(wait=True, cancel_futures=False)
+        self.executor.shutdown(wait=True)
 
         # Close database
         if self.db:
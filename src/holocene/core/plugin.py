@@ -13,6 +13,8 @@ import logging
 
 from .holocene_core import HoloceneCore
 from .channels import Message
+from .executor import PRIORITY_NORMAL
+from ..storage.profiler import query_caller
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,8 @@ class Plugin(ABC):
     - self.core.db: Database
     - self.core.channels: Channel messaging
     - self.core.config: Configuration
-    - self.core.run_in_background(): Background execution
+    - self.run_in_background(): Background execution on a named pool
+    - self.schedule(): Recurring jobs on the core scheduler
 
     Lifecycle:
     1. __init__() - Plugin created
@@ -33,16 +36,22 @@ class Plugin(ABC):
     4. [Plugin runs]
     5. on_disable() - Plugin deactivated (cleanup)
 
+    Metadata lives in a module-level PLUGIN_MANIFEST so the registry can
+    read it without importing the module (see plugin_registry).
+
     Example:
+        PLUGIN_MANIFEST = {
+            "name": "book_enricher",
+            "class": "BookEnricherPlugin",
+            "version": "1.0.0",
+            "description": "Enriches books with LLM summaries",
+            "runs_on": ["rei", "wmut"],  # Where plugin can run
+            "requires": [],
+        }
+
         class BookEnricherPlugin(Plugin):
             def get_metadata(self):
-                return {
-                    "name": "book_enricher",
-                    "version": "1.0.0",
-                    "description": "Enriches books with LLM summaries",
-                    "runs_on": ["rei", "wmut"],  # Where plugin can run
-                    "requires": []
-                }
+                return PLUGIN_MANIFEST
 
             def on_load(self):
                 print("Plugin loaded")
@@ -73,6 +82,7 @@ class Plugin(ABC):
         """
         self.core = core
         self._subscriptions = []  # Track subscriptions for cleanup
+        self._jobs = []  # Track scheduled jobs for cleanup
         self.enabled = False
 
         metadata = self.get_metadata()
@@ -89,6 +99,8 @@ class Plugin(ABC):
         - description: str - Short description
         - runs_on: List[str] - Where plugin runs ["rei", "wmut", "both"]
         - requires: List[str] - Plugin dependencies
+        - enabled_by: str or List[str] - Optional config paths; the plugin
+          is only imported if one of them is truthy
 
         Returns:
             Metadata dictionary
@@ -127,7 +139,7 @@ class Plugin(ABC):
         - Stopping background tasks
         - Saving state
 
-        Note: Channel subscriptions are automatically cleaned up.
+        Note: Channel subscriptions and scheduled jobs are automatically cleaned up.
         """
         pass
 
@@ -140,8 +152,13 @@ class Plugin(ABC):
             channel: Channel name
             callback: Callback function
         """
-        self.core.channels.subscribe(channel, callback)
-        self._subscriptions.append((channel, callback))
+        def attributed(message):
+            # Database time spent handling the message counts against this plugin
+            with query_caller(f"plugin:{self.name}"):
+                return callback(message)
+
+        self.core.channels.subscribe(channel, attributed)
+        self._subscriptions.append((channel, attributed))
         self.logger.debug(f"Subscribed to {channel}")
 
     def publish(self, channel: str, data: Any):
@@ -154,18 +171,43 @@ class Plugin(ABC):
         self.core.channels.publish(channel, data, sender=self.name)
         self.logger.debug(f"Published to {channel}")
 
-    def run_in_background(self, task, callback=None, error_handler=None):
-        """Execute task in background.
+    def run_in_background(self, task, callback=None, error_handler=None,
+                          pool="io", priority=PRIORITY_NORMAL):
+        """Execute task in background (counted against this plugin's quota).
 
         Args:
             task: Callable to execute
             callback: Optional success callback
             error_handler: Optional error callback
+            pool: Executor pool ("io", "llm", "cpu", "interactive")
+            priority: Lower runs first (PRIORITY_HIGH/NORMAL/LOW)
 
         Returns:
             Future object
         """
-        return self.core.run_in_background(task, callback, error_handler)
+        return self.core.run_in_background(
+            task, callback, error_handler, pool=pool, priority=priority, owner=self.name,
+        )
+
+    def schedule(self, name: str, func, trigger, **kwargs):
+        """Run func on a schedule (tracked for auto-cleanup).
+
+        Use instead of a thread with a sleep loop. Jobs run on the core's
+        background executor, owned by this plugin (so its quota applies);
+        see Scheduler.add_job for options (jitter, misfire_grace, persist,
+        pool, priority).
+
+        Args:
+            name: Job name, unique within the plugin
+            func: Callable to run
+            trigger: IntervalTrigger or CronTrigger
+
+        Returns:
+            Scheduled Job
+        """
+        job = self.core.scheduler.add_job(f"{self.name}.{name}", func, trigger, owner=self.name, **kwargs)
+        self._jobs.append(job.name)
+        return job
 
     def _cleanup_subscriptions(self):
         """Internal: Clean up channel subscriptions."""
@@ -174,6 +216,12 @@ class Plugin(ABC):
         self._subscriptions.clear()
         self.logger.debug("Cleaned up subscriptions")
 
+    def _cleanup_jobs(self):
+        """Internal: Remove scheduled jobs."""
+        for name in self._jobs:
+            self.core.scheduler.remove_job(name)
+        self._jobs.clear()
+
     def enable(self):
         """Enable the plugin."""
         if not self.enabled:
@@ -185,6 +233,7 @@ class Plugin(ABC):
         """Disable the plugin."""
         if self.enabled:
             self.logger.info(f"Disabling plugin: {self.name}")
+            self._cleanup_jobs()
             self.on_disable()
             self._cleanup_subscriptions()
             self.enabled = False
@@ -1,10 +1,34 @@
-"""Plugin registry for discovering and managing plugins."""
-
+"""Plugin registry for discovering and managing plugins.
+
+Plugins declare a static PLUGIN_MANIFEST at module level:
+
+    PLUGIN_MANIFEST = {
+        "name": "email_handler",
+        "class": "EmailHandlerPlugin",
+        "version": "1.0.0",
+        "description": "Email interface for Laney",
+        "runs_on": ["rei"],
+        "requires": [],
+        "enabled_by": "email.enabled",  # Optional config path(s), any truthy
+    }
+
+The registry reads manifests with `ast` instead of importing the module, so a
+plugin that doesn't run on this device (or is switched off in config) never
+pays for its imports. Modules without a manifest are still imported to find
+their Plugin subclasses. Third-party plugins register a "module:Class" entry
+point in the "holocene.plugins" group.
+"""
+
+import ast
 import logging
 import importlib
+import importlib.metadata
+import importlib.util
 import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 import sys
 
 from .plugin import Plugin
@@ -12,16 +36,43 @@ from .holocene_core import HoloceneCore
 
 logger = logging.getLogger(__name__)
 
+ENTRY_POINT_GROUP = "holocene.plugins"
+MANIFEST_NAME = "PLUGIN_MANIFEST"
+
+
+def read_manifest(plugin_file: Path) -> Optional[Dict[str, Any]]:
+    """Read a plugin module's PLUGIN_MANIFEST without importing it.
+
+    Args:
+        plugin_file: Path to plugin .py file
+
+    Returns:
+        The manifest dict, or None if the module doesn't declare one
+    """
+    tree = ast.parse(plugin_file.read_text(encoding="utf-8"), filename=str(plugin_file))
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == MANIFEST_NAME for t in targets):
+            return ast.literal_eval(node.value)
+    return None
+
 
 class PluginRegistry:
     """Manages plugin discovery, loading, and lifecycle.
 
     Features:
-    - Auto-discover plugins from holocene/plugins/ directory
+    - Discover plugins from holocene/plugins/ and "holocene.plugins" entry
+      points by manifest, importing only the ones that will run
     - Load/unload plugins
-    - Enable/disable plugins
+    - Enable/disable plugins (independent plugins are enabled concurrently)
     - Dependency resolution
-    - Device filtering (runs_on)
+    - Device filtering (runs_on) and config gating (enabled_by)
+    - Per-plugin startup timings (startup_timings, list_plugins())
 
     Example:
         core = HoloceneCore()
@@ -38,31 +89,42 @@ class PluginRegistry:
         registry.disable_all()
     """
 
-    def __init__(self, core: HoloceneCore, device: str = "wmut"):
+    def __init__(self, core: HoloceneCore, device: str = "wmut", max_workers: int = 4):
         """Initialize plugin registry.
 
         Args:
             core: HoloceneCore instance
             device: Current device identifier ("rei", "wmut", "eunice", etc.)
+            max_workers: Plugins enabled concurrently by enable_all()
         """
         self.core = core
         self.device = device
+        self.max_workers = max_workers
         self._plugins: Dict[str, Plugin] = {}  # name -> instance
-        self._plugin_classes: Dict[str, Type[Plugin]] = {}  # name -> class
+        self._manifests: Dict[str, Dict[str, Any]] = {}  # name -> manifest (discovered, not imported)
+        self._plugin_classes: Dict[str, Type[Plugin]] = {}  # name -> class (once imported)
         self._load_order: List[str] = []  # For dependency resolution
+        self.startup_timings: Dict[str, Dict[str, float]] = {}  # name -> {import_ms, load_ms, enable_ms}
 
     def discover_plugins(self, plugin_dir: Optional[Path] = None):
-        """Discover plugins from directory.
+        """Discover plugins from directory (and entry points, by default).
 
         Args:
-            plugin_dir: Directory to scan (defaults to holocene/plugins/)
+            plugin_dir: Directory to scan (defaults to holocene/plugins/,
+                plus plugins installed under the "holocene.plugins" entry point group)
         """
         if plugin_dir is None:
             # Default to holocene/plugins/
             import holocene
             holocene_dir = Path(holocene.__file__).parent
-            plugin_dir = holocene_dir / "plugins"
+            self._discover_directory(holocene_dir / "plugins")
+            self._discover_entry_points()
+        else:
+            self._discover_directory(plugin_dir)
+
+        logger.info(f"Discovered {len(self._manifests)} plugin(s)")
 
+    def _discover_directory(self, plugin_dir: Path):
         if not plugin_dir.exists():
             logger.warning(f"Plugin directory doesn't exist: {plugin_dir}")
             return
@@ -70,50 +132,126 @@ class PluginRegistry:
         logger.info(f"Discovering plugins in: {plugin_dir}")
 
         # Find all Python files in plugins directory
-        plugin_files = list(plugin_dir.glob("*.py"))
+        plugin_files = sorted(plugin_dir.glob("*.py"))
         plugin_files = [f for f in plugin_files if f.name != "__init__.py"]
 
         for plugin_file in plugin_files:
             try:
-                self._load_plugin_file(plugin_file)
+                manifest = read_manifest(plugin_file)
+                if manifest is None:
+                    self._load_plugin_file(plugin_file)
+                else:
+                    self._add_manifest(manifest, f"holocene.plugins.{plugin_file.stem}", plugin_file)
             except Exception as e:
                 logger.error(f"Failed to load plugin from {plugin_file}: {e}", exc_info=True)
 
-        logger.info(f"Discovered {len(self._plugin_classes)} plugin(s)")
+    def _discover_entry_points(self):
+        """Discover installed plugins registered as "module:Class" entry points."""
+        for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                module_name, _, class_name = entry_point.value.partition(":")
+                spec = importlib.util.find_spec(module_name)
+                manifest = read_manifest(Path(spec.origin)) if spec and spec.origin else None
+                if manifest is None:
+                    logger.error(f"Plugin entry point {entry_point.name} has no {MANIFEST_NAME}")
+                    continue
+                manifest.setdefault("class", class_name)
+                self._add_manifest(manifest, module_name)
+            except Exception as e:
+                logger.error(f"Failed to read plugin entry point {entry_point.name}: {e}", exc_info=True)
+
+    def _add_manifest(self, manifest: Dict[str, Any], module_name: str, path: Optional[Path] = None):
+        """Register a discovered plugin if it runs on this device and is enabled in config."""
+        plugin_name = manifest["name"]
+        source = path.name if path else module_name
+
+        if not self._runs_here(manifest):
+            logger.debug(f"Skipping plugin {plugin_name} (runs_on: {manifest.get('runs_on')}, device: {self.device})")
+            return
+        if not self._enabled_in_config(manifest):
+            logger.info(f"Skipping plugin {plugin_name} (not enabled in config: {manifest['enabled_by']})")
+            return
+
+        self._manifests[plugin_name] = {**manifest, "module": module_name, "path": path}
+        logger.info(f"Found plugin: {plugin_name} (from {source})")
+
+    def _runs_here(self, metadata: Dict[str, Any]) -> bool:
+        runs_on = metadata.get('runs_on', ['both'])
+        return 'both' in runs_on or self.device in runs_on
+
+    def _enabled_in_config(self, manifest: Dict[str, Any]) -> bool:
+        """True if the manifest has no enabled_by, or any of its config paths is truthy."""
+        paths = manifest.get("enabled_by")
+        if not paths:
+            return True
+        if isinstance(paths, str):
+            paths = [paths]
+
+        for config_path in paths:
+            value = getattr(self.core, "config", None)
+            for part in config_path.split("."):
+                value = getattr(value, part, None)
+            if value:
+                return True
+        return False
 
     def _load_plugin_file(self, plugin_file: Path):
-        """Load plugin classes from a Python file.
+        """Load plugin classes from a Python file without a manifest.
 
         Args:
             plugin_file: Path to plugin .py file
         """
-        module_name = f"holocene.plugins.{plugin_file.stem}"
-
-        # Import module
-        spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
+        module = self._import_module(f"holocene.plugins.{plugin_file.stem}", plugin_file)
+
+        # Find Plugin subclasses
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, Plugin) and obj != Plugin:
+                # Create instance to get metadata
+                instance = obj(self.core)
+                metadata = instance.get_metadata()
+                plugin_name = metadata.get('name', name)
+
+                # Check if plugin can run on this device
+                if self._runs_here(metadata):
+                    self._manifests[plugin_name] = {**metadata, "name": plugin_name, "class": name,
+                                                    "module": module.__name__, "path": plugin_file}
+                    self._plugin_classes[plugin_name] = obj
+                    logger.info(f"Found plugin: {plugin_name} (from {plugin_file.name})")
+                else:
+                    logger.debug(f"Skipping plugin {plugin_name} (runs_on: {metadata.get('runs_on')}, device: {self.device})")
+
+    def _import_module(self, module_name: str, path: Optional[Path] = None):
+        if path is None:
+            return importlib.import_module(module_name)
+
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
             spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return module
 
-            # Find Plugin subclasses
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, Plugin) and obj != Plugin:
-                    # Create instance to get metadata
-                    instance = obj(self.core)
-                    metadata = instance.get_metadata()
-                    plugin_name = metadata.get('name', name)
-
-                    # Check if plugin can run on this device
-                    runs_on = metadata.get('runs_on', ['both'])
-                    if 'both' in runs_on or self.device in runs_on:
-                        self._plugin_classes[plugin_name] = obj
-                        logger.info(f"Found plugin: {plugin_name} (from {plugin_file.name})")
-                    else:
-                        logger.debug(f"Skipping plugin {plugin_name} (runs_on: {runs_on}, device: {self.device})")
+    def _import_plugin_class(self, plugin_name: str) -> Type[Plugin]:
+        """Import a discovered plugin's module (first use only) and return its class."""
+        if plugin_name not in self._plugin_classes:
+            manifest = self._manifests[plugin_name]
+            start = time.perf_counter()
+            module = self._import_module(manifest["module"], manifest["path"])
+            plugin_class = getattr(module, manifest["class"])
+            if not (inspect.isclass(plugin_class) and issubclass(plugin_class, Plugin)):
+                raise TypeError(f"{manifest['module']}.{manifest['class']} is not a Plugin subclass")
+            self._plugin_classes[plugin_name] = plugin_class
+            self._timing(plugin_name)["import_ms"] = (time.perf_counter() - start) * 1000
+        return self._plugin_classes[plugin_name]
+
+    def _timing(self, plugin_name: str) -> Dict[str, float]:
+        return self.startup_timings.setdefault(plugin_name, {})
 
     def load_plugin(self, plugin_name: str) -> bool:
-        """Load a plugin by name.
+        """Load a plugin by name, importing its module if needed.
 
         Args:
             plugin_name: Plugin name
@@ -125,25 +263,25 @@ class PluginRegistry:
             logger.warning(f"Plugin already loaded: {plugin_name}")
             return True
 
-        if plugin_name not in self._plugin_classes:
+        if plugin_name not in self._manifests:
             logger.error(f"Plugin not found: {plugin_name}")
             return False
 
-        try:
-            plugin_class = self._plugin_classes[plugin_name]
-            instance = plugin_class(self.core)
+        # Check dependencies
+        for dep in self._manifests[plugin_name].get('requires', []):
+            if dep not in self._plugins:
+                logger.error(f"Plugin {plugin_name} requires {dep}, but it's not loaded")
+                return False
 
-            # Check dependencies
-            metadata = instance.get_metadata()
-            requires = metadata.get('requires', [])
+        try:
+            plugin_class = self._import_plugin_class(plugin_name)
 
-            for dep in requires:
-                if dep not in self._plugins:
-                    logger.error(f"Plugin {plugin_name} requires {dep}, but it's not loaded")
-                    return False
+            start = time.perf_counter()
+            instance = plugin_class(self.core)
 
             # Call on_load()
             instance.on_load()
+            self._timing(plugin_name)["load_ms"] = (time.perf_counter() - start) * 1000
 
             self._plugins[plugin_name] = instance
             self._load_order.append(plugin_name)
@@ -156,9 +294,20 @@ class PluginRegistry:
             return False
 
     def load_all(self):
-        """Load all discovered plugins."""
-        for plugin_name in self._plugin_classes.keys():
-            self.load_plugin(plugin_name)
+        """Load all discovered plugins, dependencies first."""
+        remaining = list(self._manifests)
+        while remaining:
+            ready = [
+                name for name in remaining
+                if all(dep in self._plugins or dep not in remaining
+                       for dep in self._manifests[name].get('requires', []))
+            ]
+            if not ready:
+                logger.error(f"Plugin dependency cycle, not loading: {', '.join(remaining)}")
+                return
+            for plugin_name in ready:
+                remaining.remove(plugin_name)
+                self.load_plugin(plugin_name)
 
     def enable_plugin(self, plugin_name: str) -> bool:
         """Enable a plugin.
@@ -210,9 +359,56 @@ class PluginRegistry:
             return False
 
     def enable_all(self):
-        """Enable all loaded plugins."""
-        for plugin_name in self._load_order:
-            self.enable_plugin(plugin_name)
+        """Enable all loaded plugins.
+
+        Plugins whose dependencies are enabled start concurrently, so one
+        slow on_enable() (IMAP login, Telegram handshake) doesn't hold up the
+        rest. A plugin whose dependency failed to enable is skipped.
+        """
+        start = time.perf_counter()
+        pending = [name for name in self._load_order if not self._plugins[name].enabled]
+        enabled = {name for name in self._load_order if self._plugins[name].enabled}
+        failed = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="plugin-enable") as pool:
+            running = {}
+
+            def submit_ready():
+                for plugin_name in list(pending):
+                    requires = self._manifests[plugin_name].get('requires', [])
+                    blocked = [dep for dep in requires if dep in failed or dep not in self._plugins]
+                    if blocked:
+                        logger.error(f"Not enabling plugin {plugin_name}: dependency not enabled ({', '.join(blocked)})")
+                        pending.remove(plugin_name)
+                        failed.add(plugin_name)
+                    elif all(dep in enabled for dep in requires):
+                        pending.remove(plugin_name)
+                        running[pool.submit(self._enable_timed, plugin_name)] = plugin_name
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    plugin_name = running.pop(future)
+                    (enabled if future.result() else failed).add(plugin_name)
+                submit_ready()
+
+        if pending:
+            logger.error(f"Plugin dependency cycle, not enabling: {', '.join(pending)}")
+
+        enable_ms = {name: timing["enable_ms"] for name, timing in self.startup_timings.items()
+                     if "enable_ms" in timing}
+        slowest = ", ".join(f"{name} {ms:.0f}ms" for name, ms in
+                            sorted(enable_ms.items(), key=lambda item: -item[1])[:3])
+        logger.info(f"Enabled {len(enabled)} plugin(s) in {(time.perf_counter() - start) * 1000:.0f}ms"
+                    f" (slowest: {slowest or 'none'})")
+
+    def _enable_timed(self, plugin_name: str) -> bool:
+        start = time.perf_counter()
+        try:
+            return self.enable_plugin(plugin_name)
+        finally:
+            self._timing(plugin_name)["enable_ms"] = (time.perf_counter() - start) * 1000
 
     def disable_all(self):
         """Disable all plugins."""
@@ -247,6 +443,7 @@ class PluginRegistry:
                 'version': metadata.get('version', 'unknown'),
                 'description': metadata.get('description', ''),
                 'runs_on': metadata.get('runs_on', []),
+                'startup_ms': {key: round(ms, 1) for key, ms in self.startup_timings.get(plugin_name, {}).items()},
             })
         return result
 
@@ -255,5 +452,6 @@ class PluginRegistry:
         logger.info("Shutting down plugin registry...")
         self.disable_all()
         self._plugins.clear()
+        self._manifests.clear()
         self._plugin_classes.clear()
         self._load_order.clear()
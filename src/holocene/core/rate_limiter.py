@@ -3,16 +3,63 @@ Rate limiting for HTTP requests using token bucket algorithm.
 
 Provides thread-safe rate limiting with per-domain limits to prevent
 overwhelming servers and avoid IP bans.
+
+Buckets hand out reservations: a caller asks for a token and gets back
+the earliest time it may start, so the limiter itself never sleeps while
+holding a lock. Blocking (``wait_for_token``) and asyncio
+(``await acquire``) waits are both built on top of ``reserve``.
 """
 
+import asyncio
 import logging
 import threading
 import time
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
 from urllib.parse import urlparse
 
 logger = logging.getLogger("holocene.rate_limiter")
 
+# HTTP status codes that mean "slow down"
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value - either delay-seconds ("120") or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or unparseable
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    if not isinstance(value, str):
+        return None
+
+    value = value.strip()
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
 class TokenBucket:
     """
@@ -21,6 +68,9 @@ class TokenBucket:
     Allows bursts up to bucket capacity while maintaining average rate.
     Based on the token bucket algorithm - tokens are added at a fixed rate,
     and requests consume tokens. If no tokens available, request waits.
+
+    Reservations may drive the token count negative; the deficit is the
+    queue of callers already promised a future start time.
     """
 
     def __init__(self, rate: float, capacity: Optional[float] = None):
@@ -36,8 +86,38 @@ class TokenBucket:
         self.capacity = capacity if capacity is not None else rate
         self.tokens = self.capacity
         self.last_update = time.monotonic()
+        self.blocked_until = 0.0  # Monotonic time before which nothing may start
         self.lock = threading.Lock()
 
+    def _refill(self, now: float) -> None:
+        """Add tokens for time elapsed since last update (caller holds lock)."""
+        if now <= self.last_update:
+            return  # Still inside a Retry-After block
+        elapsed = now - self.last_update
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.last_update = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens without blocking.
+
+        Args:
+            tokens: Number of tokens to reserve (default 1.0 = one request)
+
+        Returns:
+            float: Monotonic time at which the caller may start. Equal to
+                   the current time when tokens are immediately available.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+
+            start = now
+            if self.tokens < 0:
+                start = max(now, self.last_update) + (-self.tokens) / self.rate
+            return max(start, self.blocked_until)
+
     def consume(self, tokens: float = 1.0, block: bool = True) -> bool:
         """
         Consume tokens from the bucket.
@@ -49,37 +129,49 @@ class TokenBucket:
         Returns:
             bool: True if tokens were consumed, False if not available (only when block=False)
         """
-        with self.lock:
-            # Refill tokens based on elapsed time
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_update = now
-
-            # Check if we have enough tokens
-            if self.tokens >= tokens:
+        if not block:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until or self.tokens < tokens:
+                    return False
                 self.tokens -= tokens
                 return True
 
-            if not block:
-                return False
+        wait_time = self.reserve(tokens) - time.monotonic()
+        if wait_time > 0:
+            # Sleep outside the lock so other threads can reserve meanwhile
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+            time.sleep(wait_time)
+        return True
 
-            # Calculate wait time
-            deficit = tokens - self.tokens
-            wait_time = deficit / self.rate
+    def set_rate(self, rate: float) -> None:
+        """
+        Change the refill rate, crediting tokens earned at the old rate first.
 
-        # Wait outside the lock so other threads can proceed
-        logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
-        time.sleep(wait_time)
+        Args:
+            rate: New tokens per second
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = rate
 
-        # Try again after waiting
+    def block_for(self, seconds: float) -> None:
+        """
+        Refuse to start any request for the given number of seconds.
+
+        Used for Retry-After responses. Tokens earned meanwhile are dropped
+        so the bucket does not burst as soon as the block lifts.
+
+        Args:
+            seconds: How long to block
+        """
         with self.lock:
             now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            self.tokens -= tokens
-            return True
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            self.last_update = max(self.last_update, self.blocked_until)
 
 
 class DomainRateLimiter:
@@ -89,9 +181,24 @@ class DomainRateLimiter:
     Maintains separate token buckets for each domain, allowing
     different rate limits for different APIs (e.g., slower for
     heavily rate-limited APIs, faster for generous ones).
+
+    Bucket tables are LRU-bounded by ``max_domains``, so long-running
+    processes that touch thousands of hosts (link checker, archivers)
+    don't keep a bucket per host forever. Rates adapt per domain:
+    ``record_response`` halves a domain's rate on 429/503 (honouring
+    Retry-After) and recovers it additively on successful responses.
     """
 
-    def __init__(self, default_rate: float = 1.0, domain_rates: Optional[dict] = None):
+    BACKOFF_FACTOR = 0.5  # Multiply rate by this on 429/503
+    RECOVERY_STEP = 0.1  # Fraction of base rate regained per successful response
+    MIN_RATE_FRACTION = 1 / 16  # Never back off below this fraction of base rate
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        domain_rates: Optional[dict] = None,
+        max_domains: int = 1024,
+    ):
         """
         Initialize domain rate limiter.
 
@@ -99,20 +206,85 @@ class DomainRateLimiter:
             default_rate: Default requests per second for all domains
             domain_rates: Dict mapping domain names to custom rates
                          (e.g., {'api.crossref.org': 0.5, 'archive.org': 0.2})
+            max_domains: Maximum number of domain buckets kept; the least
+                         recently used domain is evicted beyond this
         """
         self.default_rate = default_rate
         self.domain_rates = domain_rates or {}
-        self.buckets = {}
+        self.max_domains = max_domains
+        self.buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self.stats: Dict[str, Dict] = {}
         self.lock = threading.Lock()
 
+    @staticmethod
+    def _get_domain(url: str) -> str:
+        """Extract domain from URL (URLs without scheme are treated as https)."""
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+        return urlparse(url).netloc
+
+    def _base_rate(self, domain: str) -> float:
+        """Configured (non-adapted) rate for a domain."""
+        return self.domain_rates.get(domain, self.default_rate)
+
     def _get_bucket(self, domain: str) -> TokenBucket:
         """Get or create token bucket for a domain."""
         with self.lock:
-            if domain not in self.buckets:
-                rate = self.domain_rates.get(domain, self.default_rate)
-                self.buckets[domain] = TokenBucket(rate)
-                logger.debug(f"Created rate limiter for {domain}: {rate} req/s")
-            return self.buckets[domain]
+            bucket = self.buckets.get(domain)
+            if bucket is not None:
+                self.buckets.move_to_end(domain)
+                return bucket
+
+            rate = self._base_rate(domain)
+            bucket = TokenBucket(rate)
+            self.buckets[domain] = bucket
+            self.stats[domain] = {
+                "requests": 0,
+                "delayed": 0,
+                "total_wait": 0.0,
+                "max_wait": 0.0,
+                "throttled": 0,
+            }
+            logger.debug(f"Created rate limiter for {domain}: {rate} req/s")
+
+            while len(self.buckets) > self.max_domains:
+                evicted, _ = self.buckets.popitem(last=False)
+                self.stats.pop(evicted, None)
+                logger.debug(f"Evicted idle rate limiter for {evicted}")
+
+            return bucket
+
+    def _record_wait(self, domain: str, wait: float) -> None:
+        """Update wait-time metrics for a domain."""
+        with self.lock:
+            stats = self.stats.get(domain)
+            if stats is None:
+                return
+            stats["requests"] += 1
+            if wait > 0:
+                stats["delayed"] += 1
+                stats["total_wait"] += wait
+                stats["max_wait"] = max(stats["max_wait"], wait)
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve a request slot without blocking.
+
+        Args:
+            url: Full URL to make request to
+
+        Returns:
+            float: Monotonic time (``time.monotonic()`` clock) at which the
+                   request may start
+        """
+        domain = self._get_domain(url)
+        if not domain:
+            logger.warning(f"Could not extract domain from URL: {url}")
+            return time.monotonic()
+
+        start = self._get_bucket(domain).reserve(1.0)
+        self._record_wait(domain, start - time.monotonic())
+        return start
 
     def wait_for_token(self, url: str) -> None:
         """
@@ -121,17 +293,21 @@ class DomainRateLimiter:
         Args:
             url: Full URL to make request to
         """
-        # Handle URLs without scheme by adding https://
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+        wait_time = self.reserve(url) - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
 
-        domain = urlparse(url).netloc
-        if not domain:
-            logger.warning(f"Could not extract domain from URL: {url}")
-            return
+    async def acquire(self, url: str) -> None:
+        """
+        Asyncio equivalent of wait_for_token - yields to the event loop
+        instead of blocking a thread.
 
-        bucket = self._get_bucket(domain)
-        bucket.consume(tokens=1.0, block=True)
+        Args:
+            url: Full URL to make request to
+        """
+        wait_time = self.reserve(url) - time.monotonic()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
     def can_proceed(self, url: str) -> bool:
         """
@@ -143,20 +319,76 @@ class DomainRateLimiter:
         Returns:
             bool: True if request can proceed immediately
         """
-        # Handle URLs without scheme
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-
-        domain = urlparse(url).netloc
+        domain = self._get_domain(url)
         if not domain:
             return True
 
         bucket = self._get_bucket(domain)
         return bucket.consume(tokens=1.0, block=False)
 
+    def record_response(self, url: str, status_code: int, retry_after=None) -> None:
+        """
+        Adapt a domain's rate to the server's response.
+
+        429/503 halves the domain's rate (down to a floor) and, when a
+        Retry-After header is given, blocks the domain for that long.
+        Any other response nudges the rate back toward its configured value.
+
+        Args:
+            url: URL the request was made to
+            status_code: HTTP status code of the response
+            retry_after: Raw Retry-After header value, if any
+        """
+        domain = self._get_domain(url)
+        if not domain:
+            return
+
+        bucket = self._get_bucket(domain)
+        base_rate = self._base_rate(domain)
+
+        if status_code in THROTTLE_STATUS_CODES:
+            new_rate = max(base_rate * self.MIN_RATE_FRACTION, bucket.rate * self.BACKOFF_FACTOR)
+            bucket.set_rate(new_rate)
+
+            delay = parse_retry_after(retry_after)
+            if delay:
+                bucket.block_for(delay)
+
+            with self.lock:
+                if domain in self.stats:
+                    self.stats[domain]["throttled"] += 1
+
+            logger.info(
+                f"{domain} returned {status_code}, backing off to {new_rate:.3f} req/s"
+                + (f" (retry after {delay:.0f}s)" if delay else "")
+            )
+        elif bucket.rate < base_rate:
+            bucket.set_rate(min(base_rate, bucket.rate + base_rate * self.RECOVERY_STEP))
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Get per-domain rate and wait-time metrics.
+
+        Returns:
+            Dict mapping domain to stats: requests, delayed, total_wait,
+            max_wait, avg_wait (seconds), throttled, rate and base_rate
+        """
+        with self.lock:
+            result = {}
+            for domain, stats in self.stats.items():
+                bucket = self.buckets.get(domain)
+                result[domain] = {
+                    **stats,
+                    "avg_wait": stats["total_wait"] / stats["requests"] if stats["requests"] else 0.0,
+                    "rate": bucket.rate if bucket else None,
+                    "base_rate": self._base_rate(domain),
+                }
+            return result
+
 
 # Global rate limiter instance (initialized from config)
 _global_limiter: Optional[DomainRateLimiter] = None
+_global_lock = threading.Lock()
 
 
 def set_global_limiter(limiter: Optional[DomainRateLimiter]) -> None:
@@ -174,6 +406,30 @@ def get_global_limiter() -> Optional[DomainRateLimiter]:
     return _global_limiter
 
 
+def ensure_global_limiter(
+    default_rate: float = 1.0, domain_rates: Optional[dict] = None
+) -> DomainRateLimiter:
+    """
+    Get the global rate limiter, installing one if none is set.
+
+    Long-running processes (holod) call this at startup so every client
+    shares one set of per-domain buckets instead of each keeping its own.
+
+    Args:
+        default_rate: Default requests per second if a limiter is created
+        domain_rates: Per-domain rates if a limiter is created
+
+    Returns:
+        The global DomainRateLimiter
+    """
+    with _global_lock:
+        if _global_limiter is None:
+            set_global_limiter(
+                DomainRateLimiter(default_rate=default_rate, domain_rates=domain_rates)
+            )
+        return _global_limiter
+
+
 def wait_for_request(url: str) -> None:
     """
     Wait until a request can proceed according to global rate limiter.
@@ -186,3 +442,17 @@ def wait_for_request(url: str) -> None:
     limiter = get_global_limiter()
     if limiter:
         limiter.wait_for_token(url)
+
+
+def record_response(url: str, status_code: int, retry_after=None) -> None:
+    """
+    Report a response to the global rate limiter (if set) for adaptive backoff.
+
+    Args:
+        url: URL the request was made to
+        status_code: HTTP status code
+        retry_after: Raw Retry-After header value, if any
+    """
+    limiter = get_global_limiter()
+    if limiter:
+        limiter.record_response(url, status_code, retry_after)
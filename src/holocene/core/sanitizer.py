@@ -1,10 +1,84 @@
-"""Privacy sanitization layer for Holocene."""
+"""Privacy sanitization layer for Holocene.
 
+All blacklists are compiled once when the sanitizer is created:
+
+- Keywords: one case-insensitive alternation regex (longest first), so each
+  text is scanned once however many keywords there are
+- Domains: plain and "*.suffix" patterns go into a reversed-label trie;
+  anything fancier falls back to one combined fnmatch regex
+- Paths: one prefix/substring regex plus one combined fnmatch regex
+"""
+
+import os
 import re
-from typing import List
-from fnmatch import fnmatch
+from fnmatch import translate
+from typing import Dict, Iterable, List, Optional, Pattern
 from .models import Activity
 
+REDACTED = "[REDACTED]"
+
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_WILDCARD_CHARS = set("*?[")
+
+
+def _any_of(parts: List[str], flags: int = 0) -> Optional[Pattern]:
+    """Combine regex fragments into one alternation, or None if empty."""
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{part})" for part in parts), flags)
+
+
+class DomainMatcher:
+    """Matches domains against fnmatch-style patterns in one walk.
+
+    "example.com" and "*.example.com" patterns are stored in a trie keyed by
+    reversed labels (com -> example); other wildcard patterns are combined
+    into a single regex.
+    """
+
+    _EXACT = "$"  # Trie node key: pattern ends here
+    _ANY = "*"    # Trie node key: "*." pattern - any deeper label matches
+
+    def __init__(self, patterns: Iterable[str]):
+        self._trie: Dict = {}
+        fallback = []
+
+        for pattern in patterns:
+            pattern = pattern.lower().strip()
+            if not pattern:
+                continue
+            labels = pattern.split(".")
+            wildcard = labels[0] == "*" and len(labels) > 1
+            if wildcard:
+                labels = labels[1:]
+            if any(_WILDCARD_CHARS & set(label) for label in labels):
+                fallback.append(translate(pattern))
+                continue
+
+            node = self._trie
+            for label in reversed(labels):
+                node = node.setdefault(label, {})
+            node[self._ANY if wildcard else self._EXACT] = True
+
+        self._fallback = _any_of(fallback)
+
+    def matches(self, domain: str) -> bool:
+        """Check an already lowercased, stripped domain."""
+        node = self._trie
+        labels = domain.split(".")
+        for depth, label in enumerate(reversed(labels)):
+            node = node.get(label)
+            if node is None:
+                break
+            # "*" in fnmatch also matches dots, so "*.b.com" covers a.x.b.com
+            if self._ANY in node and depth < len(labels) - 1:
+                return True
+        else:
+            if self._EXACT in node:
+                return True
+
+        return bool(self._fallback and self._fallback.match(domain))
+
 
 class PrivacySanitizer:
     """Sanitizes activities to protect privacy."""
@@ -30,6 +104,29 @@ class PrivacySanitizer:
         self.blacklist_paths = blacklist_paths or []
         self.whitelist_domains = whitelist_domains or []
 
+        self._whitelist = DomainMatcher(self.whitelist_domains)
+        self._blacklist = DomainMatcher(self.blacklist_domains)
+
+        # Longest first so "top secret" wins over "secret" in the alternation
+        keywords = sorted({kw for kw in self.blacklist_keywords if kw}, key=len, reverse=True)
+        self._keyword_re = _any_of([re.escape(kw) for kw in keywords], re.IGNORECASE)
+
+        paths = [p for p in self.blacklist_paths if p]
+        # Literal paths: searched in descriptions, prefix-matched in should_block_path
+        self._path_re = _any_of([re.escape(p) for p in paths])
+        # Glob paths, with the same case rules as fnmatch
+        self._path_glob_re = _any_of([translate(os.path.normcase(p)) for p in paths])
+
+    @classmethod
+    def from_config(cls, config) -> 'PrivacySanitizer':
+        """Create sanitizer from the privacy section of a Holocene config."""
+        return cls(
+            blacklist_domains=config.privacy.blacklist_domains,
+            blacklist_keywords=config.privacy.blacklist_keywords,
+            blacklist_paths=config.privacy.blacklist_paths,
+            whitelist_domains=config.privacy.whitelist_domains,
+        )
+
     def should_block_domain(self, domain: str) -> bool:
         """Check if a domain should be blocked."""
         if not domain:
@@ -37,17 +134,11 @@ class PrivacySanitizer:
 
         domain = domain.lower().strip()
 
-        # Check whitelist first (whitelist overrides blacklist)
-        for pattern in self.whitelist_domains:
-            if fnmatch(domain, pattern.lower()):
-                return False
-
-        # Check blacklist
-        for pattern in self.blacklist_domains:
-            if fnmatch(domain, pattern.lower()):
-                return True
+        # Whitelist overrides blacklist
+        if self._whitelist.matches(domain):
+            return False
 
-        return False
+        return self._blacklist.matches(domain)
 
     def should_block_path(self, path: str) -> bool:
         """Check if a file path should be blocked."""
@@ -56,25 +147,25 @@ class PrivacySanitizer:
 
         path = path.strip()
 
-        for pattern in self.blacklist_paths:
-            # Support wildcards and direct path matching
-            if fnmatch(path, pattern) or path.startswith(pattern):
-                return True
-
-        return False
+        # Support wildcards and direct path matching
+        if self._path_re and self._path_re.match(path):
+            return True
+        return bool(self._path_glob_re and self._path_glob_re.match(os.path.normcase(path)))
 
     def redact_keywords(self, text: str) -> str:
         """Redact blacklisted keywords from text."""
-        if not text:
+        if not text or not self._keyword_re:
             return text
 
-        result = text
-        for keyword in self.blacklist_keywords:
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-            result = pattern.sub("[REDACTED]", result)
+        return self._keyword_re.sub(REDACTED, text)
+
+    def contains_keyword(self, text: str) -> bool:
+        """Check if text contains any blacklisted keyword (case-insensitive)."""
+        return bool(text and self._keyword_re and self._keyword_re.search(text))
 
-        return result
+    def mentions_blocked_path(self, text: str) -> bool:
+        """Check if text references any blacklisted path."""
+        return bool(text and self._path_re and self._path_re.search(text))
 
     def sanitize_activity(self, activity: Activity) -> Activity:
         """
@@ -83,41 +174,35 @@ class PrivacySanitizer:
         Returns a copy of the activity with sensitive data removed/redacted.
         If the activity should be completely blocked, returns None.
         """
+        # Block entire activity if it references sensitive paths or domains
+        if self.mentions_blocked_path(activity.description):
+            return None
+        if "domain" in activity.metadata and self.should_block_domain(activity.metadata["domain"]):
+            return None
+
         # Create a copy to avoid modifying the original
         sanitized = activity.model_copy(deep=True)
 
-        # Check if description contains blocked paths
-        for path in self.blacklist_paths:
-            if path in sanitized.description:
-                # Block entire activity if it references sensitive paths
-                return None
-
-        # Redact keywords from description
-        sanitized.description = self.redact_keywords(sanitized.description)
+        # Redact keywords, then remove URLs (basic privacy measure)
+        sanitized.description = self._strip_urls(self.redact_keywords(sanitized.description))
 
-        # Remove URLs from description (basic privacy measure)
-        sanitized.description = self._strip_urls(sanitized.description)
+        # Drop tags containing keywords
+        sanitized.tags = [tag for tag in sanitized.tags if not self.contains_keyword(tag)]
 
-        # Redact keywords from tags
-        sanitized.tags = [
-            self.redact_keywords(tag) for tag in sanitized.tags
-            if not any(kw.lower() in tag.lower() for kw in self.blacklist_keywords)
-        ]
+        return sanitized
 
-        # Check metadata for sensitive domains (if source is browser/window)
-        if "domain" in sanitized.metadata:
-            domain = sanitized.metadata["domain"]
-            if self.should_block_domain(domain):
-                # Block entire activity
-                return None
+    def sanitize_activities(self, activities: Iterable[Activity]) -> List[Activity]:
+        """
+        Sanitize many activities in one pass.
 
-        return sanitized
+        Returns sanitized copies in order, leaving out blocked activities.
+        """
+        sanitized = (self.sanitize_activity(activity) for activity in activities)
+        return [activity for activity in sanitized if activity is not None]
 
     def _strip_urls(self, text: str) -> str:
         """Remove URLs from text (basic implementation)."""
-        # Match http/https URLs
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        return re.sub(url_pattern, "[URL]", text)
+        return _URL_RE.sub("[URL]", text)
 
     def is_safe_for_external_api(self, activity: Activity) -> bool:
         """
@@ -131,16 +216,10 @@ class PrivacySanitizer:
                 return False
 
         # Check for blocked keywords
-        for keyword in self.blacklist_keywords:
-            if keyword.lower() in activity.description.lower():
-                return False
-
-            if any(keyword.lower() in tag.lower() for tag in activity.tags):
-                return False
+        if self.contains_keyword(activity.description):
+            return False
+        if any(self.contains_keyword(tag) for tag in activity.tags):
+            return False
 
         # Check for blocked paths
-        for path in self.blacklist_paths:
-            if path in activity.description:
-                return False
-
-        return True
+        return not self.mentions_blocked_path(activity.description)
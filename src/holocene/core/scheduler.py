@@ -0,0 +1,360 @@
+"""Central job scheduler for holod.
+
+Plugins register jobs instead of running their own sleep loops:
+
+    self.schedule("digest", self._send_daily_digest, CronTrigger("0 8 * * *"),
+                  misfire_grace=4 * 3600)
+    self.schedule("check", self._run_batch_check, IntervalTrigger(3600, initial_delay=30),
+                  priority=PRIORITY_LOW)
+
+One timer thread keeps the jobs in a heap ordered by due time and sleeps
+until the earliest one; due jobs are dispatched onto the core's background
+executor, on the job's pool and priority and owned by the plugin that
+scheduled it (so plugin quotas and metrics apply). Last-run times are persisted (scheduler_jobs table) so that after
+a daemon restart interval jobs keep their cadence and missed cron runs are
+caught up once, within each job's misfire grace.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, List, Optional, Set
+
+from ..storage.profiler import query_caller
+from .executor import PRIORITY_NORMAL
+
+logger = logging.getLogger(__name__)
+
+# Re-check the wall clock at least this often (suspend/resume, clock changes)
+MAX_SLEEP_SECONDS = 300
+
+
+class IntervalTrigger:
+    """Fires every `seconds`; the first run waits `initial_delay` seconds."""
+
+    def __init__(self, seconds: float, initial_delay: float = 0):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+        self.initial_delay = initial_delay
+
+    def first_fire(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.initial_delay)
+
+    def next_fire(self, after: datetime) -> datetime:
+        return after + timedelta(seconds=self.seconds)
+
+    def __repr__(self):
+        return f"IntervalTrigger({self.seconds}s)"
+
+
+class CronTrigger:
+    """Fires on a 5-field cron expression: minute hour day-of-month month day-of-week.
+
+    Fields accept *, lists (1,15), ranges (1-5) and steps (*/10, 8-18/2).
+    Day-of-week is 0-6 with Sunday as 0 (7 also means Sunday). As in cron,
+    when both day fields are restricted a day matching either one fires.
+    """
+
+    FIELDS = [("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7)]
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {len(parts)}: {expression!r}")
+
+        self.expression = expression
+        values = {}
+        for text, (name, low, high) in zip(parts, self.FIELDS):
+            values[name] = self._parse_field(text, low, high, name)
+        self.minutes = values["minute"]
+        self.hours = values["hour"]
+        self.days = values["day"]
+        self.months = values["month"]
+        self.weekdays = {d % 7 for d in values["weekday"]}
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse_field(text: str, low: int, high: int, name: str) -> Set[int]:
+        values = set()
+        for part in text.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step <= 0:
+                    raise ValueError(f"Invalid step in cron {name} field: {text!r}")
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(x) for x in part.split("-", 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if not low <= start <= end <= high:
+                raise ValueError(f"Cron {name} field out of range {low}-{high}: {text!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        # Python: Monday=0; cron: Sunday=0
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def first_fire(self, now: datetime) -> datetime:
+        return self.next_fire(now)
+
+    def next_fire(self, after: datetime) -> datetime:
+        """First matching minute strictly after `after`."""
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 5)
+
+        # Jump field by field instead of walking minute by minute
+        while dt < limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+            elif dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+            elif dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+            else:
+                return dt
+
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+    def __repr__(self):
+        return f"CronTrigger({self.expression!r})"
+
+
+class Job:
+    """A scheduled job (see Scheduler.add_job)."""
+
+    def __init__(self, name: str, func: Callable, trigger, jitter: float,
+                 misfire_grace: Optional[float], persist: bool,
+                 pool: str = "io", priority: int = PRIORITY_NORMAL, owner: Optional[str] = None):
+        self.name = name
+        self.func = func
+        self.trigger = trigger
+        self.jitter = jitter
+        self.misfire_grace = misfire_grace
+        self.persist = persist
+        self.pool = pool
+        self.priority = priority
+        self.owner = owner
+
+        self.next_run: Optional[datetime] = None
+        self.last_run: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.run_count = 0
+        self.skipped = 0
+        self.running = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trigger": repr(self.trigger),
+            "pool": self.pool,
+            "owner": self.owner,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "last_error": self.last_error,
+            "run_count": self.run_count,
+            "skipped": self.skipped,
+            "running": self.running,
+        }
+
+
+class Scheduler:
+    """Runs jobs from one timer thread, dispatching them onto an executor."""
+
+    def __init__(self, submit: Callable[[Callable], Any], db=None):
+        """
+        Initialize scheduler.
+
+        Args:
+            submit: Runs a callable in the background, taking pool, priority and
+                owner keywords (HoloceneCore.run_in_background)
+            db: Database for persisted last-run times (None = in-memory only)
+        """
+        self.submit = submit
+        self.db = db
+
+        self._jobs: Dict[str, Job] = {}
+        self._heap: List = []  # (due, seq, job)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        trigger,
+        jitter: float = 0,
+        misfire_grace: Optional[float] = None,
+        persist: bool = True,
+        pool: str = "io",
+        priority: int = PRIORITY_NORMAL,
+        owner: Optional[str] = None,
+    ) -> Job:
+        """
+        Schedule a job, replacing any job with the same name.
+
+        Args:
+            name: Unique job name (plugins prefix it with the plugin name)
+            func: Callable run on the executor
+            trigger: IntervalTrigger or CronTrigger
+            jitter: Up to this many seconds are added to each run time
+            misfire_grace: Runs missed (daemon down, job still busy) by more
+                than this many seconds are skipped; None = always catch up once
+            persist: Remember the last run time across restarts
+            pool: Executor pool the job runs on
+            priority: Executor priority (PRIORITY_HIGH/NORMAL/LOW)
+            owner: Plugin name, for executor quotas and metrics
+
+        Returns:
+            The scheduled Job
+        """
+        job = Job(name, func, trigger, jitter, misfire_grace, persist, pool, priority, owner)
+        now = datetime.now()
+
+        if persist and self.db is not None:
+            state = self.db.get_scheduled_job(name)
+            if state and state["last_run_at"]:
+                job.last_run = datetime.fromisoformat(state["last_run_at"])
+                job.run_count = state["run_count"]
+
+        due = trigger.next_fire(job.last_run) if job.last_run else trigger.first_fire(now)
+        job.next_run = self._misfire_check(job, due, now)
+
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("Scheduler is shut down")
+            self._jobs[name] = job
+            self._push(job)
+            self._ensure_thread()
+            self._cond.notify()
+
+        logger.info(f"Scheduled job {name} ({trigger!r}), next run {job.next_run:%Y-%m-%d %H:%M:%S}")
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        """Unschedule a job (a run in progress finishes). Returns True if it existed."""
+        with self._cond:
+            job = self._jobs.pop(name, None)
+            self._cond.notify()
+        return job is not None
+
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        """Status of all scheduled jobs, soonest first."""
+        with self._cond:
+            jobs = sorted(self._jobs.values(), key=lambda j: j.next_run)
+            return [job.to_dict() for job in jobs]
+
+    def shutdown(self):
+        """Stop the timer thread. Jobs already dispatched keep running."""
+        with self._cond:
+            self._stopped = True
+            self._jobs.clear()
+            self._heap.clear()
+            self._cond.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+    # Internals
+
+    def _misfire_check(self, job: Job, due: datetime, now: datetime) -> datetime:
+        """Run a missed time now (once) or, past the grace time, skip to the next one."""
+        if due >= now:
+            return self._jittered(job, due)
+        if job.misfire_grace is None or (now - due).total_seconds() <= job.misfire_grace:
+            return now
+        logger.info(f"Job {job.name} missed its run at {due:%Y-%m-%d %H:%M}, skipping")
+        return self._jittered(job, job.trigger.next_fire(now))
+
+    @staticmethod
+    def _jittered(job: Job, due: datetime) -> datetime:
+        if job.jitter:
+            due += timedelta(seconds=random.uniform(0, job.jitter))
+        return due
+
+    def _push(self, job: Job):
+        heapq.heappush(self._heap, (job.next_run, next(self._seq), job))
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name="holocene-scheduler")
+            self._thread.start()
+
+    def _run(self):
+        """Timer thread: sleep until the earliest job is due, then dispatch it."""
+        with self._cond:
+            while not self._stopped:
+                # Drop entries for removed/rescheduled jobs
+                while self._heap and self._jobs.get(self._heap[0][2].name) is not self._heap[0][2]:
+                    heapq.heappop(self._heap)
+
+                now = datetime.now()
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                due, _, job = self._heap[0]
+                if due > now:
+                    self._cond.wait(min((due - now).total_seconds(), MAX_SLEEP_SECONDS))
+                    continue
+
+                heapq.heappop(self._heap)
+                self._fire(job, due, now)
+
+    def _fire(self, job: Job, due: datetime, now: datetime):
+        """Dispatch a due job and schedule its next run (called with the lock held)."""
+        if job.running:
+            # Previous run still going - never overlap, count it as missed
+            job.skipped += 1
+            logger.debug(f"Job {job.name} still running, skipping this run")
+        else:
+            job.running = True
+            try:
+                self.submit(
+                    lambda: self._execute(job, now), pool=job.pool, priority=job.priority, owner=job.owner
+                )
+            except Exception as e:
+                job.running = False
+                logger.error(f"Failed to dispatch job {job.name}: {e}")
+
+        job.next_run = self._misfire_check(job, job.trigger.next_fire(due), now)
+        self._push(job)
+
+    def _execute(self, job: Job, started: datetime):
+        """Executor side: run the job and record the outcome."""
+        error = None
+        try:
+            with query_caller(f"job:{job.name}"):
+                job.func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.error(f"Job {job.name} failed: {e}", exc_info=True)
+        finally:
+            job.running = False
+            job.last_run = started
+            job.last_error = error
+            job.run_count += 1
+
+        if job.persist and self.db is not None:
+            try:
+                self.db.record_scheduled_job_run(job.name, started.isoformat(), error)
+            except Exception as e:
+                logger.warning(f"Could not persist last run of {job.name}: {e}")
@@ -0,0 +1,226 @@
+"""Indexed fuzzy search over books, papers, links and inventory items.
+
+The search_index FTS5 table (migration 28) holds three text fields per item
+and is kept current by SQLite triggers on every insert, update and delete.
+Its trigram tokenizer makes candidate generation typo tolerant: a query is
+broken into trigrams, and the items sharing the most (rarest) trigrams
+come back from SQLite, ranked by bm25 with per-field weights. Only those
+candidates are scored in Python, with token_match_ratio() (bounded edit
+distance and prefixes) and fuzzy_match_ratio(). A query touches a few
+hundred rows, not the whole collection.
+
+    index = SearchIndex(db)
+    for hit in index.search("pyton programing", item_type="book"):
+        print(hit["item_id"], hit["score"], hit["title"])
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from .fuzzy_search import fuzzy_match_ratio, normalize_tokens, token_match_ratio
+
+logger = logging.getLogger(__name__)
+
+# rowid = item id * 8 + type code (see migration 28)
+TYPE_CODES = {"book": 1, "paper": 2, "link": 3, "item": 4}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+TYPE_TABLES = {"book": "books", "paper": "papers", "link": "links", "item": "items"}
+
+# Source of the (primary, secondary, tertiary) fields, as in the triggers
+INDEXED_COLUMNS = {
+    "book": ("title", "author", "subjects"),
+    "paper": ("title", "authors", "journal"),
+    "link": ("COALESCE(NULLIF(clean_title, ''), title)", "url", "NULL"),
+    "item": ("name", "description", "category"),
+}
+
+DEFAULT_WEIGHTS = (1.0, 0.7, 0.4)
+
+# Trigrams sent to FTS5 per query (long queries add little beyond this)
+MAX_QUERY_TRIGRAMS = 48
+
+
+def query_trigrams(query: str) -> List[str]:
+    """Distinct trigrams of a query's normalized words, in order."""
+    trigrams = []
+    seen = set()
+    for token in normalize_tokens(query):
+        for i in range(len(token) - 2):
+            trigram = token[i:i + 3]
+            if trigram not in seen:
+                seen.add(trigram)
+                trigrams.append(trigram)
+    return trigrams[:MAX_QUERY_TRIGRAMS]
+
+
+class SearchIndex:
+    """Typo-tolerant lookups backed by the trigger-maintained search_index table."""
+
+    def __init__(self, db, candidates: int = 200):
+        """
+        Initialize search index.
+
+        Args:
+            db: Database (or anything with a sqlite3 .conn)
+            candidates: Rows fetched from FTS5 and scored per query
+        """
+        self.db = db
+        self.candidates = candidates
+        self._available: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the index exists (SQLite without the trigram tokenizer skips it)."""
+        if self._available is None:
+            row = self.db.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'search_index'"
+            ).fetchone()
+            self._available = row is not None
+        return self._available
+
+    def search(
+        self,
+        query: str,
+        item_type: Optional[str] = None,
+        limit: int = 20,
+        threshold: float = 0.6,
+        weights: Sequence[float] = DEFAULT_WEIGHTS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuzzy search the collection.
+
+        Args:
+            query: Search text (typos and partial words are fine)
+            item_type: 'book', 'paper', 'link' or 'item' (None = all)
+            limit: Maximum results
+            threshold: Minimum score (0.0-1.0)
+            weights: Weights of the primary, secondary and tertiary fields
+
+        Returns:
+            List of dicts with item_type, item_id, score and title, best first
+        """
+        if not query or not query.strip():
+            return []
+        if item_type is not None and item_type not in TYPE_CODES:
+            raise ValueError(f"Unknown item type: {item_type}")
+
+        rows = self._candidates(query, item_type, weights)
+        top_weight = max(weights)
+
+        hits = []
+        for rowid, *fields in rows:
+            score = 0.0
+            for text, weight in zip(fields, weights):
+                if text:
+                    field_score = max(token_match_ratio(query, text), fuzzy_match_ratio(query, text))
+                    score = max(score, field_score * weight / top_weight)
+            if score >= threshold:
+                hits.append({
+                    "item_type": TYPE_NAMES[rowid % 8],
+                    "item_id": rowid // 8,
+                    "score": round(score, 3),
+                    "title": fields[0],
+                })
+
+        hits.sort(key=lambda hit: hit["score"], reverse=True)
+        return hits[:limit]
+
+    def search_rows(
+        self,
+        query: str,
+        item_type: str,
+        limit: int = 20,
+        threshold: float = 0.6,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuzzy search one collection and return its full rows, best first.
+
+        Each row dict gets a "_score" key.
+        """
+        hits = self.search(query, item_type=item_type, limit=limit, threshold=threshold)
+        if not hits:
+            return []
+
+        ids = [hit["item_id"] for hit in hits]
+        placeholders = ",".join("?" * len(ids))
+        cursor = self.db.conn.execute(
+            f"SELECT * FROM {TYPE_TABLES[item_type]} WHERE id IN ({placeholders})", ids
+        )
+        rows = {row["id"]: dict(row) for row in cursor.fetchall()}
+
+        results = []
+        for hit in hits:
+            row = rows.get(hit["item_id"])
+            if row is not None:
+                row["_score"] = hit["score"]
+                results.append(row)
+        return results
+
+    def rebuild(self) -> int:
+        """Refill the index from the source tables (e.g. after a bulk import with triggers off).
+
+        Returns:
+            Number of indexed items
+        """
+        if not self.available:
+            return 0
+
+        conn = self.db.conn
+        conn.execute("DELETE FROM search_index")
+        for name, columns in INDEXED_COLUMNS.items():
+            conn.execute(
+                "INSERT INTO search_index(rowid, primary_text, secondary_text, tertiary_text) "
+                f"SELECT id * 8 + {TYPE_CODES[name]}, {', '.join(columns)} FROM {TYPE_TABLES[name]}"
+            )
+        conn.execute("INSERT INTO search_index(search_index) VALUES ('optimize')")
+        conn.commit()
+        return conn.execute("SELECT COUNT(*) FROM search_index").fetchone()[0]
+
+    # Internals
+
+    def _candidates(self, query: str, item_type: Optional[str], weights: Sequence[float]) -> List[tuple]:
+        if not self.available:
+            return self._scan(query, item_type)
+
+        type_filter = ""
+        params: List[Any] = []
+        if item_type is not None:
+            type_filter = " AND rowid % 8 = ?"
+            params.append(TYPE_CODES[item_type])
+
+        trigrams = query_trigrams(query)
+        if not trigrams:
+            # Words under 3 characters have no trigrams: substring match instead
+            pattern = f"%{query.strip()}%"
+            sql = (
+                "SELECT rowid, primary_text, secondary_text, tertiary_text FROM search_index "
+                "WHERE (primary_text LIKE ? OR secondary_text LIKE ? OR tertiary_text LIKE ?)"
+                f"{type_filter} LIMIT ?"
+            )
+            return self.db.conn.execute(sql, [pattern] * 3 + params + [self.candidates]).fetchall()
+
+        match = " OR ".join(f'"{trigram}"' for trigram in trigrams)
+        sql = (
+            "SELECT rowid, primary_text, secondary_text, tertiary_text FROM search_index "
+            f"WHERE search_index MATCH ?{type_filter} "
+            "ORDER BY bm25(search_index, ?, ?, ?) LIMIT ?"
+        )
+        return self.db.conn.execute(sql, [match] + params + list(weights) + [self.candidates]).fetchall()
+
+    def _scan(self, query: str, item_type: Optional[str]) -> List[tuple]:
+        """Candidates without the index: items containing the start of any query word."""
+        words = normalize_tokens(query) or [query.strip()]
+        rows = {}
+        for name in ([item_type] if item_type else list(TYPE_CODES)):
+            columns = INDEXED_COLUMNS[name]
+            searched = [column for column in columns if column != "NULL"]
+            conditions = " OR ".join(f"{column} LIKE ?" for column in searched)
+            for word in words:
+                cursor = self.db.conn.execute(
+                    f"SELECT id * 8 + {TYPE_CODES[name]}, {', '.join(columns)} FROM {TYPE_TABLES[name]} "
+                    f"WHERE {conditions} LIMIT ?",
+                    [f"%{word[:4]}%"] * len(searched) + [self.candidates],
+                )
+                for row in cursor.fetchall():
+                    rows[row[0]] = tuple(row)
+        return list(rows.values())
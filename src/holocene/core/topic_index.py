@@ -0,0 +1,145 @@
+"""Topic keyword index for the curiosity engine.
+
+The topic_index table (migration 25) holds one row per titled book, link
+and paper. SQLite triggers keep it in step with inserts, title changes and
+deletes by queuing changed rows with keywords = NULL, and refresh()
+tokenizes just those rows. Curiosity decisions then sample a few rows per
+type by random rowid seeks (no full-table ORDER BY RANDOM()) and compare
+precomputed keyword sets.
+"""
+
+import logging
+import random
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'shall', 'can', 'need',
+    'about', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'under', 'again', 'further', 'then', 'once',
+    'here', 'there', 'when', 'where', 'why', 'how', 'all', 'each',
+    'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+    'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'also',
+    'role', 'using', 'based', 'study', 'research', 'analysis', 'exploring',
+    'investigating', 'understanding', 'formation', 'development',
+})
+
+ITEM_TYPES = ('book', 'link', 'paper')
+
+
+@lru_cache(maxsize=4096)
+def topic_keywords(text: str) -> FrozenSet[str]:
+    """Extract meaningful keywords from a topic string (cached)."""
+    words = set()
+    for word in text.lower().split():
+        # Remove punctuation
+        clean = ''.join(c for c in word if c.isalnum())
+        if len(clean) > 2 and clean not in STOPWORDS:
+            words.add(clean)
+    return frozenset(words)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two keyword sets (0.0 if either is empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class TopicIndex:
+    """Maintained keyword sets for collection items, with cheap random sampling."""
+
+    def __init__(self, db, batch_size: int = 1000):
+        """
+        Initialize index.
+
+        Args:
+            db: Database instance
+            batch_size: Rows tokenized per transaction in refresh()
+        """
+        self.db = db
+        self.batch_size = batch_size
+
+    def refresh(self) -> int:
+        """Tokenize rows queued by the triggers (new or retitled items).
+
+        Returns:
+            Number of rows tokenized
+        """
+        conn = self.db.conn
+        total = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, text FROM topic_index WHERE keywords IS NULL LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                "UPDATE topic_index SET keywords = ? WHERE id = ?",
+                [(' '.join(sorted(topic_keywords(row[1]))), row[0]) for row in rows],
+            )
+            conn.commit()
+            total += len(rows)
+
+        if total:
+            logger.debug(f"Topic index: tokenized {total} item(s)")
+        return total
+
+    def sample(self, item_type: str, count: int) -> List[Dict]:
+        """Pick about `count` random items of a type by rowid seeks.
+
+        Each probe jumps to a random id and takes the next indexed row, so
+        the cost doesn't grow with the table. Items right after gaps in the
+        id sequence are slightly more likely - fine for curiosity seeds.
+
+        Returns:
+            List of dicts with type, id, title, keywords (frozenset)
+        """
+        conn = self.db.conn
+        low = conn.execute("SELECT MIN(id) FROM topic_index WHERE item_type = ?", (item_type,)).fetchone()[0]
+        if low is None:
+            return []
+        high = conn.execute("SELECT MAX(id) FROM topic_index WHERE item_type = ?", (item_type,)).fetchone()[0]
+
+        picked = {}
+        for _ in range(count * 3):  # Extra probes make up for duplicates
+            if len(picked) >= count:
+                break
+            row = conn.execute("""
+                SELECT id, item_id, title, text, keywords FROM topic_index
+                WHERE item_type = ? AND id >= ?
+                ORDER BY id LIMIT 1
+            """, (item_type, random.randint(low, high))).fetchone()
+            if row and row[0] not in picked:
+                keywords = frozenset(row[4].split()) if row[4] is not None else topic_keywords(row[3])
+                picked[row[0]] = {'type': item_type, 'id': row[1], 'title': row[2], 'keywords': keywords}
+
+        return list(picked.values())
+
+    def dissimilar_items(self, recent_topics: Iterable[str], per_type: int = 20, limit: int = 5) -> List[Dict]:
+        """Random collection items least like the recent topics.
+
+        Args:
+            recent_topics: Topics to steer away from
+            per_type: Items sampled from each of books, links and papers
+            limit: Items returned
+
+        Returns:
+            List of dicts with type, id, title, most dissimilar first
+        """
+        recent_keywords = frozenset().union(*(topic_keywords(topic) for topic in recent_topics))
+
+        candidates = []
+        for item_type in ITEM_TYPES:
+            candidates.extend(self.sample(item_type, per_type))
+
+        # Jaccard distance to the recent topics' combined keywords
+        candidates.sort(key=lambda item: jaccard(item['keywords'], recent_keywords))
+
+        return [{'type': c['type'], 'id': c['id'], 'title': c['title']} for c in candidates[:limit]]
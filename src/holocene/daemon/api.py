@@ -4,6 +4,8 @@ Provides HTTP API for wmut CLI to communicate with holod running on rei.
 
 Endpoints:
     GET  /status                       - Daemon status
+    GET  /metrics                      - Prometheus metrics (query profiler)
+    GET  /db/profile                   - Query profile and slow-query log
     GET  /plugins                      - List all plugins
     GET  /plugins/<name>               - Get plugin details
     POST /plugins/<name>/enable        - Enable plugin
@@ -40,6 +42,7 @@ except ImportError:
 
 from ..core import HoloceneCore
 from ..core.plugin_registry import PluginRegistry
+from ..storage.profiler import pop_caller, push_caller
 
 logger = logging.getLogger(__name__)
 
@@ -202,6 +205,10 @@ class APIServer:
     def _setup_routes(self):
         """Setup Flask routes."""
 
+        # Attribute each request's database time to its endpoint
+        self.app.before_request(self._start_query_attribution)
+        self.app.teardown_request(self._end_query_attribution)
+
         # Root endpoint
         self.app.route("/", methods=["GET"])(self._root)
 
@@ -216,6 +223,9 @@ class APIServer:
         # Status endpoints
         self.app.route("/status", methods=["GET"])(self._status)
         self.app.route("/health", methods=["GET"])(self._health)
+        self.app.route("/metrics", methods=["GET"])(self._metrics)
+        self.app.route("/db/profile", methods=["GET"])(self._db_profile)
+        self.app.route("/db/profile/reset", methods=["POST"])(self._db_profile_reset)
 
         # Plugin endpoints
         self.app.route("/plugins", methods=["GET"])(self._list_plugins)
@@ -236,6 +246,9 @@ class APIServer:
         self.app.route("/links", methods=["GET", "POST"])(self._links)
         self.app.route("/links/<int:link_id>", methods=["GET"])(self._get_link)
 
+        # Streaming collection exports
+        self.app.route("/export/<collection>", methods=["GET"])(self._export_collection)
+
         # Archive viewer endpoints (local monolith archives)
         self.app.route("/mono/<int:link_id>", methods=["GET"])(self._mono_latest)
         self.app.route("/mono/<int:link_id>/latest", methods=["GET"])(self._mono_latest)
@@ -1421,6 +1434,9 @@ class APIServer:
                     "enabled": len([p for p in plugins if p.get('enabled', False)]),
                     "disabled": len([p for p in plugins if not p.get('enabled', False)])
                 },
+                "jobs": self.core.scheduler.get_jobs(),
+                "executor": self.core.executor.get_metrics(),
+                "database": self.core.db.profiler.summary() if self.core.db.profiler else None,
                 "api": {
                     "version": "1.0.0",
                     "port": self.port
@@ -1434,6 +1450,48 @@ class APIServer:
         """GET /health - Health check."""
         return jsonify({"status": "ok"})
 
+    def _start_query_attribution(self):
+        """before_request: attribute the request's queries to its route."""
+        rule = request.url_rule.rule if request.url_rule else request.path
+        push_caller(f"api:{request.method} {rule}")
+
+    def _end_query_attribution(self, error=None):
+        """teardown_request: end the attribution started in before_request."""
+        pop_caller()
+
+    def _metrics(self):
+        """GET /metrics - Query profiler metrics in the Prometheus text format."""
+        profiler = self.core.db.profiler
+        if not profiler:
+            return "# Query profiler disabled (profiler.enabled: false)\n", 200, {"Content-Type": "text/plain"}
+        return profiler.prometheus(), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+    @require_auth
+    def _db_profile(self):
+        """GET /db/profile - Most expensive statements, callers and slow queries.
+
+        Query params:
+            top: Statements returned (default: 20)
+            sort: total_ms (default), calls, avg_ms, max_ms, rows or slow
+        """
+        profiler = self.core.db.profiler
+        if not profiler:
+            return jsonify({"error": "Query profiler disabled (profiler.enabled: false)"}), 404
+        top = request.args.get("top", 20, type=int)
+        sort = request.args.get("sort", "total_ms")
+        if sort not in ("total_ms", "calls", "avg_ms", "max_ms", "rows", "slow"):
+            return jsonify({"error": f"Unknown sort: {sort}"}), 400
+        return jsonify(profiler.snapshot(top=top, sort=sort))
+
+    @require_auth
+    def _db_profile_reset(self):
+        """POST /db/profile/reset - Start profiling from scratch."""
+        profiler = self.core.db.profiler
+        if not profiler:
+            return jsonify({"error": "Query profiler disabled (profiler.enabled: false)"}), 404
+        profiler.reset()
+        return jsonify({"status": "reset"})
+
     # Plugin endpoints
 
     @require_auth
@@ -1731,6 +1789,42 @@ class APIServer:
             logger.error(f"Error getting link {link_id}: {e}", exc_info=True)
             return jsonify({"error": str(e)}), 500
 
+    # Export endpoints
+
+    @require_auth
+    def _export_collection(self, collection: str):
+        """GET /export/<collection> - Stream books/links/papers as CSV, JSONL or Parquet.
+
+        Query params: format (csv|jsonl|parquet), q, limit, gzip (1/true)
+        """
+        from flask import Response
+        from ..storage.export import (
+            COLLECTIONS, EXPORT_FORMATS, HAS_PYARROW,
+            export_filename, export_mimetype, iter_export,
+        )
+
+        fmt = request.args.get('format', 'csv')
+        compress = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+        if collection not in COLLECTIONS:
+            return jsonify({"error": f"Unknown collection: {collection}"}), 404
+        if fmt not in EXPORT_FORMATS:
+            return jsonify({"error": f"Unknown format: {fmt}"}), 400
+        if fmt == 'parquet' and not HAS_PYARROW:
+            return jsonify({"error": "Parquet export requires pyarrow on the server"}), 501
+
+        chunks = iter_export(
+            self.core.db.conn, collection, fmt,
+            query=request.args.get('q'),
+            limit=request.args.get('limit', type=int),
+            compress=compress,
+        )
+        filename = export_filename(collection, fmt, compress)
+        return Response(
+            chunks,
+            mimetype=export_mimetype(fmt, compress),
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+        )
+
     # Archive viewer endpoints
 
     @require_auth
@@ -2039,6 +2133,10 @@ class APIServer:
         """
         from pathlib import Path
         import os
+        from ..storage.archive_store import is_blob_ref
+
+        if is_blob_ref(file_path):
+            return self._serve_archive_blob(file_path, service)
 
         try:
             # Security: Validate file path
@@ -2074,31 +2172,7 @@ class APIServer:
                 with open(archive_path, 'r', encoding='utf-8') as f:
                     html_content = f.read()
 
-                # Remove the CSP meta tag that monolith embeds
-                import re
-                html_content = re.sub(
-                    r'<meta\s+http-equiv=["\']Content-Security-Policy["\'][^>]*>',
-                    '',
-                    html_content,
-                    flags=re.IGNORECASE
-                )
-
-                # Return modified HTML
-                from flask import Response
-                return Response(
-                    html_content,
-                    mimetype='text/html',
-                    headers={
-                        'Content-Security-Policy': (
-                            "default-src 'self'; "
-                            "script-src 'self' 'unsafe-inline' https://static.cloudflareinsights.com; "
-                            "style-src 'self' 'unsafe-inline' data:; "
-                            "img-src 'self' data:; "
-                            "font-src 'self' data:; "
-                            "connect-src 'self' https://cloudflareinsights.com"
-                        )
-                    }
-                )
+                return self._monolith_response(html_content)
 
             # For other file types, serve directly
             return send_file(
@@ -2112,6 +2186,91 @@ class APIServer:
             logger.error(f"Error serving archive file {file_path}: {e}", exc_info=True)
             return abort(500, description=str(e))
 
+    def _serve_archive_blob(self, ref: str, service: str):
+        """Serve an archive from the content-addressed archive store.
+
+        Monolith HTML gets the same CSP rewrite as files on disk. Other
+        formats are streamed chunk by chunk and honor single byte-range
+        requests, decompressing only the chunks the range overlaps.
+
+        Args:
+            ref: Blob reference (blob:<sha256>)
+            service: Service type (determines MIME type)
+        """
+        from pathlib import Path
+        from flask import Response
+        from ..storage.archive_store import ArchiveStore, parse_blob_ref
+
+        try:
+            store = ArchiveStore(Path.home() / ".holocene" / "archives" / "store")
+            blob_id = parse_blob_ref(ref)
+            if not store.exists(blob_id):
+                return abort(404, description="Archive blob not found")
+
+            if service == 'local_monolith':
+                html_content = store.get(blob_id).decode('utf-8', errors='replace')
+                return self._monolith_response(html_content)
+
+            mimetype = 'application/warc' if service == 'local_warc' else 'application/octet-stream'
+            size = store.info(blob_id)['size']
+            headers = {
+                'Accept-Ranges': 'bytes',
+                'Content-Disposition': f'inline; filename="{blob_id[:16]}.warc"'
+                if service == 'local_warc' else 'inline',
+            }
+
+            byte_range = request.range.range_for_length(size) if request.range else None
+            if byte_range:
+                start, end = byte_range
+                headers['Content-Range'] = f'bytes {start}-{end - 1}/{size}'
+                headers['Content-Length'] = str(end - start)
+                return Response(
+                    store.iter_range(blob_id, start, end),
+                    status=206,
+                    mimetype=mimetype,
+                    headers=headers,
+                )
+
+            headers['Content-Length'] = str(size)
+            return Response(store.iter_chunks(blob_id), mimetype=mimetype, headers=headers)
+
+        except ValueError:
+            return abort(400, description="Invalid archive reference")
+        except Exception as e:
+            logger.error(f"Error serving archive blob {ref}: {e}", exc_info=True)
+            return abort(500, description=str(e))
+
+    def _monolith_response(self, html_content: str):
+        """Build a monolith HTML response with the embedded CSP meta tag stripped.
+
+        Monolith embeds a strict CSP that blocks Cloudflare; replace it with
+        a header that still isolates the page.
+        """
+        import re
+        from flask import Response
+
+        html_content = re.sub(
+            r'<meta\s+http-equiv=["\']Content-Security-Policy["\'][^>]*>',
+            '',
+            html_content,
+            flags=re.IGNORECASE
+        )
+
+        return Response(
+            html_content,
+            mimetype='text/html',
+            headers={
+                'Content-Security-Policy': (
+                    "default-src 'self'; "
+                    "script-src 'self' 'unsafe-inline' https://static.cloudflareinsights.com; "
+                    "style-src 'self' 'unsafe-inline' data:; "
+                    "img-src 'self' data:; "
+                    "font-src 'self' data:; "
+                    "connect-src 'self' https://cloudflareinsights.com"
+                )
+            }
+        )
+
     # Telegram Mini App endpoints
 
     def _validate_telegram_init_data(self) -> Optional[dict]:
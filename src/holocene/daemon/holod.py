@@ -13,12 +13,12 @@ import signal
 import logging
 import time
 import atexit
-import threading
 import requests
 from pathlib import Path
 from typing import Optional
 
-from ..core import HoloceneCore, PluginRegistry
+from ..core import HoloceneCore, PluginRegistry, IntervalTrigger
+from ..core import rate_limiter
 from ..config import load_config
 
 # Configure logging to stdout so journald captures it
@@ -44,6 +44,8 @@ class HoloceneDaemon:
     - Graceful shutdown
     """
 
+    HEALTHCHECK_JOB = "holod.healthcheck"
+
     def __init__(self, config_path: Optional[Path] = None, device: str = "rei"):
         """Initialize daemon.
 
@@ -63,10 +65,6 @@ class HoloceneDaemon:
         self.running = False
         self.pid_file = self.config.data_dir / "holod.pid"
 
-        # Healthcheck thread
-        self._healthcheck_thread: Optional[threading.Thread] = None
-        self._healthcheck_stop_event = threading.Event()
-
         # Setup signal handlers
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -99,83 +97,60 @@ class HoloceneDaemon:
         except Exception as e:
             logger.error(f"Failed to remove PID file: {e}")
 
-    def _healthcheck_worker(self):
-        """Background worker that pings healthchecks.io and Uptime Kuma every 60 seconds."""
+    def _uses_healthcheck(self) -> bool:
+        """Whether healthchecks.io or an Uptime Kuma push monitor is configured."""
         has_healthcheck = bool(self.config.healthcheck_url)
         has_uptime_kuma = (
             self.config.integrations.uptime_kuma_enabled and
             getattr(self.config.integrations, 'uptime_kuma_push_token', None)
         )
+        return bool(has_healthcheck or has_uptime_kuma)
 
-        if not has_healthcheck and not has_uptime_kuma:
-            return
-
-        if has_healthcheck:
-            logger.info(f"Healthcheck worker started (healthchecks.io: {self.config.healthcheck_url})")
-        if has_uptime_kuma:
-            logger.info(f"Healthcheck worker started (Uptime Kuma push token configured)")
+    def _send_healthcheck_pings(self):
+        """Ping healthchecks.io and Uptime Kuma (scheduled every 60 seconds)."""
+        # Ping healthchecks.io
+        if self.config.healthcheck_url:
+            try:
+                response = requests.get(self.config.healthcheck_url, timeout=10)
+                if response.status_code == 200:
+                    logger.debug("Healthchecks.io ping successful")
+                else:
+                    logger.warning(f"Healthchecks.io ping returned {response.status_code}")
+            except Exception as e:
+                logger.error(f"Healthchecks.io ping failed: {e}")
 
-        while not self._healthcheck_stop_event.is_set():
-            # Ping healthchecks.io
-            if has_healthcheck:
-                try:
-                    response = requests.get(self.config.healthcheck_url, timeout=10)
-                    if response.status_code == 200:
-                        logger.debug("Healthchecks.io ping successful")
-                    else:
-                        logger.warning(f"Healthchecks.io ping returned {response.status_code}")
-                except Exception as e:
-                    logger.error(f"Healthchecks.io ping failed: {e}")
-
-            # Ping Uptime Kuma push monitor
-            if has_uptime_kuma:
-                try:
-                    push_url = (
-                        f"{self.config.integrations.uptime_kuma_url}/api/push/"
-                        f"{self.config.integrations.uptime_kuma_push_token}?status=up&msg=holod%20running"
-                    )
-                    response = requests.get(push_url, timeout=10)
-                    data = response.json()
-                    if data.get("ok"):
-                        logger.debug("Uptime Kuma push ping successful")
-                    else:
-                        logger.warning(f"Uptime Kuma push ping failed: {data.get('msg', 'Unknown')}")
-                except Exception as e:
-                    logger.error(f"Uptime Kuma push ping failed: {e}")
-
-            # Wait 60 seconds (or until stop event is set)
-            self._healthcheck_stop_event.wait(60)
-
-        logger.info("Healthcheck worker stopped")
+        # Ping Uptime Kuma push monitor
+        if (self.config.integrations.uptime_kuma_enabled and
+                getattr(self.config.integrations, 'uptime_kuma_push_token', None)):
+            try:
+                push_url = (
+                    f"{self.config.integrations.uptime_kuma_url}/api/push/"
+                    f"{self.config.integrations.uptime_kuma_push_token}?status=up&msg=holod%20running"
+                )
+                response = requests.get(push_url, timeout=10)
+                data = response.json()
+                if data.get("ok"):
+                    logger.debug("Uptime Kuma push ping successful")
+                else:
+                    logger.warning(f"Uptime Kuma push ping failed: {data.get('msg', 'Unknown')}")
+            except Exception as e:
+                logger.error(f"Uptime Kuma push ping failed: {e}")
 
     def _start_healthcheck(self):
-        """Start healthcheck background thread."""
-        has_healthcheck = bool(self.config.healthcheck_url)
-        has_uptime_kuma = (
-            self.config.integrations.uptime_kuma_enabled and
-            getattr(self.config.integrations, 'uptime_kuma_push_token', None)
-        )
-
-        if not has_healthcheck and not has_uptime_kuma:
+        """Schedule healthcheck pings on the core scheduler."""
+        if not self._uses_healthcheck():
             logger.info("No healthcheck URL or Uptime Kuma push token configured, skipping")
             return
 
-        self._healthcheck_stop_event.clear()
-        self._healthcheck_thread = threading.Thread(
-            target=self._healthcheck_worker,
-            daemon=True,
-            name="healthcheck"
+        self.core.scheduler.add_job(
+            self.HEALTHCHECK_JOB, self._send_healthcheck_pings, IntervalTrigger(60), persist=False
         )
-        self._healthcheck_thread.start()
-        logger.info("Healthcheck thread started")
+        logger.info("Healthcheck pings scheduled every 60s")
 
     def _stop_healthcheck(self):
-        """Stop healthcheck background thread."""
-        if self._healthcheck_thread and self._healthcheck_thread.is_alive():
-            logger.info("Stopping healthcheck thread...")
-            self._healthcheck_stop_event.set()
-            self._healthcheck_thread.join(timeout=5)
-            logger.info("Healthcheck thread stopped")
+        """Unschedule healthcheck pings."""
+        if self.core and self.core.scheduler.remove_job(self.HEALTHCHECK_JOB):
+            logger.info("Healthcheck pings stopped")
 
     def is_running(self) -> bool:
         """Check if daemon is running.
@@ -231,6 +206,9 @@ class HoloceneDaemon:
             logger.info("Initializing HoloceneCore...")
             self.core = HoloceneCore()
 
+            # Share one per-domain rate limiter across plugins and API clients
+            rate_limiter.ensure_global_limiter()
+
             # Initialize plugin registry
             logger.info(f"Initializing PluginRegistry (device: {self.device})...")
             self.registry = PluginRegistry(self.core, device=self.device)
@@ -245,15 +223,22 @@ class HoloceneDaemon:
             logger.info("Loading plugins...")
             self.registry.load_all()
 
-            # Enable configured plugins (for now, enable all)
+            # Enable loaded plugins (independent ones start concurrently)
             logger.info("Enabling plugins...")
             self.registry.enable_all()
 
             plugins = self.registry.list_plugins()
             logger.info(f"Loaded {len(plugins)} plugin(s):")
             for plugin in plugins:
-                logger.info(f"  - {plugin['name']} v{plugin['version']}")
-                print(f"  ✓ {plugin['name']}")
+                startup_ms = sum(plugin['startup_ms'].values())
+                logger.info(f"  - {plugin['name']} v{plugin['version']} "
+                            f"(startup {startup_ms:.0f}ms: {plugin['startup_ms']})")
+                print(f"  ✓ {plugin['name']} ({startup_ms:.0f}ms)")
+
+            # Resume local captures left over from the previous run
+            if self.core.db.count_capture_jobs("queued") or self.core.db.count_capture_jobs("running"):
+                capture_status = self.core.capture_pool.get_status()
+                logger.info(f"Resuming {capture_status['queued']} queued capture(s)")
 
             # Start REST API (if available)
             try:
@@ -336,9 +321,9 @@ class HoloceneDaemon:
         if self.core:
             logger.info("Shutting down HoloceneCore...")
             try:
-                # Shutdown executor first
-                if hasattr(self.core, '_executor'):
-                    self.core._executor.shutdown(wait=True)
+                # Stop scheduling, then shut down the executor
+                self.core.scheduler.shutdown()
+                self.core.executor.shutdown(wait=True)
 
                 # Close database (may fail if different thread)
                 try:
@@ -1,20 +1,19 @@
-"""Integrations with external services."""
+"""Integrations with external services.
 
-from .journel import JournelReader
-from .git_scanner import GitScanner, GitRepo
-from .internet_archive import InternetArchiveClient
-from .bookmarks import BookmarksReader, Bookmark
-from .calibre import CalibreIntegration
+Clients are imported on first use; importing one doesn't load the others.
+"""
 
-# Optional: MercadoLivre (requires beautifulsoup4)
-try:
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .journel import JournelReader
+    from .git_scanner import GitScanner, GitRepo
+    from .internet_archive import InternetArchiveClient
+    from .bookmarks import BookmarksReader, Bookmark
+    from .calibre import CalibreIntegration
     from .mercadolivre import MercadoLivreClient, MercadoLivreOAuth, is_token_expired
-    MERCADOLIVRE_AVAILABLE = True
-except ImportError:
-    MercadoLivreClient = None
-    MercadoLivreOAuth = None
-    is_token_expired = None
-    MERCADOLIVRE_AVAILABLE = False
 
 __all__ = [
     "JournelReader",
@@ -29,3 +28,27 @@ __all__ = [
     "is_token_expired",
     "MERCADOLIVRE_AVAILABLE",
 ]
+
+_getattr, __dir__ = lazy_exports(
+    __name__,
+    {
+        "JournelReader": ".journel",
+        "GitScanner": ".git_scanner",
+        "GitRepo": ".git_scanner",
+        "InternetArchiveClient": ".internet_archive",
+        "BookmarksReader": ".bookmarks",
+        "Bookmark": ".bookmarks",
+        "CalibreIntegration": ".calibre",
+        "MercadoLivreClient": ".mercadolivre",
+        "MercadoLivreOAuth": ".mercadolivre",
+        "is_token_expired": ".mercadolivre",
+    },
+    # Optional: MercadoLivre (requires beautifulsoup4)
+    optional=("MercadoLivreClient", "MercadoLivreOAuth", "is_token_expired"),
+)
+
+
+def __getattr__(name: str):
+    if name == "MERCADOLIVRE_AVAILABLE":
+        return _getattr("MercadoLivreClient") is not None
+    return _getattr(name)
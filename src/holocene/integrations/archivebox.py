@@ -8,18 +8,27 @@ ArchiveBox provides multi-format archiving with:
 - Media downloads
 - DOM snapshots
 
-Integrates via SSH to archivebox-rei LXC container.
+Integrates via SSH to archivebox-rei LXC container. All commands share one
+multiplexed SSH connection (SSHTransport), and many URLs can be added with a
+single `archivebox add` fed on stdin (archive_urls / submit_urls).
 """
 
-import subprocess
 import logging
 import json
-from typing import Optional, Dict, Any
+import re
+import shlex
+import threading
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Iterable, List
 from datetime import datetime
-from pathlib import Path
+
+from holocene.integrations.ssh_transport import SSHTransport
 
 logger = logging.getLogger(__name__)
 
+# URLs per `archivebox list` status query (they go on the command line)
+STATUS_QUERY_CHUNK = 100
+
 
 class ArchiveBoxClient:
     """Client for ArchiveBox via SSH."""
@@ -29,6 +38,8 @@ class ArchiveBoxClient:
         ssh_host: str = "192.168.1.102",
         ssh_user: str = "holocene",
         data_dir: str = "/opt/archivebox/data",
+        transport: Optional[SSHTransport] = None,
+        poll_interval: float = 10.0,
     ):
         """
         Initialize ArchiveBox client.
@@ -37,12 +48,16 @@ class ArchiveBoxClient:
             ssh_host: ArchiveBox server hostname/IP
             ssh_user: SSH user for connection
             data_dir: ArchiveBox data directory on remote server
+            transport: SSH transport to use (default: a multiplexed SSHTransport)
+            poll_interval: Seconds between snapshot status polls in submit_urls()
         """
         self.ssh_host = ssh_host
         self.ssh_user = ssh_user
         self.data_dir = data_dir
+        self.poll_interval = poll_interval
+        self.transport = transport or SSHTransport(ssh_host, ssh_user)
 
-        # Check SSH connectivity
+        # Check SSH connectivity (this also opens the shared connection)
         self.available = self._check_connectivity()
         if not self.available:
             logger.warning(
@@ -50,22 +65,14 @@ class ArchiveBoxClient:
                 "archives will be skipped"
             )
 
+    def close(self):
+        """Close the shared SSH connection."""
+        self.transport.close()
+
     def _check_connectivity(self) -> bool:
         """Check if we can SSH to ArchiveBox server."""
         try:
-            result = subprocess.run(
-                [
-                    "ssh",
-                    "-o", "ConnectTimeout=5",
-                    "-o", "BatchMode=yes",  # Don't prompt for password
-                    f"{self.ssh_user}@{self.ssh_host}",
-                    "echo ok"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            return result.returncode == 0 and "ok" in result.stdout
+            return self.transport.check()
         except Exception as e:
             logger.error(f"[ArchiveBox] Connectivity check failed: {e}")
             return False
@@ -73,7 +80,8 @@ class ArchiveBoxClient:
     def _run_command(
         self,
         command: str,
-        timeout: int = 120
+        timeout: int = 120,
+        input: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Run ArchiveBox command via SSH.
@@ -81,48 +89,36 @@ class ArchiveBoxClient:
         Args:
             command: ArchiveBox command to run
             timeout: Command timeout in seconds
+            input: Text to send on the command's stdin
 
         Returns:
             Dict with stdout, stderr, returncode
         """
         full_command = (
-            f"cd {self.data_dir} && "
+            f"cd {shlex.quote(self.data_dir)} && "
             f"sudo -u archivebox archivebox {command}"
         )
 
-        try:
-            logger.debug(f"[ArchiveBox] Running: {command}")
-            result = subprocess.run(
-                [
-                    "ssh",
-                    f"{self.ssh_user}@{self.ssh_host}",
-                    full_command
-                ],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+        logger.debug(f"[ArchiveBox] Running: {command}")
+        return self.transport.run(full_command, timeout=timeout, input=input)
 
-            return {
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
-            }
+    def _unavailable_result(self, url: str) -> Dict[str, Any]:
+        return {
+            "status": "error",
+            "url": url,
+            "error": "ArchiveBox not available",
+            "message": f"Cannot connect to {self.ssh_user}@{self.ssh_host}",
+        }
 
-        except subprocess.TimeoutExpired as e:
-            logger.error(f"[ArchiveBox] Command timed out after {timeout}s")
-            return {
-                "stdout": "",
-                "stderr": f"Command timed out after {timeout}s",
-                "returncode": -1,
-            }
-        except Exception as e:
-            logger.error(f"[ArchiveBox] Command failed: {e}")
-            return {
-                "stdout": "",
-                "stderr": str(e),
-                "returncode": -1,
-            }
+    def _archived_result(self, url: str, snapshot_id: Optional[str]) -> Dict[str, Any]:
+        return {
+            "status": "archived",
+            "url": url,
+            "snapshot_id": snapshot_id,
+            "archive_url": f"http://{self.ssh_host}:8000/archive/{snapshot_id}",
+            "archive_date": datetime.now().isoformat(),
+            "message": "Successfully archived with ArchiveBox",
+        }
 
     def archive_url(
         self,
@@ -144,17 +140,12 @@ class ArchiveBoxClient:
             Dict with status, archive_url, snapshot_id, and optional error
         """
         if not self.available:
-            return {
-                "status": "error",
-                "url": url,
-                "error": "ArchiveBox not available",
-                "message": f"Cannot connect to {self.ssh_user}@{self.ssh_host}",
-            }
+            return self._unavailable_result(url)
 
         # Build command
-        command = f"add '{url}'"
+        command = f"add {shlex.quote(url)}"
         if extractors:
-            command += f" --extractors={extractors}"
+            command += f" --extractors={shlex.quote(extractors)}"
 
         logger.info(f"[ArchiveBox] Archiving {url}...")
 
@@ -166,15 +157,7 @@ class ArchiveBoxClient:
             snapshot_id = self._extract_snapshot_id(result["stdout"], url)
 
             logger.info(f"[ArchiveBox] Success: {url} (snapshot: {snapshot_id})")
-
-            return {
-                "status": "archived",
-                "url": url,
-                "snapshot_id": snapshot_id,
-                "archive_url": f"http://{self.ssh_host}:8000/archive/{snapshot_id}",
-                "archive_date": datetime.now().isoformat(),
-                "message": "Successfully archived with ArchiveBox",
-            }
+            return self._archived_result(url, snapshot_id)
         else:
             error_msg = result["stderr"].strip() or result["stdout"].strip()
             logger.error(f"[ArchiveBox] Failed: {error_msg}")
@@ -186,6 +169,203 @@ class ArchiveBoxClient:
                 "message": f"ArchiveBox failed: {error_msg[:200]}",
             }
 
+    def archive_urls(
+        self,
+        urls: Iterable[str],
+        timeout_per_url: int = 180,
+        extractors: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Archive many URLs with a single `archivebox add` (URLs fed on stdin).
+
+        Args:
+            urls: URLs to archive
+            timeout_per_url: Seconds allowed per URL (the batch gets the sum)
+            extractors: Comma-separated list of extractors (None = defaults)
+
+        Returns:
+            Dict of url -> result dict, in the same format as archive_url()
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        if not self.available:
+            return {url: self._unavailable_result(url) for url in urls}
+
+        command = "add"
+        if extractors:
+            command += f" --extractors={shlex.quote(extractors)}"
+
+        logger.info(f"[ArchiveBox] Archiving {len(urls)} URL(s) in one batch...")
+
+        result = self._run_command(
+            command,
+            timeout=timeout_per_url * len(urls),
+            input="\n".join(urls) + "\n",
+        )
+
+        snapshot_ids = self._extract_batch_snapshot_ids(result["stdout"], urls)
+        missing = [url for url in urls if url not in snapshot_ids]
+        if missing:
+            # Output didn't name them (already in index, or batch cut short)
+            for url, status in self.get_snapshot_statuses(missing).items():
+                if status.get("is_archived"):
+                    snapshot_ids[url] = status.get("timestamp")
+
+        error_msg = result["stderr"].strip() or result["stdout"].strip()[-500:] or "Not archived"
+        results = {}
+        for url in urls:
+            if url in snapshot_ids:
+                results[url] = self._archived_result(url, snapshot_ids[url])
+            else:
+                results[url] = {
+                    "status": "error",
+                    "url": url,
+                    "error": error_msg,
+                    "message": f"ArchiveBox failed: {error_msg[:200]}",
+                }
+
+        logger.info(f"[ArchiveBox] Batch done: {len(snapshot_ids)}/{len(urls)} archived")
+        return results
+
+    def submit_urls(
+        self,
+        urls: Iterable[str],
+        timeout_per_url: int = 180,
+        extractors: Optional[str] = None,
+    ) -> Dict[str, Future]:
+        """
+        Start a batched add in the background and return a Future per URL.
+
+        While the batch runs, snapshot status is polled every poll_interval
+        seconds, so each URL's Future resolves as soon as ArchiveBox reports
+        its snapshot archived rather than when the whole batch finishes.
+
+        Args:
+            urls: URLs to archive
+            timeout_per_url: Seconds allowed per URL (the batch gets the sum)
+            extractors: Comma-separated list of extractors (None = defaults)
+
+        Returns:
+            Dict of url -> Future resolving to an archive_url()-style result dict
+        """
+        futures = {url: Future() for url in dict.fromkeys(urls)}
+        if futures:
+            threading.Thread(
+                target=self._run_batch,
+                args=(futures, timeout_per_url, extractors),
+                daemon=True,
+                name="archivebox-batch",
+            ).start()
+        return futures
+
+    def _run_batch(self, futures: Dict[str, Future], timeout_per_url: int, extractors: Optional[str]):
+        """Thread: run archive_urls() while polling snapshot status for early results."""
+        batch_done = threading.Event()
+        poller = threading.Thread(
+            target=self._poll_snapshots,
+            args=(futures, batch_done),
+            daemon=True,
+            name="archivebox-poll",
+        )
+        poller.start()
+
+        try:
+            results = self.archive_urls(list(futures), timeout_per_url, extractors)
+        except Exception as e:
+            logger.error(f"[ArchiveBox] Batch failed: {e}", exc_info=True)
+            results = {url: {"status": "error", "url": url, "error": str(e)} for url in futures}
+        finally:
+            batch_done.set()
+            poller.join()
+
+        for url, future in futures.items():
+            if not future.done():
+                future.set_result(results[url])
+
+    def _poll_snapshots(self, futures: Dict[str, Future], batch_done: threading.Event):
+        """Thread: resolve futures whose snapshots are archived until the batch ends."""
+        while not batch_done.wait(self.poll_interval):
+            pending = [url for url, future in futures.items() if not future.done()]
+            if not pending:
+                return
+            try:
+                statuses = self.get_snapshot_statuses(pending)
+            except Exception as e:
+                logger.debug(f"[ArchiveBox] Status poll failed: {e}")
+                continue
+            for url, status in statuses.items():
+                if status.get("is_archived"):
+                    futures[url].set_result(self._archived_result(url, status.get("timestamp")))
+
+    def get_snapshot_statuses(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up snapshots for URLs (one `archivebox list` per STATUS_QUERY_CHUNK URLs).
+
+        Args:
+            urls: URLs to look up
+
+        Returns:
+            Dict of url -> {"timestamp", "is_archived", "title"} for URLs in the index
+        """
+        urls = list(urls)
+        statuses = {}
+        for start in range(0, len(urls), STATUS_QUERY_CHUNK):
+            chunk = urls[start:start + STATUS_QUERY_CHUNK]
+            result = self._run_command(
+                "list --json --filter-type=exact " + " ".join(shlex.quote(url) for url in chunk),
+                timeout=30,
+            )
+            if result["returncode"] != 0:
+                continue
+            for snapshot in self._parse_snapshot_json(result["stdout"]):
+                if snapshot.get("url") in chunk:
+                    statuses[snapshot["url"]] = {
+                        "timestamp": snapshot.get("timestamp"),
+                        "is_archived": bool(snapshot.get("is_archived")),
+                        "title": snapshot.get("title"),
+                    }
+        return statuses
+
+    @staticmethod
+    def _parse_snapshot_json(output: str) -> List[Dict[str, Any]]:
+        """Parse `archivebox list --json` output (a JSON array, or one object per line)."""
+        output = output.strip()
+        if not output:
+            return []
+        try:
+            data = json.loads(output)
+            return data if isinstance(data, list) else [data]
+        except json.JSONDecodeError:
+            snapshots = []
+            for line in output.splitlines():
+                try:
+                    snapshots.append(json.loads(line))
+                except json.JSONDecodeError:
+                    pass
+            return snapshots
+
+    @staticmethod
+    def _extract_batch_snapshot_ids(output: str, urls: List[str]) -> Dict[str, str]:
+        """
+        Map URLs to snapshot IDs from batched `archivebox add` output.
+
+        Each archived link is printed as its URL followed by its snapshot
+        directory (`> ./archive/1764018763.676681`).
+        """
+        wanted = set(urls)
+        snapshot_ids = {}
+        current = None
+        for line in output.splitlines():
+            stripped = line.strip()
+            if stripped in wanted:
+                current = stripped
+                continue
+            match = re.search(r'archive/(\d+\.\d+)', stripped)
+            if match and current and current not in snapshot_ids:
+                snapshot_ids[current] = match.group(1)
+        return snapshot_ids
+
     def _extract_snapshot_id(self, output: str, url: str) -> Optional[str]:
         """
         Extract snapshot ID from ArchiveBox output.
@@ -194,7 +374,6 @@ class ArchiveBoxClient:
         """
         # Try to find the snapshot directory in output
         # Format: /opt/archivebox/data/archive/1764018763.676681
-        import re
         match = re.search(r'/archive/(\d+\.\d+)', output)
         if match:
             return match.group(1)
@@ -310,7 +489,6 @@ class ArchiveBoxClient:
         version = "unknown"
         if result["returncode"] == 0:
             # Parse version from output
-            import re
             match = re.search(r'ArchiveBox v([\d.]+)', result["stdout"])
             if match:
                 version = match.group(1)
@@ -320,7 +498,6 @@ class ArchiveBoxClient:
         total_snapshots = 0
         if stats_result["returncode"] == 0:
             # Parse snapshot count from status output
-            import re
             match = re.search(r'(\d+)\s+Snapshots', stats_result["stdout"])
             if match:
                 total_snapshots = int(match.group(1))
@@ -1,13 +1,23 @@
-"""Browser bookmarks reader for Chrome/Edge/Firefox."""
+"""Browser bookmarks reader for Chrome/Edge/Firefox.
 
+read_changed_bookmarks() supports incremental imports: it takes the state
+from the previous run (per bookmarks file: mtime, size, content hash and a
+high-water mark) and returns only bookmarks added or changed since, without
+reading or copying files that haven't changed.
+"""
+
+import hashlib
 import json
+import logging
 import sqlite3
 import shutil
 import tempfile
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class Bookmark:
     """Represents a browser bookmark."""
@@ -93,21 +103,32 @@ class BookmarksReader:
             for child in node.get("children", []):
                 self._parse_bookmark_tree(child, bookmarks)
 
-    def _read_firefox_bookmarks(self, db_path: Path) -> List[Bookmark]:
+    def _read_firefox_bookmarks(self, db_path: Path, modified_after: int = 0) -> List[Bookmark]:
         """
         Read bookmarks from Firefox places.sqlite database.
 
         Firefox can lock the database, so we copy it to a temp location first.
+
+        Args:
+            db_path: Path to places.sqlite
+            modified_after: Only bookmarks with lastModified above this
+                            (microseconds since epoch; 0 = all)
         """
         bookmarks = []
 
         # Copy database to temp location (Firefox may have it locked)
         with tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite") as tmp_file:
             tmp_path = Path(tmp_file.name)
+        tmp_wal = Path(f"{tmp_path}-wal")
 
         try:
             shutil.copy2(db_path, tmp_path)
 
+            # Recent changes may only be in the write-ahead log
+            wal_path = Path(f"{db_path}-wal")
+            if wal_path.exists():
+                shutil.copy2(wal_path, tmp_wal)
+
             # Connect to the copy
             conn = sqlite3.connect(tmp_path)
             cursor = conn.cursor()
@@ -125,9 +146,10 @@ class BookmarksReader:
                 JOIN moz_places p ON b.fk = p.id
                 WHERE b.type = 1  -- Type 1 is bookmark (not folder or separator)
                 AND p.url IS NOT NULL
+                AND b.lastModified > ?
             """
 
-            cursor.execute(query)
+            cursor.execute(query, (modified_after,))
             rows = cursor.fetchall()
 
             for row in rows:
@@ -148,9 +170,10 @@ class BookmarksReader:
             conn.close()
 
         finally:
-            # Clean up temp file
-            if tmp_path.exists():
-                tmp_path.unlink()
+            # Clean up temp files
+            for path in (tmp_path, tmp_wal):
+                if path.exists():
+                    path.unlink()
 
         return bookmarks
 
@@ -182,25 +205,10 @@ class BookmarksReader:
 
         # Handle Chrome/Edge (JSON files)
         if browser not in ["firefox"]:
-            paths_to_try = []
-            if browser == "auto":
-                paths_to_try = self.bookmarks_paths
-            elif browser == "edge":
-                paths_to_try = [p for p in self.bookmarks_paths if "Edge" in str(p)]
-            elif browser == "chrome":
-                paths_to_try = [p for p in self.bookmarks_paths if "Chrome" in str(p)]
-
-            for path in paths_to_try:
+            for path in self._chrome_paths_for(browser):
                 if path.exists():
                     try:
-                        with open(path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-
-                        # Parse bookmark tree
-                        roots = data.get("roots", {})
-                        for root_name, root_node in roots.items():
-                            if root_name in ["bookmark_bar", "other", "synced"]:
-                                self._parse_bookmark_tree(root_node, bookmarks)
+                        bookmarks.extend(self._read_chrome_bookmarks(path))
 
                         # If we found bookmarks and we're not in auto mode, return them
                         if bookmarks and browser != "auto":
@@ -211,6 +219,126 @@ class BookmarksReader:
 
         return bookmarks
 
+    def _chrome_paths_for(self, browser: str) -> List[Path]:
+        """Chrome/Edge bookmarks files to read for a browser choice."""
+        if browser == "auto":
+            return self.bookmarks_paths
+        if browser == "edge":
+            return [p for p in self.bookmarks_paths if "Edge" in str(p) or "edge" in str(p)]
+        if browser == "chrome":
+            return [p for p in self.bookmarks_paths if "Chrome" in str(p) or "chrome" in str(p)]
+        return []
+
+    @staticmethod
+    def _file_signature(paths: List[Path]) -> Optional[Dict]:
+        """mtime/size of a bookmarks file (plus its side files), None if missing."""
+        if not paths[0].exists():
+            return None
+        return {
+            str(path.name): [path.stat().st_mtime_ns, path.stat().st_size]
+            for path in paths if path.exists()
+        }
+
+    @staticmethod
+    def _file_hash(paths: List[Path]) -> str:
+        digest = hashlib.sha256()
+        for path in paths:
+            if path.exists():
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(block)
+        return digest.hexdigest()
+
+    def read_changed_bookmarks(
+        self,
+        browser: str = "auto",
+        state: Optional[Dict] = None,
+    ) -> Tuple[List[Bookmark], Dict]:
+        """
+        Read only bookmarks added or changed since a previous read.
+
+        Each source file is skipped outright if its mtime/size are unchanged,
+        and after that if its content hash is unchanged. Changed sources only
+        yield bookmarks past their high-water mark: Firefox lastModified
+        (catches edits too), Chrome/Edge date_added (Chrome doesn't track
+        per-bookmark edits).
+
+        Args:
+            browser: "edge", "chrome", "firefox", or "auto" (tries all)
+            state: State returned by the previous call (None/{} = read everything)
+
+        Returns:
+            Tuple of (new/changed bookmarks, state to pass next time)
+        """
+        state = dict(state or {})
+        bookmarks = []
+
+        sources = []
+        if browser in ["firefox", "auto"]:
+            sources += [("firefox", p) for p in self._get_firefox_paths()]
+        if browser != "firefox":
+            sources += [("chrome", p) for p in self._chrome_paths_for(browser)]
+
+        for kind, path in sources:
+            files = [path, Path(f"{path}-wal")] if kind == "firefox" else [path]
+            signature = self._file_signature(files)
+            if signature is None:
+                continue
+
+            key = str(path)
+            previous = state.get(key, {})
+            if previous.get("signature") == signature:
+                continue
+
+            try:
+                content_hash = self._file_hash(files)
+                if previous.get("hash") == content_hash:
+                    state[key] = {**previous, "signature": signature}
+                    continue
+
+                high_water = previous.get("high_water", 0)
+                if kind == "firefox":
+                    found = self._read_firefox_bookmarks(path, modified_after=high_water)
+                    marks = [b.date_modified or 0 for b in found]
+                else:
+                    found = self._read_chrome_bookmarks(path, added_after=high_water)
+                    marks = [int(b.date_added or 0) for b in found]
+
+            except Exception as e:
+                logger.warning(f"Skipping unreadable {kind} bookmarks {path}: {e}")
+                continue
+
+            bookmarks.extend(found)
+            state[key] = {
+                "signature": signature,
+                "hash": content_hash,
+                "high_water": max([high_water] + marks),
+            }
+
+        return bookmarks, state
+
+    def _read_chrome_bookmarks(self, path: Path, added_after: int = 0) -> List[Bookmark]:
+        """
+        Read bookmarks from a Chrome/Edge Bookmarks JSON file.
+
+        Args:
+            path: Bookmarks file
+            added_after: Only bookmarks with date_added above this
+                         (Chrome timestamp, microseconds since 1601; 0 = all)
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        bookmarks = []
+        roots = data.get("roots", {})
+        for root_name, root_node in roots.items():
+            if root_name in ["bookmark_bar", "other", "synced"]:
+                self._parse_bookmark_tree(root_node, bookmarks)
+
+        if added_after:
+            bookmarks = [b for b in bookmarks if int(b.date_added or 0) > added_after]
+        return bookmarks
+
     def get_bookmark_urls(self, browser: str = "auto") -> List[str]:
         """Get just the URLs from bookmarks."""
         bookmarks = self.read_bookmarks(browser)
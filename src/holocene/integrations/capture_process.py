@@ -0,0 +1,162 @@
+"""Run capture tools (monolith, wget) as resource-limited child processes.
+
+subprocess.run() gives no progress, can't be cancelled, and lets a runaway
+capture of a huge page eat all memory on rei. run_capture() streams output
+lines to a callback, kills the whole process group on timeout or
+cancellation, and applies rlimits (address space, CPU time, niceness) to
+the child on POSIX systems.
+"""
+
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False
+
+logger = logging.getLogger(__name__)
+
+
+class CaptureCancelled(Exception):
+    """The capture was cancelled while its process was running."""
+
+
+@dataclass
+class ResourceLimits:
+    """Limits applied to a capture process (POSIX only; ignored elsewhere)."""
+
+    memory_mb: Optional[int] = 1024  # RLIMIT_AS
+    cpu_seconds: Optional[int] = 300  # RLIMIT_CPU
+    nice: int = 10  # Lower priority than holod itself
+
+    def apply(self, pid: int = 0):
+        """
+        Apply the limits to a process.
+
+        Args:
+            pid: Process to limit (0 = the current process, e.g. in preexec_fn)
+        """
+        if self.nice:
+            os.setpriority(os.PRIO_PROCESS, pid, self.nice)
+        if not HAS_RESOURCE:
+            return
+
+        def setlimit(which, value):
+            if pid:
+                resource.prlimit(pid, which, (value, value))
+            else:
+                resource.setrlimit(which, (value, value))
+
+        if self.memory_mb:
+            setlimit(resource.RLIMIT_AS, self.memory_mb * 1024 * 1024)
+        if self.cpu_seconds:
+            setlimit(resource.RLIMIT_CPU, self.cpu_seconds)
+
+
+def _kill(process: subprocess.Popen):
+    """Kill the process and anything it spawned."""
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_capture(
+    args: List[str],
+    timeout: float,
+    cwd: Optional[str] = None,
+    limits: Optional[ResourceLimits] = None,
+    on_output: Optional[Callable[[str], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run a capture tool, streaming its output.
+
+    Args:
+        args: Command and arguments
+        timeout: Seconds before the process is killed
+        cwd: Working directory
+        limits: Resource limits for the child (POSIX only)
+        on_output: Called with each line of stdout/stderr as it arrives
+        cancel: Set this event to kill the process
+
+    Returns:
+        CompletedProcess with the collected stdout and stderr text
+
+    Raises:
+        subprocess.TimeoutExpired: The process ran longer than timeout
+        CaptureCancelled: cancel was set
+    """
+    posix = os.name == "posix"
+    # preexec_fn can deadlock in a threaded process, so limit the child from
+    # outside with prlimit (Linux) where possible
+    limit_after_spawn = bool(limits and posix and HAS_RESOURCE and hasattr(resource, "prlimit"))
+    process = subprocess.Popen(
+        args,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        start_new_session=posix,  # Own process group, so wget's children die with it
+        preexec_fn=limits.apply if limits and posix and not limit_after_spawn else None,
+    )
+    if limit_after_spawn:
+        try:
+            limits.apply(process.pid)
+        except ProcessLookupError:
+            pass  # Already exited
+
+    collected = {"stdout": [], "stderr": []}
+
+    def pump(stream, name):
+        for line in stream:
+            collected[name].append(line)
+            if on_output:
+                try:
+                    on_output(line.rstrip())
+                except Exception as e:
+                    logger.debug(f"[Capture] Progress callback failed: {e}")
+        stream.close()
+
+    readers = [
+        threading.Thread(target=pump, args=(process.stdout, "stdout"), daemon=True),
+        threading.Thread(target=pump, args=(process.stderr, "stderr"), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                process.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            if cancel is not None and cancel.is_set():
+                raise CaptureCancelled(f"{args[0]} cancelled")
+            if time.monotonic() > deadline:
+                raise subprocess.TimeoutExpired(args, timeout)
+    finally:
+        if process.poll() is None:  # Timed out, cancelled or interrupted
+            _kill(process)
+        process.wait()
+        for reader in readers:
+            reader.join(timeout=5)
+
+    return subprocess.CompletedProcess(
+        args, process.returncode, "".join(collected["stdout"]), "".join(collected["stderr"])
+    )
@@ -0,0 +1,346 @@
+"""Resumable crawler over a persistent frontier (crawl_frontier table).
+
+Crawl jobs (e.g. Mercado Livre product enrichment) queue (key, url) pairs
+in the database; a Crawler then works through them:
+
+- Bounded concurrency: a fixed worker pool fetches and parses pages
+- Per-host politeness: request starts to the same host are spaced by a
+  jittered delay, shared by all workers; 429/5xx responses slow the host down
+- Conditional GETs and HTML cache reuse through HTTPFetcher
+- Batched writes: results are saved and frontier rows updated in one
+  transaction per batch, on the calling thread (workers never touch the DB)
+- Resumable: rows are only marked done once their results are written, and
+  rows left in_progress by an interrupted run go back to pending
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Worker result source -> stats counter
+SOURCE_STATS = {"network": "fetched", "cache": "cached", "not_modified": "not_modified"}
+
+
+class HostThrottle:
+    """Spaces request starts per host (delay ± jitter) across threads."""
+
+    def __init__(self, delay: float, jitter: float = 0.0):
+        """
+        Initialize throttle.
+
+        Args:
+            delay: Seconds between request starts to the same host
+            jitter: Random +/- seconds added to each delay
+        """
+        self.delay = delay
+        self.jitter = jitter
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        Block until this host may be requested again, reserving the slot.
+
+        Args:
+            host: Host name
+            stop_event: Abort waiting when set
+
+        Returns:
+            True when the request may go ahead, False if stopped
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            gap = max(0.0, self.delay + random.uniform(-self.jitter, self.jitter))
+            self._next_slot[host] = slot + gap
+
+        delay = slot - now
+        if delay <= 0:
+            return not (stop_event and stop_event.is_set())
+        if stop_event:
+            return not stop_event.wait(delay)
+        time.sleep(delay)
+        return True
+
+    def penalize(self, host: str, seconds: float):
+        """Push the host's next slot back (after 429s or server errors)."""
+        with self._lock:
+            now = time.monotonic()
+            self._next_slot[host] = max(self._next_slot.get(host, now), now) + seconds
+
+
+class Crawler:
+    """Works through one job's crawl frontier."""
+
+    def __init__(
+        self,
+        db,
+        job: str,
+        fetcher,
+        parse: Callable[[str, Dict, Dict], Optional[Dict]],
+        save: Callable[[Any, List[Tuple[Dict, Dict]]], None],
+        concurrency: int = 2,
+        delay: float = 7.0,
+        jitter: float = 2.0,
+        batch_size: int = 20,
+        max_attempts: int = 3,
+        retry_delay: float = 600.0,
+        use_cache: bool = True,
+        timeout: int = 30,
+    ):
+        """
+        Initialize crawler.
+
+        Args:
+            db: Database instance
+            job: Crawl job name (crawl_frontier.job)
+            fetcher: HTTPFetcher (conditional GETs + HTML cache)
+            parse: parse(html, entry, page) -> data dict; runs in worker threads
+            save: save(db, [(entry, data), ...]); runs on the calling thread and
+                must not commit (the crawler commits with the frontier update)
+            concurrency: Worker threads
+            delay: Seconds between request starts to the same host
+            jitter: Random +/- seconds on each delay
+            batch_size: Results per database transaction
+            max_attempts: Give up on an entry after this many failures
+            retry_delay: Base backoff in seconds (doubles per attempt)
+            use_cache: Parse cached HTML instead of fetching on an entry's first crawl
+            timeout: Request timeout in seconds
+        """
+        self.db = db
+        self.job = job
+        self.fetcher = fetcher
+        self.parse = parse
+        self.save = save
+        self.concurrency = max(1, concurrency)
+        self.throttle = HostThrottle(delay, jitter)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.use_cache = use_cache
+        self.timeout = timeout
+
+        self.running = False
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {"fetched": 0, "cached": 0, "not_modified": 0, "saved": 0, "retrying": 0, "failed": 0}
+
+    def run(
+        self,
+        limit: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+        on_result: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Crawl due frontier entries until none are left (or limit/stop).
+
+        Args:
+            limit: Maximum entries to crawl
+            stop_event: Stop claiming work when set; waiting workers give up
+                and their entries go back to pending
+            on_result: Called with each worker result (for progress output)
+
+        Returns:
+            Stats for this run
+        """
+        stop_event = stop_event or threading.Event()
+        self.stats = self._empty_stats()
+        self.running = True
+
+        resumed = self.db.reset_crawl_in_progress(self.job)
+        if resumed:
+            logger.info(f"[Crawler:{self.job}] Resuming {resumed} interrupted entr{'y' if resumed == 1 else 'ies'}")
+
+        claimed = 0
+        exhausted = False
+        results: List[Dict] = []
+        in_flight = {}
+        halt = threading.Event()  # Tells waiting workers to give up
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix=f"crawl-{self.job}"
+            ) as pool:
+                try:
+                    while True:
+                        if stop_event.is_set():
+                            halt.set()
+
+                        # Keep a short queue per worker so nobody idles between batches
+                        room = self.concurrency * 2 - len(in_flight)
+                        if limit is not None:
+                            room = min(room, limit - claimed)
+                        if room > 0 and not exhausted and not halt.is_set():
+                            entries = self.db.claim_crawl_entries(self.job, room)
+                            exhausted = len(entries) < room
+                            for entry in entries:
+                                in_flight[pool.submit(self._crawl, entry, halt)] = entry
+                            claimed += len(entries)
+
+                        if not in_flight:
+                            break
+
+                        done, _ = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            del in_flight[future]
+                            result = future.result()  # _crawl doesn't raise
+                            results.append(result)
+                            if on_result:
+                                on_result(result)
+
+                        if len(results) >= self.batch_size or (results and not in_flight):
+                            self._flush(results)
+                            results = []
+                except BaseException:
+                    # Ctrl-C or a failed write: unclaimed work stays in_progress
+                    # and is picked up again by the next run
+                    halt.set()
+                    raise
+        finally:
+            if results:
+                self._flush(results)
+            self.running = False
+
+        return dict(self.stats)
+
+    def _crawl(self, entry: Dict, stop_event: threading.Event) -> Dict:
+        """Worker: fetch (or reuse) and parse one page. Never touches the DB."""
+        result = {
+            "entry": entry,
+            "ok": False,
+            "cancelled": False,
+            "source": None,
+            "data": None,
+            "status_code": None,
+            "etag": None,
+            "last_modified": None,
+            "error": None,
+            "retry": False,
+        }
+
+        try:
+            page = None
+            # First crawl of an entry: a page cached by an earlier fetch is as good as a new one
+            if self.use_cache and entry.get("last_status") is None:
+                cached = self.fetcher.read_cache(entry["key"])
+                if cached:
+                    page = {"html": cached[0], "cached_path": cached[1], "status_code": 200,
+                            "etag": None, "last_modified": None, "not_modified": False}
+                    result["source"] = "cache"
+
+            if page is None:
+                if not self.throttle.wait(entry["host"], stop_event):
+                    result["cancelled"] = True
+                    return result
+                page = self.fetcher.fetch_conditional(
+                    entry["url"],
+                    cache_key=entry["key"],
+                    etag=entry.get("etag"),
+                    last_modified=entry.get("last_modified"),
+                    timeout=self.timeout,
+                )
+                result["source"] = "not_modified" if page["not_modified"] else "network"
+
+            result["status_code"] = page["status_code"]
+            result["etag"] = page["etag"]
+            result["last_modified"] = page["last_modified"]
+
+            if not page["not_modified"]:
+                result["data"] = self.parse(page["html"], entry, page)
+            result["ok"] = True
+
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            result["status_code"] = status
+            result["error"] = str(e)
+            # Rate limiting and server errors are worth retrying; other 4xx aren't
+            result["retry"] = status is None or status == 429 or status >= 500
+            if result["retry"]:
+                self.throttle.penalize(entry["host"], self.throttle.delay * 4)
+
+        except requests.exceptions.RequestException as e:
+            result["error"] = str(e)
+            result["retry"] = True
+
+        except Exception as e:
+            logger.warning(f"[Crawler:{self.job}] Failed to process {entry['url']}: {e}")
+            result["error"] = f"{type(e).__name__}: {e}"
+
+        return result
+
+    def _flush(self, results: List[Dict]):
+        """Save a batch of results and update the frontier in one transaction."""
+        cancelled = [r["entry"]["id"] for r in results if r["cancelled"]]
+        finished = [r for r in results if not r["cancelled"]]
+        now = datetime.now()
+
+        outcomes = []
+        for r in finished:
+            entry = r["entry"]
+            outcome = {
+                "id": entry["id"],
+                "attempts": entry["attempts"],
+                "next_attempt_at": None,
+                "etag": r["etag"],
+                "last_modified": r["last_modified"],
+                "last_status": r["status_code"],
+                "last_error": r["error"],
+            }
+            if r["ok"]:
+                outcome["status"] = "done"
+            else:
+                attempts = entry["attempts"] + 1
+                outcome["attempts"] = attempts
+                if r["retry"] and attempts < self.max_attempts:
+                    backoff = self.retry_delay * (2 ** (attempts - 1))
+                    outcome["status"] = "pending"
+                    outcome["next_attempt_at"] = (now + timedelta(seconds=backoff)).isoformat()
+                else:
+                    outcome["status"] = "failed"
+            outcomes.append(outcome)
+
+        saves = [(r["entry"], r["data"]) for r in finished if r["ok"] and r["data"] is not None]
+
+        try:
+            self.save(self.db, saves)
+            self.db.complete_crawl_entries(outcomes, commit=False)
+            self.db.conn.commit()
+        except Exception as e:
+            self.db.conn.rollback()
+            logger.error(f"[Crawler:{self.job}] Failed to write batch: {e}", exc_info=True)
+            cancelled += [r["entry"]["id"] for r in finished]
+            finished = []
+
+        if cancelled:
+            self.db.reset_crawl_in_progress(self.job, cancelled)
+
+        for r, outcome in zip(finished, outcomes):
+            if r["ok"]:
+                self.stats[SOURCE_STATS[r["source"]]] += 1
+                if r["data"] is not None:
+                    self.stats["saved"] += 1
+            elif outcome["status"] == "pending":
+                self.stats["retrying"] += 1
+            else:
+                self.stats["failed"] += 1
+
+    def get_status(self) -> Dict[str, Any]:
+        """Crawler state plus frontier counts, for status displays."""
+        return {
+            "job": self.job,
+            "running": self.running,
+            "concurrency": self.concurrency,
+            "delay": self.throttle.delay,
+            "last_run": dict(self.stats),
+            "frontier": self.db.get_crawl_stats(self.job),
+        }
@@ -1,12 +1,34 @@
-"""Local git repository scanner and activity tracker."""
-
+"""Local git repository scanner and activity tracker.
+
+With a Database, GitScanner keeps an incremental commit index (git_repos /
+git_commits tables) instead of running git log in every repo for every
+summary:
+
+- Repos are discovered once and rediscovered only when the scan directory's
+  mtime changes
+- A repo whose ref files haven't changed since the last index is skipped
+  without running git at all
+- Otherwise only commits not reachable from the previously indexed ref tips
+  are read, in parallel across repos
+- Activity summaries are then a single indexed query
+"""
+
+import logging
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
+# Unit separator - can't appear in names or subjects, unlike "|"
+LOG_FIELD_SEP = "\x1f"
+LOG_FORMAT = "--format=%H%x1f%an%x1f%ai%x1f%ct%x1f%s"
+
 
 class GitRepo:
     """Represents a local git repository."""
@@ -19,14 +41,14 @@ class GitRepo:
         self._is_fork = None
         self._owner = None
 
-    def _run_git(self, *args) -> Optional[str]:
+    def _run_git(self, *args, timeout: int = 5) -> Optional[str]:
         """Run a git command in the repo directory."""
         try:
             result = subprocess.run(
                 ["git", "-C", str(self.path)] + list(args),
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=timeout,
             )
             if result.returncode == 0:
                 return result.stdout.strip()
@@ -99,6 +121,80 @@ class GitRepo:
         """Get count of commits since a specific date."""
         return len(self.get_commits_since(since))
 
+    def refs_fingerprint(self) -> Optional[float]:
+        """Latest mtime among the files git updates when any ref moves.
+
+        Covers HEAD, packed-refs, the HEAD reflog and everything under refs/
+        (directories too, so deleted branches count). Cheap stat calls only.
+
+        Returns:
+            Fingerprint, or None if .git isn't a plain directory (worktrees,
+            submodules) and the refs have to be asked from git
+        """
+        git_dir = self.path / ".git"
+        if not git_dir.is_dir():
+            return None
+
+        latest = 0.0
+        for name in ("HEAD", "packed-refs", "logs/HEAD"):
+            try:
+                latest = max(latest, (git_dir / name).stat().st_mtime)
+            except OSError:
+                pass
+
+        for root, dirs, files in os.walk(git_dir / "refs"):
+            for entry in [root] + [os.path.join(root, f) for f in files]:
+                try:
+                    latest = max(latest, os.stat(entry).st_mtime)
+                except OSError:
+                    pass
+
+        return latest
+
+    def get_ref_tips(self) -> Optional[List[str]]:
+        """Get the commit hashes HEAD and every ref point at (sorted, unique).
+
+        Returns:
+            List of hashes ([] for a repo without commits), None if git failed
+        """
+        output = self._run_git("show-ref", "--head", "--hash")
+        if output is None:
+            # show-ref exits 1 when there are no refs at all
+            return [] if self._run_git("rev-parse", "--git-dir") is not None else None
+        return sorted(set(output.split()))
+
+    def get_new_commits(self, known_tips: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Get commits on any ref that aren't reachable from known_tips.
+
+        Args:
+            known_tips: Ref tips from the previous index ([] = full history)
+
+        Returns:
+            Commit dicts (full hash, author, date, committed_at, subject),
+            or None if git failed
+        """
+        log = self._run_git("log", "--all", LOG_FORMAT, "--not", *known_tips, timeout=60)
+        if log is None and known_tips:
+            # An old tip was garbage-collected (rebase + gc) - reread everything
+            log = self._run_git("log", "--all", LOG_FORMAT, timeout=60)
+        if log is None:
+            return None
+
+        commits = []
+        for line in log.split("\n"):
+            parts = line.split(LOG_FIELD_SEP, 4)
+            if len(parts) == 5:
+                commit_hash, author, date_str, committed_at, subject = parts
+                commits.append({
+                    "hash": commit_hash,
+                    "author": author,
+                    "date": date_str,
+                    "committed_at": int(committed_at),
+                    "subject": subject,
+                })
+
+        return commits
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -113,28 +209,45 @@ class GitRepo:
 class GitScanner:
     """Scans local directories for git repositories."""
 
-    def __init__(self, scan_path: Path, github_token: Optional[str] = None):
+    def __init__(
+        self,
+        scan_path: Path,
+        github_token: Optional[str] = None,
+        db=None,
+        max_workers: int = 8,
+    ):
         """
         Initialize git scanner.
 
         Args:
             scan_path: Directory to scan for repos
             github_token: Optional GitHub API token for enriching public repos
+            db: Optional Database - enables the incremental commit index
+            max_workers: Repos to run git in at once
         """
         self.scan_path = Path(scan_path)
         self.github_token = github_token
+        self.db = db
+        self.max_workers = max_workers
         self._repos_cache = None
+        self._scan_mtime = None
 
     def scan_repos(self) -> List[GitRepo]:
-        """Scan for all git repositories in scan_path."""
-        if self._repos_cache is not None:
+        """Scan for all git repositories in scan_path.
+
+        Cached until scan_path's mtime changes (a repo directory added,
+        removed or renamed).
+        """
+        try:
+            scan_mtime = self.scan_path.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        if self._repos_cache is not None and scan_mtime == self._scan_mtime:
             return self._repos_cache
 
         repos = []
 
-        if not self.scan_path.exists():
-            return repos
-
         # Look for .git directories (one level deep)
         for item in self.scan_path.iterdir():
             if not item.is_dir():
@@ -145,6 +258,7 @@ class GitScanner:
                 repos.append(GitRepo(item))
 
         self._repos_cache = repos
+        self._scan_mtime = scan_mtime
         return repos
 
     def get_repo_by_name(self, name: str) -> Optional[GitRepo]:
@@ -155,20 +269,112 @@ class GitScanner:
                 return repo
         return None
 
+    def refresh_index(self) -> Dict[str, int]:
+        """
+        Bring the commit index up to date with the repos on disk.
+
+        Requires a Database. Repos whose ref files are unchanged are skipped
+        without running git; the rest are read in parallel, each only for
+        commits since its previously indexed ref tips.
+
+        Returns:
+            Dict with repos, checked (git was run), changed and new_commits
+        """
+        if self.db is None:
+            raise ValueError("refresh_index requires GitScanner(db=...)")
+
+        repos = self.scan_repos()
+        states = self.db.get_git_repo_states()
+
+        # Forget repos that disappeared from the scan path
+        current = {str(repo.path) for repo in repos}
+        gone = [
+            path for path in states
+            if Path(path).parent == self.scan_path and path not in current
+        ]
+        self.db.remove_git_repos(gone)
+
+        to_check = []
+        for repo in repos:
+            fingerprint = repo.refs_fingerprint()
+            state = states.get(str(repo.path))
+            if state and fingerprint is not None and state["refs_mtime"] == fingerprint:
+                continue
+            to_check.append((repo, fingerprint, state["ref_tips"] if state else []))
+
+        result = {"repos": len(repos), "checked": len(to_check), "changed": 0, "new_commits": 0}
+        if not to_check:
+            return result
+
+        def read_repo(item):
+            repo, fingerprint, known_tips = item
+            tips = repo.get_ref_tips()
+            if tips is None:
+                return None
+            if tips == known_tips:
+                return repo, fingerprint, tips, []
+            commits = repo.get_new_commits(known_tips)
+            if commits is None:
+                return None
+            return repo, fingerprint, tips, commits
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="git-scan") as pool:
+            outcomes = list(pool.map(read_repo, to_check))
+
+        # Database connections are per-thread - write from the calling thread
+        for outcome in outcomes:
+            if outcome is None:
+                continue
+            repo, fingerprint, tips, commits = outcome
+            added = self.db.index_git_commits(str(repo.path), repo.name, commits, tips, fingerprint)
+            if added:
+                result["changed"] += 1
+                result["new_commits"] += added
+
+        logger.debug(
+            f"[GitScanner] Indexed {result['new_commits']} new commits "
+            f"({result['checked']}/{result['repos']} repos checked)"
+        )
+        return result
+
+    def get_indexed_commits_since(self, since: datetime) -> List[Dict[str, Any]]:
+        """Refresh the index and get commits since a date across all repos.
+
+        Returns:
+            Commit dicts (repo_name, hash, author, date, subject), newest first
+        """
+        self.refresh_index()
+        repo_paths = [str(repo.path) for repo in self.scan_repos()]
+        return [
+            {**commit, "hash": commit["hash"][:7]}
+            for commit in self.db.get_git_commits_since(since, repo_paths=repo_paths)
+        ]
+
     def get_activity_since(self, since: datetime) -> Dict[str, Any]:
         """Get activity summary across all repos."""
         repos = self.scan_repos()
 
+        if self.db is not None:
+            counts = defaultdict(int)
+            for commit in self.get_indexed_commits_since(since):
+                counts[commit["repo_name"]] += 1
+            repo_counts = [(repo.name, counts.get(repo.name, 0)) for repo in repos]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="git-scan") as pool:
+                repo_counts = list(zip(
+                    [repo.name for repo in repos],
+                    pool.map(lambda repo: repo.get_commit_count_since(since), repos),
+                ))
+
         total_commits = 0
         active_repos = []
         commits_by_repo = {}
 
-        for repo in repos:
-            commit_count = repo.get_commit_count_since(since)
+        for repo_name, commit_count in repo_counts:
             if commit_count > 0:
                 total_commits += commit_count
-                active_repos.append(repo.name)
-                commits_by_repo[repo.name] = commit_count
+                active_repos.append(repo_name)
+                commits_by_repo[repo_name] = commit_count
 
         return {
             "total_commits": total_commits,
@@ -182,7 +388,7 @@ class GitScanner:
         activity = self.get_activity_since(since)
 
         if activity["total_commits"] == 0:
-            return f"No git commits found in {len(activity['total_repos_scanned'])} scanned repos."
+            return f"No git commits found in {activity['total_repos_scanned']} scanned repos."
 
         lines = [
             f"Git Activity ({activity['total_commits']} commits across {len(activity['active_repos'])} repos):"
@@ -5,14 +5,17 @@ Provides a clean abstraction for making HTTP requests with:
 - HTML caching to avoid re-fetch costs
 - Automatic SSL handling
 - Browser-like headers
+- Streaming downloads with a size cap (via page_content.fetch_capped)
+- Conditional GETs (ETag / Last-Modified) answered from the HTML cache
 """
 
-import requests
 import urllib3
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Any
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+from .page_content import fetch_capped, make_soup
+
 # Disable SSL warnings when using proxies
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -25,7 +28,8 @@ class HTTPFetcher:
         config,
         use_proxy: bool = False,
         cache_dir: Optional[Path] = None,
-        cache_enabled: bool = False
+        cache_enabled: bool = False,
+        max_bytes: int = 10 * 1024 * 1024,
     ):
         """
         Initialize HTTP fetcher.
@@ -35,8 +39,10 @@ class HTTPFetcher:
             use_proxy: Whether to use proxy for requests
             cache_dir: Directory for caching HTML (if cache_enabled)
             cache_enabled: Whether to cache fetched HTML
+            max_bytes: Stop downloading a page after this many bytes
         """
         self.config = config
+        self.max_bytes = max_bytes
         self.use_proxy = use_proxy
         self.cache_enabled = cache_enabled
         self.cache_dir = cache_dir
@@ -101,6 +107,68 @@ class HTTPFetcher:
             Tuple of (html_content, cached_path_relative)
             cached_path_relative is None if caching disabled
 
+        Raises:
+            requests.exceptions.RequestException: On fetch failure
+        """
+        result = self.fetch_conditional(url, cache_key, timeout=timeout, custom_headers=custom_headers)
+        return result['html'], result['cached_path']
+
+    def _cache_file(self, cache_key: Optional[str]) -> Optional[Path]:
+        """Path of the cached HTML for a key (None if caching is off)."""
+        if self.cache_enabled and self.cache_dir and cache_key:
+            return self.cache_dir / f"{cache_key}.html"
+        return None
+
+    def _relative_cache_path(self, html_file: Path) -> str:
+        """Cache path relative to data_dir for portability."""
+        try:
+            return str(html_file.relative_to(self.config.data_dir))
+        except ValueError:
+            # If not relative to data_dir, use absolute path
+            return str(html_file)
+
+    def read_cache(self, cache_key: Optional[str]) -> Optional[Tuple[str, str]]:
+        """
+        Read previously cached HTML.
+
+        Args:
+            cache_key: Unique key used when fetching
+
+        Returns:
+            Tuple of (html_content, cached_path_relative), or None if not cached
+        """
+        html_file = self._cache_file(cache_key)
+        if html_file is None or not html_file.exists():
+            return None
+        return html_file.read_text(encoding='utf-8'), self._relative_cache_path(html_file)
+
+    def fetch_conditional(
+        self,
+        url: str,
+        cache_key: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        timeout: int = 30,
+        custom_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch URL, revalidating against the cached copy when validators are given.
+
+        Validators are only sent when the page is in the HTML cache, so a
+        304 can always be answered from it.
+
+        Args:
+            url: URL to fetch
+            cache_key: Unique key for caching (e.g., item_id)
+            etag: ETag from the previous fetch
+            last_modified: Last-Modified from the previous fetch
+            timeout: Request timeout in seconds
+            custom_headers: Custom headers to merge with browser headers
+
+        Returns:
+            Dict with html, cached_path, status_code, etag, last_modified and
+            not_modified (True when the server answered 304)
+
         Raises:
             requests.exceptions.RequestException: On fetch failure
         """
@@ -109,34 +177,48 @@ class HTTPFetcher:
         if custom_headers:
             headers.update(custom_headers)
 
+        cached = self.read_cache(cache_key) if (etag or last_modified) else None
+        if cached:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
         # Get proxy if enabled
         proxies = self._get_proxy_dict()
 
         # Make request
-        response = requests.get(
+        response, html_content, _ = fetch_capped(
             url,
+            max_bytes=self.max_bytes,
             proxies=proxies,
             timeout=timeout,
             headers=headers,
             verify=False  # Disable SSL verification for proxies
         )
-        response.raise_for_status()
 
-        html_content = response.text
-        cached_path = None
+        result = {
+            'status_code': response.status_code,
+            'etag': response.headers.get('ETag') or etag,
+            'last_modified': response.headers.get('Last-Modified') or last_modified,
+            'not_modified': False,
+            'cached_path': None,
+        }
+
+        if response.status_code == 304 and cached:
+            result['html'], result['cached_path'] = cached
+            result['not_modified'] = True
+            return result
+
+        result['html'] = html_content
 
         # Cache if enabled
-        if self.cache_enabled and self.cache_dir and cache_key:
-            html_file = self.cache_dir / f"{cache_key}.html"
+        html_file = self._cache_file(cache_key)
+        if html_file is not None:
             html_file.write_text(html_content, encoding='utf-8')
-            # Return path relative to data_dir for portability
-            try:
-                cached_path = str(html_file.relative_to(self.config.data_dir))
-            except ValueError:
-                # If not relative to data_dir, use absolute path
-                cached_path = str(html_file)
+            result['cached_path'] = self._relative_cache_path(html_file)
 
-        return html_content, cached_path
+        return result
 
     def fetch_and_parse(
         self,
@@ -156,7 +238,7 @@ class HTTPFetcher:
             Tuple of (BeautifulSoup object, cached_path_relative)
         """
         html_content, cached_path = self.fetch(url, cache_key, timeout)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         return soup, cached_path
 
     @classmethod
@@ -0,0 +1,234 @@
+"""Long-lived IMAP mailbox connection with IDLE push and UID-based fetching.
+
+imaplib (before Python 3.14) has no IDLE support, so IDLE is driven over
+imaplib's public send()/readline() and the connection socket:
+
+    mailbox = IMAPMailbox(host, 993, user, password)
+    mailbox.connect()
+    while running:
+        for uid, raw in mailbox.fetch(mailbox.search_new(last_uid)):
+            ...
+        mailbox.idle(timeout=540)  # Returns when the server reports changes
+"""
+
+import imaplib
+import logging
+import re
+import select
+import socket
+import ssl
+from typing import Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_UID_RE = re.compile(rb"UID (\d+)")
+
+# Errors after which the connection should be dropped and reopened
+CONNECTION_ERRORS = (imaplib.IMAP4.abort, OSError, EOFError)
+
+
+class IMAPMailbox:
+    """One IMAP connection to one mailbox, kept open between checks."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        use_ssl: bool = True,
+        mailbox: str = "INBOX",
+        timeout: float = 30,
+    ):
+        """
+        Initialize mailbox (does not connect).
+
+        Args:
+            host: IMAP server
+            port: IMAP port
+            username: Login user
+            password: Login password
+            use_ssl: Use IMAP over TLS (port 993) instead of plain IMAP
+            mailbox: Mailbox to select
+            timeout: Socket timeout for commands, in seconds
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.mailbox = mailbox
+        self.timeout = timeout
+
+        self.conn: Optional[imaplib.IMAP4] = None
+        self.uidvalidity: Optional[int] = None
+        self._idle_count = 0
+
+    @property
+    def connected(self) -> bool:
+        return self.conn is not None
+
+    @property
+    def supports_idle(self) -> bool:
+        return bool(self.conn and "IDLE" in self.conn.capabilities)
+
+    def connect(self):
+        """Open the connection, log in and select the mailbox."""
+        self.close()
+        imap_class = imaplib.IMAP4_SSL if self.use_ssl else imaplib.IMAP4
+        conn = imap_class(self.host, self.port, timeout=self.timeout)
+        try:
+            conn.login(self.username, self.password)
+            status, _ = conn.select(self.mailbox)
+            if status != "OK":
+                raise imaplib.IMAP4.error(f"Could not select {self.mailbox}")
+            _, data = conn.response("UIDVALIDITY")
+            self.uidvalidity = int(data[0]) if data and data[0] else None
+        except BaseException:
+            self._shutdown(conn)
+            raise
+
+        self.conn = conn
+        logger.info(f"Connected to {self.host} ({self.mailbox}, IDLE: {'yes' if self.supports_idle else 'no'})")
+
+    def close(self):
+        """Log out and drop the connection (safe to call when not connected)."""
+        conn, self.conn = self.conn, None
+        if conn is None:
+            return
+        try:
+            conn.logout()
+        except Exception:
+            self._shutdown(conn)
+
+    def interrupt(self):
+        """Wake a thread blocked in idle() (from another thread); the connection is lost."""
+        if self.conn is not None:
+            self._shutdown(self.conn)
+
+    def search_new(self, last_uid: Optional[int] = None) -> List[int]:
+        """
+        Find unseen messages, only those above a UID high-water mark if given.
+
+        Args:
+            last_uid: Highest UID already processed (None = all unseen)
+
+        Returns:
+            Sorted list of UIDs
+        """
+        criteria = ["UNSEEN"] if last_uid is None else ["UID", f"{last_uid + 1}:*", "UNSEEN"]
+        status, data = self.conn.uid("SEARCH", None, *criteria)
+        if status != "OK":
+            raise imaplib.IMAP4.error(f"UID SEARCH failed: {data}")
+
+        uids = sorted(int(uid) for uid in (data[0] or b"").split())
+        # "n:*" always matches the newest message, even when its UID is below n
+        if last_uid is not None:
+            uids = [uid for uid in uids if uid > last_uid]
+        return uids
+
+    def fetch(self, uids: List[int], batch_size: int = 25) -> Iterator[Tuple[int, bytes]]:
+        """
+        Fetch full messages, several per FETCH command (marks them seen).
+
+        Args:
+            uids: Message UIDs
+            batch_size: UIDs per FETCH
+
+        Yields:
+            (uid, raw RFC822 bytes), in UID order
+        """
+        uids = sorted(uids)
+        for start in range(0, len(uids), batch_size):
+            batch = uids[start:start + batch_size]
+            status, data = self.conn.uid("FETCH", ",".join(map(str, batch)), "(UID RFC822)")
+            if status != "OK":
+                raise imaplib.IMAP4.error(f"UID FETCH failed: {data}")
+            yield from sorted(self._parse_fetch(data))
+
+    @staticmethod
+    def _parse_fetch(data: list) -> List[Tuple[int, bytes]]:
+        """Pair UIDs with message bodies in an imaplib FETCH response."""
+        messages = []
+        for i, part in enumerate(data):
+            if not isinstance(part, tuple):
+                continue
+            header, body = part
+            match = _UID_RE.search(header)
+            # Some servers send UID after the literal: b' UID 42)'
+            if not match and i + 1 < len(data) and isinstance(data[i + 1], bytes):
+                match = _UID_RE.search(data[i + 1])
+            if match:
+                messages.append((int(match.group(1)), body))
+        return messages
+
+    def idle(self, timeout: float) -> bool:
+        """
+        Wait in IDLE until the server reports a change or timeout passes.
+
+        Servers drop IDLE after ~30 minutes, so callers should loop with a
+        timeout well below that.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the server sent updates (new mail, flag changes)
+        """
+        conn = self.conn
+        self._idle_count += 1
+        tag = f"HIDLE{self._idle_count}".encode()
+
+        conn.send(tag + b" IDLE\r\n")
+        line = conn.readline()
+        if not line.startswith(b"+"):
+            raise imaplib.IMAP4.error(f"IDLE rejected: {line.strip()!r}")
+
+        changed = False
+        try:
+            if self._wait_readable(conn, timeout):
+                line = conn.readline()
+                if not line:
+                    raise imaplib.IMAP4.abort("Connection closed during IDLE")
+                changed = line.startswith(b"*")
+        finally:
+            if self.conn is conn:
+                conn.send(b"DONE\r\n")
+
+        while True:
+            line = conn.readline()
+            if not line:
+                raise imaplib.IMAP4.abort("Connection closed ending IDLE")
+            if line.startswith(tag):
+                if not line[len(tag):].strip().startswith(b"OK"):
+                    raise imaplib.IMAP4.error(f"IDLE failed: {line.strip()!r}")
+                return changed
+            changed = changed or line.startswith(b"*")
+
+    @staticmethod
+    def _wait_readable(conn: imaplib.IMAP4, timeout: float) -> bool:
+        sock = conn.sock
+        # Bytes already read into imaplib's buffer (or decrypted and held by
+        # TLS) don't show up in select(), so peek without blocking first
+        previous = sock.gettimeout()
+        sock.setblocking(False)
+        try:
+            if conn.file.peek(1):
+                return True
+        except (BlockingIOError, ssl.SSLWantReadError):
+            pass
+        finally:
+            sock.settimeout(previous)
+        readable, _, _ = select.select([sock], [], [], timeout)
+        return bool(readable)
+
+    @staticmethod
+    def _shutdown(conn: imaplib.IMAP4):
+        try:
+            conn.sock.shutdown(socket.SHUT_RDWR)
+        except (OSError, AttributeError):
+            pass
+        try:
+            conn.shutdown()
+        except Exception:
+            pass
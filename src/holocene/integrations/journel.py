@@ -1,11 +1,18 @@
 """Journel integration for reading project data."""
 
+import hashlib
 import re
+import threading
 import yaml
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 
+# Parsed project files shared by every reader in the process:
+# path -> (mtime_ns, size, content sha256, parsed project or None)
+_parse_cache: Dict[Path, Tuple[int, int, str, Optional["JournelProject"]]] = {}
+_parse_cache_lock = threading.Lock()
+
 
 class JournelProject:
     """Represents a journel project."""
@@ -64,9 +71,41 @@ class JournelReader:
         self.ignore_projects = set(ignore_projects or [])
 
     def _parse_project_file(self, file_path: Path) -> Optional[JournelProject]:
-        """Parse a project markdown file with YAML frontmatter."""
+        """Parse a project file, reusing the cached parse if it hasn't changed.
+
+        Files with the same mtime and size are never reread. Files whose
+        mtime changed but content didn't (touched, synced) are reread and
+        hashed, but not re-parsed.
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        with _parse_cache_lock:
+            cached = _parse_cache.get(file_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[3]
+
         try:
-            content = file_path.read_text(encoding="utf-8")
+            data = file_path.read_bytes()
+        except OSError:
+            return None
+
+        content_hash = hashlib.sha256(data).hexdigest()
+        if cached and cached[2] == content_hash:
+            project = cached[3]
+        else:
+            project = self._parse_project_content(data)
+
+        with _parse_cache_lock:
+            _parse_cache[file_path] = (stat.st_mtime_ns, stat.st_size, content_hash, project)
+        return project
+
+    def _parse_project_content(self, data: bytes) -> Optional[JournelProject]:
+        """Parse project markdown with YAML frontmatter."""
+        try:
+            content = data.decode("utf-8")
 
             # Extract YAML frontmatter
             match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
@@ -88,7 +127,15 @@ class JournelReader:
             return []
 
         projects = []
-        for file_path in projects_dir.glob("*.md"):
+        paths = list(projects_dir.glob("*.md"))
+
+        # Drop cache entries for deleted files
+        with _parse_cache_lock:
+            for cached_path in [p for p in _parse_cache if p.parent == projects_dir]:
+                if cached_path not in paths:
+                    del _parse_cache[cached_path]
+
+        for file_path in paths:
             project = self._parse_project_file(file_path)
 
             if project is None:
@@ -3,17 +3,26 @@
 Supports multiple archiving formats:
 - monolith: Single HTML file with embedded assets (fast, browser-viewable)
 - wget WARC: ISO standard web archive format (preservation-grade)
+
+Captures are ingested into the content-addressed ArchiveStore (chunked,
+deduplicated and compressed) and referenced as ``blob:<sha256>``. Pass
+use_store=False to keep standalone files instead.
 """
 
+import gzip
 import subprocess
 import shutil
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Callable, Literal
 from datetime import datetime
 from urllib.parse import urlparse
 import hashlib
 
+from holocene.integrations.capture_process import CaptureCancelled, ResourceLimits, run_capture
+from holocene.storage.archive_store import ArchiveStore
+
 logger = logging.getLogger(__name__)
 
 ArchiveFormat = Literal["monolith", "warc"]
@@ -22,12 +31,21 @@ ArchiveFormat = Literal["monolith", "warc"]
 class LocalArchiveClient:
     """Client for local web page archiving."""
 
-    def __init__(self, archive_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        archive_dir: Optional[Path] = None,
+        store: Optional[ArchiveStore] = None,
+        use_store: bool = True,
+        limits: Optional[ResourceLimits] = None,
+    ):
         """
         Initialize local archive client.
 
         Args:
             archive_dir: Directory to store archives (default: ~/.holocene/archives/)
+            store: ArchiveStore to ingest captures into (default: archive_dir/store)
+            use_store: Ingest captures into the store instead of keeping standalone files
+            limits: Memory/CPU limits for monolith and wget processes (None = unlimited)
         """
         if archive_dir is None:
             archive_dir = Path.home() / ".holocene" / "archives"
@@ -35,6 +53,11 @@ class LocalArchiveClient:
         self.archive_dir = Path(archive_dir)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
 
+        if store is None and use_store:
+            store = ArchiveStore(self.archive_dir / "store")
+        self.store = store
+        self.limits = limits
+
         # Check available tools
         self.has_monolith = self._check_tool("monolith")
         self.has_wget = self._check_tool("wget")
@@ -82,13 +105,53 @@ class LocalArchiveClient:
 
         return format_dir / filename
 
-    def archive_with_monolith(self, url: str, timeout: int = 60) -> Dict[str, Any]:
+    def _finalize(self, output_path: Path, format: ArchiveFormat) -> Dict[str, Any]:
+        """
+        Move a finished capture into the archive store (if enabled).
+
+        WARCs are stored gunzipped - the store compresses chunks itself, and
+        per-record gzip members would hide duplicate content from chunking.
+
+        Returns:
+            Dict with local_path (file path or blob reference), file_size
+            (uncompressed capture size) and stored_bytes (new bytes on disk)
+        """
+        file_size = output_path.stat().st_size
+        if not self.store:
+            return {"local_path": str(output_path), "file_size": file_size, "stored_bytes": file_size}
+
+        if format == "warc":
+            with gzip.open(output_path, "rb") as f:
+                data = f.read()
+            media_type = "application/warc"
+        else:
+            data = output_path.read_bytes()
+            media_type = "text/html"
+
+        stored = self.store.put(data, media_type=media_type)
+        output_path.unlink()
+
+        return {
+            "local_path": stored["ref"],
+            "file_size": stored["size"],
+            "stored_bytes": stored["stored_bytes"],
+        }
+
+    def archive_with_monolith(
+        self,
+        url: str,
+        timeout: int = 60,
+        progress: Optional[Callable[[str], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
         """
         Archive URL using monolith (single HTML file).
 
         Args:
             url: URL to archive
             timeout: Timeout in seconds
+            progress: Called with each line of tool output
+            cancel: Set to kill the capture (result status is "cancelled")
 
         Returns:
             Dict with status, local_path, and optional error
@@ -112,7 +175,7 @@ class LocalArchiveClient:
             # -I: Isolate document (prevent external requests)
             # -u: User-Agent (pretend to be Firefox to avoid blocking)
             # -t: Timeout for network requests
-            result = subprocess.run(
+            result = run_capture(
                 [
                     "monolith",
                     "-j", "-i", "-I",
@@ -121,20 +184,23 @@ class LocalArchiveClient:
                     url,
                     "-o", str(output_path)
                 ],
-                capture_output=True,
-                text=True,
                 timeout=timeout,
+                limits=self.limits,
+                on_output=progress,
+                cancel=cancel,
             )
 
             if result.returncode == 0:
-                file_size = output_path.stat().st_size
-                logger.info(f"[LocalArchive] Success: {output_path} ({file_size:,} bytes)")
+                stored = self._finalize(output_path, "monolith")
+                logger.info(
+                    f"[LocalArchive] Success: {stored['local_path']} "
+                    f"({stored['file_size']:,} bytes, {stored['stored_bytes']:,} new on disk)"
+                )
 
                 return {
                     "status": "archived",
                     "url": url,
-                    "local_path": str(output_path),
-                    "file_size": file_size,
+                    **stored,
                     "archive_date": datetime.now().isoformat(),
                     "message": "Successfully archived with monolith",
                 }
@@ -149,7 +215,12 @@ class LocalArchiveClient:
                     "message": f"Monolith failed: {error_msg}",
                 }
 
+        except CaptureCancelled:
+            output_path.unlink(missing_ok=True)
+            logger.info(f"[LocalArchive] Monolith capture of {url} cancelled")
+            return self._cancelled_result(url)
         except subprocess.TimeoutExpired:
+            output_path.unlink(missing_ok=True)
             logger.error(f"[LocalArchive] Monolith timed out after {timeout}s")
             return {
                 "status": "error",
@@ -166,13 +237,21 @@ class LocalArchiveClient:
                 "message": f"Failed to archive: {e}",
             }
 
-    def archive_with_warc(self, url: str, timeout: int = 120) -> Dict[str, Any]:
+    def archive_with_warc(
+        self,
+        url: str,
+        timeout: int = 120,
+        progress: Optional[Callable[[str], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
         """
         Archive URL using wget WARC format.
 
         Args:
             url: URL to archive
             timeout: Timeout in seconds
+            progress: Called with each line of tool output
+            cancel: Set to kill the capture (result status is "cancelled")
 
         Returns:
             Dict with status, local_path, and optional error
@@ -199,7 +278,7 @@ class LocalArchiveClient:
             # --convert-links: Convert links for offline browsing
             # --no-directories: Flat structure
             # --timeout: Connection timeout
-            result = subprocess.run(
+            result = run_capture(
                 [
                     "wget",
                     "--warc-file", str(output_path.parent / warc_base),
@@ -211,22 +290,25 @@ class LocalArchiveClient:
                     "--timeout", "30",
                     url,
                 ],
-                capture_output=True,
-                text=True,
                 timeout=timeout,
                 cwd=str(output_path.parent),
+                limits=self.limits,
+                on_output=progress,
+                cancel=cancel,
             )
 
             # Check if WARC file was created
             if output_path.exists():
-                file_size = output_path.stat().st_size
-                logger.info(f"[LocalArchive] Success: {output_path} ({file_size:,} bytes)")
+                stored = self._finalize(output_path, "warc")
+                logger.info(
+                    f"[LocalArchive] Success: {stored['local_path']} "
+                    f"({stored['file_size']:,} bytes, {stored['stored_bytes']:,} new on disk)"
+                )
 
                 return {
                     "status": "archived",
                     "url": url,
-                    "local_path": str(output_path),
-                    "file_size": file_size,
+                    **stored,
                     "archive_date": datetime.now().isoformat(),
                     "message": "Successfully archived with wget WARC",
                 }
@@ -241,7 +323,12 @@ class LocalArchiveClient:
                     "message": f"Wget failed: {error_msg}",
                 }
 
+        except CaptureCancelled:
+            output_path.unlink(missing_ok=True)
+            logger.info(f"[LocalArchive] Wget capture of {url} cancelled")
+            return self._cancelled_result(url)
         except subprocess.TimeoutExpired:
+            output_path.unlink(missing_ok=True)
             logger.error(f"[LocalArchive] Wget timed out after {timeout}s")
             return {
                 "status": "error",
@@ -258,11 +345,21 @@ class LocalArchiveClient:
                 "message": f"Failed to archive: {e}",
             }
 
+    def _cancelled_result(self, url: str) -> Dict[str, Any]:
+        return {
+            "status": "cancelled",
+            "url": url,
+            "error": "Cancelled",
+            "message": "Capture was cancelled",
+        }
+
     def archive_url(
         self,
         url: str,
         format: ArchiveFormat = "monolith",
         timeout: int = 60,
+        progress: Optional[Callable[[str], None]] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> Dict[str, Any]:
         """
         Archive a URL in the specified format.
@@ -271,14 +368,16 @@ class LocalArchiveClient:
             url: URL to archive
             format: Archive format ('monolith' or 'warc')
             timeout: Timeout in seconds
+            progress: Called with each line of tool output
+            cancel: Set to kill the capture (result status is "cancelled")
 
         Returns:
             Dict with archiving result
         """
         if format == "monolith":
-            return self.archive_with_monolith(url, timeout)
+            return self.archive_with_monolith(url, timeout, progress=progress, cancel=cancel)
         elif format == "warc":
-            return self.archive_with_warc(url, timeout)
+            return self.archive_with_warc(url, timeout, progress=progress, cancel=cancel)
         else:
             return {
                 "status": "error",
@@ -310,4 +409,5 @@ class LocalArchiveClient:
                 "install": "System package manager (apt, brew, etc.)",
             },
             "archive_dir": str(self.archive_dir),
+            "store": str(self.store.root) if self.store else None,
         }
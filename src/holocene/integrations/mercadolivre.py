@@ -3,16 +3,15 @@
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from urllib.parse import urlencode
+import html as htmllib
 import re
 import json
 import time
 import random
 
-import requests
-from bs4 import BeautifulSoup
-
 from holocene.core.api_client import BaseAPIClient
 from holocene.core.rate_limiter import get_global_limiter
+from holocene.integrations.page_content import fetch_capped, make_soup
 
 
 class MercadoLivreOAuth:
@@ -273,48 +272,70 @@ def is_token_expired(token_data: Dict) -> bool:
     return True
 
 
-def fetch_product_page(url: str, delay: float = 2.5) -> Dict:
-    """Fetch and parse a Mercado Livre product page.
+# Product page extraction: JSON-LD and meta tags are read with regexes, so
+# the common case never builds a parse tree
+_JSON_LD_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.I | re.S
+)
+_META_TAG_RE = re.compile(r'<meta\b[^>]*>', re.I)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_SELLER_LINK_RE = re.compile(r'<a\b[^>]*class=["\'][^"\']*seller[^"\']*["\'][^>]*>(.*?)</a>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+_FREE_SHIPPING_RE = re.compile(r'frete gr[aá]tis', re.I)
+
+
+def _json_ld_nodes(html: str):
+    """Yield JSON-LD objects from a page (flattening lists and @graph)."""
+    for match in _JSON_LD_RE.finditer(html):
+        try:
+            data = json.loads(match.group(1))
+        except (json.JSONDecodeError, ValueError):
+            continue
+        stack = data if isinstance(data, list) else [data]
+        for node in stack:
+            if not isinstance(node, dict):
+                continue
+            yield node
+            for child in node.get('@graph', []):
+                if isinstance(child, dict):
+                    yield child
+
+
+def _meta_content(html: str, prop: str) -> Optional[str]:
+    """Content of the first <meta property=prop> (or name=prop) tag."""
+    for tag in _META_TAG_RE.finditer(html):
+        attrs = {
+            name.lower(): double if double is not None else single
+            for name, double, single in _ATTR_RE.findall(tag.group(0))
+        }
+        if attrs.get('property') == prop or attrs.get('name') == prop:
+            content = attrs.get('content')
+            return htmllib.unescape(content) if content else None
+    return None
+
+
+def parse_product_page(html: str, url: str, fetched_at: Optional[str] = None) -> Dict:
+    """Extract product data from a Mercado Livre product page.
+
+    JSON-LD structured data comes first; a BeautifulSoup tree is only
+    built when it lacks the title or price.
 
     Args:
+        html: Page HTML
         url: Product page URL
-        delay: Delay before making request (default 2.5s, polite crawling)
+        fetched_at: When the page was fetched (default: now)
 
     Returns:
         Dict with enriched product data including description, specs, seller info
     """
-    # Polite delay
-    if delay > 0:
-        time.sleep(delay + random.uniform(-0.5, 0.5))  # Add jitter
-
-    # Fetch page with browser-like headers
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
-
-    response = requests.get(url, headers=headers, timeout=30)
-    response.raise_for_status()
-
-    html = response.text
-    soup = BeautifulSoup(html, 'html.parser')
-
     result = {
         'url': url,
-        'fetched_at': datetime.utcnow().isoformat(),
+        'fetched_at': fetched_at or datetime.utcnow().isoformat(),
     }
 
     # Extract JSON-LD structured data (schema.org format)
-    json_ld_scripts = soup.find_all('script', type='application/ld+json')
-
-    for script in json_ld_scripts:
+    for data in _json_ld_nodes(html):
         try:
-            data = json.loads(script.string)
-
             # Product/Offer data
             if data.get('@type') == 'Product' or 'offers' in data:
                 if 'name' in data:
@@ -325,12 +346,17 @@ def fetch_product_page(url: str, delay: float = 2.5) -> Dict:
 
                 if 'offers' in data:
                     offers = data['offers']
+                    if isinstance(offers, list):
+                        offers = offers[0] if offers else {}
                     if 'price' in offers:
                         result['price'] = float(offers['price'])
                     if 'priceCurrency' in offers:
                         result['currency'] = offers['priceCurrency']
                     if 'availability' in offers:
                         result['availability'] = 'InStock' in offers['availability']
+                    seller = offers.get('seller')
+                    if isinstance(seller, dict) and seller.get('name'):
+                        result['seller_info'] = {'nickname': seller['name']}
 
                 if 'aggregateRating' in data:
                     rating = data['aggregateRating']
@@ -349,37 +375,172 @@ def fetch_product_page(url: str, delay: float = 2.5) -> Dict:
                         item.get('item', {}).get('name', '') for item in items
                     ])
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (KeyError, ValueError, TypeError, AttributeError, IndexError):
             continue
 
     # Fallback: scrape from HTML if JSON-LD didn't have everything
-    if 'title' not in result:
-        title_tag = soup.find('h1', class_='ui-pdp-title')
-        if title_tag:
-            result['title'] = title_tag.get_text(strip=True)
-
-    if 'price' not in result:
-        price_tag = soup.find('span', class_='andes-money-amount__fraction')
-        if price_tag:
-            try:
-                result['price'] = float(price_tag.get_text(strip=True).replace('.', '').replace(',', '.'))
-            except:
-                pass
-
-    # Extract description from meta tags or main content
-    description_meta = soup.find('meta', property='og:description')
-    if description_meta and description_meta.get('content'):
-        result['description'] = description_meta.get('content')
+    if 'title' not in result or 'price' not in result:
+        soup = make_soup(html)
+
+        if 'title' not in result:
+            title_tag = soup.find('h1', class_='ui-pdp-title')
+            if title_tag:
+                result['title'] = title_tag.get_text(strip=True)
+
+        if 'price' not in result:
+            price_tag = soup.find('span', class_='andes-money-amount__fraction')
+            if price_tag:
+                try:
+                    result['price'] = float(price_tag.get_text(strip=True).replace('.', '').replace(',', '.'))
+                except ValueError:
+                    pass
+
+    # Extract description from meta tags
+    description = _meta_content(html, 'og:description')
+    if description:
+        result['description'] = description
 
     # Extract seller info from page
-    seller_link = soup.find('a', class_=re.compile('.*seller.*'))
-    if seller_link:
-        result['seller_info'] = {
-            'nickname': seller_link.get_text(strip=True) if seller_link else None
-        }
+    if 'seller_info' not in result:
+        seller_link = _SELLER_LINK_RE.search(html)
+        if seller_link:
+            nickname = htmllib.unescape(_TAG_RE.sub('', seller_link.group(1))).strip()
+            result['seller_info'] = {'nickname': nickname or None}
 
     # Extract shipping info
-    if soup.find(text=re.compile('Frete grátis|frete gr[aá]tis', re.I)):
+    if _FREE_SHIPPING_RE.search(html):
         result['shipping'] = {'free_shipping': True}
 
     return result
+
+
+def fetch_product_page(url: str, delay: float = 2.5) -> Dict:
+    """Fetch and parse a Mercado Livre product page.
+
+    Args:
+        url: Product page URL
+        delay: Delay before making request (default 2.5s, polite crawling)
+
+    Returns:
+        Dict with enriched product data including description, specs, seller info
+    """
+    # Polite delay
+    if delay > 0:
+        time.sleep(delay + random.uniform(-0.5, 0.5))  # Add jitter
+
+    # Fetch page with browser-like headers
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+
+    _, html, _ = fetch_capped(url, headers=headers, timeout=30)
+    return parse_product_page(html, url)
+
+
+# Product enrichment crawl job (see integrations.crawler)
+ENRICH_JOB = "mercadolivre_enrich"
+
+
+def queue_enrichment(db, item_ids: Optional[List[str]] = None, refresh: bool = False,
+                     limit: Optional[int] = None) -> int:
+    """Queue favorites for product page enrichment.
+
+    Args:
+        db: Database instance
+        item_ids: Specific favorites (always re-queued); default: all favorites
+        refresh: Also re-queue favorites that are already enriched
+        limit: Maximum favorites to queue (most recently bookmarked first)
+
+    Returns:
+        Number of favorites queued
+    """
+    query = "SELECT item_id, url FROM mercadolivre_favorites WHERE url IS NOT NULL"
+    params: list = []
+
+    if item_ids:
+        query += f" AND item_id IN ({','.join('?' * len(item_ids))})"
+        params.extend(item_ids)
+    elif not refresh:
+        query += " AND enriched_at IS NULL"
+
+    query += " ORDER BY bookmarked_date DESC"
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    cursor = db.conn.cursor()
+    cursor.execute(query, params)
+    entries = [(row[0], row[1]) for row in cursor.fetchall()]
+
+    return db.enqueue_crawl_urls(ENRICH_JOB, entries, refresh=refresh or bool(item_ids))
+
+
+def _parse_for_enrichment(html: str, entry: Dict, page: Dict) -> Dict:
+    """Crawler parse hook: product data plus where the HTML is cached."""
+    data = parse_product_page(html, entry["url"])
+    data["cached_html_path"] = page.get("cached_path")
+    return data
+
+
+def save_enrichment(db, results: List) -> None:
+    """Crawler save hook: write a batch of parsed pages (no commit).
+
+    Args:
+        db: Database instance
+        results: List of (frontier entry, parsed page data)
+    """
+    rows = []
+    for entry, data in results:
+        seller_info = data.get('seller_info') or {}
+        reviews = data.get('reviews') or {}
+        shipping = data.get('shipping') or {}
+        rows.append({
+            'item_id': entry['key'],
+            'description': data.get('description'),
+            'original_price': data.get('original_price'),
+            'specifications': json.dumps(data['specifications']) if data.get('specifications') else None,
+            'seller_nickname': seller_info.get('nickname'),
+            'seller_reputation': seller_info.get('reputation_level'),
+            'reviews_rating': reviews.get('rating_average'),
+            'reviews_total': reviews.get('total'),
+            'warranty': data.get('warranty'),
+            'free_shipping': 1 if shipping.get('free_shipping') else 0,
+            'enriched_at': data.get('fetched_at'),
+            'cached_html_path': data.get('cached_html_path'),
+        })
+
+    db.update_mercadolivre_enrichment(rows, commit=False)
+
+
+def create_enrichment_crawler(db, config, **kwargs):
+    """Build the product enrichment crawler from config.
+
+    Args:
+        db: Database instance
+        config: Holocene config
+        **kwargs: Crawler overrides (concurrency, delay, ...)
+
+    Returns:
+        Crawler for the ENRICH_JOB frontier
+    """
+    from holocene.integrations.crawler import Crawler
+    from holocene.integrations.http_fetcher import HTTPFetcher
+
+    options = {
+        'concurrency': config.mercadolivre.enrich_concurrency,
+        'delay': config.mercadolivre.enrich_delay_seconds,
+        **kwargs,
+    }
+    return Crawler(
+        db,
+        ENRICH_JOB,
+        fetcher=HTTPFetcher.from_config(config, integration_name='mercadolivre'),
+        parse=_parse_for_enrichment,
+        save=save_enrichment,
+        **options,
+    )
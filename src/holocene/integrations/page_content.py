@@ -0,0 +1,383 @@
+"""Shared page fetching and text extraction.
+
+One place for "download a page and get its readable text", used by Laney's
+fetch_url tool, HTTPFetcher and the Mercado Livre product crawler:
+
+- Streaming downloads with a byte cap (a huge page or binary file can't
+  blow up memory)
+- Fast text extraction: lxml when installed, otherwise a tree-less stdlib
+  HTMLParser pass (much cheaper than building a BeautifulSoup tree)
+- Conditional revalidation with ETag / Last-Modified
+- Full cleaned text cached once per URL and content hash (page_cache /
+  page_texts tables), so any truncation length is served from one entry
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from typing import Optional, Dict, Any, Tuple
+
+import requests
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; Holocene/1.0; +https://github.com/endarthur/holocene)"
+
+# Elements whose content is never readable page text
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "nav", "footer", "header"}
+
+# Elements that start a new line of text
+BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "tr", "td", "th", "table", "section", "article",
+    "main", "aside", "blockquote", "pre", "h1", "h2", "h3", "h4", "h5", "h6", "dt", "dd",
+    "figcaption", "title", "hr",
+}
+
+
+def _clean_lines(text: str) -> str:
+    """Strip each line and drop empty ones."""
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+class _TextExtractor(HTMLParser):
+    """Collects visible text in one pass, without building a tree."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+
+def extract_text(html: str) -> str:
+    """
+    Extract readable text from HTML, dropping scripts, styles and page chrome.
+
+    Args:
+        html: HTML document
+
+    Returns:
+        Text with one non-empty, stripped line per line of content
+    """
+    if HAS_LXML:
+        try:
+            root = lxml.html.fromstring(html)
+            etree.strip_elements(root, *SKIP_TAGS, etree.Comment, with_tail=False)
+            for element in root.iter(*BLOCK_TAGS):
+                element.tail = "\n" + (element.tail or "")
+            return _clean_lines(root.text_content())
+        except (etree.ParserError, ValueError):
+            pass  # Empty or odd documents - fall back to the stdlib parser
+
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return _clean_lines("".join(parser.parts))
+
+
+def make_soup(html: str):
+    """Build a BeautifulSoup tree with the fastest available parser."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "lxml" if HAS_LXML else "html.parser")
+
+
+def fetch_capped(
+    url: str,
+    max_bytes: int = 5 * 1024 * 1024,
+    session: Optional[requests.Session] = None,
+    **kwargs,
+) -> Tuple[requests.Response, str, bool]:
+    """
+    GET a URL, streaming the body and stopping at max_bytes.
+
+    Args:
+        url: URL to fetch
+        max_bytes: Maximum body bytes to read
+        session: Optional requests session (connection reuse)
+        **kwargs: Passed to requests (headers, timeout, proxies, verify...)
+
+    Returns:
+        Tuple of (response, decoded body, whether the cap was hit).
+        The body is empty for 304 responses.
+
+    Raises:
+        requests.exceptions.RequestException: On fetch failure or HTTP error
+    """
+    getter = session.get if session else requests.get
+    response = getter(url, stream=True, **kwargs)
+
+    try:
+        if response.status_code == 304:
+            return response, "", False
+        response.raise_for_status()
+
+        chunks = []
+        size = 0
+        capped = False
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            # A body of exactly max_bytes ends here; anything past it is truncated
+            if size > max_bytes:
+                capped = True
+                break
+
+        body = b"".join(chunks)[:max_bytes]
+    finally:
+        response.close()
+
+    # requests falls back to (slow) charset detection when the header has none
+    encoding = response.encoding or "utf-8"
+    return response, body.decode(encoding, errors="replace"), capped
+
+
+class PageContentService:
+    """Fetches pages and caches their cleaned full text."""
+
+    def __init__(
+        self,
+        conn: Optional[sqlite3.Connection] = None,
+        max_bytes: int = 5 * 1024 * 1024,
+        timeout: int = 15,
+        fresh_for: timedelta = timedelta(hours=24),
+        memory_entries: int = 256,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        """
+        Initialize page content service.
+
+        Args:
+            conn: SQLite connection for the persistent cache (None = memory only)
+            max_bytes: Download cap per page
+            timeout: Request timeout in seconds
+            fresh_for: Serve cached text without revalidating for this long
+            memory_entries: Pages kept in the in-process cache
+            user_agent: User-Agent header
+        """
+        self.conn = conn
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.fresh_for = fresh_for
+        self.memory_entries = memory_entries
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Cache tiers
+
+    def _memory_get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry:
+                self._memory.move_to_end(url)
+            return entry
+
+    def _memory_put(self, url: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._memory[url] = entry
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _db_get(self, url: str) -> Optional[Dict[str, Any]]:
+        if self.conn is None:
+            return None
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT c.content_hash, c.content_type, c.etag, c.last_modified,
+                       c.validated_at, c.byte_capped, t.text
+                FROM page_cache c
+                JOIN page_texts t ON t.content_hash = c.content_hash
+                WHERE c.url = ?
+            """, (url,))
+            row = cursor.fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"[PageContent] Cache read failed: {e}")
+            return None
+
+        if not row:
+            return None
+        return {
+            "content_hash": row[0],
+            "content_type": row[1],
+            "etag": row[2],
+            "last_modified": row[3],
+            "validated_at": row[4],
+            "byte_capped": bool(row[5]),
+            "text": row[6],
+        }
+
+    def _db_put(self, url: str, entry: Dict[str, Any]):
+        if self.conn is None:
+            return
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT OR IGNORE INTO page_texts (content_hash, text, length) VALUES (?, ?, ?)",
+                (entry["content_hash"], entry["text"], len(entry["text"])),
+            )
+            cursor.execute("""
+                INSERT INTO page_cache
+                    (url, content_hash, content_type, etag, last_modified, byte_capped,
+                     fetched_at, validated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    content_type = excluded.content_type,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    byte_capped = excluded.byte_capped,
+                    fetched_at = excluded.fetched_at,
+                    validated_at = excluded.validated_at
+            """, (
+                url, entry["content_hash"], entry["content_type"], entry["etag"],
+                entry["last_modified"], int(entry["byte_capped"]),
+                entry["validated_at"], entry["validated_at"],
+            ))
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"[PageContent] Cache write failed: {e}")
+
+    def _db_mark_validated(self, url: str, validated_at: str):
+        if self.conn is None:
+            return
+        try:
+            self.conn.execute(
+                "UPDATE page_cache SET validated_at = ? WHERE url = ?", (validated_at, url)
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"[PageContent] Cache update failed: {e}")
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        validated_at = datetime.fromisoformat(entry["validated_at"])
+        return datetime.now() - validated_at < self.fresh_for
+
+    # Fetching
+
+    def get_page(self, url: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get the cleaned full text of a page.
+
+        Args:
+            url: Page URL
+            refresh: Revalidate even if the cached copy is fresh
+
+        Returns:
+            Cache entry dict (text, content_hash, content_type, etag,
+            last_modified, validated_at, byte_capped) plus "cached":
+            "session", "persistent", "revalidated" or False
+
+        Raises:
+            requests.exceptions.RequestException: On fetch failure
+            ValueError: For content types that have no text
+        """
+        entry = self._memory_get(url)
+        source = "session"
+        if entry is None:
+            entry = self._db_get(url)
+            source = "persistent"
+
+        if entry and not refresh and self._is_fresh(entry):
+            self._memory_put(url, entry)
+            return {**entry, "cached": source}
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response, body, capped = fetch_capped(
+            url,
+            max_bytes=self.max_bytes,
+            session=self.session,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        now = datetime.now().isoformat()
+
+        if response.status_code == 304 and entry:
+            entry = {**entry, "validated_at": now}
+            self._memory_put(url, entry)
+            self._db_mark_validated(url, now)
+            return {**entry, "cached": "revalidated"}
+
+        content_type = response.headers.get("content-type", "")
+        if "text/plain" in content_type:
+            text = _clean_lines(body)
+        elif "html" in content_type:
+            text = extract_text(body)
+        else:
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+        entry = {
+            "text": text,
+            "content_hash": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            "content_type": content_type,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "validated_at": now,
+            "byte_capped": capped,
+        }
+        self._memory_put(url, entry)
+        self._db_put(url, entry)
+        return {**entry, "cached": False}
+
+    def get_text(self, url: str, max_length: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get page text truncated to max_length, in fetch_url's result format.
+
+        Args:
+            url: Page URL
+            max_length: Maximum characters to return (None = all)
+
+        Returns:
+            Dict with success, url, content, length, truncated and cached
+
+        Raises:
+            requests.exceptions.RequestException: On fetch failure
+            ValueError: For content types that have no text
+        """
+        page = self.get_page(url)
+        text = page["text"]
+        content = text if max_length is None else text[:max_length]
+
+        return {
+            "success": True,
+            "url": url,
+            "content": content,
+            "length": len(content),
+            "truncated": len(content) < len(text) or page["byte_capped"],
+            "cached": page["cached"],
+        }
@@ -0,0 +1,135 @@
+"""Persistent, multiplexed SSH transport.
+
+Every `ssh user@host command` normally pays for a TCP connect, key exchange
+and authentication. With OpenSSH connection sharing (ControlMaster) the
+first command opens a master connection that stays up for `persist` seconds
+after its last use, and later commands - including concurrent ones - open a
+new channel on it, which takes milliseconds instead of a handshake.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SSHTransport:
+    """Runs remote commands over one shared SSH connection."""
+
+    def __init__(
+        self,
+        host: str,
+        user: Optional[str] = None,
+        ssh_command: str = "ssh",
+        connect_timeout: int = 5,
+        persist: int = 600,
+        control_dir: Optional[str] = None,
+    ):
+        """
+        Initialize SSH transport (no connection is made until the first command).
+
+        Args:
+            host: Remote hostname/IP
+            user: Remote user (None = ssh config default)
+            ssh_command: ssh executable
+            connect_timeout: Seconds to wait for the initial connection
+            persist: Seconds the master connection stays up after the last command
+            control_dir: Directory for the control socket (default: private temp dir)
+        """
+        self.target = f"{user}@{host}" if user else host
+        self.ssh_command = ssh_command
+        self.connect_timeout = connect_timeout
+        self.persist = persist
+
+        # Socket paths are limited to ~104 bytes, so keep them short (%C is a hash)
+        self._owns_control_dir = control_dir is None
+        self.control_dir = control_dir or tempfile.mkdtemp(prefix="holo-ssh-")
+        self.control_path = os.path.join(self.control_dir, "%C")
+
+        self.commands_run = 0
+        self._lock = threading.Lock()
+
+    def _ssh_args(self) -> List[str]:
+        return [
+            self.ssh_command,
+            "-o", "BatchMode=yes",  # Don't prompt for password
+            "-o", f"ConnectTimeout={self.connect_timeout}",
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={self.control_path}",
+            "-o", f"ControlPersist={self.persist}",
+            self.target,
+        ]
+
+    def run(self, command: str, timeout: float = 120, input: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run a shell command on the remote host.
+
+        Args:
+            command: Remote shell command
+            timeout: Command timeout in seconds
+            input: Text to send on the command's stdin
+
+        Returns:
+            Dict with stdout, stderr, returncode (-1 on timeout or local failure)
+        """
+        with self._lock:
+            self.commands_run += 1
+
+        try:
+            result = subprocess.run(
+                self._ssh_args() + [command],
+                input=input,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            return {
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+                "returncode": result.returncode,
+            }
+
+        except subprocess.TimeoutExpired:
+            logger.error(f"[SSH] Command on {self.target} timed out after {timeout}s")
+            return {
+                "stdout": "",
+                "stderr": f"Command timed out after {timeout}s",
+                "returncode": -1,
+            }
+        except Exception as e:
+            logger.error(f"[SSH] Command on {self.target} failed: {e}")
+            return {
+                "stdout": "",
+                "stderr": str(e),
+                "returncode": -1,
+            }
+
+    def check(self) -> bool:
+        """Open the master connection (if needed) and check the host answers."""
+        result = self.run("echo ok", timeout=self.connect_timeout + 5)
+        return result["returncode"] == 0 and "ok" in result["stdout"]
+
+    def close(self):
+        """Shut down the master connection and remove the control directory."""
+        try:
+            subprocess.run(
+                [self.ssh_command, "-o", f"ControlPath={self.control_path}", "-O", "exit", self.target],
+                capture_output=True,
+                timeout=10,
+            )
+        except Exception as e:
+            logger.debug(f"[SSH] Closing master connection to {self.target} failed: {e}")
+
+        if self._owns_control_dir:
+            shutil.rmtree(self.control_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -3,8 +3,6 @@
 Provides tools for searching and querying the Holocene knowledge base.
 """
 
-import csv
-import io
 import json
 import math
 import re
@@ -1025,7 +1023,7 @@ LANEY_TOOLS = [
                     },
                     "limit": {
                         "type": "integer",
-                        "description": "Maximum links to export (default: 500)"
+                        "description": "Maximum links to export (default: all)"
                     }
                 },
                 "required": []
@@ -1053,6 +1051,41 @@ LANEY_TOOLS = [
             }
         }
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "export_collection",
+            "description": "Export books, links or papers as CSV, JSONL or Parquet (optionally gzipped). Streams the whole collection, so large exports are fine. Returns the file path for attachment.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "collection": {
+                        "type": "string",
+                        "enum": ["books", "links", "papers"],
+                        "description": "Collection to export"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["csv", "jsonl", "parquet"],
+                        "description": "File format (default: csv)"
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "Optional search query to filter items"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum items to export (default: all)"
+                    },
+                    "gzip": {
+                        "type": "boolean",
+                        "description": "Gzip-compress the file (default: false)"
+                    }
+                },
+                "required": ["collection"]
+            }
+        }
+    },
     {
         "type": "function",
         "function": {
@@ -1281,7 +1314,8 @@ class LaneyToolHandler:
 
         # Session-level cache for web searches and URL fetches (avoid redundant API calls)
         self._search_cache: Dict[str, Any] = {}
-        self._fetch_cache: Dict[str, Any] = {}
+        self._search_index = None  # Fuzzy collection search (lazy)
+        self._page_content = None  # Shared page fetch/extract service (lazy)
 
         # Load persistent cache hits into session cache on init
         self._load_persistent_cache()
@@ -1351,6 +1385,7 @@ class LaneyToolHandler:
             "export_books_csv": self.export_books_csv,
             "export_links_csv": self.export_links_csv,
             "export_papers_csv": self.export_papers_csv,
+            "export_collection": self.export_collection,
             "generate_collection_report": self.generate_collection_report,
             # Backlog - global ideas/tasks across conversations
             "backlog_add": self.backlog_add,
@@ -1449,22 +1484,47 @@ class LaneyToolHandler:
             "total_items": books + papers + links + ml_favorites
         }
 
+    def _fuzzy_rows(self, item_type: str, columns: str, query: str, limit: int) -> Optional[List[sqlite3.Row]]:
+        """Rows of a collection ranked by the fuzzy search index (typo tolerant).
+
+        Returns None when the index can't answer (no trigram support, no
+        hits), so callers fall back to their LIKE query.
+        """
+        from holocene.core.search_index import SearchIndex, TYPE_TABLES
+
+        if self._search_index is None:
+            self._search_index = SearchIndex(self)  # Only needs .conn
+        hits = self._search_index.search(query, item_type=item_type, limit=limit)
+        if not hits:
+            return None
+
+        ids = [hit["item_id"] for hit in hits]
+        rank = {item_id: i for i, item_id in enumerate(ids)}
+        cursor = self.conn.execute(
+            f"SELECT {columns} FROM {TYPE_TABLES[item_type]} WHERE id IN ({','.join('?' * len(ids))})", ids
+        )
+        return sorted(cursor.fetchall(), key=lambda row: rank[row[0]])
+
     def search_books(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search books by title, author, or subjects."""
-        cursor = self.conn.cursor()
+        """Search books by title, author, or subjects (typo tolerant)."""
+        columns = """id, title, author, publication_year, dewey_decimal,
+                   call_number, subjects, enriched_summary"""
+        rows = self._fuzzy_rows("book", columns, query, limit)
 
-        search_pattern = f"%{query}%"
-        cursor.execute("""
-            SELECT id, title, author, publication_year, dewey_decimal,
-                   call_number, subjects, enriched_summary
-            FROM books
-            WHERE title LIKE ? OR author LIKE ? OR subjects LIKE ?
-            ORDER BY title
-            LIMIT ?
-        """, (search_pattern, search_pattern, search_pattern, limit))
+        if rows is None:
+            cursor = self.conn.cursor()
+            search_pattern = f"%{query}%"
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM books
+                WHERE title LIKE ? OR author LIKE ? OR subjects LIKE ?
+                ORDER BY title
+                LIMIT ?
+            """, (search_pattern, search_pattern, search_pattern, limit))
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             results.append({
                 "id": row[0],
                 "title": row[1],
@@ -1479,20 +1539,24 @@ class LaneyToolHandler:
         return results
 
     def search_papers(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search papers by title, authors, or abstract."""
-        cursor = self.conn.cursor()
+        """Search papers by title or authors (typo tolerant), falling back to abstracts."""
+        columns = "id, title, authors, abstract, publication_date, journal, doi, arxiv_id"
+        rows = self._fuzzy_rows("paper", columns, query, limit)
 
-        search_pattern = f"%{query}%"
-        cursor.execute("""
-            SELECT id, title, authors, abstract, publication_date, journal, doi, arxiv_id
-            FROM papers
-            WHERE title LIKE ? OR authors LIKE ? OR abstract LIKE ?
-            ORDER BY publication_date DESC
-            LIMIT ?
-        """, (search_pattern, search_pattern, search_pattern, limit))
+        if rows is None:
+            cursor = self.conn.cursor()
+            search_pattern = f"%{query}%"
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM papers
+                WHERE title LIKE ? OR authors LIKE ? OR abstract LIKE ?
+                ORDER BY publication_date DESC
+                LIMIT ?
+            """, (search_pattern, search_pattern, search_pattern, limit))
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             abstract = row[3]
             results.append({
                 "id": row[0],
@@ -1508,20 +1572,24 @@ class LaneyToolHandler:
         return results
 
     def search_links(self, query: str, limit: int = 15) -> List[Dict[str, Any]]:
-        """Search links by URL or title."""
-        cursor = self.conn.cursor()
+        """Search links by URL or title (typo tolerant)."""
+        columns = "id, url, title, clean_title, source, archived, trust_tier, first_seen"
+        rows = self._fuzzy_rows("link", columns, query, limit)
 
-        search_pattern = f"%{query}%"
-        cursor.execute("""
-            SELECT id, url, title, clean_title, source, archived, trust_tier, first_seen
-            FROM links
-            WHERE url LIKE ? OR title LIKE ? OR clean_title LIKE ?
-            ORDER BY first_seen DESC
-            LIMIT ?
-        """, (search_pattern, search_pattern, search_pattern, limit))
+        if rows is None:
+            cursor = self.conn.cursor()
+            search_pattern = f"%{query}%"
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM links
+                WHERE url LIKE ? OR title LIKE ? OR clean_title LIKE ?
+                ORDER BY first_seen DESC
+                LIMIT ?
+            """, (search_pattern, search_pattern, search_pattern, limit))
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             results.append({
                 "id": row[0],
                 "url": row[1],
@@ -2598,6 +2666,10 @@ class LaneyToolHandler:
     def fetch_url(self, url: str, max_length: int = 8000) -> Dict[str, Any]:
         """Fetch and extract text from a URL.
 
+        The page's full cleaned text is cached once (per URL and content
+        hash), so later fetches at any max_length are served from it, and
+        stale entries are revalidated with ETag/Last-Modified.
+
         Args:
             url: URL to fetch
             max_length: Maximum characters to return
@@ -2607,76 +2679,19 @@ class LaneyToolHandler:
         """
         import requests
 
-        # Check session cache first (fastest)
-        cache_key = f"{url}|{max_length}"
-        if cache_key in self._fetch_cache:
-            cached = self._fetch_cache[cache_key].copy()
-            cached["cached"] = "session"
-            return cached
-
-        # Check persistent cache (still fast, local DB)
-        db_cached = self._get_cached("fetch_url", cache_key)
-        if db_cached:
-            self._fetch_cache[cache_key] = db_cached  # Promote to session
-            db_cached["cached"] = "persistent"
-            return db_cached
+        if self._page_content is None:
+            from ..integrations.page_content import PageContentService
+            self._page_content = PageContentService(conn=self.conn)
 
         try:
-            # Fetch the page
-            headers = {
-                "User-Agent": "Mozilla/5.0 (compatible; Holocene/1.0; +https://github.com/endarthur/holocene)"
-            }
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-
-            content_type = response.headers.get('content-type', '')
-
-            # Handle different content types
-            if 'text/plain' in content_type:
-                text = response.text[:max_length]
-            elif 'text/html' in content_type or 'html' in content_type:
-                # Try to extract text from HTML
-                try:
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(response.text, 'html.parser')
-
-                    # Remove script and style elements
-                    for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-                        element.decompose()
-
-                    # Get text
-                    text = soup.get_text(separator='\n', strip=True)
-
-                    # Clean up whitespace
-                    lines = [line.strip() for line in text.splitlines() if line.strip()]
-                    text = '\n'.join(lines)[:max_length]
-
-                except ImportError:
-                    # BeautifulSoup not available, return raw
-                    text = response.text[:max_length]
-            else:
-                return {
-                    "error": f"Unsupported content type: {content_type}",
-                    "url": url,
-                }
-
-            result = {
-                "success": True,
-                "url": url,
-                "content": text,
-                "length": len(text),
-                "truncated": len(response.text) > max_length,
-            }
-            # Cache in both session and persistent storage
-            self._fetch_cache[cache_key] = result
-            self._set_cached("fetch_url", cache_key, result)
-            result["cached"] = False
-            return result
+            return self._page_content.get_text(url, max_length=max_length)
 
         except requests.exceptions.Timeout:
             return {"error": "Request timed out", "url": url}
         except requests.exceptions.RequestException as e:
             return {"error": f"Failed to fetch URL: {str(e)}", "url": url}
+        except ValueError as e:
+            return {"error": str(e), "url": url}
         except Exception as e:
             return {"error": f"Error processing URL: {str(e)}", "url": url}
 
@@ -3755,120 +3770,35 @@ This is my space for self-reflection, separate from Arthur's profile.
 
     # === Export Tools ===
 
-    def export_books_csv(self, query: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
-        """Export books to CSV file.
+    def export_collection(
+        self,
+        collection: str,
+        format: str = "csv",
+        query: Optional[str] = None,
+        limit: Optional[int] = None,
+        gzip: bool = False,
+    ) -> Dict[str, Any]:
+        """Stream a collection to a file in the documents directory.
 
         Args:
+            collection: 'books', 'links' or 'papers'
+            format: 'csv', 'jsonl' or 'parquet'
             query: Optional search filter
-            limit: Max books to export
+            limit: Max items to export (default: all)
+            gzip: Compress the file
 
         Returns:
             File path and count
         """
-        try:
-            cursor = self.conn.cursor()
+        from ..storage.export import export_filename, export_to_path
 
-            if query:
-                cursor.execute("""
-                    SELECT id, title, authors, isbn, publication_year, publisher,
-                           dewey_number, cutter_number, call_number, subjects,
-                           summary, added_at
-                    FROM books
-                    WHERE title LIKE ? OR authors LIKE ? OR subjects LIKE ?
-                    ORDER BY title
-                """, (f"%{query}%", f"%{query}%", f"%{query}%"))
-            else:
-                cursor.execute("""
-                    SELECT id, title, authors, isbn, publication_year, publisher,
-                           dewey_number, cutter_number, call_number, subjects,
-                           summary, added_at
-                    FROM books
-                    ORDER BY title
-                """)
-
-            rows = cursor.fetchall()
-            if limit:
-                rows = rows[:limit]
-
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(['ID', 'Title', 'Authors', 'ISBN', 'Year', 'Publisher',
-                           'Dewey', 'Cutter', 'Call Number', 'Subjects', 'Summary', 'Added'])
-
-            for row in rows:
-                writer.writerow(row)
-
-            # Save to file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"books_export_{timestamp}.csv"
-            filepath = self.documents_dir / filename
-
-            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                f.write(output.getvalue())
-
-            self.created_documents.append(filepath)
-
-            return {
-                "success": True,
-                "file_path": str(filepath),
-                "filename": filename,
-                "count": len(rows),
-                "message": f"Exported {len(rows)} books to {filename}"
-            }
-
-        except Exception as e:
-            return {"error": f"Failed to export books: {str(e)}"}
-
-    def export_links_csv(self, query: Optional[str] = None, limit: int = 500) -> Dict[str, Any]:
-        """Export links to CSV file.
-
-        Args:
-            query: Optional search filter
-            limit: Max links to export (default 500)
-
-        Returns:
-            File path and count
-        """
         try:
-            cursor = self.conn.cursor()
-
-            if query:
-                cursor.execute("""
-                    SELECT id, url, title, source, trust_tier, created_at,
-                           ia_url, last_checked, status_code
-                    FROM links
-                    WHERE url LIKE ? OR title LIKE ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """, (f"%{query}%", f"%{query}%", limit))
-            else:
-                cursor.execute("""
-                    SELECT id, url, title, source, trust_tier, created_at,
-                           ia_url, last_checked, status_code
-                    FROM links
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """, (limit,))
-
-            rows = cursor.fetchall()
-
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(['ID', 'URL', 'Title', 'Source', 'Trust Tier', 'Created',
-                           'Archive URL', 'Last Checked', 'Status'])
-
-            for row in rows:
-                writer.writerow(row)
-
-            # Save to file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"links_export_{timestamp}.csv"
+            filename = export_filename(collection, format, gzip)
             filepath = self.documents_dir / filename
-
-            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                f.write(output.getvalue())
+            count = export_to_path(
+                self.conn, collection, filepath,
+                fmt=format, query=query, limit=limit, compress=gzip,
+            )
 
             self.created_documents.append(filepath)
 
@@ -3876,75 +3806,24 @@ This is my space for self-reflection, separate from Arthur's profile.
                 "success": True,
                 "file_path": str(filepath),
                 "filename": filename,
-                "count": len(rows),
-                "message": f"Exported {len(rows)} links to {filename}"
+                "count": count,
+                "message": f"Exported {count} {collection} to {filename}"
             }
 
         except Exception as e:
-            return {"error": f"Failed to export links: {str(e)}"}
-
-    def export_papers_csv(self, query: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
-        """Export papers to CSV file.
-
-        Args:
-            query: Optional search filter
-            limit: Max papers to export
-
-        Returns:
-            File path and count
-        """
-        try:
-            cursor = self.conn.cursor()
-
-            if query:
-                cursor.execute("""
-                    SELECT id, title, authors, doi, arxiv_id, publication_date,
-                           abstract, url, added_at
-                    FROM papers
-                    WHERE title LIKE ? OR authors LIKE ? OR abstract LIKE ?
-                    ORDER BY added_at DESC
-                """, (f"%{query}%", f"%{query}%", f"%{query}%"))
-            else:
-                cursor.execute("""
-                    SELECT id, title, authors, doi, arxiv_id, publication_date,
-                           abstract, url, added_at
-                    FROM papers
-                    ORDER BY added_at DESC
-                """)
-
-            rows = cursor.fetchall()
-            if limit:
-                rows = rows[:limit]
-
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(['ID', 'Title', 'Authors', 'DOI', 'arXiv ID', 'Published',
-                           'Abstract', 'URL', 'Added'])
-
-            for row in rows:
-                writer.writerow(row)
-
-            # Save to file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"papers_export_{timestamp}.csv"
-            filepath = self.documents_dir / filename
+            return {"error": f"Failed to export {collection}: {str(e)}"}
 
-            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                f.write(output.getvalue())
-
-            self.created_documents.append(filepath)
+    def export_books_csv(self, query: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Export books to CSV file."""
+        return self.export_collection("books", "csv", query=query, limit=limit)
 
-            return {
-                "success": True,
-                "file_path": str(filepath),
-                "filename": filename,
-                "count": len(rows),
-                "message": f"Exported {len(rows)} papers to {filename}"
-            }
+    def export_links_csv(self, query: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Export links to CSV file."""
+        return self.export_collection("links", "csv", query=query, limit=limit)
 
-        except Exception as e:
-            return {"error": f"Failed to export papers: {str(e)}"}
+    def export_papers_csv(self, query: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Export papers to CSV file."""
+        return self.export_collection("papers", "csv", query=query, limit=limit)
 
     def generate_collection_report(
         self,
@@ -3978,18 +3857,12 @@ This is my space for self-reflection, separate from Arthur's profile.
             report_lines.append("## Collection Overview")
             report_lines.append("")
 
-            cursor.execute("SELECT COUNT(*) FROM books")
-            total_books = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM papers")
-            total_papers = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM links")
-            total_links = cursor.fetchone()[0]
+            from ..storage.database import collection_counts
 
-            report_lines.append(f"- **Total Books:** {total_books}")
-            report_lines.append(f"- **Total Papers:** {total_papers}")
-            report_lines.append(f"- **Total Links:** {total_links}")
+            counts = collection_counts(self.conn)
+            report_lines.append(f"- **Total Books:** {counts['books']}")
+            report_lines.append(f"- **Total Papers:** {counts['papers']}")
+            report_lines.append(f"- **Total Links:** {counts['links']}")
             report_lines.append("")
 
             if include_books:
@@ -3998,10 +3871,10 @@ This is my space for self-reflection, separate from Arthur's profile.
 
                 # Recent books
                 cursor.execute("""
-                    SELECT title, authors, publication_year, call_number
+                    SELECT title, author, publication_year, call_number
                     FROM books
-                    WHERE added_at >= ?
-                    ORDER BY added_at DESC
+                    WHERE created_at >= ?
+                    ORDER BY created_at DESC
                     LIMIT 10
                 """, (cutoff_date,))
                 recent_books = cursor.fetchall()
@@ -4018,9 +3891,9 @@ This is my space for self-reflection, separate from Arthur's profile.
 
                 # By Dewey class
                 cursor.execute("""
-                    SELECT SUBSTR(dewey_number, 1, 1) as class, COUNT(*) as cnt
+                    SELECT SUBSTR(dewey_decimal, 1, 1) as class, COUNT(*) as cnt
                     FROM books
-                    WHERE dewey_number IS NOT NULL
+                    WHERE dewey_decimal IS NOT NULL
                     GROUP BY class
                     ORDER BY cnt DESC
                 """)
@@ -4116,9 +3989,9 @@ This is my space for self-reflection, separate from Arthur's profile.
                 "success": True,
                 "file_path": str(filepath),
                 "filename": filename,
-                "total_books": total_books,
-                "total_papers": total_papers,
-                "total_links": total_links,
+                "total_books": counts["books"],
+                "total_papers": counts["papers"],
+                "total_links": counts["links"],
                 "message": f"Generated collection report: {filename}"
             }
 
@@ -0,0 +1,106 @@
+"""Archive Scheduler Plugin - Continuously drains the unarchived-links backlog.
+
+This plugin:
+- Runs an ArchiveScheduler inside holod with one worker pool per backend
+  (local monolith/WARC, Internet Archive, ArchiveBox)
+- Rescans the backlog periodically and refills pools as captures finish
+- Queues newly added links immediately
+- Only runs when integrations.archive_scheduler_enabled is set
+"""
+
+from typing import Optional
+
+from holocene.core import Plugin, Message
+
+
+PLUGIN_MANIFEST = {
+    "name": "archive_scheduler",
+    "class": "ArchiveSchedulerPlugin",
+    "version": "1.0.0",
+    "description": "Archives the link backlog continuously across all backends",
+    "runs_on": ["rei"],
+    "requires": [],
+    "enabled_by": "integrations.archive_scheduler_enabled",
+}
+
+
+class ArchiveSchedulerPlugin(Plugin):
+    """Drains unarchived links across all archiving backends in parallel."""
+
+    def get_metadata(self):
+        return PLUGIN_MANIFEST
+
+    def on_load(self):
+        """Initialize the plugin."""
+        self.logger.info("ArchiveScheduler plugin loaded")
+        self.scheduler = None
+
+    def on_enable(self):
+        """Build archiving clients and start the scheduler."""
+        integrations = self.core.config.integrations
+        if not integrations.archive_scheduler_enabled:
+            self.logger.info("Archive scheduler disabled in config")
+            return
+
+        from holocene.storage.archiving import ArchivingService
+        from holocene.storage.archive_scheduler import ArchiveScheduler
+        from holocene.integrations.internet_archive import InternetArchiveClient
+        from holocene.integrations.archivebox import ArchiveBoxClient
+
+        ia_client = None
+        if integrations.internet_archive_enabled:
+            ia_client = InternetArchiveClient(
+                access_key=integrations.ia_access_key,
+                secret_key=integrations.ia_secret_key,
+            )
+
+        archivebox_client = None
+        if integrations.archivebox_enabled:
+            archivebox_client = ArchiveBoxClient(
+                ssh_host=integrations.archivebox_host,
+                ssh_user=integrations.archivebox_user,
+                data_dir=integrations.archivebox_data_dir,
+            )
+
+        archiving = ArchivingService(
+            db=self.core.db,
+            capture_pool=self.core.capture_pool,
+            ia_client=ia_client,
+            archivebox_client=archivebox_client,
+        )
+
+        available = archiving.available_services()
+        services = [
+            s for s in (integrations.archive_scheduler_services or available)
+            if s in available
+        ]
+        if not services:
+            self.logger.warning("No archiving backends available - scheduler not started")
+            return
+
+        self.scheduler = ArchiveScheduler(
+            archiving,
+            services=services,
+            max_concurrent=integrations.archive_scheduler_max_concurrent,
+        )
+        self.scheduler.start(interval=integrations.archive_scheduler_interval_seconds)
+
+        self.subscribe('links.added', self._on_link_added)
+        self.subscribe('link.added', self._on_link_added)
+
+    def on_disable(self):
+        """Stop the scheduler (running captures finish, queued ones are dropped)."""
+        if self.scheduler:
+            self.scheduler.stop(wait=True)
+            if self.scheduler.archiving.archivebox:
+                self.scheduler.archiving.archivebox.close()  # Shared SSH connection
+            self.scheduler = None
+
+    def _on_link_added(self, msg: Message):
+        """Top up the pools so new links are archived without waiting for a rescan."""
+        if self.scheduler:
+            self.run_in_background(self.scheduler.fill)
+
+    def get_status(self) -> Optional[dict]:
+        """Public method to get scheduler status (for API/CLI)."""
+        return self.scheduler.get_status() if self.scheduler else None
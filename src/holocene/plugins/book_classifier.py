@@ -5,27 +5,35 @@ This plugin:
 - Classifies unclassified books automatically
 - Uses NanoGPT (DeepSeek V3) for Dewey Decimal Classification
 - Generates Cutter numbers and full call numbers
+- Collects books for a few seconds (classification.batch_delay) and
+  classifies them several per prompt, so an import of hundreds of books
+  costs a few dozen LLM calls instead of one per book
 - Runs classification in background (non-blocking)
 - Publishes classification.complete events
 """
 
 import json
-from typing import Dict
-from holocene.core import Plugin, Message
-from holocene.research.dewey_classifier import DeweyClassifier, generate_cutter_number
+import threading
+from typing import Dict, List
+from holocene.core import Plugin, Message, PRIORITY_LOW
+from holocene.research.dewey_classifier import DeweyClassifier
+
+
+PLUGIN_MANIFEST = {
+    "name": "book_classifier",
+    "class": "BookClassifierPlugin",
+    "version": "1.1.0",
+    "description": "Automatically classifies books with Dewey Decimal Classification",
+    "runs_on": ["rei", "wmut", "both"],
+    "requires": [],
+}
 
 
 class BookClassifierPlugin(Plugin):
     """Automatically classifies books with Dewey Decimal Classification."""
 
     def get_metadata(self):
-        return {
-            "name": "book_classifier",
-            "version": "1.0.0",
-            "description": "Automatically classifies books with Dewey Decimal Classification",
-            "runs_on": ["rei", "wmut", "both"],
-            "requires": []
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Initialize the plugin."""
@@ -45,6 +53,14 @@ class BookClassifierPlugin(Plugin):
                 self.logger.error(f"Failed to initialize DeweyClassifier: {e}")
                 self.classifier = None
 
+        # Books waiting for the next batch (book_id -> force)
+        classification = self.core.config.classification
+        self.batch_size = classification.batch_size
+        self.batch_delay = classification.batch_delay
+        self._pending: Dict[int, bool] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+
         # Stats
         self.classified_count = 0
         self.failed_count = 0
@@ -82,9 +98,7 @@ class BookClassifierPlugin(Plugin):
             self.logger.info(f"Book {book_id} not yet enriched, waiting for enrichment first")
             return
 
-        # Classify in background
-        self.logger.info(f"Classifying book {book_id} in background")
-        self._classify_book_async(book_id, book)
+        self._queue_book(book_id)
 
     def _on_enrichment_complete(self, msg: Message):
         """Handle enrichment.complete event - classify newly enriched books."""
@@ -104,8 +118,7 @@ class BookClassifierPlugin(Plugin):
             return
 
         # Classify now that we have enrichment
-        self.logger.info(f"Classifying newly enriched book {book_id}")
-        self._classify_book_async(book_id, book)
+        self._queue_book(book_id)
 
     def _on_classification_requested(self, msg: Message):
         """Handle manual classification requests."""
@@ -125,8 +138,8 @@ class BookClassifierPlugin(Plugin):
             self.logger.info(f"Book {book_id} already classified (use force=True to re-classify)")
             return
 
-        self.logger.info(f"Classifying book {book_id} (force={force})")
-        self._classify_book_async(book_id, book)
+        self.logger.info(f"Queueing book {book_id} for classification (force={force})")
+        self._queue_book(book_id, force=force)
 
     def _has_enrichment_metadata(self, book: Dict) -> bool:
         """Check if book has enrichment in metadata JSON."""
@@ -152,121 +165,151 @@ class BookClassifierPlugin(Plugin):
         except (json.JSONDecodeError, TypeError):
             return False
 
-    def _classify_book_async(self, book_id: int, book: Dict):
-        """Classify a book asynchronously."""
+    def _queue_book(self, book_id: int, force: bool = False):
+        """Add a book to the next batch.
+
+        The batch is sent batch_delay seconds after its first book arrives,
+        or as soon as it is full.
+        """
         if not self.classifier:
             self.logger.error("Cannot classify: No classifier configured")
             return
 
+        with self._pending_lock:
+            self._pending[book_id] = self._pending.get(book_id, False) or force
+            full = len(self._pending) >= self.batch_size
+            if not full and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.batch_delay, self._flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        self.logger.debug(f"Book {book_id} queued for classification")
+        if full:
+            self._flush_pending()
+
+    def _flush_pending(self):
+        """Send the queued books to the background as one batch."""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending, self._pending = self._pending, {}
+
+        if pending:
+            self.logger.info(f"Classifying batch of {len(pending)} book(s) in background")
+            self._classify_batch_async(pending)
+
+    def _classify_batch_async(self, pending: Dict[int, bool]):
+        """Classify a batch of books asynchronously."""
+
         def do_classification():
             """Actually perform the classification (runs in background thread)."""
-            try:
-                result = self._classify_book(book_id, book)
-                return result
-            except Exception as e:
-                self.logger.error(f"Classification failed for book {book_id}: {e}", exc_info=True)
-                self.failed_count += 1
-                raise
-
-        def on_complete(result):
-            """Called when classification completes."""
-            self.classified_count += 1
-            self.logger.info(f"Classification complete for book {book_id} (total: {self.classified_count})")
-
-            # Publish completion event
-            self.publish('classification.complete', {
-                'book_id': book_id,
-                'dewey_number': result['dewey_number'],
-                'dewey_label': result.get('dewey_label', ''),
-                'confidence': result.get('confidence', 'medium'),
-                'cutter_number': result.get('cutter_number', ''),
-                'call_number': result.get('call_number', ''),
-                'stats': {
-                    'classified': self.classified_count,
-                    'failed': self.failed_count
-                }
-            })
+            return self._classify_batch(pending)
 
         def on_error(error):
-            """Called if classification fails."""
+            """Called if the whole batch fails."""
             self.logger.error(f"Background classification failed: {error}")
-            self.publish('classification.failed', {
-                'book_id': book_id,
-                'error': str(error)
-            })
-
-        # Run in background
+            self.failed_count += len(pending)
+            for book_id in pending:
+                self.publish('classification.failed', {
+                    'book_id': book_id,
+                    'error': str(error)
+                })
+
+        # Run in background (bulk work: behind anything a user is waiting for)
         self.run_in_background(
             do_classification,
-            callback=on_complete,
-            error_handler=on_error
+            error_handler=on_error,
+            pool="llm",
+            priority=PRIORITY_LOW,
         )
 
-    def _classify_book(self, book_id: int, book: Dict) -> Dict:
-        """Perform book classification using Dewey classifier.
+    def _classify_batch(self, pending: Dict[int, bool]) -> Dict[int, Dict]:
+        """Classify queued books with the batch classifier and save the results.
 
         Args:
-            book_id: Book ID
-            book: Book dictionary
+            pending: Book ID -> force re-classification
 
         Returns:
-            Dict with classification results
+            Dict mapping book ID to classification result
         """
-        title = book.get('title', 'Unknown')
-        author = book.get('author', '')
-        subtitle = book.get('subtitle', '')
-        subjects = book.get('subjects', '')
-        publisher = book.get('publisher', '')
-        publication_year = book.get('publication_year')
-
-        # Get enriched summary from old column or metadata JSON
-        enriched_summary = book.get('enriched_summary', '')
-        if not enriched_summary:
-            metadata = book.get('metadata')
-            if metadata and metadata != '{}':
-                try:
-                    metadata_dict = json.loads(metadata) if isinstance(metadata, str) else metadata
-                    enriched_summary = metadata_dict.get('enrichment', {}).get('summary', '')
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-        # Call classifier
-        self.logger.info(f"Calling DeweyClassifier for book {book_id}")
-        result = self.classifier.classify_book(
-            title=title,
-            author=author,
-            subtitle=subtitle,
-            subjects=subjects,
-            publisher=publisher,
-            publication_year=publication_year,
-            enriched_summary=enriched_summary
+        # Re-read the books: they may have been classified since they were queued
+        books: List[Dict] = []
+        for book_id, force in pending.items():
+            book = self.core.db.get_book(book_id)
+            if not book:
+                continue
+            if not force and (book.get('udc_classification') or self._has_classification_metadata(book)):
+                continue
+            books.append(book)
+
+        if not books:
+            return {}
+
+        batch = self.classifier.batch_classifier(self.batch_size)
+        results = {}
+        for batch_results in batch.iter_batches(books):
+            for book_id, result in batch_results.items():
+                self._save_result(book_id, result)
+            results.update(batch_results)
+
+        self.logger.info(
+            f"Classified {len(books)} book(s) with {batch.prompts_sent} prompt(s) "
+            f"(total: {self.classified_count} classified, {self.failed_count} failed)"
         )
+        return results
 
-        # Extract results
-        dewey_number = result.get('dewey_number', '')
-        confidence = result.get('confidence', 'medium')
-        cutter_number = result.get('cutter_number', '')
-        call_number = result.get('call_number', '')
-
-        self.logger.info(f"Classification result: {dewey_number} (confidence: {confidence})")
+    def _save_result(self, book_id: int, result: Dict):
+        """Save one book's classification and publish the outcome."""
+        if "error" in result:
+            self.failed_count += 1
+            self.logger.warning(f"Classification failed for book {book_id}: {result['error']}")
+            self.publish('classification.failed', {
+                'book_id': book_id,
+                'error': result['error']
+            })
+            return
 
-        # Save to database
+        dewey_number = result['dewey_number']
         success = self.core.db.update_book_classification(
             book_id=book_id,
             udc_number=dewey_number,
             classification_system="Dewey",
-            confidence=confidence,
-            cutter_number=cutter_number,
-            call_number=call_number
+            confidence=result.get('confidence', 'medium'),
+            cutter_number=result.get('cutter_number', ''),
+            call_number=result.get('call_number', '')
         )
 
-        if success:
-            self.logger.info(f"Saved classification for book {book_id}")
-        else:
+        if not success:
+            self.failed_count += 1
             self.logger.error(f"Failed to save classification for book {book_id}")
+            return
 
-        return result
+        self.classified_count += 1
+        self.logger.info(f"Book {book_id} classified as {dewey_number} (confidence: {result.get('confidence')})")
+
+        # Publish completion event
+        self.publish('classification.complete', {
+            'book_id': book_id,
+            'dewey_number': dewey_number,
+            'dewey_label': result.get('dewey_label', ''),
+            'confidence': result.get('confidence', 'medium'),
+            'cutter_number': result.get('cutter_number', ''),
+            'call_number': result.get('call_number', ''),
+            'stats': {
+                'classified': self.classified_count,
+                'failed': self.failed_count
+            }
+        })
 
     def on_disable(self):
         """Disable the plugin."""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            dropped, self._pending = len(self._pending), {}
+
+        if dropped:
+            self.logger.info(f"{dropped} queued book(s) left unclassified (use 'holo books classify --all')")
         self.logger.info(f"BookClassifier disabled - Stats: {self.classified_count} classified, {self.failed_count} failed")
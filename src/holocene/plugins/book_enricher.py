@@ -10,21 +10,25 @@ This plugin:
 
 import json
 from typing import Dict, List
-from holocene.core import Plugin, Message
+from holocene.core import Plugin, Message, PRIORITY_LOW
 from holocene.llm.nanogpt import NanoGPTClient
 
 
+PLUGIN_MANIFEST = {
+    "name": "book_enricher",
+    "class": "BookEnricherPlugin",
+    "version": "1.0.0",
+    "description": "Automatically enriches books with AI-generated summaries and tags",
+    "runs_on": ["rei", "wmut", "both"],  # Can run anywhere
+    "requires": [],
+}
+
+
 class BookEnricherPlugin(Plugin):
     """Automatically enriches books with LLM-generated metadata."""
 
     def get_metadata(self):
-        return {
-            "name": "book_enricher",
-            "version": "1.0.0",
-            "description": "Automatically enriches books with AI-generated summaries and tags",
-            "runs_on": ["rei", "wmut", "both"],  # Can run anywhere
-            "requires": []
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Initialize the plugin."""
@@ -148,11 +152,13 @@ class BookEnricherPlugin(Plugin):
                 'error': str(error)
             })
 
-        # Run in background
+        # Run in background (bulk work: behind anything a user is waiting for)
         self.run_in_background(
             do_enrichment,
             callback=on_complete,
-            error_handler=on_error
+            error_handler=on_error,
+            pool="llm",
+            priority=PRIORITY_LOW,
         )
 
     def _enrich_book(self, book_id: int, book: Dict) -> Dict:
@@ -0,0 +1,81 @@
+"""Database Maintenance Plugin - Keeps holocene.db small and its query plans fresh.
+
+This plugin:
+- Checks the WAL size every few minutes and checkpoints it with TRUNCATE
+  once it passes maintenance.wal_checkpoint_mb
+- Runs PRAGMA optimize every few hours
+- Runs a full pass nightly (maintenance.schedule): retention policies,
+  incremental vacuum, ANALYZE (see storage/maintenance.py)
+- Publishes db.maintenance_complete events
+"""
+
+from holocene.core import Plugin, IntervalTrigger, CronTrigger, PRIORITY_LOW
+from holocene.storage.maintenance import DatabaseMaintenance
+
+
+PLUGIN_MANIFEST = {
+    "name": "db_maintenance",
+    "class": "DatabaseMaintenancePlugin",
+    "version": "1.0.0",
+    "description": "Checkpoints, optimizes, vacuums and prunes holocene.db",
+    "runs_on": ["rei", "wmut", "both"],
+    "requires": [],
+    "enabled_by": "maintenance.enabled",
+}
+
+
+class DatabaseMaintenancePlugin(Plugin):
+    """Runs database maintenance on a schedule."""
+
+    def get_metadata(self):
+        return PLUGIN_MANIFEST
+
+    def on_load(self):
+        """Initialize the plugin."""
+        self.logger.info("DatabaseMaintenance plugin loaded")
+        self.settings = self.core.config.maintenance
+        self.maintenance = DatabaseMaintenance(self.core.db, self.settings)
+
+    def on_enable(self):
+        """Schedule the maintenance jobs."""
+        self.schedule(
+            "wal_checkpoint",
+            self._check_wal,
+            IntervalTrigger(self.settings.checkpoint_interval_seconds, initial_delay=60),
+            persist=False,
+        )
+        self.schedule(
+            "optimize",
+            self.maintenance.optimize,
+            IntervalTrigger(self.settings.optimize_interval_hours * 3600, initial_delay=600),
+            persist=False,
+            priority=PRIORITY_LOW,
+        )
+        self.schedule("full_pass", self._full_pass, CronTrigger(self.settings.schedule), priority=PRIORITY_LOW)
+        self.logger.info(
+            f"DatabaseMaintenance enabled (WAL limit {self.settings.wal_checkpoint_mb} MB, "
+            f"full pass '{self.settings.schedule}')"
+        )
+
+    def on_disable(self):
+        """Disable the plugin (scheduled jobs are removed automatically)."""
+        self.logger.info("DatabaseMaintenance disabled")
+
+    def _check_wal(self):
+        """Checkpoint the WAL if it has grown past the threshold."""
+        return self.maintenance.checkpoint()
+
+    def _full_pass(self):
+        """Retention, incremental vacuum, ANALYZE and a final checkpoint."""
+        report = self.maintenance.run(analyze=True)
+        removed = sum(result["removed"] for result in report["retention"].values())
+        self.logger.info(
+            f"Maintenance pass: {removed} old row(s) removed, "
+            f"{report['reclaimed_bytes'] / 1024 / 1024:.1f} MB reclaimed"
+        )
+        self.publish('db.maintenance_complete', {
+            'removed_rows': removed,
+            'reclaimed_bytes': report['reclaimed_bytes'],
+            'retention': report['retention'],
+        })
+        return report
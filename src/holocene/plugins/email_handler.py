@@ -1,7 +1,8 @@
 """Email Handler Plugin - Laney's email interface.
 
 This plugin:
-- Polls IMAP for new emails to laney@gentropic.org
+- Listens for new emails to laney@gentropic.org (IMAP IDLE on one
+  long-lived connection; polling when the server lacks IDLE)
 - Processes incoming emails:
   - URLs → archives them to the collection
   - Questions → sends to Laney, replies with response
@@ -10,7 +11,6 @@ This plugin:
 - Runs on rei (server)
 """
 
-import imaplib
 import json
 import smtplib
 import email
@@ -25,25 +25,37 @@ import mimetypes
 import re
 import threading
 import time
+from concurrent.futures import wait
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple, Union
 from html import unescape
 
-from holocene.core import Plugin
+from holocene.core import Plugin, IntervalTrigger
+from holocene.integrations.imap_client import IMAPMailbox
+
+
+PLUGIN_MANIFEST = {
+    "name": "email_handler",
+    "class": "EmailHandlerPlugin",
+    "version": "1.0.0",
+    "description": "Email interface for Laney - receive questions, archive links",
+    "runs_on": ["rei"],
+    "requires": [],
+    "enabled_by": "email.enabled",
+}
 
 
 class EmailHandlerPlugin(Plugin):
     """Handles email communication for Laney."""
 
+    IDLE_RENEW_SECONDS = 540  # Re-issue IDLE well before servers' ~30 min cutoff
+    FETCH_BATCH_SIZE = 25  # Messages per UID FETCH
+    RECONNECT_BACKOFF = 5  # Seconds, doubled per failed reconnect
+    MAX_RECONNECT_BACKOFF = 300
+
     def get_metadata(self):
-        return {
-            "name": "email_handler",
-            "version": "1.0.0",
-            "description": "Email interface for Laney - receive questions, archive links",
-            "runs_on": ["rei"],
-            "requires": []
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Initialize the plugin."""
@@ -70,13 +82,17 @@ class EmailHandlerPlugin(Plugin):
             "last_check": None
         }
 
-        # Background thread
-        self._check_thread: Optional[threading.Thread] = None
+        # One IMAP connection, kept open between checks
+        self._mailbox = IMAPMailbox(
+            email_config.imap_server,
+            email_config.imap_port,
+            email_config.username,
+            email_config.password,
+            use_ssl=email_config.imap_ssl,
+        )
+        self._idle_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
-        # Track processed email IDs to avoid reprocessing
-        self._processed_ids: set = set()
-
     def on_enable(self):
         """Enable the plugin and start email checking."""
         if not getattr(self, '_email_configured', False):
@@ -90,95 +106,148 @@ class EmailHandlerPlugin(Plugin):
 
     def on_disable(self):
         """Stop the email checker."""
-        self._stop_email_checker()
+        if getattr(self, '_email_configured', False):
+            self._stop_email_checker()
         self.logger.info(f"EmailHandler disabled - Stats: {self.stats}")
 
     def _start_email_checker(self):
-        """Start background thread for checking emails."""
-        self._stop_event.clear()
-        self._check_thread = threading.Thread(
-            target=self._email_check_loop,
-            name="email-checker",
-            daemon=True
-        )
-        self._check_thread.start()
-        self.logger.info("Email checker thread started")
+        """Start push ingestion (IMAP IDLE), or schedule periodic checks."""
+        if self.email_config.imap_idle:
+            self._stop_event.clear()
+            self._idle_thread = threading.Thread(target=self._idle_loop, name="email-idle", daemon=True)
+            self._idle_thread.start()
+            self.logger.info("Email IDLE listener started")
+        else:
+            interval = self.email_config.check_interval_seconds
+            self.schedule("check_emails", self._scheduled_check, IntervalTrigger(interval), persist=False)
+            self.logger.info(f"Email checks scheduled every {interval}s")
 
     def _stop_email_checker(self):
-        """Stop the background thread."""
-        if self._check_thread:
-            self._stop_event.set()
-            self._check_thread.join(timeout=10)
-            self._check_thread = None
-
-    def _email_check_loop(self):
-        """Main loop for checking emails."""
-        interval = self.email_config.check_interval_seconds
-
+        """Stop the IDLE listener and close the IMAP connection."""
+        self._stop_event.set()
+        if self._idle_thread:
+            self._mailbox.interrupt()  # Wakes the blocked IDLE
+            self._idle_thread.join(timeout=10)
+            self._idle_thread = None
+        self._mailbox.close()
+
+    def _idle_loop(self):
+        """Push mode: check, then IDLE until the server reports new mail.
+
+        Falls back to waiting check_interval_seconds between checks when the
+        server doesn't support IDLE. Connection failures back off
+        exponentially up to MAX_RECONNECT_BACKOFF.
+        """
+        backoff = self.RECONNECT_BACKOFF
         while not self._stop_event.is_set():
             try:
                 self._check_emails()
+                backoff = self.RECONNECT_BACKOFF
+
+                if self._mailbox.supports_idle:
+                    if self._mailbox.idle(self.IDLE_RENEW_SECONDS):
+                        self.logger.debug("IDLE: mailbox changed")
+                elif self._stop_event.wait(self.email_config.check_interval_seconds):
+                    break
+
             except Exception as e:
-                self.logger.error(f"Error checking emails: {e}")
+                if self._stop_event.is_set():
+                    break
+                self.logger.error(f"IMAP connection error: {e} (reconnecting in {backoff:.0f}s)")
                 self.stats["errors"] += 1
+                self._mailbox.close()
+                if self._stop_event.wait(backoff):
+                    break
+                backoff = min(backoff * 2, self.MAX_RECONNECT_BACKOFF)
+
+    def _scheduled_check(self):
+        """Scheduled job (polling mode): check emails, counting failures in stats.
+
+        The job already runs on the executor, so the handlers run inline
+        rather than waiting on tasks queued behind it in the same pool.
+        """
+        try:
+            self._check_emails(inline=True)
+        except Exception as e:
+            self.logger.error(f"Error checking emails: {e}")
+            self.stats["errors"] += 1
+            self._mailbox.close()  # Reconnect on the next check
+
+    def _check_emails(self, inline: bool = False):
+        """Fetch new emails over the persistent connection and process them.
 
-            # Wait for interval or stop event
-            self._stop_event.wait(interval)
+        Only UIDs above the persisted high-water mark are searched (unless the
+        mailbox's UIDVALIDITY changed). Messages are fetched in batches; their
+        headers, threads and storage are handled in order here, then replies
+        and link archiving run concurrently on the core executor, one task
+        per email thread.
 
-    def _check_emails(self):
-        """Check IMAP for new emails and process them."""
+        Args:
+            inline: Run the handlers on this thread instead (for callers that
+                are themselves executor tasks)
+        """
         self.stats["last_check"] = datetime.now().isoformat()
         self.logger.debug("Checking for new emails...")
 
-        try:
-            # Connect to IMAP
-            mail = imaplib.IMAP4_SSL(
-                self.email_config.imap_server,
-                self.email_config.imap_port
-            )
-            mail.login(self.email_config.username, self.email_config.password)
-            mail.select('INBOX')
-
-            # Search for unread emails
-            status, messages = mail.search(None, 'UNSEEN')
-            if status != 'OK':
-                self.logger.warning("Failed to search emails")
-                mail.logout()
-                return
+        if not self._mailbox.connected:
+            self._mailbox.connect()
 
-            email_ids = messages[0].split()
-            if not email_ids:
-                self.logger.debug("No new emails")
-                mail.logout()
-                return
+        state_key = f"email_imap:{self.email_config.address}"
+        state = self.core.db.get_import_state(state_key)
+        last_uid = state.get("last_uid") if state.get("uidvalidity") == self._mailbox.uidvalidity else None
 
-            self.logger.info(f"Found {len(email_ids)} new email(s)")
+        uids = self._mailbox.search_new(last_uid)
+        if not uids:
+            self.logger.debug("No new emails")
+            return
+
+        self.logger.info(f"Found {len(uids)} new email(s)")
 
-            for email_id in email_ids:
+        handlers: Dict[int, List] = {}  # thread_id -> handlers, in arrival order
+        try:
+            for uid, raw_email in self._mailbox.fetch(uids, batch_size=self.FETCH_BATCH_SIZE):
                 try:
-                    self._process_email(mail, email_id)
+                    prepared = self._prepare_email(raw_email)
+                    if prepared:
+                        thread_id, handler = prepared
+                        handlers.setdefault(thread_id, []).append(handler)
                 except Exception as e:
-                    self.logger.error(f"Error processing email {email_id}: {e}")
+                    self.logger.error(f"Error processing email UID {uid}: {e}")
                     self.stats["errors"] += 1
+                last_uid = max(last_uid or 0, uid)
+        finally:
+            if last_uid is not None:
+                self.core.db.set_import_state(
+                    state_key, {"uidvalidity": self._mailbox.uidvalidity, "last_uid": last_uid}
+                )
+
+        if inline:
+            for thread_handlers in handlers.values():
+                self._run_handlers(thread_handlers)
+            return
 
-            mail.logout()
+        futures = [
+            self.run_in_background(lambda thread_handlers=thread_handlers: self._run_handlers(thread_handlers))
+            for thread_handlers in handlers.values()
+        ]
+        wait(futures)
 
-        except imaplib.IMAP4.error as e:
-            self.logger.error(f"IMAP error: {e}")
-            self.stats["errors"] += 1
-        except Exception as e:
-            self.logger.error(f"Error checking emails: {e}")
-            self.stats["errors"] += 1
+    def _run_handlers(self, handlers: List):
+        """Run one email thread's handlers in order."""
+        for handler in handlers:
+            try:
+                handler()
+            except Exception as e:
+                self.logger.error(f"Error handling email: {e}", exc_info=True)
+                self.stats["errors"] += 1
 
-    def _process_email(self, mail: imaplib.IMAP4_SSL, email_id: bytes):
-        """Process a single email."""
-        # Fetch the email
-        status, msg_data = mail.fetch(email_id, '(RFC822)')
-        if status != 'OK':
-            return
+    def _prepare_email(self, raw_email: bytes):
+        """Parse and store a single email.
 
-        # Parse email
-        raw_email = msg_data[0][1]
+        Returns:
+            (thread_id, handler) where handler replies or archives links, or
+            None if the email is ignored
+        """
         msg = email.message_from_bytes(raw_email)
 
         # Extract headers
@@ -196,7 +265,7 @@ class EmailHandlerPlugin(Plugin):
         if self.email_config.allowed_senders:
             if not self._is_sender_allowed(from_addr):
                 self.logger.info(f"Ignoring email from non-allowed sender: {from_addr}")
-                return
+                return None
 
         # Auto-whitelist CC'd addresses (trusted sender vouches for them)
         newly_whitelisted = self._auto_whitelist_cc(msg, from_addr)
@@ -229,6 +298,7 @@ class EmailHandlerPlugin(Plugin):
             body=body,
             direction='inbound'
         )
+        self.stats["emails_processed"] += 1
 
         # Determine what to do with the email
         urls = self._extract_urls(body)
@@ -240,13 +310,11 @@ class EmailHandlerPlugin(Plugin):
         if is_urls_only:
             # Archive the URLs
             self.logger.info(f"URL-only email with {len(urls)} URLs - archiving")
-            self._handle_url_email(from_addr, subject, urls, message_id, msg, thread_id)
-        else:
-            # Send to Laney for a response
-            self.logger.info("Question email - sending to Laney...")
-            self._handle_question_email(from_addr, subject, body, message_id, msg, thread_id)
+            return thread_id, lambda: self._handle_url_email(from_addr, subject, urls, message_id, msg, thread_id)
 
-        self.stats["emails_processed"] += 1
+        # Send to Laney for a response
+        self.logger.info("Question email - sending to Laney...")
+        return thread_id, lambda: self._handle_question_email(from_addr, subject, body, message_id, msg, thread_id)
 
     def _handle_url_email(self, from_addr: str, subject: str, urls: List[str],
                           message_id: str, original_msg, thread_id: int):
@@ -384,15 +452,16 @@ class EmailHandlerPlugin(Plugin):
 
             # Insert new link
             db.conn.execute("""
-                INSERT INTO links (url, source, created_at, trust_tier)
-                VALUES (?, ?, ?, 'recent')
-            """, (url, source, now))
+                INSERT INTO links (url, source, first_seen, last_seen, created_at, trust_tier)
+                VALUES (?, ?, ?, ?, ?, 'recent')
+            """, (url, source, now, now, now))
             db.conn.commit()
 
             self.logger.info(f"Added link: {url}")
             return True
 
         except Exception as e:
+            self.core.db.conn.rollback()  # Don't hold the write lock (handlers run concurrently)
             self.logger.error(f"Failed to add link: {e}")
             return False
 
@@ -10,17 +10,21 @@ import time
 from holocene.core import Plugin, Message
 
 
+PLUGIN_MANIFEST = {
+    "name": "example",
+    "class": "ExamplePlugin",
+    "version": "1.0.0",
+    "description": "Example plugin for testing the plugin system",
+    "runs_on": ["both"],  # Runs on any device
+    "requires": [],  # No dependencies
+}
+
+
 class ExamplePlugin(Plugin):
     """Example plugin for testing."""
 
     def get_metadata(self):
-        return {
-            "name": "example",
-            "version": "1.0.0",
-            "description": "Example plugin for testing the plugin system",
-            "runs_on": ["both"],  # Runs on any device
-            "requires": []  # No dependencies
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Called when plugin is loaded."""
@@ -16,7 +16,18 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 from urllib.parse import urlparse
 
-from holocene.core import Plugin, Message
+from holocene.core import Plugin, Message, IntervalTrigger, PRIORITY_LOW
+from holocene.core import rate_limiter
+
+
+PLUGIN_MANIFEST = {
+    "name": "link_status_checker",
+    "class": "LinkStatusCheckerPlugin",
+    "version": "2.0.0",
+    "description": "Monitors link health with batch processing and Uptime Kuma integration",
+    "runs_on": ["rei"],
+    "requires": [],
+}
 
 
 class LinkStatusCheckerPlugin(Plugin):
@@ -25,18 +36,12 @@ class LinkStatusCheckerPlugin(Plugin):
     # Configuration
     BATCH_SIZE = 50  # Links per batch
     CHECK_INTERVAL_SECONDS = 3600  # 1 hour between batch checks
-    DELAY_BETWEEN_CHECKS = 1.5  # Seconds between individual link checks
+    DELAY_BETWEEN_CHECKS = 1.5  # Seconds between checks to the same domain (no shared limiter)
     REQUEST_TIMEOUT = 15  # Seconds
     MAX_LINK_AGE_DAYS = 21  # Re-check links older than this
 
     def get_metadata(self):
-        return {
-            "name": "link_status_checker",
-            "version": "2.0.0",
-            "description": "Monitors link health with batch processing and Uptime Kuma integration",
-            "runs_on": ["rei"],
-            "requires": []
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Initialize the plugin."""
@@ -51,10 +56,15 @@ class LinkStatusCheckerPlugin(Plugin):
             "last_batch_time": None
         }
 
-        # Background thread for scheduled checks
-        self._check_thread: Optional[threading.Thread] = None
+        # Set on disable to interrupt a batch in progress
         self._stop_event = threading.Event()
 
+        # Per-domain rate limiting: share holod's limiter so checks don't
+        # collide with archivers hitting the same hosts
+        self.limiter = rate_limiter.get_global_limiter() or rate_limiter.DomainRateLimiter(
+            default_rate=1.0 / self.DELAY_BETWEEN_CHECKS
+        )
+
         # HTTP session with connection pooling
         self.session = requests.Session()
         self.session.headers.update({
@@ -88,43 +98,19 @@ class LinkStatusCheckerPlugin(Plugin):
             self.session.close()
 
     def _start_scheduled_checker(self):
-        """Start the background scheduled checker thread."""
+        """Schedule hourly batch checks (the first waits for the daemon to finish starting)."""
         self._stop_event.clear()
-        self._check_thread = threading.Thread(
-            target=self._scheduled_checker_worker,
-            daemon=True,
-            name="link_checker"
+        self.schedule(
+            "batch_check",
+            self._run_batch_check,
+            IntervalTrigger(self.CHECK_INTERVAL_SECONDS, initial_delay=30),
+            priority=PRIORITY_LOW,
         )
-        self._check_thread.start()
-        self.logger.info("Scheduled link checker started")
+        self.logger.info(f"Scheduled link checker started (interval: {self.CHECK_INTERVAL_SECONDS}s)")
 
     def _stop_scheduled_checker(self):
-        """Stop the background scheduled checker thread."""
-        if self._check_thread and self._check_thread.is_alive():
-            self.logger.info("Stopping scheduled link checker...")
-            self._stop_event.set()
-            self._check_thread.join(timeout=5)
-            self.logger.info("Scheduled link checker stopped")
-
-    def _scheduled_checker_worker(self):
-        """Background worker that runs batch checks on schedule."""
-        self.logger.info(f"Link checker worker started (interval: {self.CHECK_INTERVAL_SECONDS}s)")
-
-        # Initial delay to let daemon fully start
-        if self._stop_event.wait(30):
-            return
-
-        while not self._stop_event.is_set():
-            try:
-                self._run_batch_check()
-            except Exception as e:
-                self.logger.error(f"Batch check failed: {e}", exc_info=True)
-
-            # Wait for next check interval
-            if self._stop_event.wait(self.CHECK_INTERVAL_SECONDS):
-                break
-
-        self.logger.info("Link checker worker stopped")
+        """Interrupt a batch check in progress (the job itself is removed on disable)."""
+        self._stop_event.set()
 
     def _on_check_batch(self, msg: Message):
         """Handle manual batch check request."""
@@ -191,9 +177,6 @@ class LinkStatusCheckerPlugin(Plugin):
                 batch_stats['errors'] += 1
                 self.session_stats['errors'] += 1
 
-            # Rate limiting - wait between checks
-            time.sleep(self.DELAY_BETWEEN_CHECKS)
-
         self.logger.info(
             f"Batch check complete: {batch_stats['checked']} checked, "
             f"{batch_stats['alive']} alive, {batch_stats['dead']} dead, "
@@ -264,6 +247,9 @@ class LinkStatusCheckerPlugin(Plugin):
             'response_time_ms': 0
         }
 
+        # Only waits when the previous check hit the same domain
+        self.limiter.wait_for_token(url)
+
         start_time = time.time()
 
         try:
@@ -284,6 +270,10 @@ class LinkStatusCheckerPlugin(Plugin):
                 )
                 response.close()
 
+            self.limiter.record_response(
+                url, response.status_code, response.headers.get('Retry-After')
+            )
+
             result['status_code'] = response.status_code
             result['is_alive'] = 200 <= response.status_code < 400
             result['response_time_ms'] = int((time.time() - start_time) * 1000)
@@ -0,0 +1,73 @@
+"""Mercado Livre Enricher Plugin - Crawls queued favorites' product pages.
+
+This plugin:
+- Checks the mercadolivre_enrich crawl frontier periodically
+- Runs the enrichment crawler (bounded concurrency, per-host politeness,
+  batched DB writes) whenever entries are due
+- Resumes interrupted crawls after a restart (the frontier lives in the DB)
+- Only runs when mercadolivre.enrich_in_background is set
+
+Queue favorites with: holo mercadolivre enrich --all
+"""
+
+import threading
+from typing import Optional
+
+from holocene.core import Plugin, IntervalTrigger, PRIORITY_LOW
+
+
+PLUGIN_MANIFEST = {
+    "name": "mercadolivre_enricher",
+    "class": "MercadoLivreEnricherPlugin",
+    "version": "1.0.0",
+    "description": "Crawls product pages for queued Mercado Livre favorites",
+    "runs_on": ["rei", "both"],
+    "requires": [],
+    "enabled_by": "mercadolivre.enrich_in_background",
+}
+
+
+class MercadoLivreEnricherPlugin(Plugin):
+    """Enriches queued Mercado Livre favorites in the background."""
+
+    def get_metadata(self):
+        return PLUGIN_MANIFEST
+
+    def on_load(self):
+        """Initialize the plugin."""
+        self.logger.info("MercadoLivreEnricher plugin loaded")
+        self.crawler = None
+        self._stop = threading.Event()
+
+    def on_enable(self):
+        """Schedule the frontier check."""
+        config = self.core.config
+        if not config.mercadolivre.enrich_in_background:
+            self.logger.info("Background enrichment disabled in config")
+            return
+
+        from holocene.integrations.mercadolivre import create_enrichment_crawler
+
+        self.crawler = create_enrichment_crawler(self.core.db, config)
+        self._stop.clear()
+        self.schedule(
+            "crawl",
+            self._crawl_due,
+            IntervalTrigger(config.mercadolivre.enrich_interval_seconds),
+            persist=False,
+            priority=PRIORITY_LOW,
+        )
+
+    def on_disable(self):
+        """Stop crawling; unfinished entries are resumed on the next start."""
+        self._stop.set()
+
+    def _crawl_due(self):
+        """Scheduled job - crawl if the frontier has due entries."""
+        if self.core.db.get_crawl_stats(self.crawler.job)["due"]:
+            stats = self.crawler.run(stop_event=self._stop)
+            self.logger.info(f"Enrichment run finished: {stats}")
+
+    def get_status(self) -> Optional[dict]:
+        """Public method to get crawler status (for API/CLI)."""
+        return self.crawler.get_status() if self.crawler else None
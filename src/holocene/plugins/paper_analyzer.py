@@ -0,0 +1,166 @@
+"""Paper Analyzer Plugin - Drains the full-text analysis backlog.
+
+This plugin:
+- Finds papers with a local PDF whose full text hasn't been analyzed
+  (full_text_analyzed = 0)
+- Analyzes several at once on the llm pool (papers.analysis_workers),
+  summarizing each PDF chunk by chunk (see research/paper_analysis.py)
+- Extracts PDF pages on the cpu pool, so parsing runs in worker
+  processes instead of holding the llm threads and the GIL
+- Starts the next paper as soon as one finishes, and rescans the backlog
+  on a schedule for newly downloaded PDFs
+- Publishes papers.analyzed and papers.analysis_failed events
+"""
+
+import threading
+from typing import Dict, Set
+
+from holocene.core import Plugin, Message, IntervalTrigger, PRIORITY_LOW
+from holocene.llm import NanoGPTClient
+from holocene.research.paper_analysis import PaperAnalyzer
+
+
+PLUGIN_MANIFEST = {
+    "name": "paper_analyzer",
+    "class": "PaperAnalyzerPlugin",
+    "version": "1.0.0",
+    "description": "Analyzes the full text of downloaded papers in the background",
+    "runs_on": ["rei", "both"],
+    "requires": [],
+    "enabled_by": "llm.api_key",
+}
+
+
+class PaperAnalyzerPlugin(Plugin):
+    """Analyzes papers' full text in the background."""
+
+    def get_metadata(self):
+        return PLUGIN_MANIFEST
+
+    def on_load(self):
+        """Initialize the plugin."""
+        self.logger.info("PaperAnalyzer plugin loaded")
+
+        config = self.core.config
+        self.settings = config.papers
+        self.analyzer = None
+        if getattr(config.llm, 'api_key', None):
+            llm_client = NanoGPTClient(config.llm.api_key, config.llm.base_url)
+            self.analyzer = PaperAnalyzer(llm_client, config, db=self.core.db, submit=self._extract)
+        else:
+            self.logger.warning("No NanoGPT API key configured - paper analysis disabled")
+
+        # Papers being analyzed, and failures per paper (reset on restart)
+        self._lock = threading.Lock()
+        self._in_flight: Set[int] = set()
+        self._failures: Dict[int, int] = {}
+
+        # Stats
+        self.analyzed_count = 0
+        self.failed_count = 0
+
+    def on_enable(self):
+        """Start draining the backlog."""
+        if not self.analyzer or not self.settings.analyze_in_background:
+            self.logger.info("Background paper analysis is off")
+            return
+
+        self.subscribe('papers.analyze_requested', self._on_analyze_requested)
+        self.schedule(
+            "drain_backlog",
+            self._fill_workers,
+            IntervalTrigger(self.settings.analysis_interval_seconds, initial_delay=60),
+            persist=False,
+        )
+        self.logger.info(f"PaperAnalyzer enabled ({self.settings.analysis_workers} worker(s))")
+
+    def on_disable(self):
+        """Disable the plugin (queued analyses are cancelled on shutdown)."""
+        self.logger.info(
+            f"PaperAnalyzer disabled - Stats: {self.analyzed_count} analyzed, {self.failed_count} failed"
+        )
+
+    def _extract(self, task):
+        """Run a page extraction task on the cpu pool."""
+        return self.run_in_background(task, pool="cpu", priority=PRIORITY_LOW)
+
+    def _on_analyze_requested(self, msg: Message):
+        """Handle papers.analyze_requested - analyze a paper now."""
+        paper_id = msg.data.get('paper_id')
+        if not paper_id:
+            return
+        paper = self.core.db.get_paper(paper_id)
+        if not paper:
+            self.logger.warning(f"Paper {paper_id} not found")
+            return
+        with self._lock:
+            self._failures.pop(paper_id, None)
+            if paper_id in self._in_flight:
+                return
+            self._in_flight.add(paper_id)
+        self._start(paper)
+
+    def _fill_workers(self):
+        """Start analyses until analysis_workers papers are in flight."""
+        with self._lock:
+            free = self.settings.analysis_workers - len(self._in_flight)
+            if free <= 0:
+                return
+            exhausted = [
+                paper_id for paper_id, failures in self._failures.items()
+                if failures >= self.settings.analysis_max_attempts
+            ]
+            papers = self.core.db.get_unanalyzed_papers(
+                limit=free, exclude_ids=list(self._in_flight) + exhausted
+            )
+            for paper in papers:
+                self._in_flight.add(paper['id'])
+
+        for paper in papers:
+            self._start(paper)
+
+    def _start(self, paper: Dict):
+        """Analyze one paper on the llm pool."""
+        paper_id = paper['id']
+
+        def do_analysis():
+            return self.analyzer.analyze_paper(paper)
+
+        def on_complete(result):
+            with self._lock:
+                self._in_flight.discard(paper_id)
+                self._failures.pop(paper_id, None)
+            self.analyzed_count += 1
+            self.logger.info(
+                f"Analyzed paper {paper_id}: {result['analysis_pages']} pages, "
+                f"{result['chunks']} chunks ({result['cached_chunks']} cached)"
+            )
+            self.publish('papers.analyzed', {
+                'paper_id': paper_id,
+                'total_pages': result['total_pages'],
+                'sections': result['sections'],
+                'chunks': result['chunks'],
+            })
+            self._fill_workers()
+
+        def on_error(error):
+            with self._lock:
+                self._in_flight.discard(paper_id)
+                self._failures[paper_id] = self._failures.get(paper_id, 0) + 1
+            self.failed_count += 1
+            self.logger.warning(f"Analysis of paper {paper_id} failed: {error}")
+            self.publish('papers.analysis_failed', {'paper_id': paper_id, 'error': str(error)})
+            self._fill_workers()
+
+        try:
+            self.run_in_background(
+                do_analysis,
+                callback=on_complete,
+                error_handler=on_error,
+                pool="llm",
+                priority=PRIORITY_LOW,
+            )
+        except RuntimeError:
+            # Executor is shutting down
+            with self._lock:
+                self._in_flight.discard(paper_id)
@@ -18,7 +18,19 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, Any, Optional, List
 
-from holocene.core import Plugin
+from holocene.core import Plugin, CronTrigger, IntervalTrigger, PRIORITY_LOW
+from holocene.core.topic_index import TopicIndex, jaccard, topic_keywords
+
+
+PLUGIN_MANIFEST = {
+    "name": "proactive_laney",
+    "class": "ProactiveLaneyPlugin",
+    "version": "2.0.0",
+    "description": "Daily digests, curiosity engine, and proactive insights from Laney",
+    "runs_on": ["rei"],
+    "requires": [],
+    "enabled_by": ["email.enabled", "llm.api_key"],
+}
 
 
 class ProactiveLaneyPlugin(Plugin):
@@ -28,13 +40,7 @@ class ProactiveLaneyPlugin(Plugin):
     DEFAULT_RECIPIENT = "endarthur@gmail.com"
 
     def get_metadata(self):
-        return {
-            "name": "proactive_laney",
-            "version": "2.0.0",
-            "description": "Daily digests, curiosity engine, and proactive insights from Laney",
-            "runs_on": ["rei"],
-            "requires": []
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Initialize the plugin."""
@@ -56,11 +62,12 @@ class ProactiveLaneyPlugin(Plugin):
         # Scheduling settings for digest
         self.digest_hour = 8  # 8 AM local time
         self.digest_minute = 0
-        self.last_digest_date = None
+        self.digest_misfire_grace = 4 * 3600  # Still send if holod comes up by noon
+        self.digest_prepare_lead = 30 * 60  # Build digest + LLM commentary this long before sending
 
-        # Background thread for digest
-        self._stop_event = threading.Event()
-        self._worker_thread: Optional[threading.Thread] = None
+        # Digest built ahead of the send time (None until prepared)
+        self._prepared_digest: Optional[Dict[str, Any]] = None
+        self._prepared_lock = threading.Lock()
 
         # Stats
         self.digests_sent = 0
@@ -72,63 +79,55 @@ class ProactiveLaneyPlugin(Plugin):
             self.logger.warning("ProactiveLaney not enabled (no email or LLM config)")
             return
 
-        # Start digest scheduler if email is enabled
+        # Schedule the digest if email is enabled
         if self._email_enabled:
-            self._stop_event.clear()
-            self._worker_thread = threading.Thread(
-                target=self._scheduler_loop,
-                daemon=True,
-                name="proactive-laney-digest"
+            self.schedule(
+                "daily_digest",
+                self._send_daily_digest,
+                CronTrigger(f"{self.digest_minute} {self.digest_hour} * * *"),
+                misfire_grace=self.digest_misfire_grace,
+            )
+            prepare_at = datetime(2000, 1, 1, self.digest_hour, self.digest_minute) - timedelta(seconds=self.digest_prepare_lead)
+            self.schedule(
+                "prepare_digest",
+                self._prepare_digest,
+                CronTrigger(f"{prepare_at.minute} {prepare_at.hour} * * *"),
+                misfire_grace=self.digest_misfire_grace,
+                pool="llm",  # Commentary is written by the LLM
+                priority=PRIORITY_LOW,
             )
-            self._worker_thread.start()
-            self.logger.info(f"Digest scheduler started (at {self.digest_hour:02d}:{self.digest_minute:02d})")
+            self.logger.info(f"Digest scheduled (at {self.digest_hour:02d}:{self.digest_minute:02d}, prepared at {prepare_at:%H:%M})")
 
         # Start curiosity engine if LLM is enabled
         if self._llm_enabled:
             self._start_curiosity_engine()
 
     def on_disable(self):
-        """Stop the scheduler and curiosity engine."""
-        # Stop digest scheduler
-        if self._worker_thread and self._worker_thread.is_alive():
-            self._stop_event.set()
-            self._worker_thread.join(timeout=5)
-
-        # Stop curiosity engine
+        """Stop the curiosity engine (scheduled jobs are removed automatically)."""
         self._stop_curiosity_engine()
 
         self.logger.info(f"ProactiveLaney disabled - Sent {self.digests_sent} digest(s)")
 
-    def _scheduler_loop(self):
-        """Main scheduling loop - checks every minute if it's time for digest."""
-        # Initial delay
-        if self._stop_event.wait(60):
-            return
+    def _prepare_digest(self):
+        """Build the digest (including LLM calls) ahead of the send time."""
+        digest = self._generate_digest()
+        with self._prepared_lock:
+            self._prepared_digest = digest
+        self.logger.info("Daily digest prepared")
 
-        while not self._stop_event.is_set():
-            try:
-                now = datetime.now()
+    def _take_prepared_digest(self) -> Optional[Dict[str, Any]]:
+        """Return today's prepared digest, if any (each is sent once)."""
+        with self._prepared_lock:
+            digest, self._prepared_digest = self._prepared_digest, None
 
-                # Check if it's digest time and we haven't sent today
-                if (now.hour == self.digest_hour and
-                    now.minute == self.digest_minute and
-                    self.last_digest_date != now.date()):
-
-                    self.logger.info("Time for daily digest!")
-                    self._send_daily_digest()
-                    self.last_digest_date = now.date()
-
-            except Exception as e:
-                self.logger.error(f"Scheduler error: {e}", exc_info=True)
-
-            # Check every minute
-            if self._stop_event.wait(60):
-                break
+        if digest and digest['generated_at'][:10] == datetime.now().date().isoformat():
+            return digest
+        return None
 
     def _send_daily_digest(self):
-        """Generate and send the daily digest email."""
+        """Send the daily digest email (prepared earlier, or generated now)."""
         try:
-            digest = self._generate_digest()
+            digest = self._take_prepared_digest() or self._generate_digest()
 
             # Always send something, even if quiet day
             # Format as email
@@ -153,12 +152,13 @@ class ProactiveLaneyPlugin(Plugin):
         """Generate the digest content by querying the database."""
         db = self.core.db
         now = datetime.now()
-        yesterday = (now - timedelta(days=1)).isoformat()
+        since = (now - timedelta(days=1)).isoformat()
 
         digest = {
             'generated_at': now.isoformat(),
             'has_content': False,
             'stats': {},
+            'activity': {},
             'recent_books': [],
             'recent_papers': [],
             'recent_links': [],
@@ -169,22 +169,9 @@ class ProactiveLaneyPlugin(Plugin):
         }
 
         try:
-            # Collection stats
-            stats_query = """
-                SELECT
-                    (SELECT COUNT(*) FROM books) as books,
-                    (SELECT COUNT(*) FROM papers) as papers,
-                    (SELECT COUNT(*) FROM links) as links,
-                    (SELECT COUNT(*) FROM mercadolivre_favorites) as favorites
-            """
-            cursor = db.conn.execute(stats_query)
-            row = cursor.fetchone()
-            digest['stats'] = {
-                'books': row[0],
-                'papers': row[1],
-                'links': row[2],
-                'favorites': row[3]
-            }
+            # Collection stats, and the last day's activity from the daily rollups
+            digest['stats'] = db.get_collection_counts()
+            digest['activity'] = db.get_rollup_totals(since=since[:10])
 
             # Recent books (last 24h)
             cursor = db.conn.execute("""
@@ -193,7 +180,7 @@ class ProactiveLaneyPlugin(Plugin):
                 WHERE created_at > ?
                 ORDER BY created_at DESC
                 LIMIT 10
-            """, (yesterday,))
+            """, (since,))
             digest['recent_books'] = [
                 {'title': r[0], 'author': r[1], 'added': r[2]}
                 for r in cursor.fetchall()
@@ -206,7 +193,7 @@ class ProactiveLaneyPlugin(Plugin):
                 WHERE added_at > ?
                 ORDER BY added_at DESC
                 LIMIT 10
-            """, (yesterday,))
+            """, (since,))
             digest['recent_papers'] = [
                 {'title': r[0], 'authors': r[1], 'added': r[2]}
                 for r in cursor.fetchall()
@@ -219,7 +206,7 @@ class ProactiveLaneyPlugin(Plugin):
                 WHERE created_at > ?
                 ORDER BY created_at DESC
                 LIMIT 15
-            """, (yesterday,))
+            """, (since,))
             digest['recent_links'] = [
                 {'url': r[0], 'title': r[1], 'source': r[2], 'added': r[3]}
                 for r in cursor.fetchall()
@@ -245,7 +232,7 @@ class ProactiveLaneyPlugin(Plugin):
                 WHERE status = 'completed' AND completed_at > ?
                 ORDER BY completed_at DESC
                 LIMIT 10
-            """, (yesterday,))
+            """, (since,))
             digest['completed_tasks'] = [
                 {'id': r[0], 'title': r[1], 'type': r[2], 'completed': r[3]}
                 for r in cursor.fetchall()
@@ -389,6 +376,22 @@ class ProactiveLaneyPlugin(Plugin):
             stats = digest['stats']
             context_parts.append(f"Collection: {stats['books']} books, {stats['papers']} papers, {stats['links']} links")
 
+            # Background work since yesterday
+            activity = digest.get('activity', {})
+            work = [
+                f"{activity[metric]} {label}"
+                for metric, label in (
+                    ('books.enriched', 'books enriched'),
+                    ('books.classified', 'books classified'),
+                    ('links.checked', 'link checks'),
+                )
+                if activity.get(metric, 0) > 0
+            ]
+            if work:
+                context_parts.append(f"Background work: {', '.join(work)}")
+            if activity.get('links.dead', 0) > 0:
+                context_parts.append(f"Newly dead links: {activity['links.dead']} ({stats['dead_links']} total)")
+
             context = "\n".join(context_parts) if context_parts else "Quiet day - no new items."
 
             prompt = f"""You are Laney, a pattern-recognition AI assistant. Write a brief, personalized opening for a daily digest email to Arthur (a geoscientist/maker who works on GCU projects).
@@ -688,55 +691,28 @@ This is for a daily email digest - it should be the most interesting part."""
         self.current_adventure_id = None
         self._adventure_lock = threading.Lock()
 
-        # Curiosity thread
+        # Set on disable so running adventures wind down
         self._curiosity_stop = threading.Event()
-        self._curiosity_thread: Optional[threading.Thread] = None
 
         # Curiosity Drift / ADHD-style attention management
         # Topics marked as "resting" by the Necromancer
         self.resting_topics: List[str] = []  # Keywords to avoid for now
         self.resting_until: Dict[str, datetime] = {}  # When topics can return
 
+        # Keyword sets for books/links/papers, kept current by SQLite triggers
+        self.topic_index = TopicIndex(self.core.db)
+
     # =========================================================================
     # CURIOSITY DRIFT SYSTEM - ADHD-style attention management
     # =========================================================================
 
-    def _get_topic_keywords(self, topic: str) -> set:
+    def _get_topic_keywords(self, topic: str) -> frozenset:
         """Extract meaningful keywords from a topic string."""
-        # Common words to ignore
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-                     'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                     'could', 'should', 'may', 'might', 'must', 'shall', 'can', 'need',
-                     'about', 'into', 'through', 'during', 'before', 'after', 'above',
-                     'below', 'between', 'under', 'again', 'further', 'then', 'once',
-                     'here', 'there', 'when', 'where', 'why', 'how', 'all', 'each',
-                     'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
-                     'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'also',
-                     'role', 'using', 'based', 'study', 'research', 'analysis', 'exploring',
-                     'investigating', 'understanding', 'formation', 'development'}
-
-        # Extract words, lowercase, filter
-        words = set()
-        for word in topic.lower().split():
-            # Remove punctuation
-            clean = ''.join(c for c in word if c.isalnum())
-            if len(clean) > 2 and clean not in stopwords:
-                words.add(clean)
-        return words
+        return topic_keywords(topic)
 
     def _calculate_topic_similarity(self, topic1: str, topic2: str) -> float:
         """Calculate Jaccard similarity between two topics (0.0 to 1.0)."""
-        kw1 = self._get_topic_keywords(topic1)
-        kw2 = self._get_topic_keywords(topic2)
-
-        if not kw1 or not kw2:
-            return 0.0
-
-        intersection = len(kw1 & kw2)
-        union = len(kw1 | kw2)
-
-        return intersection / union if union > 0 else 0.0
+        return jaccard(topic_keywords(topic1), topic_keywords(topic2))
 
     def _get_recent_adventure_topics(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get topics from recent adventures."""
@@ -794,62 +770,9 @@ This is for a daily email digest - it should be the most interesting part."""
     def _get_dissimilar_collection_items(self, recent_topics: List[str], limit: int = 5) -> List[Dict]:
         """Get collection items that are dissimilar to recent adventure topics."""
         try:
-            # Get all keywords from recent topics
-            recent_keywords = set()
-            for topic in recent_topics:
-                recent_keywords.update(self._get_topic_keywords(topic))
-
-            # Get random items from collection
-            candidates = []
-
-            # Books
-            cursor = self.core.db.conn.execute("""
-                SELECT 'book' as type, id, title, subjects FROM books
-                WHERE title IS NOT NULL
-                ORDER BY RANDOM() LIMIT 20
-            """)
-            for row in cursor.fetchall():
-                candidates.append({
-                    'type': row[0], 'id': row[1], 'title': row[2],
-                    'keywords': self._get_topic_keywords(f"{row[2]} {row[3] or ''}")
-                })
-
-            # Links
-            cursor = self.core.db.conn.execute("""
-                SELECT 'link' as type, id, title FROM links
-                WHERE title IS NOT NULL AND title != ''
-                ORDER BY RANDOM() LIMIT 20
-            """)
-            for row in cursor.fetchall():
-                candidates.append({
-                    'type': row[0], 'id': row[1], 'title': row[2],
-                    'keywords': self._get_topic_keywords(row[2])
-                })
-
-            # Papers
-            cursor = self.core.db.conn.execute("""
-                SELECT 'paper' as type, id, title FROM papers
-                WHERE title IS NOT NULL
-                ORDER BY RANDOM() LIMIT 20
-            """)
-            for row in cursor.fetchall():
-                candidates.append({
-                    'type': row[0], 'id': row[1], 'title': row[2],
-                    'keywords': self._get_topic_keywords(row[2])
-                })
-
-            # Score by dissimilarity (lower overlap = better)
-            for item in candidates:
-                overlap = len(item['keywords'] & recent_keywords)
-                item['dissimilarity'] = 1.0 / (1 + overlap)  # Higher = more different
-
-            # Sort by dissimilarity and return top items
-            candidates.sort(key=lambda x: x['dissimilarity'], reverse=True)
-
-            return [
-                {'type': c['type'], 'id': c['id'], 'title': c['title']}
-                for c in candidates[:limit]
-            ]
+            # Tokenize anything added or retitled since the last check
+            self.topic_index.refresh()
+            return self.topic_index.dissimilar_items(recent_topics, per_type=20, limit=limit)
 
         except Exception as e:
             self.logger.warning(f"Error getting dissimilar items: {e}")
@@ -992,7 +915,7 @@ Be honest. If you've been obsessing, admit it. The goal is healthy variety, not
             self.logger.error(f"Error cleaning up orphaned adventures: {e}")
 
     def _start_curiosity_engine(self):
-        """Start the curiosity check loop."""
+        """Schedule the periodic curiosity check."""
         if not self._can_run:
             return
 
@@ -1001,49 +924,38 @@ Be honest. If you've been obsessing, admit it. The goal is healthy variety, not
         # Clean up any orphaned adventures from previous crashes
         self._cleanup_orphaned_adventures()
         self._curiosity_stop.clear()
-        self._curiosity_thread = threading.Thread(
-            target=self._curiosity_loop,
-            daemon=True,
-            name="curiosity-engine"
+        # Not persisted: a restart should let the system stabilize before exploring
+        self.schedule(
+            "curiosity_check",
+            self._curiosity_check,
+            IntervalTrigger(self.curiosity_check_interval, initial_delay=60),
+            persist=False,
+            pool="llm",
+            priority=PRIORITY_LOW,
         )
-        self._curiosity_thread.start()
         self.logger.info(f"Curiosity engine started (check every {self.curiosity_check_interval}s, budget {self.daily_adventure_budget}/day)")
 
     def _stop_curiosity_engine(self):
         """Stop the curiosity engine."""
-        if self._curiosity_thread and self._curiosity_thread.is_alive():
+        if hasattr(self, '_curiosity_stop'):
             self._curiosity_stop.set()
-            self._curiosity_thread.join(timeout=5)
         self.logger.info("Curiosity engine stopped")
 
-    def _curiosity_loop(self):
-        """Main curiosity check loop - periodically decides whether to explore."""
-        # Initial delay to let system stabilize
-        if self._curiosity_stop.wait(60):
-            return
-
-        while not self._curiosity_stop.is_set():
-            try:
-                # Reset daily budget if new day
-                today = datetime.now().date()
-                if today != self.last_adventure_reset:
-                    self.adventure_budget_used_today = 0
-                    self.last_adventure_reset = today
-                    self.logger.info("Daily adventure budget reset")
-
-                # Skip if already on an adventure
-                if self.current_adventure_id is not None:
-                    self.logger.debug("Already on an adventure, skipping curiosity check")
-                else:
-                    # Check if we should explore something
-                    self._maybe_start_adventure()
-
-            except Exception as e:
-                self.logger.error(f"Curiosity loop error: {e}", exc_info=True)
+    def _curiosity_check(self):
+        """Scheduled curiosity check - decides whether to explore."""
+        # Reset daily budget if new day
+        today = datetime.now().date()
+        if today != self.last_adventure_reset:
+            self.adventure_budget_used_today = 0
+            self.last_adventure_reset = today
+            self.logger.info("Daily adventure budget reset")
 
-            # Wait for next check
-            if self._curiosity_stop.wait(self.curiosity_check_interval):
-                break
+        # Skip if already on an adventure
+        if self.current_adventure_id is not None:
+            self.logger.debug("Already on an adventure, skipping curiosity check")
+        else:
+            # Check if we should explore something
+            self._maybe_start_adventure()
 
     def _get_adventure_context(self) -> Dict[str, Any]:
         """Gather context for the curiosity decision."""
@@ -10,25 +10,28 @@ This plugin:
 
 import json
 import sqlite3
-import threading
-import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
-from holocene.core import Plugin, Message
+from holocene.core import Plugin, Message, IntervalTrigger, PRIORITY_LOW
+
+
+PLUGIN_MANIFEST = {
+    "name": "task_worker",
+    "class": "TaskWorkerPlugin",
+    "version": "1.0.0",
+    "description": "Executes Laney's background tasks (research, discovery, etc.)",
+    "runs_on": ["rei", "both"],
+    "requires": [],
+    "enabled_by": "llm.api_key",
+}
 
 
 class TaskWorkerPlugin(Plugin):
     """Executes Laney's queued background tasks."""
 
     def get_metadata(self):
-        return {
-            "name": "task_worker",
-            "version": "1.0.0",
-            "description": "Executes Laney's background tasks (research, discovery, etc.)",
-            "runs_on": ["rei", "both"],
-            "requires": []
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Initialize the plugin."""
@@ -46,7 +49,6 @@ class TaskWorkerPlugin(Plugin):
 
         # Worker state
         self.running = False
-        self.worker_thread = None
         self.current_task_id = None
 
         # Settings
@@ -66,47 +68,41 @@ class TaskWorkerPlugin(Plugin):
             return
 
         self.running = True
-        self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-        self.worker_thread.start()
+        self.schedule(
+            "run_next_task",
+            self._run_next_task,
+            IntervalTrigger(self.check_interval),
+            persist=False,
+            pool="llm",  # Tasks are LLM conversations
+            priority=PRIORITY_LOW,
+        )
         self.logger.info("TaskWorker started")
 
     def on_disable(self):
-        """Stop the task worker."""
+        """Stop the task worker (its scheduled job is removed automatically)."""
         self.running = False
-        if self.worker_thread:
-            self.worker_thread.join(timeout=5)
         self.logger.info("TaskWorker stopped")
 
-    def _worker_loop(self):
-        """Main worker loop - checks for and executes tasks."""
-        self.logger.info("TaskWorker loop started")
-
-        while self.running:
-            try:
-                # Reset daily counter if new day
-                today = datetime.now().date()
-                if today != self.last_reset:
-                    self.tasks_today = 0
-                    self.last_reset = today
-
-                # Check if we've hit daily limit
-                if self.tasks_today >= self.max_daily_tasks:
-                    self.logger.debug(f"Daily task limit reached ({self.max_daily_tasks})")
-                    time.sleep(self.check_interval)
-                    continue
-
-                # Get next pending task
-                task = self._get_next_task()
-
-                if task:
-                    self.logger.info(f"Executing task #{task['id']}: {task['title']}")
-                    self._execute_task(task)
-                    self.tasks_today += 1
+    def _run_next_task(self):
+        """Scheduled job - executes the next pending task, if any."""
+        # Reset daily counter if new day
+        today = datetime.now().date()
+        if today != self.last_reset:
+            self.tasks_today = 0
+            self.last_reset = today
+
+        # Check if we've hit daily limit
+        if self.tasks_today >= self.max_daily_tasks:
+            self.logger.debug(f"Daily task limit reached ({self.max_daily_tasks})")
+            return
 
-            except Exception as e:
-                self.logger.error(f"Error in worker loop: {e}", exc_info=True)
+        # Get next pending task
+        task = self._get_next_task()
 
-            time.sleep(self.check_interval)
+        if task:
+            self.logger.info(f"Executing task #{task['id']}: {task['title']}")
+            self._execute_task(task)
+            self.tasks_today += 1
 
     def _get_next_task(self) -> Optional[Dict]:
         """Get the highest priority pending task."""
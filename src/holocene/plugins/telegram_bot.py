@@ -19,9 +19,8 @@ from typing import Optional, List, Dict
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from holocene.core import Plugin, Message
+from holocene.core import Plugin, Message, PRIORITY_HIGH
 from holocene.storage.archiving import ArchivingService
-from holocene.integrations.local_archive import LocalArchiveClient
 from holocene.integrations.archivebox import ArchiveBoxClient
 from holocene.integrations.internet_archive import InternetArchiveClient
 
@@ -420,17 +419,22 @@ class ConversationManager:
             conn.close()
 
 
+PLUGIN_MANIFEST = {
+    "name": "telegram_bot",
+    "class": "TelegramBotPlugin",
+    "version": "1.0.0",
+    "description": "Telegram interface for mobile access and notifications",
+    "runs_on": ["rei", "both"],  # Server-side (provides eunice interface)
+    "requires": [],
+    "enabled_by": "telegram.bot_token",
+}
+
+
 class TelegramBotPlugin(Plugin):
     """Telegram bot interface for mobile access (eunice device)."""
 
     def get_metadata(self):
-        return {
-            "name": "telegram_bot",
-            "version": "1.0.0",
-            "description": "Telegram interface for mobile access and notifications",
-            "runs_on": ["rei", "both"],  # Server-side (provides eunice interface)
-            "requires": []
-        }
+        return PLUGIN_MANIFEST
 
     def on_load(self):
         """Initialize the plugin."""
@@ -586,8 +590,8 @@ class TelegramBotPlugin(Plugin):
 
     def _init_archiving_service(self):
         """Initialize the archiving service with local, IA, and ArchiveBox clients."""
-        # Create local archive client
-        local_client = LocalArchiveClient()
+        # Local captures run on the core's capture workers
+        capture_pool = self.core.capture_pool
 
         # Create IA client if enabled
         ia_client = None
@@ -616,9 +620,9 @@ class TelegramBotPlugin(Plugin):
         # Create unified archiving service
         self.archiving = ArchivingService(
             db=self.core.db,
-            local_client=local_client,
             ia_client=ia_client,
-            archivebox_client=archivebox_client
+            archivebox_client=archivebox_client,
+            capture_pool=capture_pool,
         )
 
         # Log available tools
@@ -790,6 +794,15 @@ class TelegramBotPlugin(Plugin):
 
         return None
 
+    async def _run_interactive(self, func):
+        """Run a blocking call for a waiting user on the core's interactive pool.
+
+        Keeps commands like /ask and /archive ahead of bulk background work
+        (enrichment, classification) instead of queueing behind it.
+        """
+        future = self.run_in_background(func, pool="interactive", priority=PRIORITY_HIGH)
+        return await asyncio.wrap_future(future)
+
     def _is_authorized(self, chat_id: int, chat_type: str = "private") -> bool:
         """Check if user/group is authorized to use bot.
 
@@ -1371,7 +1384,7 @@ This link will grant you access to:
             return result
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, classify)
+            result = await self._run_interactive(classify)
 
             # Log what we got back
             self.logger.info(f"Classification result: {result}")
@@ -1467,7 +1480,7 @@ This link will grant you access to:
             return result
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, force_archive)
+            result = await self._run_interactive(force_archive)
 
             if result.get('success'):
                 # Build success message with all services
@@ -1566,7 +1579,16 @@ This link will grant you access to:
             return result
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, local_archive)
+            # Wait for the capture workers from the event loop rather than
+            # holding an interactive worker for the whole capture
+            capture = self.archiving.submit_local(actual_url, 'monolith')
+            if capture is not None:
+                raw = await asyncio.wrap_future(capture)
+                result = await self._run_interactive(
+                    lambda: self.archiving.record_local(link_id, actual_url, raw, 'monolith')
+                )
+            else:
+                result = await self._run_interactive(local_archive)
 
             if result.get('success'):
                 # Build success message
@@ -1665,7 +1687,7 @@ This link will grant you access to:
             return result
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, box_archive)
+            result = await self._run_interactive(box_archive)
 
             if result.get('success'):
                 # Build success message
@@ -2104,7 +2126,9 @@ This link will grant you access to:
             self.run_in_background(
                 lambda: self._add_paper_from_doi(doi, update.effective_chat.id),
                 callback=lambda result: self.logger.info(f"Paper added: {result}"),
-                error_handler=lambda e: self.logger.error(f"Failed to add paper: {e}")
+                error_handler=lambda e: self.logger.error(f"Failed to add paper: {e}"),
+                pool="interactive",
+                priority=PRIORITY_HIGH,
             )
             return
 
@@ -2115,7 +2139,9 @@ This link will grant you access to:
             self.run_in_background(
                 lambda: self._add_paper_from_arxiv(arxiv_id, update.effective_chat.id),
                 callback=lambda result: self.logger.info(f"arXiv paper added: {result}"),
-                error_handler=lambda e: self.logger.error(f"Failed to add arXiv paper: {e}")
+                error_handler=lambda e: self.logger.error(f"Failed to add arXiv paper: {e}"),
+                pool="interactive",
+                priority=PRIORITY_HIGH,
             )
             return
 
@@ -2130,7 +2156,9 @@ This link will grant you access to:
             self.run_in_background(
                 lambda: self._add_link_from_url(url, update.effective_chat.id, processing_msg),
                 callback=lambda result: self.logger.info(f"Link added: {result}"),
-                error_handler=lambda e: self.logger.error(f"Failed to add link: {e}")
+                error_handler=lambda e: self.logger.error(f"Failed to add link: {e}"),
+                pool="interactive",
+                priority=PRIORITY_HIGH,
             )
             return
 
@@ -2147,7 +2175,9 @@ This link will grant you access to:
             self.run_in_background(
                 lambda: self._add_link_from_url(url, update.effective_chat.id, processing_msg, title_hint=title),
                 callback=lambda result: self.logger.info(f"Shared link added: {result}"),
-                error_handler=lambda e: self.logger.error(f"Failed to add shared link: {e}")
+                error_handler=lambda e: self.logger.error(f"Failed to add shared link: {e}"),
+                pool="interactive",
+                priority=PRIORITY_HIGH,
             )
             return
 
@@ -2604,7 +2634,7 @@ CRITICAL: You must CALL the generate_image tool, not just describe what you woul
         progress_task = asyncio.create_task(update_progress())
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, run_laney)
+            result = await self._run_interactive(run_laney)
             progress_state["done"] = True  # Signal updater to stop
             progress_task.cancel()  # Cancel the updater
 
@@ -3577,3 +3607,7 @@ This link is now invalid (single-use only).
                         self.logger.info("Bot thread stopped successfully")
             except Exception as e:
                 self.logger.error(f"Error stopping bot: {e}")
+
+        archiving = getattr(self, 'archiving', None)
+        if archiving and archiving.archivebox:
+            archiving.archivebox.close()  # Shared SSH connection
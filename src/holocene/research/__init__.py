@@ -1,21 +1,31 @@
-"""Research mode for overnight context compilation."""
+"""Research mode for overnight context compilation.
 
-from .pdf_handler import PDFHandler
-from .orchestrator import ResearchOrchestrator
-from .report_generator import ReportGenerator
-from .book_importer import LibraryCatImporter
-from .book_enrichment import BookEnricher
-from .wikipedia_client import WikipediaClient
-from .crossref_client import CrossrefClient
-from .openalex_client import OpenAlexClient
-from .internet_archive_client import InternetArchiveClient
-from .unpaywall_client import UnpaywallClient
-from .arxiv_client import ArxivClient
-from .bibtex_importer import BibTeXImporter
-from .pdf_metadata_extractor import PDFMetadataExtractor
-from .udc_classifier import UDCClassifier
-from .dewey_classifier import DeweyClassifier
-from .extended_dewey import ExtendedDeweyClassifier
+Clients are imported on first use; importing one doesn't load the others.
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .pdf_handler import PDFHandler
+    from .orchestrator import ResearchOrchestrator
+    from .report_generator import ReportGenerator
+    from .book_importer import LibraryCatImporter
+    from .book_enrichment import BookEnricher
+    from .wikipedia_client import WikipediaClient
+    from .crossref_client import CrossrefClient
+    from .openalex_client import OpenAlexClient
+    from .internet_archive_client import InternetArchiveClient
+    from .unpaywall_client import UnpaywallClient
+    from .arxiv_client import ArxivClient
+    from .bibtex_importer import BibTeXImporter
+    from .pdf_metadata_extractor import PDFMetadataExtractor
+    from .udc_classifier import UDCClassifier
+    from .dewey_classifier import DeweyClassifier
+    from .extended_dewey import ExtendedDeweyClassifier
+    from .batch_classifier import BatchClassifier
+    from .paper_analysis import PaperAnalyzer
 
 __all__ = [
     "PDFHandler",
@@ -34,4 +44,27 @@ __all__ = [
     "UDCClassifier",
     "DeweyClassifier",
     "ExtendedDeweyClassifier",
+    "BatchClassifier",
+    "PaperAnalyzer",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "PDFHandler": ".pdf_handler",
+    "ResearchOrchestrator": ".orchestrator",
+    "ReportGenerator": ".report_generator",
+    "LibraryCatImporter": ".book_importer",
+    "BookEnricher": ".book_enrichment",
+    "WikipediaClient": ".wikipedia_client",
+    "CrossrefClient": ".crossref_client",
+    "OpenAlexClient": ".openalex_client",
+    "InternetArchiveClient": ".internet_archive_client",
+    "UnpaywallClient": ".unpaywall_client",
+    "ArxivClient": ".arxiv_client",
+    "BibTeXImporter": ".bibtex_importer",
+    "PDFMetadataExtractor": ".pdf_metadata_extractor",
+    "UDCClassifier": ".udc_classifier",
+    "DeweyClassifier": ".dewey_classifier",
+    "ExtendedDeweyClassifier": ".extended_dewey",
+    "BatchClassifier": ".batch_classifier",
+    "PaperAnalyzer": ".paper_analysis",
+})
@@ -91,6 +91,68 @@ class ArxivClient:
 
         return None
 
+    def _parse_entry(self, entry, ns: Dict[str, str], arxiv_id: str) -> Dict:
+        """Extract paper metadata from an Atom feed entry."""
+        title = entry.find('atom:title', ns)
+        title = title.text.strip().replace('\n', ' ') if title is not None else None
+
+        summary = entry.find('atom:summary', ns)
+        summary = summary.text.strip().replace('\n', ' ') if summary is not None else None
+
+        # Authors
+        authors = []
+        for author in entry.findall('atom:author', ns):
+            name = author.find('atom:name', ns)
+            if name is not None:
+                authors.append(name.text.strip())
+
+        # Published date
+        published = entry.find('atom:published', ns)
+        published_date = None
+        if published is not None:
+            try:
+                dt = datetime.fromisoformat(published.text.replace('Z', '+00:00'))
+                published_date = dt.strftime('%Y-%m-%d')
+            except:
+                pass
+
+        # Categories (subjects)
+        categories = []
+        for category in entry.findall('atom:category', ns):
+            term = category.get('term')
+            if term:
+                categories.append(term)
+
+        # PDF URL
+        pdf_url = None
+        for link in entry.findall('atom:link', ns):
+            if link.get('title') == 'pdf':
+                pdf_url = link.get('href')
+                break
+
+        # Abstract URL
+        abstract_url = None
+        for link in entry.findall('atom:link', ns):
+            if link.get('rel') == 'alternate':
+                abstract_url = link.get('href')
+                break
+
+        # DOI (if available)
+        doi = entry.find('arxiv:doi', ns)
+        doi = doi.text.strip() if doi is not None else None
+
+        return {
+            'arxiv_id': arxiv_id,
+            'title': title,
+            'authors': authors,
+            'abstract': summary,
+            'published_date': published_date,
+            'categories': categories,
+            'pdf_url': pdf_url,
+            'url': abstract_url,
+            'doi': doi
+        }
+
     def get_paper(self, arxiv_id: str) -> Optional[Dict]:
         """Get paper metadata by arXiv ID.
 
@@ -123,66 +185,7 @@ class ArxivClient:
             if entry is None:
                 return None
 
-            # Extract metadata
-            title = entry.find('atom:title', ns)
-            title = title.text.strip().replace('\n', ' ') if title is not None else None
-
-            summary = entry.find('atom:summary', ns)
-            summary = summary.text.strip().replace('\n', ' ') if summary is not None else None
-
-            # Authors
-            authors = []
-            for author in entry.findall('atom:author', ns):
-                name = author.find('atom:name', ns)
-                if name is not None:
-                    authors.append(name.text.strip())
-
-            # Published date
-            published = entry.find('atom:published', ns)
-            published_date = None
-            if published is not None:
-                try:
-                    dt = datetime.fromisoformat(published.text.replace('Z', '+00:00'))
-                    published_date = dt.strftime('%Y-%m-%d')
-                except:
-                    pass
-
-            # Categories (subjects)
-            categories = []
-            for category in entry.findall('atom:category', ns):
-                term = category.get('term')
-                if term:
-                    categories.append(term)
-
-            # PDF URL
-            pdf_url = None
-            for link in entry.findall('atom:link', ns):
-                if link.get('title') == 'pdf':
-                    pdf_url = link.get('href')
-                    break
-
-            # Abstract URL
-            abstract_url = None
-            for link in entry.findall('atom:link', ns):
-                if link.get('rel') == 'alternate':
-                    abstract_url = link.get('href')
-                    break
-
-            # DOI (if available)
-            doi = entry.find('arxiv:doi', ns)
-            doi = doi.text.strip() if doi is not None else None
-
-            return {
-                'arxiv_id': arxiv_id,
-                'title': title,
-                'authors': authors,
-                'abstract': summary,
-                'published_date': published_date,
-                'categories': categories,
-                'pdf_url': pdf_url,
-                'url': abstract_url,
-                'doi': doi
-            }
+            return self._parse_entry(entry, ns, arxiv_id)
 
         except Exception as e:
             print(f"Error fetching arXiv paper {arxiv_id}: {e}")
@@ -222,9 +225,8 @@ class ArxivClient:
                 if entry_id is not None:
                     arxiv_id = self.extract_arxiv_id(entry_id.text)
                     if arxiv_id:
-                        paper_data = self.get_paper(arxiv_id)
-                        if paper_data:
-                            papers.append(paper_data)
+                        # The search feed carries full metadata - no per-paper request
+                        papers.append(self._parse_entry(entry, ns, arxiv_id))
 
             return papers
 
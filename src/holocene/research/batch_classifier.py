@@ -0,0 +1,336 @@
+"""Batch Dewey/UDC classification: many books per LLM prompt.
+
+classify_book() sends one prompt per book, each carrying the full librarian
+system prompt. BatchClassifier sends that system prompt once per batch of
+books and asks for one structured entry per book:
+
+- Every returned number is checked against the schedule (well-formed
+  notation, an existing main class, no vacant DDC sections). Missing or
+  rejected entries are retried on their own, with the rejection reason,
+  in later batches; accepted ones are never sent again.
+- Cutter and call numbers are computed locally, not asked of the LLM.
+
+    batch = BatchClassifier(llm_client, config, system="Dewey")
+    for results in batch.iter_batches(books):
+        for book_id, result in results.items():
+            ...
+
+A 2,000-book import takes about 2000 / batch_size prompts, plus a few for
+retries.
+"""
+
+import json
+import re
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from holocene.research.dewey_classifier import DEWEY_SYSTEM_PROMPT, generate_cutter_number
+from holocene.research.udc_classifier import UDC_SYSTEM_PROMPT
+
+DDC_MAIN_CLASSES = {
+    "0": "Computer science, information & general works",
+    "1": "Philosophy & psychology",
+    "2": "Religion",
+    "3": "Social sciences",
+    "4": "Language",
+    "5": "Science",
+    "6": "Technology",
+    "7": "Arts & recreation",
+    "8": "Literature",
+    "9": "History & geography",
+}
+
+# Sections with no subject assigned in DDC 23
+DDC_VACANT_SECTIONS = {"007", "008", "009", "024", "029"} | {f"04{i}" for i in range(10)}
+
+UDC_MAIN_CLASSES = {
+    "0": "Science and knowledge, organization, information",
+    "1": "Philosophy, psychology",
+    "2": "Religion, theology",
+    "3": "Social sciences",
+    "5": "Mathematics, natural sciences",
+    "6": "Applied sciences, medicine, technology",
+    "7": "The arts, recreation, sport",
+    "8": "Language, linguistics, literature",
+    "9": "Geography, biography, history",
+}
+
+_DDC_PATTERN = re.compile(r"^(\d{3})(\.\d+)?$")
+
+# Main number, then any common auxiliaries: (place), =language, "time", -0 form, .0 point-of-view
+_UDC_NUMBER = r"\d+(?:\.\d+)*(?:\([\d./=\-]+\)|=[\d.]+|\"[^\"]+\"|-0?[\d.]+|\.0[\d.]+)*"
+_UDC_PATTERN = re.compile(rf"^{_UDC_NUMBER}(?:\s*[:+/]\s*{_UDC_NUMBER})*$")
+
+SYSTEMS = {
+    "Dewey": {"prompt": DEWEY_SYSTEM_PROMPT, "number_key": "dewey_number", "label_key": "dewey_label"},
+    "UDC": {"prompt": UDC_SYSTEM_PROMPT, "number_key": "udc_number", "label_key": "udc_label"},
+}
+
+CONFIDENCE_LEVELS = ("high", "medium", "low")
+
+# Summary characters sent per book (the title and subjects carry most of the signal)
+MAX_SUMMARY_CHARS = 400
+
+
+def validate_dewey_number(number: str) -> str:
+    """
+    Check a Dewey number against the DDC schedule.
+
+    Args:
+        number: DDC number as returned by the LLM (e.g. "550.182", "DDC 641.3373")
+
+    Returns:
+        Normalized number
+
+    Raises:
+        ValueError: If the number is malformed or in a vacant section
+    """
+    normalized = re.sub(r"^(DDC|Dewey)\s*", "", str(number or "").strip(), flags=re.IGNORECASE).rstrip(".")
+    match = _DDC_PATTERN.match(normalized)
+    if not match:
+        raise ValueError(f"'{number}' is not a DDC number (three digits, optional decimals)")
+    if match.group(1) in DDC_VACANT_SECTIONS:
+        raise ValueError(f"DDC section {match.group(1)} is unassigned")
+    return normalized
+
+
+def validate_udc_number(number: str) -> str:
+    """
+    Check a UDC number against the UDC main tables.
+
+    Args:
+        number: UDC number, optionally with auxiliaries (e.g. "550.8", "821.134.3(81)")
+
+    Returns:
+        Normalized number
+
+    Raises:
+        ValueError: If the number is malformed or in the vacant class 4
+    """
+    normalized = re.sub(r"^UDC\s*", "", str(number or "").strip(), flags=re.IGNORECASE)
+    if not _UDC_PATTERN.match(normalized):
+        raise ValueError(f"'{number}' is not valid UDC notation")
+    if normalized[0] == "4":
+        raise ValueError("UDC class 4 is vacant")
+    return normalized
+
+
+class BatchClassifier:
+    """Classify books several per prompt, validating and retrying per book."""
+
+    def __init__(
+        self,
+        llm_client,
+        config,
+        system: str = "Dewey",
+        batch_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ):
+        """
+        Initialize batch classifier.
+
+        Args:
+            llm_client: NanoGPTClient (anything with simple_prompt())
+            config: Holocene config (llm.primary and classification settings)
+            system: "Dewey" or "UDC"
+            batch_size: Books per prompt (default: config.classification.batch_size)
+            max_retries: Extra attempts per rejected book (default: config.classification.batch_retries)
+        """
+        if system not in SYSTEMS:
+            raise ValueError(f"Unknown classification system: {system}")
+
+        self.llm_client = llm_client
+        self.config = config
+        self.system = system
+        self.batch_size = max(1, batch_size or config.classification.batch_size)
+        self.max_retries = config.classification.batch_retries if max_retries is None else max_retries
+        self.prompts_sent = 0
+
+    def classify_books(self, books: List[Dict]) -> Dict[int, Dict]:
+        """
+        Classify books.
+
+        Args:
+            books: Book dicts (need id and title)
+
+        Returns:
+            Dict mapping book ID to a classify_book()-style result
+            (with "error" if the book could not be classified)
+        """
+        results = {}
+        for batch_results in self.iter_batches(books):
+            results.update(batch_results)
+        return results
+
+    def iter_batches(self, books: List[Dict]) -> Iterator[Dict[int, Dict]]:
+        """
+        Classify books, yielding the results of each prompt as it completes.
+
+        Rejected books wait until a full batch of them has accumulated (or
+        the fresh books run out), so retries share prompts too.
+        """
+        fresh = deque((book, 0, None) for book in books)
+        retry: List[Tuple[Dict, int, Optional[str]]] = []
+
+        while fresh or retry:
+            if len(retry) >= self.batch_size or not fresh:
+                chunk, retry = retry[:self.batch_size], retry[self.batch_size:]
+            else:
+                chunk = [fresh.popleft() for _ in range(min(self.batch_size, len(fresh)))]
+
+            answers, request_error = self._request(chunk)
+
+            results = {}
+            for book, attempts, _ in chunk:
+                try:
+                    if request_error:
+                        raise ValueError(request_error)
+                    results[book["id"]] = self._build_result(book, answers.get(str(book["id"])))
+                except ValueError as e:
+                    if attempts < self.max_retries:
+                        retry.append((book, attempts + 1, str(e)))
+                    else:
+                        results[book["id"]] = {
+                            "error": f"Classification failed: {e}",
+                            "confidence": "low",
+                            "classification_system": self.system,
+                        }
+
+            if results:
+                yield results
+
+    # Internals
+
+    def _request(self, chunk: List[Tuple[Dict, int, Optional[str]]]) -> Tuple[Dict[str, Dict], Optional[str]]:
+        """Send one prompt; returns (answers by book ID, error for the whole request)."""
+        entries = []
+        for book, _, rejection in chunk:
+            entry = {
+                "id": book["id"],
+                "title": book.get("title"),
+                "author": book.get("author"),
+                "subtitle": book.get("subtitle"),
+                "subjects": book.get("subjects"),
+                "publisher": book.get("publisher"),
+                "year": book.get("publication_year"),
+                "summary": (_book_summary(book) or "")[:MAX_SUMMARY_CHARS] or None,
+            }
+            if rejection:
+                entry["previous_answer_rejected"] = rejection
+            entries.append({key: value for key, value in entry.items() if value})
+
+        notation = "DDC number with appropriate decimal precision" if self.system == "Dewey" else "UDC number"
+        prompt = f"""Classify each of these {len(entries)} books using {self.system} classification.
+
+Books:
+{json.dumps(entries, ensure_ascii=False, indent=1)}
+
+Return ONLY a valid JSON array (no markdown, no explanation) with one object per book, in any order:
+[
+  {{
+    "id": <book id from the list>,
+    "number": "{notation}",
+    "label": "human-readable subject label",
+    "confidence": "high" | "medium" | "low",
+    "reasoning": "one short sentence"
+  }}
+]
+
+Guidelines:
+- Include every book exactly once, using its id
+- Be as specific as possible while remaining accurate
+- For interdisciplinary works, choose the primary focus
+- If previous_answer_rejected is set, that book's last answer was invalid: give a corrected number"""
+
+        self.prompts_sent += 1
+        try:
+            response = self.llm_client.simple_prompt(
+                prompt=prompt,
+                system=SYSTEMS[self.system]["prompt"],
+                model=self.config.llm.primary,
+                temperature=0.1,
+                timeout=60 + 5 * len(entries),
+            )
+        except Exception as e:
+            return {}, f"LLM request failed: {e}"
+
+        try:
+            items = _parse_json_array(response)
+        except ValueError as e:
+            return {}, str(e)
+
+        return {str(item.get("id")): item for item in items if isinstance(item, dict)}, None
+
+    def _build_result(self, book: Dict, answer: Optional[Dict]) -> Dict:
+        """Validate one book's answer and turn it into a classify_book()-style result."""
+        if not answer:
+            raise ValueError("No answer returned for this book")
+
+        if self.system == "Dewey":
+            number = validate_dewey_number(answer.get("number"))
+            default_label = DDC_MAIN_CLASSES[number[0]]
+        else:
+            number = validate_udc_number(answer.get("number"))
+            default_label = UDC_MAIN_CLASSES[number[0]]
+
+        confidence = str(answer.get("confidence", "medium")).lower()
+        keys = SYSTEMS[self.system]
+        result = {
+            keys["number_key"]: number,
+            keys["label_key"]: answer.get("label") or default_label,
+            "confidence": confidence if confidence in CONFIDENCE_LEVELS else "medium",
+            "reasoning": answer.get("reasoning", ""),
+        }
+
+        classification = self.config.classification
+        author = book.get("author")
+        if classification.generate_cutter_numbers and author:
+            cutter = generate_cutter_number(author, classification.cutter_length)
+            result["cutter_number"] = cutter
+            if classification.generate_full_call_numbers:
+                title = book.get("title") or ""
+                work_letter = title[0].lower() if title else "a"
+                result["call_number"] = f"{number} {cutter}{work_letter}"
+
+        result["classified_at"] = datetime.now().isoformat()
+        result["classification_system"] = self.system
+        return result
+
+
+def _book_summary(book: Dict) -> Optional[str]:
+    """Enriched summary from the old column or the metadata JSON."""
+    if book.get("enriched_summary"):
+        return book["enriched_summary"]
+    metadata = book.get("metadata")
+    if not metadata or metadata == "{}":
+        return None
+    try:
+        metadata_dict = json.loads(metadata) if isinstance(metadata, str) else metadata
+        return metadata_dict.get("enrichment", {}).get("summary")
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        return None
+
+
+def _parse_json_array(response: str) -> List:
+    """Parse the LLM's JSON array, tolerating markdown fences and surrounding text."""
+    text = (response or "").strip()
+    if text.startswith("```"):
+        text = re.sub(r"```(?:json)?\n?", "", text)
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end <= start:
+            raise ValueError("Failed to parse LLM response: no JSON array")
+        try:
+            data = json.loads(text[start:end + 1])
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse LLM response: {e}")
+
+    if isinstance(data, dict):
+        data = data.get("results", data.get("books", []))
+    if not isinstance(data, list):
+        raise ValueError("Failed to parse LLM response: expected a JSON array")
+    return data
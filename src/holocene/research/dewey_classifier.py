@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import re
 
 from holocene.llm import NanoGPTClient
@@ -10,6 +10,62 @@ from holocene.config import load_config
 from holocene.storage.database import Database
 
 
+# Shared by classify_book() and the batch classifier
+DEWEY_SYSTEM_PROMPT = """You are a professional librarian expert in the Dewey Decimal Classification (DDC) system.
+
+DDC is the world's most widely used library classification system, particularly strong in sciences and technical subjects.
+
+Key Dewey main classes:
+000 - Computer science, information & general works
+100 - Philosophy & psychology
+200 - Religion
+300 - Social sciences
+400 - Language
+500 - Science
+  510 - Mathematics
+  520 - Astronomy
+  530 - Physics
+  540 - Chemistry
+  550 - Earth sciences & geology
+    550.1 - Philosophy and theory
+    550.182 - Mathematical geology, geostatistics
+    551 - Geology, hydrology, meteorology
+    552 - Petrology
+    553 - Economic geology
+    554-559 - Regional geology
+  560 - Paleontology
+  570 - Life sciences, biology
+  580 - Plants (botany)
+  590 - Animals (zoology)
+600 - Technology
+  610 - Medicine & health
+  620 - Engineering
+  621 - Applied physics (mechanical, electrical)
+    621.9 - Tools, machining
+  630 - Agriculture
+  640 - Home & family management
+    641.3 - Food
+      641.3373 - Coffee
+  650 - Management & public relations
+  660 - Chemical engineering
+  670 - Manufacturing
+  680 - Manufacture for specific uses
+  690 - Building & construction
+700 - Arts & recreation
+  741 - Drawing & drawings
+    741.5 - Comics, graphic novels, manga
+  780 - Music
+  790 - Sports, games & entertainment
+800 - Literature
+900 - History & geography
+
+DDC uses pure decimal notation for unlimited subdivision:
+- Three digits before decimal (e.g., 550)
+- Decimal point + additional precision (e.g., 550.182)
+- Can go to any depth needed (e.g., 641.3373 for coffee)
+
+Your task is to assign accurate DDC numbers to books based on their metadata."""
+
 def generate_cutter_number(author_name: str, length: int = 3) -> str:
     """
     Generate a Cutter number for an author's last name.
@@ -131,60 +187,7 @@ class DeweyClassifier:
 
         metadata = "\n".join(metadata_parts)
 
-        system_prompt = """You are a professional librarian expert in the Dewey Decimal Classification (DDC) system.
-
-DDC is the world's most widely used library classification system, particularly strong in sciences and technical subjects.
-
-Key Dewey main classes:
-000 - Computer science, information & general works
-100 - Philosophy & psychology
-200 - Religion
-300 - Social sciences
-400 - Language
-500 - Science
-  510 - Mathematics
-  520 - Astronomy
-  530 - Physics
-  540 - Chemistry
-  550 - Earth sciences & geology
-    550.1 - Philosophy and theory
-    550.182 - Mathematical geology, geostatistics
-    551 - Geology, hydrology, meteorology
-    552 - Petrology
-    553 - Economic geology
-    554-559 - Regional geology
-  560 - Paleontology
-  570 - Life sciences, biology
-  580 - Plants (botany)
-  590 - Animals (zoology)
-600 - Technology
-  610 - Medicine & health
-  620 - Engineering
-  621 - Applied physics (mechanical, electrical)
-    621.9 - Tools, machining
-  630 - Agriculture
-  640 - Home & family management
-    641.3 - Food
-      641.3373 - Coffee
-  650 - Management & public relations
-  660 - Chemical engineering
-  670 - Manufacturing
-  680 - Manufacture for specific uses
-  690 - Building & construction
-700 - Arts & recreation
-  741 - Drawing & drawings
-    741.5 - Comics, graphic novels, manga
-  780 - Music
-  790 - Sports, games & entertainment
-800 - Literature
-900 - History & geography
-
-DDC uses pure decimal notation for unlimited subdivision:
-- Three digits before decimal (e.g., 550)
-- Decimal point + additional precision (e.g., 550.182)
-- Can go to any depth needed (e.g., 641.3373 for coffee)
-
-Your task is to assign accurate DDC numbers to books based on their metadata."""
+        system_prompt = DEWEY_SYSTEM_PROMPT
 
         user_prompt = f"""Classify this book using Dewey Decimal Classification.
 
@@ -262,6 +265,25 @@ Guidelines:
                 "classification_system": "Dewey"
             }
 
+    def classify_books(self, books: List[Dict], batch_size: Optional[int] = None) -> Dict[int, Dict]:
+        """
+        Classify many books, several per prompt (see BatchClassifier).
+
+        Args:
+            books: Book dicts from the database (need id and title)
+            batch_size: Books per prompt (default: config.classification.batch_size)
+
+        Returns:
+            Dict mapping book ID to a classify_book()-style result
+        """
+        return self.batch_classifier(batch_size).classify_books(books)
+
+    def batch_classifier(self, batch_size: Optional[int] = None):
+        """BatchClassifier sharing this classifier's LLM client and config."""
+        from holocene.research.batch_classifier import BatchClassifier
+
+        return BatchClassifier(self.llm_client, self.config, system="Dewey", batch_size=batch_size)
+
     def classify_paper(
         self,
         title: str,
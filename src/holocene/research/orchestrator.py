@@ -1,8 +1,11 @@
 """Research orchestration - the main engine for overnight research compilation."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from datetime import datetime
+import logging
+import math
 import time
 
 from ..storage.database import Database, calculate_trust_tier
@@ -11,6 +14,25 @@ from ..config import load_config
 from .report_generator import ResearchReport, ReportGenerator
 from .pdf_handler import PDFHandler
 from .wikipedia_client import WikipediaClient
+from .crossref_client import CrossrefClient
+from .openalex_client import OpenAlexClient
+from .arxiv_client import ArxivClient
+
+logger = logging.getLogger(__name__)
+
+# LLM calls allowed per research depth
+CALL_BUDGETS = {
+    "quick": 10,
+    "deep": 50,
+    "thorough": 100,
+}
+
+# Results requested from each external search API
+EXTERNAL_RESULTS = 5
+
+# Sources per summarization call, and concurrent summarization calls
+SUMMARY_BATCH_SIZE = 5
+MAX_LLM_WORKERS = 4
 
 
 class ResearchOrchestrator:
@@ -40,6 +62,9 @@ class ResearchOrchestrator:
         self.wikipedia = WikipediaClient(
             cache_dir=self.config.data_dir / "wikipedia_cache"
         )
+        self.crossref = CrossrefClient()
+        self.openalex = OpenAlexClient()
+        self.arxiv = ArxivClient()
 
     def research(
         self,
@@ -48,11 +73,17 @@ class ResearchOrchestrator:
         include_books: bool = True,
         include_papers: bool = True,
         include_vision: bool = True,
-        include_wikipedia: bool = False
+        include_wikipedia: bool = False,
+        include_academic: Optional[bool] = None
     ) -> Path:
         """
         Conduct research on a topic.
 
+        Remote sources are fetched in background threads while the local
+        collection is searched. Depending on the call budget, each source
+        group is then summarized by its own (parallel) LLM call and the
+        summaries are merged into the final analysis.
+
         Args:
             topic: Research topic/question
             depth: Research depth - "quick" (10 calls), "deep" (50 calls), "thorough" (100 calls)
@@ -60,18 +91,20 @@ class ResearchOrchestrator:
             include_papers: Check papers collection for relevant academic papers
             include_vision: Analyze figures with vision models
             include_wikipedia: Fetch Wikipedia background information
+            include_academic: Search Crossref, OpenAlex and arXiv
+                (default: on for "deep" and "thorough")
 
         Returns:
             Path to generated markdown report
         """
         start_time = time.time()
 
-        # Determine call budget
-        call_budget = {
-            "quick": 10,
-            "deep": 50,
-            "thorough": 100,
-        }.get(depth, 10)
+        if include_academic is None:
+            include_academic = depth != "quick"
+
+        # Determine call budget (never more than what's left for today)
+        call_budget = CALL_BUDGETS.get(depth, CALL_BUDGETS["quick"])
+        call_budget = min(call_budget, self.budget_tracker.remaining_budget())
 
         print(f"🔍 Starting research on: {topic}")
         print(f"   Depth: {depth} (up to {call_budget} API calls)")
@@ -79,51 +112,31 @@ class ResearchOrchestrator:
 
         # Create report
         report = ResearchReport(topic)
-        calls_used = 0
-
-        # Step 1: Search links database
-        print("📚 Searching your link collection...")
-        relevant_links = self._search_links(topic, limit=20)
-        print(f"   Found {len(relevant_links)} relevant links")
-
-        # Step 2: Search book collection (if enabled)
-        relevant_books = []
-        if include_books:
-            print("📖 Checking your book collection...")
-            relevant_books = self._search_books(topic, limit=5)
-            if relevant_books:
-                print(f"   Found {len(relevant_books)} relevant books")
-                for book in relevant_books:
-                    report.add_book(
-                        title=book["title"],
-                        author=book.get("author", "Unknown"),
-                        notes=book.get("notes")
-                    )
-
-        # Step 2.5: Search papers collection (if enabled)
-        relevant_papers = []
-        if include_papers:
-            print("📄 Checking your papers collection...")
-            relevant_papers = self._search_papers(topic, limit=5)
-            if relevant_papers:
-                print(f"   Found {len(relevant_papers)} relevant papers")
-
-        # Step 3: Fetch Wikipedia background (if enabled)
-        wikipedia_data = None
-        if include_wikipedia:
-            print("📚 Fetching Wikipedia background...")
-            wikipedia_data = self._fetch_wikipedia_background(topic)
-            if wikipedia_data:
-                print(f"   Found Wikipedia article: {wikipedia_data['title']}")
 
-        # Step 4: Compile sources for analysis
-        print(f"\n🤖 Analyzing sources with DeepSeek...")
-        sources_text = self._compile_sources(relevant_links, relevant_books, relevant_papers, wikipedia_data)
+        # Step 1: Gather sources (remote fetches overlap the local searches)
+        sources = self._gather_sources(
+            topic,
+            include_books=include_books,
+            include_papers=include_papers,
+            include_wikipedia=include_wikipedia,
+            include_academic=include_academic,
+        )
+        relevant_links = sources["links"]
+        relevant_books = sources["books"]
+        relevant_papers = sources["papers"]
+        external_papers = sources["academic"]
+
+        for book in relevant_books:
+            report.add_book(
+                title=book["title"],
+                author=book.get("author", "Unknown"),
+                notes=book.get("notes")
+            )
 
-        # Step 5: LLM analysis
-        analysis = self._analyze_topic(topic, sources_text, relevant_links, relevant_books, relevant_papers)
+        # Step 2: LLM analysis
+        print(f"\n🤖 Analyzing sources with DeepSeek...")
+        analysis, calls_used = self._analyze_sources(topic, sources, call_budget)
         report.set_analysis(analysis)
-        calls_used += 1
 
         # Add sources to report
         for link in relevant_links[:10]:  # Limit to top 10 in report
@@ -142,6 +155,7 @@ class ResearchOrchestrator:
         report.set_metadata("source_count", len(relevant_links))
         report.set_metadata("book_count", len(relevant_books))
         report.set_metadata("paper_count", len(relevant_papers))
+        report.set_metadata("external_paper_count", len(external_papers))
         report.set_metadata("api_calls_used", calls_used)
         report.set_metadata("processing_time", f"{elapsed_min}m {elapsed_sec}s")
 
@@ -150,7 +164,8 @@ class ResearchOrchestrator:
         report_path = self.report_gen.save(report, output_dir)
 
         # Update budget tracker
-        self.budget_tracker.increment_usage(calls_used)
+        if calls_used:
+            self.budget_tracker.increment_usage(calls_used)
 
         print(f"\n✅ Research complete!")
         print(f"   Report saved: {report_path}")
@@ -159,43 +174,123 @@ class ResearchOrchestrator:
 
         return report_path
 
-    def _search_links(self, topic: str, limit: int = 20) -> List[Dict]:
+    def _gather_sources(
+        self,
+        topic: str,
+        include_books: bool = True,
+        include_papers: bool = True,
+        include_wikipedia: bool = False,
+        include_academic: bool = False
+    ) -> Dict[str, Any]:
         """
-        Search links database for relevant sources.
+        Collect all sources for a topic.
+
+        Remote lookups run in a thread pool; the local searches run on the
+        calling thread meanwhile (the database connection is per-thread).
+        A failing source is reported and treated as empty.
 
         Args:
             topic: Research topic
-            limit: Maximum results
+            include_books: Search the book collection
+            include_papers: Search the papers collection
+            include_wikipedia: Fetch Wikipedia background
+            include_academic: Search Crossref, OpenAlex and arXiv
 
         Returns:
-            List of relevant links
+            Dict with links, books, papers, wikipedia (dict or None) and
+            academic (deduplicated external papers)
         """
-        # Extract keywords from topic
-        keywords = self._extract_keywords(topic)
+        remote_tasks = {}
+        if include_wikipedia:
+            remote_tasks["wikipedia"] = self._fetch_wikipedia_background
+        if include_academic:
+            remote_tasks["crossref"] = self._search_crossref
+            remote_tasks["openalex"] = self._search_openalex
+            remote_tasks["arxiv"] = self._search_arxiv
+
+        results: Dict[str, Any] = {}
+        pool = ThreadPoolExecutor(max_workers=len(remote_tasks)) if remote_tasks else None
+        futures = {}
+        if pool:
+            print(f"🌐 Fetching {', '.join(remote_tasks)} in the background...")
+            futures = {pool.submit(fn, topic): name for name, fn in remote_tasks.items()}
 
-        # Search links database
-        # For now, simple keyword matching on URL and title
-        all_links = self.db.get_links(limit=1000)  # Get recent links
+        try:
+            print("📚 Searching your link collection...")
+            results["links"] = self._run_source("links", self._search_links, topic, limit=20)
+            print(f"   Found {len(results['links'])} relevant links")
+
+            results["books"] = []
+            if include_books:
+                print("📖 Checking your book collection...")
+                results["books"] = self._run_source("books", self._search_books, topic, limit=5)
+                if results["books"]:
+                    print(f"   Found {len(results['books'])} relevant books")
+
+            results["papers"] = []
+            if include_papers:
+                print("📄 Checking your papers collection...")
+                results["papers"] = self._run_source("papers", self._search_papers, topic, limit=5)
+                if results["papers"]:
+                    print(f"   Found {len(results['papers'])} relevant papers")
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.warning(f"[Research] {name} lookup failed: {e}")
+                    print(f"   ⚠️  {name} lookup failed: {e}")
+                    results[name] = None
+        finally:
+            if pool:
+                pool.shutdown(wait=True)
+
+        wikipedia_data = results.get("wikipedia")
+        if wikipedia_data:
+            print(f"   Found Wikipedia article: {wikipedia_data['title']}")
 
-        scored_links = []
-        for link in all_links:
-            score = 0
-            url_lower = link["url"].lower()
-            title_lower = (link.get("title") or "").lower()
+        academic = self._merge_external_papers(
+            results.get("crossref") or [],
+            results.get("openalex") or [],
+            results.get("arxiv") or [],
+        )
+        if include_academic:
+            print(f"   Found {len(academic)} papers in Crossref/OpenAlex/arXiv")
+
+        return {
+            "links": results["links"],
+            "books": results["books"],
+            "papers": results["papers"],
+            "wikipedia": wikipedia_data,
+            "academic": academic,
+        }
+
+    def _run_source(self, name: str, fn, *args, **kwargs) -> List[Dict]:
+        """Run a local source search, treating failures as no results."""
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"[Research] {name} search failed: {e}")
+            print(f"   ⚠️  {name} search failed: {e}")
+            return []
 
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                if keyword_lower in url_lower:
-                    score += 2
-                if keyword_lower in title_lower:
-                    score += 3
+    def _search_links(self, topic: str, limit: int = 20) -> List[Dict]:
+        """
+        Search links database for relevant sources.
 
-            if score > 0:
-                scored_links.append((score, link))
+        Uses the full-text index, so every link is considered (not just
+        the most recent ones).
 
-        # Sort by score and return top results
-        scored_links.sort(reverse=True, key=lambda x: x[0])
-        return [link for score, link in scored_links[:limit]]
+        Args:
+            topic: Research topic
+            limit: Maximum results
+
+        Returns:
+            List of relevant links, best match first
+        """
+        keywords = self._extract_keywords(topic)
+        return self.db.search_links_ranked(keywords, limit=limit)
 
     def _search_books(self, topic: str, limit: int = 5) -> List[Dict]:
         """
@@ -225,6 +320,69 @@ class ResearchOrchestrator:
         keywords = self._extract_keywords(topic)
         return self.db.search_papers_for_research(keywords, limit=limit)
 
+    def _search_crossref(self, topic: str, limit: int = EXTERNAL_RESULTS) -> List[Dict]:
+        """Search Crossref and return normalized papers."""
+        data = self.crossref.search(topic, limit=limit)
+        items = data.get("message", {}).get("items", [])
+        return [
+            {**self.crossref.parse_paper(item), "source": "Crossref"}
+            for item in items
+        ]
+
+    def _search_openalex(self, topic: str, limit: int = EXTERNAL_RESULTS) -> List[Dict]:
+        """Search OpenAlex and return normalized papers."""
+        data = self.openalex.search(topic, limit=limit)
+        return [
+            {**self.openalex.parse_paper(work), "source": "OpenAlex"}
+            for work in data.get("results", [])
+        ]
+
+    def _search_arxiv(self, topic: str, limit: int = EXTERNAL_RESULTS) -> List[Dict]:
+        """Search arXiv and return normalized papers."""
+        keywords = self._extract_keywords(topic)
+        if not keywords:
+            return []
+        query = " AND ".join(f"all:{keyword}" for keyword in keywords)
+        return [
+            {
+                "title": paper.get("title"),
+                "authors": paper.get("authors", []),
+                "abstract": paper.get("abstract"),
+                "publication_date": paper.get("published_date"),
+                "journal": "arXiv",
+                "url": paper.get("url"),
+                "doi": paper.get("doi"),
+                "source": "arXiv",
+            }
+            for paper in self.arxiv.search(query, max_results=limit)
+        ]
+
+    def _merge_external_papers(self, *result_lists: List[Dict]) -> List[Dict]:
+        """
+        Merge external search results, dropping duplicates by DOI or title.
+
+        Args:
+            *result_lists: Normalized paper lists, in priority order
+
+        Returns:
+            Deduplicated papers (first occurrence wins)
+        """
+        merged = []
+        seen = set()
+        for papers in result_lists:
+            for paper in papers:
+                title = (paper.get("title") or "").strip().lower()
+                if not title:
+                    continue
+                keys = {("title", title)}
+                if paper.get("doi"):
+                    keys.add(("doi", paper["doi"].lower()))
+                if keys & seen:
+                    continue
+                seen |= keys
+                merged.append(paper)
+        return merged
+
     def _extract_keywords(self, topic: str) -> List[str]:
         """
         Extract keywords from research topic.
@@ -244,7 +402,14 @@ class ResearchOrchestrator:
 
         return keywords
 
-    def _compile_sources(self, links: List[Dict], books: List[Dict], papers: List[Dict], wikipedia_data: Optional[Dict] = None) -> str:
+    def _compile_sources(
+        self,
+        links: List[Dict],
+        books: List[Dict],
+        papers: List[Dict],
+        wikipedia_data: Optional[Dict] = None,
+        external_papers: Optional[List[Dict]] = None
+    ) -> str:
         """
         Compile sources into text for LLM analysis.
 
@@ -253,6 +418,7 @@ class ResearchOrchestrator:
             books: List of relevant books
             papers: List of relevant papers
             wikipedia_data: Optional Wikipedia article data
+            external_papers: Papers found in Crossref/OpenAlex/arXiv
 
         Returns:
             Formatted source text
@@ -301,8 +467,193 @@ class ResearchOrchestrator:
                 if paper.get("notes"):
                     parts.append(f"  Note: {paper['notes']}")
 
+        if external_papers:
+            parts.append("\n## Academic Literature (Crossref/OpenAlex/arXiv)")
+            for paper in external_papers:
+                year = (paper.get("publication_date") or "")[:4]
+                parts.append(f"- {paper['title']}" + (f" ({year})" if year else ""))
+                if paper.get("journal"):
+                    parts.append(f"  {paper['journal']} - via {paper['source']}")
+
         return "\n".join(parts)
 
+    def _analyze_sources(
+        self,
+        topic: str,
+        sources: Dict[str, Any],
+        call_budget: int
+    ) -> Tuple[str, int]:
+        """
+        Analyze gathered sources within the call budget.
+
+        With room for it (one call per source group plus a merge call), each
+        group is summarized in parallel and the summaries feed the final
+        analysis; otherwise a single analysis call sees the source list.
+
+        Args:
+            topic: Research topic
+            sources: Output of _gather_sources
+            call_budget: Maximum LLM calls to make
+
+        Returns:
+            Tuple of (analysis text, LLM calls made)
+        """
+        links = sources["links"]
+        books = sources["books"]
+        papers = sources["papers"]
+        sources_text = self._compile_sources(
+            links, books, papers, sources["wikipedia"], sources["academic"]
+        )
+
+        if call_budget < 1:
+            print("   ⚠️  Daily LLM budget exhausted - skipping analysis")
+            return "Analysis skipped: daily LLM budget exhausted.", 0
+
+        batches = self._plan_summaries(self._source_groups(sources), call_budget - 1)
+        if len(batches) < 2:
+            return self._analyze_topic(topic, sources_text, links, books, papers), 1
+
+        print(f"   Summarizing {len(batches)} source batches in parallel...")
+        with ThreadPoolExecutor(max_workers=min(MAX_LLM_WORKERS, len(batches))) as pool:
+            summaries = list(pool.map(
+                lambda batch: self._summarize_batch(topic, *batch), batches
+            ))
+
+        summary_parts = [
+            f"### {label}\n{summary}"
+            for (label, _), summary in zip(batches, summaries)
+            if summary
+        ]
+        if summary_parts:
+            sources_text += "\n\n## Source Summaries\n\n" + "\n\n".join(summary_parts)
+
+        analysis = self._analyze_topic(topic, sources_text, links, books, papers)
+        return analysis, len(batches) + 1
+
+    def _source_groups(self, sources: Dict[str, Any]) -> List[Tuple[str, List[str]]]:
+        """
+        Render gathered sources as one text entry per source, grouped by kind.
+
+        Args:
+            sources: Output of _gather_sources
+
+        Returns:
+            List of (group label, entries) for non-empty groups
+        """
+        groups = []
+
+        wikipedia_data = sources["wikipedia"]
+        if wikipedia_data:
+            groups.append(("Wikipedia", [
+                f"{wikipedia_data['title']}\n{wikipedia_data['extract']}"
+            ]))
+
+        if sources["links"]:
+            groups.append(("Web sources", [
+                f"[{link.get('trust_tier') or 'unknown'}] {link.get('title') or link['url']} - {link['url']}"
+                for link in sources["links"]
+            ]))
+
+        if sources["books"]:
+            entries = []
+            for book in sources["books"]:
+                entry = f"{book['title']} by {book.get('author') or 'Unknown'}"
+                for field in ("enriched_summary", "notes"):
+                    if book.get(field):
+                        entry += f"\n{book[field]}"
+                entries.append(entry)
+            groups.append(("Books from your collection", entries))
+
+        for label, key in (
+            ("Papers from your collection", "papers"),
+            ("Academic literature", "academic"),
+        ):
+            if sources[key]:
+                entries = []
+                for paper in sources[key]:
+                    entry = paper["title"]
+                    if paper.get("abstract"):
+                        entry += f"\n{paper['abstract'][:1500]}"
+                    entries.append(entry)
+                groups.append((label, entries))
+
+        return groups
+
+    def _plan_summaries(
+        self,
+        groups: List[Tuple[str, List[str]]],
+        available_calls: int
+    ) -> List[Tuple[str, str]]:
+        """
+        Split source groups into summarization batches that fit the budget.
+
+        Every group gets one call; spare calls go round-robin to groups with
+        more than SUMMARY_BATCH_SIZE entries, splitting them further.
+
+        Args:
+            groups: Output of _source_groups
+            available_calls: Calls available for summaries
+
+        Returns:
+            List of (batch label, batch text); empty if the budget can't
+            cover one call per group
+        """
+        if not groups or available_calls < len(groups):
+            return []
+
+        wanted = {label: math.ceil(len(entries) / SUMMARY_BATCH_SIZE) for label, entries in groups}
+        allotted = {label: 1 for label, _ in groups}
+        spare = available_calls - len(groups)
+
+        while spare > 0:
+            growable = [label for label in allotted if allotted[label] < wanted[label]]
+            if not growable:
+                break
+            for label in growable[:spare]:
+                allotted[label] += 1
+                spare -= 1
+
+        batches = []
+        for label, entries in groups:
+            count = allotted[label]
+            size = math.ceil(len(entries) / count)
+            for i in range(count):
+                batch = entries[i * size:(i + 1) * size]
+                if batch:
+                    batch_label = label if count == 1 else f"{label} ({i + 1}/{count})"
+                    batches.append((batch_label, "\n\n".join(batch)))
+        return batches
+
+    def _summarize_batch(self, topic: str, label: str, text: str) -> Optional[str]:
+        """
+        Summarize one batch of sources with the LLM.
+
+        Args:
+            topic: Research topic
+            label: Batch label (source group)
+            text: Rendered sources
+
+        Returns:
+            Summary text, or None if the call failed
+        """
+        prompt = f"""I'm researching: {topic}
+
+Here are some sources ({label}):
+
+{text}
+
+In at most 200 words, summarize what these sources contribute to the topic: key concepts, notable findings or claims, and anything that looks unreliable. Only use the information given.
+"""
+        try:
+            return self.llm_client.simple_prompt(
+                prompt,
+                model="deepseek-ai/DeepSeek-V3.1",
+                temperature=0.3
+            )
+        except Exception as e:
+            logger.warning(f"[Research] Summary of {label} failed: {e}")
+            return None
+
     def _analyze_topic(
         self,
         topic: str,
@@ -0,0 +1,512 @@
+"""Full-text paper analysis: streamed extraction, sections, map-reduce summaries.
+
+Summaries used to come from the first N pages of a PDF, read in one go
+and cut to 40K characters for one LLM call. PaperAnalyzer reads the whole
+PDF a page at a time instead:
+
+1. iter_pages() extracts one page at a time (pdfplumber's page cache is
+   released after each), so a 600-page thesis never sits in memory whole.
+   Given a submit function (holod passes the executor's cpu pool), pages
+   are extracted in batches in worker processes instead, one batch ahead
+   of the LLM calls.
+2. Section headings (abstract, methods, results, references, ...) are
+   detected as the pages go by; chunks break at sections, and references
+   and acknowledgements are left out of the summary.
+3. Each chunk is summarized on its own (map). Chunk summaries are cached
+   in paper_chunks by PDF hash, so an interrupted or repeated analysis
+   only sends the chunks it hasn't seen.
+4. The chunk summaries are combined into the final summary (reduce),
+   in several rounds if they don't fit one prompt.
+
+    analyzer = PaperAnalyzer(llm_client, config, db=db)
+    result = analyzer.analyze_pdf(Path("paper.pdf"))
+    db.update_paper_analysis(paper_id, result["summary"], ...)
+"""
+
+import hashlib
+import logging
+import re
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pdfplumber
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_CHARS = 12000
+
+# Pages per extraction task when pages are extracted through submit
+PAGE_BATCH = 8
+
+# Notes per reduce prompt; more than this is condensed in several rounds
+REDUCE_CHARS = 30000
+
+# Sections not worth summarizing
+SKIPPED_SECTIONS = {"references", "acknowledgements"}
+
+# Heading text -> canonical section name
+SECTION_NAMES = {
+    "abstract": "abstract",
+    "summary": "abstract",
+    "introduction": "introduction",
+    "background": "introduction",
+    "related work": "introduction",
+    "literature review": "introduction",
+    "methods": "methods",
+    "method": "methods",
+    "methodology": "methods",
+    "materials and methods": "methods",
+    "data and methods": "methods",
+    "experimental": "methods",
+    "experimental setup": "methods",
+    "experiments": "methods",
+    "study area": "methods",
+    "results": "results",
+    "results and discussion": "results",
+    "discussion": "discussion",
+    "conclusion": "conclusion",
+    "conclusions": "conclusion",
+    "concluding remarks": "conclusion",
+    "acknowledgements": "acknowledgements",
+    "acknowledgments": "acknowledgements",
+    "acknowledgement": "acknowledgements",
+    "acknowledgment": "acknowledgements",
+    "references": "references",
+    "bibliography": "references",
+    "literature cited": "references",
+    "works cited": "references",
+    "appendix": "appendix",
+}
+
+_HEADING = re.compile(
+    r"^\s*(?:(?:\d+(?:\.\d+)*|[IVX]+)\.?\s+)?"  # Optional numbering: "2.", "2.1", "IV."
+    r"(" + "|".join(sorted((re.escape(name) for name in SECTION_NAMES), key=len, reverse=True)) + r")"
+    r"(?:\s+[A-Z])?"  # "Appendix A"
+    r"\s*(?:[:.—–-]\s*(.*))?$",  # "Abstract: text" / "Abstract—text"
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class Chunk:
+    """A run of consecutive text from one or more sections."""
+
+    index: int
+    sections: List[str]
+    start_page: int
+    end_page: int
+    text: str
+    abstract: str = ""  # Text of the chunk's abstract section, if any
+
+    @property
+    def skipped(self) -> bool:
+        return all(section in SKIPPED_SECTIONS for section in self.sections)
+
+
+@dataclass
+class _ChunkBuilder:
+    lines: List[str] = field(default_factory=list)
+    chars: int = 0
+    sections: List[str] = field(default_factory=list)
+    start_page: int = 0
+    end_page: int = 0
+    abstract: List[str] = field(default_factory=list)
+
+
+def hash_pdf(pdf_path: Path) -> str:
+    """SHA-256 of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_pages(pdf_path: Path, max_pages: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    """
+    Extract a PDF's text one page at a time.
+
+    Args:
+        pdf_path: Path to PDF file
+        max_pages: Stop after this many pages (None = all)
+
+    Yields:
+        (page number starting at 1, page text) for pages with text
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        pages = pdf.pages if max_pages is None else pdf.pages[:max_pages]
+        yield from _page_texts(pages, 1)
+
+
+def extract_pages(pdf_path: Path, first_page: int, count: int) -> List[Tuple[int, str]]:
+    """
+    Extract the text of a run of pages (picklable, for the cpu pool).
+
+    Args:
+        pdf_path: Path to PDF file
+        first_page: First page number, starting at 1
+        count: Number of pages
+
+    Returns:
+        (page number, page text) for pages with text
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return list(_page_texts(pdf.pages[first_page - 1:first_page - 1 + count], first_page))
+
+
+def iter_pages_with(
+    submit: Callable[[Callable[[], List[Tuple[int, str]]]], Future],
+    pdf_path: Path,
+    total_pages: int,
+    batch_pages: int = PAGE_BATCH,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Extract a PDF's text in batches of pages run by submit.
+
+    The next batch is extracted while the caller works on the current one.
+
+    Args:
+        submit: Runs a picklable callable and returns its Future
+        pdf_path: Path to PDF file
+        total_pages: Number of pages in the PDF
+        batch_pages: Pages per extraction task
+
+    Yields:
+        (page number starting at 1, page text) for pages with text
+    """
+    pending = deque()
+    for first_page in range(1, total_pages + 1, batch_pages):
+        pending.append(submit(partial(extract_pages, pdf_path, first_page, batch_pages)))
+        if len(pending) > 1:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _page_texts(pages, first_number: int) -> Iterator[Tuple[int, str]]:
+    for number, page in enumerate(pages, first_number):
+        try:
+            text = page.extract_text()
+        finally:
+            page.close()  # Drop the page's parsed layout before the next one
+        if text and text.strip():
+            yield number, text.strip()
+
+
+def count_pages(pdf_path: Path) -> Optional[int]:
+    """Number of pages in a PDF (None if it can't be read)."""
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+    except Exception:
+        return None
+
+
+def detect_heading(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Recognize a section heading line.
+
+    Args:
+        line: One line of page text
+
+    Returns:
+        (section name, text following the heading on the same line), or None
+    """
+    if len(line) > 80 and not line.lower().lstrip().startswith("abstract"):
+        return None
+    match = _HEADING.match(line)
+    if not match:
+        return None
+    rest = (match.group(2) or "").strip()
+    if rest and match.group(1).lower() != "abstract":
+        return None  # "Methods used by ..." is a sentence, not a heading
+    return SECTION_NAMES[match.group(1).lower()], rest
+
+
+def iter_chunks(pages: Iterable[Tuple[int, str]], chunk_chars: int = DEFAULT_CHUNK_CHARS) -> Iterator[Chunk]:
+    """
+    Group page text into chunks of at most chunk_chars, breaking at sections.
+
+    A section change starts a new chunk once the current one holds a
+    quarter of chunk_chars; references and acknowledgements always get
+    chunks of their own so they can be skipped.
+
+    Args:
+        pages: (page number, text) pairs, e.g. from iter_pages()
+        chunk_chars: Maximum characters per chunk
+
+    Yields:
+        Chunk objects, in document order
+    """
+    builder = _ChunkBuilder()
+    section = "front"
+    index = 0
+
+    def flush():
+        nonlocal builder, index
+        if builder.lines:
+            chunk = Chunk(
+                index, builder.sections, builder.start_page, builder.end_page,
+                "\n".join(builder.lines), " ".join(builder.abstract),
+            )
+            index += 1
+            builder = _ChunkBuilder()
+            return chunk
+        return None
+
+    for page_number, text in pages:
+        for line in text.splitlines():
+            heading = detect_heading(line)
+            heading_only = bool(heading) and not heading[1]
+            if heading:
+                new_section, rest = heading
+                if new_section != section:
+                    isolated = {new_section, section} & SKIPPED_SECTIONS
+                    if builder.lines and (isolated or builder.chars >= chunk_chars // 4):
+                        chunk = flush()
+                        if chunk:
+                            yield chunk
+                    section = new_section
+                line = rest if new_section == "abstract" and rest else line
+
+            while line:
+                piece, line = line[:chunk_chars], line[chunk_chars:]
+                if builder.chars + len(piece) > chunk_chars and builder.lines:
+                    chunk = flush()
+                    if chunk:
+                        yield chunk
+                if not builder.lines:
+                    builder.start_page = page_number
+                if section not in builder.sections:
+                    builder.sections.append(section)
+                builder.lines.append(piece)
+                if section == "abstract" and not heading_only:
+                    builder.abstract.append(piece.strip())
+                builder.chars += len(piece) + 1
+                builder.end_page = page_number
+
+    chunk = flush()
+    if chunk:
+        yield chunk
+
+
+class PaperAnalyzer:
+    """Summarize a paper's whole PDF with cached, chunk-by-chunk LLM calls."""
+
+    def __init__(
+        self,
+        llm_client,
+        config,
+        db=None,
+        chunk_chars: Optional[int] = None,
+        submit: Optional[Callable[[Callable], Future]] = None,
+    ):
+        """
+        Initialize paper analyzer.
+
+        Args:
+            llm_client: NanoGPTClient (anything with simple_prompt())
+            config: Holocene config (llm.primary, papers.chunk_chars)
+            db: Database for the chunk cache (None = no caching)
+            chunk_chars: Characters per chunk (default: config.papers.chunk_chars)
+            submit: Runs page extraction elsewhere, e.g. on the executor's cpu
+                pool (None = extract on the calling thread)
+        """
+        self.llm_client = llm_client
+        self.config = config
+        self.db = db
+        self.chunk_chars = chunk_chars or config.papers.chunk_chars
+        self.submit = submit
+        self.model = config.llm.primary
+
+    def analyze_pdf(
+        self,
+        pdf_path: Path,
+        title: Optional[str] = None,
+        progress: Optional[Callable[[Chunk, bool], None]] = None,
+    ) -> Dict:
+        """
+        Summarize a whole PDF.
+
+        Args:
+            pdf_path: Path to PDF file
+            title: Paper title, for the prompts
+            progress: Called with (chunk, from_cache) after each chunk
+
+        Returns:
+            Dict with summary, abstract (if found), sections, total_pages,
+            analysis_pages, chunks, cached_chunks, pdf_hash and
+            full_text_analyzed
+
+        Raises:
+            ValueError: If the PDF has no extractable text
+        """
+        pdf_hash = hash_pdf(pdf_path)
+        cached = self.db.get_paper_chunk_summaries(pdf_hash, self.chunk_chars) if self.db else {}
+
+        notes: List[Tuple[Chunk, str]] = []
+        sections: List[str] = []
+        abstract = ""
+        pages_with_text = 0
+        last_page = 0
+        chunk_count = 0
+        cached_count = 0
+
+        total_pages = count_pages(pdf_path)
+        if self.submit and total_pages:
+            source = iter_pages_with(self.submit, pdf_path, total_pages)
+        else:
+            source = iter_pages(pdf_path)
+
+        def pages():
+            nonlocal pages_with_text, last_page
+            for number, text in source:
+                pages_with_text += 1
+                last_page = number
+                yield number, text
+
+        for chunk in iter_chunks(pages(), self.chunk_chars):
+            chunk_count += 1
+            for section in chunk.sections:
+                if section not in sections:
+                    sections.append(section)
+            if chunk.abstract and not abstract:
+                abstract = chunk.abstract
+            if chunk.skipped:
+                continue
+
+            from_cache = chunk.index in cached
+            if from_cache:
+                summary = cached[chunk.index]
+                cached_count += 1
+            else:
+                summary = self._summarize_chunk(chunk, title)
+                if self.db:
+                    self.db.save_paper_chunk_summary(
+                        pdf_hash, self.chunk_chars, chunk.index, summary,
+                        sections=",".join(chunk.sections), start_page=chunk.start_page,
+                        end_page=chunk.end_page, chars=len(chunk.text), model=self.model,
+                    )
+            notes.append((chunk, summary))
+            if progress:
+                progress(chunk, from_cache)
+            # The chunk's text is dropped here; only its notes are kept
+
+        if not notes:
+            raise ValueError(f"No extractable text in {pdf_path}")
+
+        return {
+            "summary": self._reduce(notes, title),
+            "abstract": abstract[:3000] or None,
+            "sections": sections,
+            "total_pages": total_pages or last_page,
+            "analysis_pages": pages_with_text,
+            "chunks": chunk_count,
+            "cached_chunks": cached_count,
+            "pdf_hash": pdf_hash,
+            "full_text_analyzed": True,
+        }
+
+    def analyze_paper(self, paper: Dict, progress: Optional[Callable[[Chunk, bool], None]] = None) -> Dict:
+        """
+        Analyze a paper's local PDF and save the result.
+
+        Args:
+            paper: Paper dict (needs id and local_pdf_path)
+            progress: See analyze_pdf()
+
+        Returns:
+            analyze_pdf() result
+
+        Raises:
+            FileNotFoundError: If the paper has no local PDF
+        """
+        pdf_path = Path(paper["local_pdf_path"]) if paper.get("local_pdf_path") else None
+        if not pdf_path or not pdf_path.exists():
+            raise FileNotFoundError(f"No local PDF for paper {paper['id']}")
+
+        result = self.analyze_pdf(pdf_path, title=paper.get("title"), progress=progress)
+        if self.db:
+            self.db.update_paper_analysis(
+                paper["id"],
+                summary=result["summary"],
+                analysis_pages=result["analysis_pages"],
+                total_pages=result["total_pages"],
+                full_text_analyzed=True,
+                abstract=result["abstract"],
+            )
+        return result
+
+    # Internals
+
+    def _summarize_chunk(self, chunk: Chunk, title: Optional[str]) -> str:
+        """Map step: notes for one chunk."""
+        about = f' of "{title}"' if title else ""
+        prompt = f"""Below is part {chunk.index + 1} of an academic paper{about} \
+(sections: {", ".join(chunk.sections)}; pages {chunk.start_page}-{chunk.end_page}).
+
+Write concise notes on this part only: claims, methods, data, key numbers and findings.
+Use short markdown bullet points, at most 200 words. No preamble.
+
+Text:
+{chunk.text}"""
+        return self.llm_client.simple_prompt(
+            prompt=prompt,
+            system="You are a research assistant taking precise notes on academic papers.",
+            model=self.model,
+            temperature=0.1,
+            timeout=120,
+        ).strip()
+
+    def _reduce(self, notes: List[Tuple[Chunk, str]], title: Optional[str]) -> str:
+        """Reduce step: combine chunk notes into the final summary."""
+        parts = [f"### Part {chunk.index + 1} ({', '.join(chunk.sections)})\n{summary}" for chunk, summary in notes]
+
+        # Condense groups of notes until everything fits one prompt
+        while len(parts) > 1 and sum(len(part) for part in parts) > REDUCE_CHARS:
+            groups, group, size = [], [], 0
+            for part in parts:
+                if group and size + len(part) > REDUCE_CHARS:
+                    groups.append(group)
+                    group, size = [], 0
+                group.append(part)
+                size += len(part)
+            groups.append(group)
+            if len(groups) == len(parts):
+                break  # Every part is already as big as a prompt
+            parts = [self._condense(group, title) for group in groups]
+
+        about = f' "{title}"' if title else ""
+        prompt = f"""Below are notes taken on consecutive parts of the academic paper{about}.
+
+Write a high-quality markdown summary of the whole paper covering: main contribution/thesis,
+key methodology, major findings/arguments, and significance. Use headers (##), bullet points,
+and **bold** for emphasis. 2-4 paragraphs. Focus on intellectual content, not bibliographic details.
+
+Notes:
+{chr(10).join(parts)[:REDUCE_CHARS * 2]}"""
+        return self.llm_client.simple_prompt(
+            prompt=prompt,
+            system="You are a research assistant summarizing academic papers.",
+            model=self.model,
+            temperature=0.2,
+            timeout=180,
+        ).strip()
+
+    def _condense(self, parts: List[str], title: Optional[str]) -> str:
+        about = f' "{title}"' if title else ""
+        prompt = f"""Merge these notes on consecutive parts of the paper{about} into one set of
+concise markdown bullet notes (at most 400 words). Keep claims, methods, key numbers and findings.
+
+{chr(10).join(parts)}"""
+        return self.llm_client.simple_prompt(
+            prompt=prompt,
+            system="You are a research assistant taking precise notes on academic papers.",
+            model=self.model,
+            temperature=0.1,
+            timeout=180,
+        ).strip()
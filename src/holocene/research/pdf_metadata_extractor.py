@@ -9,28 +9,32 @@ import pdfplumber
 # Import is needed but may be circular, so we'll use import inside function if needed
 
 from holocene.llm import NanoGPTClient
+from holocene.research.paper_analysis import PaperAnalyzer
 
 
 class PDFMetadataExtractor:
     """Extract bibliographic metadata from PDFs using LLM analysis."""
 
-    def __init__(self, config):
+    def __init__(self, config, db=None):
         """
         Initialize PDF metadata extractor.
 
         Args:
             config: Holocene configuration object
+            db: Database for the full-text chunk cache (optional)
         """
         self.config = config
+        self.db = db
         self.llm_client = NanoGPTClient(config.llm.api_key, config.llm.base_url)
 
-    def extract_text(self, pdf_path: Path, max_pages: int = 5) -> str:
+    def extract_text(self, pdf_path: Path, max_pages: Optional[int] = 5, max_chars: Optional[int] = None) -> str:
         """
-        Extract text from first N pages of PDF.
+        Extract text from first N pages of PDF, one page at a time.
 
         Args:
             pdf_path: Path to PDF file
-            max_pages: Maximum number of pages to extract
+            max_pages: Maximum number of pages to extract (None = all)
+            max_chars: Stop reading once this much text is extracted
 
         Returns:
             Extracted text with page breaks
@@ -38,10 +42,19 @@ class PDFMetadataExtractor:
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 pages_text = []
-                for i in range(min(max_pages, len(pdf.pages))):
-                    text = pdf.pages[i].extract_text()
+                chars = 0
+                for i, page in enumerate(pdf.pages):
+                    if max_pages is not None and i >= max_pages:
+                        break
+                    try:
+                        text = page.extract_text()
+                    finally:
+                        page.close()  # Release the page's layout cache before the next page
                     if text:
                         pages_text.append(text.strip())
+                        chars += len(pages_text[-1])
+                    if max_chars is not None and chars >= max_chars:
+                        break
 
                 return "\n\n---PAGE BREAK---\n\n".join(pages_text)
         except Exception as e:
@@ -218,7 +231,7 @@ PDF Excerpt:
         Args:
             pdf_path: Path to PDF file
             max_pages: Maximum pages to extract (default: 10 for summaries, 5 otherwise)
-            full_text: Extract entire PDF instead of excerpt
+            full_text: Summarize the entire PDF chunk by chunk (see PaperAnalyzer)
             extract_summary: Request detailed summary from LLM
 
         Returns:
@@ -226,8 +239,9 @@ PDF Excerpt:
         """
         # Step 1: Extract text from PDF
         if full_text:
-            # Extract all pages
-            text = self.extract_text(pdf_path, max_pages=999999)
+            # Read pages until there's enough text for the metadata prompt;
+            # the summary covers the whole PDF (below)
+            text = self.extract_text(pdf_path, max_pages=None, max_chars=40000)
         else:
             # Extract first N pages (more pages if summarizing)
             if max_pages is None:
@@ -250,9 +264,18 @@ PDF Excerpt:
             text,
             doi=doi,
             isbn=isbn,
-            extract_summary=extract_summary
+            extract_summary=extract_summary and not full_text
         )
 
+        # Full text: map-reduce summary over the whole PDF
+        if full_text and extract_summary and "error" not in metadata:
+            analysis = PaperAnalyzer(self.llm_client, self.config, db=self.db).analyze_pdf(
+                pdf_path, title=metadata.get("title")
+            )
+            metadata["summary"] = analysis["summary"]
+            if not metadata.get("abstract") and analysis["abstract"]:
+                metadata["abstract"] = analysis["abstract"]
+
         # Step 4: Add file information
         metadata["source_file"] = str(pdf_path)
         metadata["extraction_method"] = "deepseek_v3"
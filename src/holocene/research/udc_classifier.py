@@ -2,13 +2,67 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from holocene.llm import NanoGPTClient
 from holocene.config import load_config
 from holocene.storage.database import Database
 
 
+# Shared by classify_book() and the batch classifier
+UDC_SYSTEM_PROMPT = """You are a professional librarian expert in the Universal Decimal Classification (UDC) system.
+
+UDC is an international classification system used primarily in European and Latin American libraries, including Brazilian universities.
+
+Key UDC main classes:
+0 - Generalities, Science and Knowledge
+1 - Philosophy, Psychology
+2 - Religion, Theology
+3 - Social Sciences
+31 - Statistics, Demography, Sociology
+32 - Politics
+33 - Economics
+34 - Law
+35 - Public administration, Military art
+36 - Social welfare
+37 - Education
+39 - Ethnology, Folklore
+
+5 - Mathematics and Natural Sciences
+50 - Generalities about pure sciences
+51 - Mathematics
+52 - Astronomy
+53 - Physics
+54 - Chemistry
+55 - Geology
+56 - Paleontology
+57 - Biological sciences
+58 - Botany
+59 - Zoology
+
+6 - Applied Sciences, Medicine, Technology
+61 - Medical sciences
+62 - Engineering
+63 - Agriculture
+64 - Home economics
+65 - Business management
+66 - Chemical technology
+67 - Manufacturing
+68 - Industries for finished goods
+69 - Building industry
+
+7 - The Arts
+8 - Language, Linguistics, Literature
+9 - Geography, Biography, History
+
+UDC uses synthesis - numbers can be combined with auxiliaries:
+(1/9) - Place (e.g., (81) = Brazil)
+=1/=9 - Language
+"..." - Time
+-0 - Common form auxiliaries
+
+Your task is to assign accurate UDC numbers to books based on their metadata."""
+
 class UDCClassifier:
     """Classify books and papers using UDC system."""
 
@@ -66,58 +120,7 @@ class UDCClassifier:
 
         metadata = "\n".join(metadata_parts)
 
-        system_prompt = """You are a professional librarian expert in the Universal Decimal Classification (UDC) system.
-
-UDC is an international classification system used primarily in European and Latin American libraries, including Brazilian universities.
-
-Key UDC main classes:
-0 - Generalities, Science and Knowledge
-1 - Philosophy, Psychology
-2 - Religion, Theology
-3 - Social Sciences
-31 - Statistics, Demography, Sociology
-32 - Politics
-33 - Economics
-34 - Law
-35 - Public administration, Military art
-36 - Social welfare
-37 - Education
-39 - Ethnology, Folklore
-
-5 - Mathematics and Natural Sciences
-50 - Generalities about pure sciences
-51 - Mathematics
-52 - Astronomy
-53 - Physics
-54 - Chemistry
-55 - Geology
-56 - Paleontology
-57 - Biological sciences
-58 - Botany
-59 - Zoology
-
-6 - Applied Sciences, Medicine, Technology
-61 - Medical sciences
-62 - Engineering
-63 - Agriculture
-64 - Home economics
-65 - Business management
-66 - Chemical technology
-67 - Manufacturing
-68 - Industries for finished goods
-69 - Building industry
-
-7 - The Arts
-8 - Language, Linguistics, Literature
-9 - Geography, Biography, History
-
-UDC uses synthesis - numbers can be combined with auxiliaries:
-(1/9) - Place (e.g., (81) = Brazil)
-=1/=9 - Language
-"..." - Time
--0 - Common form auxiliaries
-
-Your task is to assign accurate UDC numbers to books based on their metadata."""
+        system_prompt = UDC_SYSTEM_PROMPT
 
         user_prompt = f"""Classify this book using UDC notation.
 
@@ -179,6 +182,25 @@ Guidelines:
                 "classification_system": "UDC"
             }
 
+    def classify_books(self, books: List[Dict], batch_size: Optional[int] = None) -> Dict[int, Dict]:
+        """
+        Classify many books, several per prompt (see BatchClassifier).
+
+        Args:
+            books: Book dicts from the database (need id and title)
+            batch_size: Books per prompt (default: config.classification.batch_size)
+
+        Returns:
+            Dict mapping book ID to a classify_book()-style result
+        """
+        return self.batch_classifier(batch_size).classify_books(books)
+
+    def batch_classifier(self, batch_size: Optional[int] = None):
+        """BatchClassifier sharing this classifier's LLM client and config."""
+        from holocene.research.batch_classifier import BatchClassifier
+
+        return BatchClassifier(self.llm_client, self.config, system="UDC", batch_size=batch_size)
+
     def classify_paper(
         self,
         title: str,
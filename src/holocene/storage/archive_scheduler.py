@@ -0,0 +1,343 @@
+"""Concurrent archiving scheduler for draining the unarchived-links backlog.
+
+ArchivingService.archive_url() runs each backend one after another for a
+single URL. The scheduler gives every backend its own worker pool instead,
+so Internet Archive's slow Save Page Now never holds up local monolith
+captures, and keeps pulling work from the database as slots free up:
+
+- Per-backend pools with their own concurrency caps, plus a global cap
+  on captures running at once
+- ArchiveBox queue depth (via get_queue_status) throttles ArchiveBox adds,
+  and each refill goes to ArchiveBox as one batched add (submit_urls)
+- In-flight (link, service) pairs are deduplicated
+- Queued work is marked with 'pending' rows in archive_snapshots, and each
+  outcome is recorded as soon as it finishes
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, List, Set
+
+from holocene.storage.archiving import ArchivingService
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveScheduler:
+    """Runs archiving backends in independent worker pools."""
+
+    # Concurrent captures per backend
+    DEFAULT_CONCURRENCY = {
+        "local_monolith": 3,
+        "local_warc": 2,
+        "internet_archive": 2,  # The shared rate limiter still caps SPN at 12/min
+        "archivebox": 10,  # URLs in flight; sent as batched adds that run remotely
+    }
+
+    def __init__(
+        self,
+        archiving: ArchivingService,
+        services: Optional[List[str]] = None,
+        max_concurrent: int = 6,
+        concurrency: Optional[Dict[str, int]] = None,
+        archivebox_max_queue: int = 20,
+        queue_check_interval: float = 120.0,
+        max_attempts: int = 3,
+    ):
+        """
+        Initialize archive scheduler.
+
+        Args:
+            archiving: ArchivingService with the backend clients to use
+            services: Services to schedule (default: all available in archiving)
+            max_concurrent: Global cap on captures running at once
+            concurrency: Per-service overrides for DEFAULT_CONCURRENCY
+            archivebox_max_queue: Don't add to ArchiveBox while it has this many pending
+            queue_check_interval: Seconds to cache ArchiveBox queue status
+            max_attempts: Stop retrying a link/service after this many failures
+        """
+        self.archiving = archiving
+        self.db = archiving.db
+        self.services = services or archiving.available_services()
+        self.concurrency = {**self.DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self.max_concurrent = max_concurrent
+        self.archivebox_max_queue = archivebox_max_queue
+        self.queue_check_interval = queue_check_interval
+        self.max_attempts = max_attempts
+
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._global_slots = threading.BoundedSemaphore(max_concurrent)
+        self._in_flight: Dict[str, Set[int]] = {service: set() for service in self.services}
+        self._lock = threading.Lock()
+
+        self._archivebox_status: Optional[Dict[str, Any]] = None
+        self._archivebox_checked_at = 0.0
+        self._archivebox_added = 0  # Adds since last queue check (not yet in its count)
+
+        self.stats = {
+            service: {"queued": 0, "succeeded": 0, "failed": 0} for service in self.services
+        }
+
+        self._running = False
+        self._stop_event = threading.Event()
+        self._feeder_thread: Optional[threading.Thread] = None
+
+    def start(self, interval: Optional[float] = None):
+        """
+        Start worker pools and (optionally) a feeder thread.
+
+        Args:
+            interval: Seconds between backlog scans. None = no feeder thread;
+                      call fill() yourself.
+        """
+        if self._running:
+            return
+
+        for service in self.services:
+            self._pools[service] = ThreadPoolExecutor(
+                max_workers=self.concurrency.get(service, 1),
+                thread_name_prefix=f"archive-{service}",
+            )
+            # Pending markers from an interrupted run would hide those links forever
+            cleared = self.db.clear_pending_snapshots(service)
+            if cleared:
+                logger.info(f"[ArchiveScheduler] Cleared {cleared} stale pending {service} snapshot(s)")
+
+        self._running = True
+        self._stop_event.clear()
+
+        if interval:
+            self._feeder_thread = threading.Thread(
+                target=self._feeder_loop,
+                args=(interval,),
+                daemon=True,
+                name="archive-feeder",
+            )
+            self._feeder_thread.start()
+
+        logger.info(
+            f"[ArchiveScheduler] Started: {', '.join(self.services) or 'no services'} "
+            f"(max {self.max_concurrent} concurrent)"
+        )
+
+    def stop(self, wait: bool = True):
+        """
+        Stop scheduling new work and shut down worker pools.
+
+        Args:
+            wait: Wait for running captures to finish
+        """
+        self._running = False
+        self._stop_event.set()
+
+        if self._feeder_thread and self._feeder_thread.is_alive():
+            self._feeder_thread.join(timeout=5)
+
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+        self._pools.clear()
+
+        logger.info("[ArchiveScheduler] Stopped")
+
+    def _feeder_loop(self, interval: float):
+        """Periodically top up the pools (picks up new links and expired backoffs)."""
+        while not self._stop_event.is_set():
+            try:
+                self.fill()
+            except Exception as e:
+                logger.error(f"[ArchiveScheduler] Fill failed: {e}", exc_info=True)
+
+            if self._stop_event.wait(interval):
+                break
+
+    def submit(self, link_id: int, url: str, service: str) -> bool:
+        """
+        Queue a single capture.
+
+        Args:
+            link_id: Link ID in database
+            url: URL to archive
+            service: Service name (must be one of self.services)
+
+        Returns:
+            True if queued, False if not running, unknown service or already in flight
+        """
+        if not self._running or service not in self._pools:
+            return False
+
+        with self._lock:
+            if link_id in self._in_flight[service]:
+                return False
+            self._in_flight[service].add(link_id)
+            self.stats[service]["queued"] += 1
+            if service == "archivebox":
+                self._archivebox_added += 1
+
+        try:
+            pending_id = self.db.add_archive_snapshot(
+                link_id=link_id, service=service, status="pending"
+            )
+            self._pools[service].submit(self._run_job, link_id, url, service, pending_id)
+        except Exception:
+            with self._lock:
+                self._in_flight[service].discard(link_id)
+            raise
+
+        return True
+
+    def fill(self) -> int:
+        """
+        Queue backlog links for every service up to its free capacity.
+
+        Returns:
+            Number of captures queued
+        """
+        return sum(self._fill_service(service) for service in self.services)
+
+    def _fill_service(self, service: str) -> int:
+        """Queue backlog links for one service up to its free capacity."""
+        if not self._running:
+            return 0
+
+        with self._lock:
+            in_flight = list(self._in_flight[service])
+        free = self.concurrency.get(service, 1) - len(in_flight)
+
+        if service == "archivebox":
+            free = min(free, self._archivebox_capacity())
+
+        if free <= 0:
+            return 0
+
+        links = self.db.get_links_needing_archive(
+            service, limit=free, max_attempts=self.max_attempts, exclude_ids=in_flight
+        )
+        if service == "archivebox" and hasattr(self.archiving.archivebox, "submit_urls"):
+            return self._submit_archivebox_batch(links)
+        return sum(1 for link in links if self.submit(link["id"], link["url"], service))
+
+    def _submit_archivebox_batch(self, links: List[Dict[str, Any]]) -> int:
+        """Queue links to ArchiveBox as one batched add; results arrive as futures."""
+        service = "archivebox"
+        batch = []
+        with self._lock:
+            for link in links:
+                if link["id"] in self._in_flight[service]:
+                    continue
+                self._in_flight[service].add(link["id"])
+                self.stats[service]["queued"] += 1
+                self._archivebox_added += 1
+                batch.append(link)
+
+        if not batch:
+            return 0
+
+        try:
+            pending_ids = {
+                link["id"]: self.db.add_archive_snapshot(link_id=link["id"], service=service, status="pending")
+                for link in batch
+            }
+            futures = self.archiving.archivebox.submit_urls([link["url"] for link in batch])
+        except Exception:
+            with self._lock:
+                self._in_flight[service].difference_update(link["id"] for link in batch)
+            raise
+
+        for link in batch:
+            futures[link["url"]].add_done_callback(
+                partial(self._on_batch_result, link["id"], link["url"], pending_ids[link["id"]])
+            )
+        return len(batch)
+
+    def _on_batch_result(self, link_id: int, url: str, pending_id: int, future: Future):
+        """Record one URL's result from a batched ArchiveBox add."""
+        try:
+            raw = future.result()
+        except Exception as e:
+            raw = {"status": "error", "url": url, "error": str(e)}
+        self._finish_job(link_id, url, "archivebox", pending_id, raw)
+
+    def _archivebox_capacity(self) -> int:
+        """How many more URLs ArchiveBox can take, from its (cached) queue depth."""
+        now = time.monotonic()
+        if (
+            self._archivebox_status is None
+            or now - self._archivebox_checked_at > self.queue_check_interval
+        ):
+            self._archivebox_status = self.archiving.archivebox.get_queue_status()
+            self._archivebox_checked_at = now
+            self._archivebox_added = 0
+
+        status = self._archivebox_status
+        if not status.get("available"):
+            return 0
+        pending = status.get("pending_count", 0) + self._archivebox_added
+        return max(0, self.archivebox_max_queue - pending)
+
+    def _run_job(self, link_id: int, url: str, service: str, pending_id: int):
+        """Worker: run one capture, then record the outcome and refill this service."""
+        with self._global_slots:
+            if not self._running:
+                try:
+                    self.db.delete_archive_snapshot(pending_id)
+                finally:
+                    with self._lock:
+                        self._in_flight[service].discard(link_id)
+                return
+            try:
+                raw = self.archiving.run_backend(service, url)
+            except Exception as e:
+                logger.error(f"[ArchiveScheduler] {service} crashed on {url}: {e}", exc_info=True)
+                raw = {"status": "error", "url": url, "error": str(e)}
+
+        self._finish_job(link_id, url, service, pending_id, raw)
+
+    def _finish_job(self, link_id: int, url: str, service: str, pending_id: int, raw: Dict[str, Any]):
+        """Record a capture's outcome, then refill this service."""
+        try:
+            # Drop the marker before recording so failure backoff sees the previous attempt
+            self.db.delete_archive_snapshot(pending_id)
+            outcome = self.archiving.record_result(link_id, service, raw)
+
+            with self._lock:
+                self.stats[service]["succeeded" if outcome["success"] else "failed"] += 1
+
+        except Exception as e:
+            logger.error(f"[ArchiveScheduler] Failed to record {service} for {url}: {e}", exc_info=True)
+
+        finally:
+            with self._lock:
+                self._in_flight[service].discard(link_id)
+                in_flight = len(self._in_flight[service])
+
+        # Batched ArchiveBox results trickle in; refill once half the batch is done
+        # rather than sending a one-URL batch per result
+        if service == "archivebox" and in_flight > self.concurrency.get(service, 1) // 2:
+            return
+
+        try:
+            self._fill_service(service)
+        except Exception as e:
+            logger.error(f"[ArchiveScheduler] Refill of {service} failed: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get scheduler state for status displays."""
+        with self._lock:
+            services = {
+                service: {
+                    "in_flight": len(self._in_flight[service]),
+                    "concurrency": self.concurrency.get(service, 1),
+                    **self.stats[service],
+                }
+                for service in self.services
+            }
+
+        return {
+            "running": self._running,
+            "max_concurrent": self.max_concurrent,
+            "services": services,
+            "archivebox_queue": self._archivebox_status,
+        }
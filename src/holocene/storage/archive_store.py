@@ -0,0 +1,449 @@
+"""Content-addressed, deduplicated, compressed store for local web archives.
+
+Monolith HTML and WARC captures of the same page are mostly identical
+between snapshots, and monolith inlines every image/font/script as a
+base64 data: URI, so the same assets show up in many pages. Instead of one
+standalone file per snapshot, captures are split into chunks:
+
+- Embedded data: URIs become their own chunks (an asset shared across
+  snapshots or pages is stored once)
+- The remaining text is cut at content-defined line boundaries, so an edit
+  near the top of a page doesn't shift every chunk after it
+- Each chunk is stored once, named by its SHA-256, compressed as an
+  independent frame (zstd when available, zlib otherwise)
+
+A blob is described by a manifest listing its chunks with offsets - the
+seekable frame index - so a byte range can be served by decompressing only
+the chunks it overlaps. Blobs are referenced from archive_snapshots as
+``blob:<sha256>`` and garbage-collected against that table.
+
+Layout under the store root:
+    chunks/ab/abcdef...   one compressed frame per chunk
+    blobs/12/123456....json  manifest per blob
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Union
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "blob:"
+
+# Frame codec tags (first byte of every chunk file)
+CODEC_ZSTD = b"Z"
+CODEC_ZLIB = b"D"
+
+# Base64 data: URIs at least this large become standalone chunks
+MIN_ASSET_SIZE = 2048
+DATA_URI_RE = re.compile(
+    rb"data:[\w.+-]+/[\w.+-]+(?:;[\w.+-]+=[\w.+-]+)*;base64,[A-Za-z0-9+/=]{%d,}" % MIN_ASSET_SIZE
+)
+LINE_RE = re.compile(rb"[^\n]*\n|[^\n]+")
+
+
+def is_blob_ref(value: Optional[str]) -> bool:
+    """Check whether a snapshot_url points into the archive store."""
+    return bool(value) and value.startswith(BLOB_PREFIX)
+
+
+def blob_ref(blob_id: str) -> str:
+    """Build the snapshot_url reference for a blob."""
+    return f"{BLOB_PREFIX}{blob_id}"
+
+
+def parse_blob_ref(value: str) -> str:
+    """Extract the blob ID from a ``blob:<sha256>`` reference."""
+    if not is_blob_ref(value):
+        raise ValueError(f"Not a blob reference: {value}")
+    return value[len(BLOB_PREFIX):]
+
+
+def _split_text(data: bytes, min_size: int, avg_mask: int, max_size: int) -> Iterator[bytes]:
+    """Content-defined chunking at line boundaries.
+
+    A chunk ends after a line whose CRC32 matches the mask (once the chunk
+    is at least min_size), or when it reaches max_size. Boundaries depend
+    only on nearby content, so they resynchronise right after an edit.
+    """
+    start = 0
+    size = 0
+    for match in LINE_RE.finditer(data):
+        line_end = match.end()
+        line_len = line_end - match.start()
+
+        # Minified pages can be one enormous line - cut those at max_size
+        while size + line_len > max_size:
+            cut = start + max_size
+            yield data[start:cut]
+            line_len -= cut - max(start, match.start())
+            start = cut
+            size = 0
+
+        size += line_len
+        if size >= min_size and (zlib.crc32(match.group()) & avg_mask) == 0:
+            yield data[start:line_end]
+            start = line_end
+            size = 0
+
+    if start < len(data):
+        yield data[start:]
+
+
+def chunk_content(
+    data: bytes,
+    min_size: int = 16 * 1024,
+    avg_size: int = 64 * 1024,
+    max_size: int = 256 * 1024,
+) -> Iterator[bytes]:
+    """Split capture content into dedup-friendly chunks.
+
+    Args:
+        data: Raw (uncompressed) capture bytes
+        min_size: Minimum text chunk size
+        avg_size: Target average text chunk size (rounded down to a power of two)
+        max_size: Maximum text chunk size (embedded assets are never split)
+
+    Yields:
+        Chunks that concatenate back to data
+    """
+    # Lines are ~100 bytes on average, so a chunk ends on ~1 in (avg/100) lines
+    avg_lines = max(1, avg_size // 128)
+    avg_mask = (1 << max(0, avg_lines.bit_length() - 1)) - 1
+
+    pos = 0
+    for match in DATA_URI_RE.finditer(data):
+        if match.start() > pos:
+            yield from _split_text(data[pos:match.start()], min_size, avg_mask, max_size)
+        yield match.group()
+        pos = match.end()
+
+    if pos < len(data):
+        yield from _split_text(data[pos:], min_size, avg_mask, max_size)
+
+
+class ArchiveStore:
+    """Content-addressed chunk store for local archive captures."""
+
+    # Unreferenced chunks/manifests younger than this survive GC, so a
+    # capture being written concurrently isn't collected before its
+    # archive_snapshots row exists
+    GC_GRACE_SECONDS = 3600
+
+    def __init__(self, root: Union[str, Path], compression_level: int = 9):
+        """
+        Initialize archive store.
+
+        Args:
+            root: Store directory (e.g., ~/.holocene/archives/store)
+            compression_level: zstd (1-22) or zlib (1-9, clamped) level
+        """
+        self.root = Path(root)
+        self.chunk_dir = self.root / "chunks"
+        self.blob_dir = self.root / "blobs"
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.compression_level = compression_level
+        self._local = threading.local()  # zstd contexts aren't thread-safe
+
+    # Compression
+
+    def _compress(self, data: bytes) -> bytes:
+        if HAS_ZSTD:
+            if not hasattr(self._local, "cctx"):
+                self._local.cctx = zstandard.ZstdCompressor(level=self.compression_level)
+            return CODEC_ZSTD + self._local.cctx.compress(data)
+        return CODEC_ZLIB + zlib.compress(data, min(self.compression_level, 9))
+
+    def _decompress(self, frame: bytes) -> bytes:
+        codec, payload = frame[:1], frame[1:]
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(payload)
+        if codec == CODEC_ZSTD:
+            if not HAS_ZSTD:
+                raise RuntimeError(
+                    "Archive chunk is zstd-compressed but zstandard is not installed. "
+                    "Install with: pip install zstandard"
+                )
+            if not hasattr(self._local, "dctx"):
+                self._local.dctx = zstandard.ZstdDecompressor()
+            return self._local.dctx.decompress(payload)
+        raise ValueError(f"Unknown archive chunk codec: {codec!r}")
+
+    # Paths
+
+    def _chunk_path(self, chunk_id: str) -> Path:
+        return self.chunk_dir / chunk_id[:2] / chunk_id
+
+    def _manifest_path(self, blob_id: str) -> Path:
+        if not re.fullmatch(r"[0-9a-f]{64}", blob_id):
+            raise ValueError(f"Invalid blob ID: {blob_id}")
+        return self.blob_dir / blob_id[:2] / f"{blob_id}.json"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Write via temp file + rename so readers never see partial files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    # Writing
+
+    def put(self, data: bytes, media_type: Optional[str] = None) -> Dict:
+        """
+        Store content, deduplicating chunks against everything already stored.
+
+        Args:
+            data: Raw capture bytes
+            media_type: Optional MIME type recorded in the manifest
+
+        Returns:
+            Dict with blob_id, ref (for snapshot_url), size, chunks,
+            new_chunks and stored_bytes (compressed bytes actually written)
+        """
+        blob_id = hashlib.sha256(data).hexdigest()
+        manifest_path = self._manifest_path(blob_id)
+
+        if manifest_path.exists():
+            # Identical capture already stored - refresh for GC grace and reuse
+            os.utime(manifest_path)
+            manifest = self._read_manifest(blob_id)
+            for chunk_id, _, _ in manifest["chunks"]:
+                self._touch_chunk(chunk_id)
+            return {
+                "blob_id": blob_id,
+                "ref": blob_ref(blob_id),
+                "size": manifest["size"],
+                "chunks": len(manifest["chunks"]),
+                "new_chunks": 0,
+                "stored_bytes": 0,
+            }
+
+        chunks = []
+        offset = 0
+        new_chunks = 0
+        stored_bytes = 0
+
+        for chunk in chunk_content(data):
+            chunk_id = hashlib.sha256(chunk).hexdigest()
+            if not self._touch_chunk(chunk_id):
+                frame = self._compress(chunk)
+                self._write_atomic(self._chunk_path(chunk_id), frame)
+                new_chunks += 1
+                stored_bytes += len(frame)
+            chunks.append([chunk_id, offset, len(chunk)])
+            offset += len(chunk)
+
+        manifest = {
+            "blob_id": blob_id,
+            "size": len(data),
+            "media_type": media_type,
+            "created_at": time.time(),
+            "chunks": chunks,
+        }
+        self._write_atomic(manifest_path, json.dumps(manifest).encode("utf-8"))
+
+        logger.debug(
+            f"[ArchiveStore] Stored {blob_id[:12]}: {len(data):,} bytes in {len(chunks)} chunks "
+            f"({new_chunks} new, {stored_bytes:,} bytes written)"
+        )
+
+        return {
+            "blob_id": blob_id,
+            "ref": blob_ref(blob_id),
+            "size": len(data),
+            "chunks": len(chunks),
+            "new_chunks": new_chunks,
+            "stored_bytes": stored_bytes,
+        }
+
+    def put_file(self, path: Union[str, Path], media_type: Optional[str] = None) -> Dict:
+        """Store a file's content (see put())."""
+        return self.put(Path(path).read_bytes(), media_type=media_type)
+
+    def _touch_chunk(self, chunk_id: str) -> bool:
+        """Mark an existing chunk as recently used. Returns False if missing."""
+        try:
+            os.utime(self._chunk_path(chunk_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    # Reading
+
+    def _read_manifest(self, blob_id: str) -> Dict:
+        path = self._manifest_path(blob_id)
+        if not path.exists():
+            raise FileNotFoundError(f"Blob not found: {blob_id}")
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _read_chunk(self, chunk_id: str) -> bytes:
+        return self._decompress(self._chunk_path(chunk_id).read_bytes())
+
+    def exists(self, blob_id: str) -> bool:
+        """Check whether a blob is stored."""
+        return self._manifest_path(blob_id).exists()
+
+    def info(self, blob_id: str) -> Dict:
+        """Get blob size, media type and chunk count."""
+        manifest = self._read_manifest(blob_id)
+        return {
+            "blob_id": blob_id,
+            "size": manifest["size"],
+            "media_type": manifest.get("media_type"),
+            "chunks": len(manifest["chunks"]),
+        }
+
+    def iter_chunks(self, blob_id: str) -> Iterator[bytes]:
+        """Stream a blob chunk by chunk (constant memory per chunk)."""
+        for chunk_id, _, _ in self._read_manifest(blob_id)["chunks"]:
+            yield self._read_chunk(chunk_id)
+
+    def get(self, blob_id: str) -> bytes:
+        """Read a whole blob."""
+        return b"".join(self.iter_chunks(blob_id))
+
+    def iter_range(self, blob_id: str, start: int, end: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Stream bytes [start, end) of a blob, decompressing only overlapping chunks.
+
+        Args:
+            blob_id: Blob ID
+            start: First byte offset
+            end: One past the last byte (None = end of blob)
+        """
+        manifest = self._read_manifest(blob_id)
+        chunks = manifest["chunks"]
+        end = manifest["size"] if end is None else min(end, manifest["size"])
+        if start >= end:
+            return
+
+        offsets = [offset for _, offset, _ in chunks]
+        index = bisect.bisect_right(offsets, start) - 1
+
+        while index < len(chunks):
+            chunk_id, offset, length = chunks[index]
+            if offset >= end:
+                break
+            data = self._read_chunk(chunk_id)
+            yield data[max(0, start - offset):min(length, end - offset)]
+            index += 1
+
+    def read_range(self, blob_id: str, start: int, end: Optional[int] = None) -> bytes:
+        """Read bytes [start, end) of a blob (see iter_range())."""
+        return b"".join(self.iter_range(blob_id, start, end))
+
+    # Maintenance
+
+    def gc(self, live_blob_ids: Set[str], dry_run: bool = False) -> Dict:
+        """
+        Delete manifests not in live_blob_ids, then chunks no live manifest uses.
+
+        Anything touched within GC_GRACE_SECONDS is kept, so captures being
+        written right now survive.
+
+        Args:
+            live_blob_ids: Blob IDs still referenced (e.g., from archive_snapshots)
+            dry_run: Only report what would be deleted
+
+        Returns:
+            Dict with blobs_deleted, chunks_deleted and bytes_freed
+        """
+        cutoff = time.time() - self.GC_GRACE_SECONDS
+        result = {"blobs_deleted": 0, "chunks_deleted": 0, "bytes_freed": 0}
+        live_chunks: Set[str] = set()
+
+        for manifest_path in self.blob_dir.glob("*/*.json"):
+            blob_id = manifest_path.stem
+            if blob_id in live_blob_ids or manifest_path.stat().st_mtime > cutoff:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                live_chunks.update(chunk_id for chunk_id, _, _ in manifest["chunks"])
+                continue
+
+            result["blobs_deleted"] += 1
+            result["bytes_freed"] += manifest_path.stat().st_size
+            if not dry_run:
+                manifest_path.unlink()
+
+        for chunk_path in self.chunk_dir.glob("*/*"):
+            if chunk_path.name.startswith(".tmp-") or chunk_path.name in live_chunks:
+                continue
+            stat = chunk_path.stat()
+            if stat.st_mtime > cutoff:
+                continue
+
+            result["chunks_deleted"] += 1
+            result["bytes_freed"] += stat.st_size
+            if not dry_run:
+                chunk_path.unlink()
+
+        logger.info(
+            f"[ArchiveStore] GC{' (dry run)' if dry_run else ''}: "
+            f"{result['blobs_deleted']} blobs, {result['chunks_deleted']} chunks, "
+            f"{result['bytes_freed']:,} bytes"
+        )
+        return result
+
+    def gc_against_db(self, db, dry_run: bool = False) -> Dict:
+        """
+        Garbage-collect against blob references in archive_snapshots.
+
+        Args:
+            db: Database instance
+            dry_run: Only report what would be deleted
+
+        Returns:
+            GC result dict (see gc())
+        """
+        cursor = db.conn.cursor()
+        cursor.execute(
+            "SELECT snapshot_url FROM archive_snapshots WHERE snapshot_url LIKE ?",
+            (f"{BLOB_PREFIX}%",),
+        )
+        live = {parse_blob_ref(row[0]) for row in cursor.fetchall()}
+        return self.gc(live, dry_run=dry_run)
+
+    def stats(self) -> Dict:
+        """Get logical vs physical size of the store."""
+        logical = 0
+        blobs = 0
+        for manifest_path in self.blob_dir.glob("*/*.json"):
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            logical += manifest["size"]
+            blobs += 1
+
+        physical = 0
+        chunks = 0
+        for chunk_path in self.chunk_dir.glob("*/*"):
+            physical += chunk_path.stat().st_size
+            chunks += 1
+
+        return {
+            "blobs": blobs,
+            "chunks": chunks,
+            "logical_bytes": logical,
+            "stored_bytes": physical,
+            "ratio": (logical / physical) if physical else None,
+            "codec": "zstd" if HAS_ZSTD else "zlib",
+        }
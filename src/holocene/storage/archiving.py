@@ -6,7 +6,8 @@ retry logic, and database tracking.
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from datetime import datetime
 import json
 
@@ -15,6 +16,9 @@ from holocene.integrations.internet_archive import InternetArchiveClient
 from holocene.integrations.archivebox import ArchiveBoxClient
 from holocene.storage.database import Database
 
+if TYPE_CHECKING:
+    from holocene.storage.capture_pool import CapturePool
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +31,7 @@ class ArchivingService:
         local_client: Optional[LocalArchiveClient] = None,
         ia_client: Optional[InternetArchiveClient] = None,
         archivebox_client: Optional[ArchiveBoxClient] = None,
+        capture_pool: Optional["CapturePool"] = None,
     ):
         """
         Initialize archiving service.
@@ -36,11 +41,13 @@ class ArchivingService:
             local_client: Local archive client (will create if None)
             ia_client: Internet Archive client (optional)
             archivebox_client: ArchiveBox client (optional)
+            capture_pool: Run local captures on this pool instead of the calling thread
         """
         self.db = db
-        self.local = local_client or LocalArchiveClient()
+        self.local = local_client or (capture_pool.local if capture_pool else LocalArchiveClient())
         self.ia = ia_client
         self.archivebox = archivebox_client
+        self.capture_pool = capture_pool
 
     def archive_url(
         self,
@@ -81,165 +88,229 @@ class ArchivingService:
 
         # 1. Local archiving
         if local_format:
-            logger.info(f"[Archiving] Starting local archive ({local_format}) for {url}")
+            service_name = f"local_{local_format}"
+            raw = self.run_backend(service_name, url)
+            self._merge_result(results, self.record_result(link_id, service_name, raw))
 
-            local_result = self.local.archive_url(url, format=local_format, timeout=60)
+        # 2. Internet Archive
+        if use_ia and self.ia:
+            raw = self.run_backend("internet_archive", url, force_ia=force_ia)
+            self._merge_result(results, self.record_result(link_id, "internet_archive", raw))
 
-            if local_result["status"] == "archived":
-                # Record success in database
-                service_name = f"local_{local_format}"
-                metadata = {
-                    "file_size": local_result.get("file_size"),
-                    "format": local_format,
-                }
+        elif use_ia and not self.ia:
+            logger.warning("[Archiving] IA archiving requested but no IA client configured")
+            results["errors"].append("IA client not configured")
 
-                snapshot_id = self.db.add_archive_snapshot(
-                    link_id=link_id,
-                    service=service_name,
-                    snapshot_url=local_result["local_path"],
-                    archive_date=local_result["archive_date"],
-                    status="success",
-                    metadata=json.dumps(metadata),
-                )
+        # 3. ArchiveBox
+        if use_archivebox and self.archivebox:
+            raw = self.run_backend("archivebox", url)
+            self._merge_result(results, self.record_result(link_id, "archivebox", raw))
 
-                results["services"][service_name] = {
-                    "status": "success",
-                    "snapshot_id": snapshot_id,
-                    "local_path": local_result["local_path"],
-                    "file_size": local_result.get("file_size"),
-                }
-                results["success"] = True
+        elif use_archivebox and not self.archivebox:
+            logger.warning("[Archiving] ArchiveBox requested but no client configured")
+            results["errors"].append("ArchiveBox client not configured")
 
-                logger.info(f"[Archiving] Local archive successful: {local_result['local_path']}")
+        return results
 
-            else:
-                # Record failure
-                service_name = f"local_{local_format}"
-                error_msg = local_result.get("error", "Unknown error")
+    def submit_local(self, url: str, local_format: ArchiveFormat = "monolith") -> Optional[Future]:
+        """
+        Queue a local capture on the capture pool without waiting for it.
 
-                failure = self.db.record_snapshot_failure(
-                    link_id=link_id,
-                    service=service_name,
-                    error_message=error_msg,
-                )
+        For callers that wait on their own (e.g. an asyncio event loop);
+        pass the result to record_local().
 
-                results["services"][service_name] = {
-                    "status": "failed",
-                    "error": error_msg,
-                    "attempts": failure["attempts"],
-                }
-                results["errors"].append(f"Local archive failed: {error_msg}")
+        Args:
+            url: URL to archive
+            local_format: 'monolith' or 'warc'
 
-                logger.error(f"[Archiving] Local archive failed: {error_msg}")
+        Returns:
+            Future for the raw capture result, or None without a running capture pool
+        """
+        if self.capture_pool is None or not self.capture_pool.running:
+            return None
+        job_id = self.capture_pool.submit(url, format=local_format, timeout=60)
+        return self.capture_pool.future(job_id)
 
-        # 2. Internet Archive
-        if use_ia and self.ia:
+    def record_local(
+        self, link_id: int, url: str, raw: Dict[str, Any], local_format: ArchiveFormat = "monolith"
+    ) -> Dict[str, Any]:
+        """
+        Record a capture from submit_local().
+
+        Returns:
+            Dict shaped like archive_url() results
+        """
+        results = {"url": url, "link_id": link_id, "services": {}, "success": False, "errors": []}
+        self._merge_result(results, self.record_result(link_id, f"local_{local_format}", raw))
+        return results
+
+    def _merge_result(self, results: Dict[str, Any], service_result: Dict[str, Any]):
+        """Fold a single-service result from record_result() into archive_url() results."""
+        results["services"][service_result["service"]] = service_result["result"]
+        if service_result["success"]:
+            results["success"] = True
+        else:
+            results["errors"].append(service_result["error"])
+
+    def available_services(self) -> List[str]:
+        """List service names this instance can archive to (for run_backend)."""
+        services = [f"local_{fmt}" for fmt in self.local.get_available_formats()]
+        if self.ia:
+            services.append("internet_archive")
+        if self.archivebox and self.archivebox.available:
+            services.append("archivebox")
+        return services
+
+    def run_backend(self, service: str, url: str, force_ia: bool = False) -> Dict[str, Any]:
+        """
+        Run a single archiving backend without touching the database.
+
+        Safe to call concurrently for different backends - each client
+        keeps its own state. Pair with record_result() to persist.
+
+        Args:
+            service: 'local_monolith', 'local_warc', 'internet_archive' or 'archivebox'
+            url: URL to archive
+            force_ia: Force new IA snapshot even if already archived
+
+        Returns:
+            The backend client's raw result dict
+        """
+        if service.startswith("local_"):
+            local_format = service.replace("local_", "")
+            logger.info(f"[Archiving] Starting local archive ({local_format}) for {url}")
+            if self.capture_pool is not None:
+                return self.capture_pool.capture(url, format=local_format, timeout=60)
+            return self.local.archive_url(url, format=local_format, timeout=60)
+
+        if service == "internet_archive":
+            if not self.ia:
+                return {"status": "error", "url": url, "error": "IA client not configured"}
             logger.info(f"[Archiving] Starting Internet Archive for {url}")
+            return self.ia.save_url(url, force=force_ia)
+
+        if service == "archivebox":
+            if not self.archivebox:
+                return {"status": "error", "url": url, "error": "ArchiveBox client not configured"}
+            logger.info(f"[Archiving] Starting ArchiveBox for {url}")
+            return self.archivebox.archive_url(url, timeout=180)
 
-            ia_result = self.ia.save_url(url, force=force_ia)
+        return {"status": "error", "url": url, "error": f"Unknown service: {service}"}
 
-            if ia_result["status"] in ["archived", "already_archived"]:
-                # Record success
-                snapshot_id = self.db.add_archive_snapshot(
-                    link_id=link_id,
-                    service="internet_archive",
-                    snapshot_url=ia_result.get("snapshot_url"),
-                    archive_date=ia_result.get("archive_date"),
-                    status="success",
-                )
+    def record_result(self, link_id: int, service: str, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record a backend result from run_backend() in archive_snapshots.
 
-                results["services"]["internet_archive"] = {
-                    "status": "success",
-                    "snapshot_id": snapshot_id,
-                    "snapshot_url": ia_result.get("snapshot_url"),
-                    "already_archived": ia_result["status"] == "already_archived",
-                }
-                results["success"] = True
+        Args:
+            link_id: Link ID in database
+            service: Service name passed to run_backend()
+            raw: Raw result dict returned by run_backend()
 
-                logger.info(
-                    f"[Archiving] IA archive successful: {ia_result.get('snapshot_url', 'N/A')[:80]}"
-                )
+        Returns:
+            Dict with service, success, result (per-service summary) and error
+        """
+        if service == "internet_archive":
+            succeeded = raw.get("status") in ["archived", "already_archived"]
+        else:
+            succeeded = raw.get("status") == "archived"
+
+        if not succeeded:
+            error_msg = raw.get("error", "Unknown error")
+
+            failure = self.db.record_snapshot_failure(
+                link_id=link_id,
+                service=service,
+                error_message=error_msg,
+            )
 
+            if service.startswith("local_"):
+                label = "Local archive"
+            elif service == "internet_archive":
+                label = "IA archive"
             else:
-                # Record failure
-                error_msg = ia_result.get("error", "Unknown error")
+                label = "ArchiveBox"
 
-                failure = self.db.record_snapshot_failure(
-                    link_id=link_id,
-                    service="internet_archive",
-                    error_message=error_msg,
-                )
+            logger.error(f"[Archiving] {label} failed: {error_msg}")
 
-                results["services"]["internet_archive"] = {
+            return {
+                "service": service,
+                "success": False,
+                "result": {
                     "status": "failed",
                     "error": error_msg,
                     "attempts": failure["attempts"],
-                }
-                results["errors"].append(f"IA archive failed: {error_msg}")
-
-                logger.error(f"[Archiving] IA archive failed: {error_msg}")
-
-        elif use_ia and not self.ia:
-            logger.warning("[Archiving] IA archiving requested but no IA client configured")
-            results["errors"].append("IA client not configured")
+                },
+                "error": f"{label} failed: {error_msg}",
+            }
 
-        # 3. ArchiveBox
-        if use_archivebox and self.archivebox:
-            logger.info(f"[Archiving] Starting ArchiveBox for {url}")
+        if service.startswith("local_"):
+            metadata = {
+                "file_size": raw.get("file_size"),
+                "format": service.replace("local_", ""),
+            }
 
-            ab_result = self.archivebox.archive_url(url, timeout=180)
+            snapshot_id = self.db.add_archive_snapshot(
+                link_id=link_id,
+                service=service,
+                snapshot_url=raw["local_path"],
+                archive_date=raw["archive_date"],
+                status="success",
+                metadata=json.dumps(metadata),
+            )
 
-            if ab_result["status"] == "archived":
-                # Record success
-                metadata = {
-                    "snapshot_id": ab_result.get("snapshot_id"),
-                }
+            result = {
+                "status": "success",
+                "snapshot_id": snapshot_id,
+                "local_path": raw["local_path"],
+                "file_size": raw.get("file_size"),
+            }
 
-                snapshot_id = self.db.add_archive_snapshot(
-                    link_id=link_id,
-                    service="archivebox",
-                    snapshot_url=ab_result.get("archive_url"),
-                    archive_date=ab_result.get("archive_date"),
-                    status="success",
-                    metadata=json.dumps(metadata),
-                )
+            logger.info(f"[Archiving] Local archive successful: {raw['local_path']}")
 
-                results["services"]["archivebox"] = {
-                    "status": "success",
-                    "snapshot_id": snapshot_id,
-                    "archive_url": ab_result.get("archive_url"),
-                    "archivebox_snapshot_id": ab_result.get("snapshot_id"),
-                }
-                results["success"] = True
+        elif service == "internet_archive":
+            snapshot_id = self.db.add_archive_snapshot(
+                link_id=link_id,
+                service="internet_archive",
+                snapshot_url=raw.get("snapshot_url"),
+                archive_date=raw.get("archive_date"),
+                status="success",
+            )
 
-                logger.info(
-                    f"[Archiving] ArchiveBox successful: {ab_result.get('archive_url', 'N/A')}"
-                )
+            result = {
+                "status": "success",
+                "snapshot_id": snapshot_id,
+                "snapshot_url": raw.get("snapshot_url"),
+                "already_archived": raw["status"] == "already_archived",
+            }
 
-            else:
-                # Record failure
-                error_msg = ab_result.get("error", "Unknown error")
+            logger.info(
+                f"[Archiving] IA archive successful: {(raw.get('snapshot_url') or 'N/A')[:80]}"
+            )
 
-                failure = self.db.record_snapshot_failure(
-                    link_id=link_id,
-                    service="archivebox",
-                    error_message=error_msg,
-                )
+        else:
+            metadata = {
+                "snapshot_id": raw.get("snapshot_id"),
+            }
 
-                results["services"]["archivebox"] = {
-                    "status": "failed",
-                    "error": error_msg,
-                    "attempts": failure["attempts"],
-                }
-                results["errors"].append(f"ArchiveBox failed: {error_msg}")
+            snapshot_id = self.db.add_archive_snapshot(
+                link_id=link_id,
+                service="archivebox",
+                snapshot_url=raw.get("archive_url"),
+                archive_date=raw.get("archive_date"),
+                status="success",
+                metadata=json.dumps(metadata),
+            )
 
-                logger.error(f"[Archiving] ArchiveBox failed: {error_msg}")
+            result = {
+                "status": "success",
+                "snapshot_id": snapshot_id,
+                "archive_url": raw.get("archive_url"),
+                "archivebox_snapshot_id": raw.get("snapshot_id"),
+            }
 
-        elif use_archivebox and not self.archivebox:
-            logger.warning("[Archiving] ArchiveBox requested but no client configured")
-            results["errors"].append("ArchiveBox client not configured")
+            logger.info(f"[Archiving] ArchiveBox successful: {raw.get('archive_url', 'N/A')}")
 
-        return results
+        return {"service": service, "success": True, "result": result, "error": None}
 
     def get_archive_status(self, link_id: int) -> Dict[str, Any]:
         """
@@ -0,0 +1,321 @@
+"""Dedicated worker pool for local monolith/WARC captures.
+
+A capture holds its thread for up to two minutes while monolith or wget
+runs. On the core's shared background executor a few of those starve
+enrichment and classification, so captures get their own workers:
+
+- Own concurrency limit (max_workers), independent of the core executor
+- Each capture process runs under ResourceLimits (memory, CPU time, nice)
+- Tool output is streamed as progress (last line kept per job), and
+  queued or running captures can be cancelled
+- Jobs live in the capture_jobs table. Jobs for a link record their
+  result in archive_snapshots and are picked up again after a restart;
+  jobs whose caller waits for the result (capture()) are not.
+
+    pool = CapturePool(db, LocalArchiveClient(limits=ResourceLimits()))
+    pool.start()
+    job_id = pool.submit(url, "warc", link_id=42)
+    pool.future(job_id).add_done_callback(...)
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from holocene.integrations.local_archive import ArchiveFormat, LocalArchiveClient
+from holocene.storage.archiving import ArchivingService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUTS = {"monolith": 60, "warc": 120}
+
+# Write progress lines to the database at most this often per job
+PROGRESS_WRITE_INTERVAL = 2.0
+
+
+class CapturePool:
+    """Runs local captures from the persistent capture_jobs queue."""
+
+    def __init__(
+        self,
+        db,
+        local_client: LocalArchiveClient,
+        max_workers: int = 2,
+        on_progress: Optional[Callable[[int, str], None]] = None,
+    ):
+        """
+        Initialize capture pool.
+
+        Args:
+            db: Database instance
+            local_client: Client that runs the captures (carries the ResourceLimits)
+            max_workers: Captures running at once
+            on_progress: Called with (job_id, line) for each line of tool output
+        """
+        self.db = db
+        self.local = local_client
+        self.max_workers = max_workers
+        self.on_progress = on_progress
+
+        self._workers: List[threading.Thread] = []
+        self._wakeup = threading.Condition()
+        self._running = False
+
+        self._lock = threading.Lock()
+        self._futures: Dict[int, Future] = {}
+        self._cancel_events: Dict[int, threading.Event] = {}  # Running jobs
+        self._progress: Dict[int, str] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Recover jobs from a previous run and start the workers."""
+        if self._running:
+            return
+
+        recovered = self.db.reset_interrupted_capture_jobs()
+        if any(recovered.values()):
+            logger.info(
+                f"[CapturePool] Requeued {recovered['requeued']} interrupted capture(s), "
+                f"cancelled {recovered['cancelled']} whose caller is gone"
+            )
+
+        self._running = True
+        self._workers = [
+            threading.Thread(target=self._worker_loop, daemon=True, name=f"capture-worker-{i}")
+            for i in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        logger.info(f"[CapturePool] Started {self.max_workers} capture worker(s)")
+
+    def stop(self, wait: bool = True):
+        """
+        Stop the workers. Running captures are killed; link captures are
+        queued again for the next start.
+
+        Args:
+            wait: Wait for the workers to exit
+        """
+        self._running = False
+        with self._wakeup:
+            self._wakeup.notify_all()
+        with self._lock:
+            for event in self._cancel_events.values():
+                event.set()
+
+        if wait:
+            for worker in self._workers:
+                worker.join(timeout=10)
+        self._workers = []
+
+        logger.info("[CapturePool] Stopped")
+
+    def submit(
+        self,
+        url: str,
+        format: ArchiveFormat = "monolith",
+        link_id: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> int:
+        """
+        Queue a capture.
+
+        Args:
+            url: URL to capture
+            format: 'monolith' or 'warc'
+            link_id: Record the result for this link (and resume after restarts)
+            timeout: Capture timeout in seconds (default: DEFAULT_TIMEOUTS)
+
+        Returns:
+            Job ID (see future(), cancel(), get_job())
+        """
+        if format not in DEFAULT_TIMEOUTS:
+            raise ValueError(f"Unknown capture format: {format}")
+
+        job_id = self.db.add_capture_job(url, format, link_id=link_id, timeout=timeout)
+        with self._lock:
+            self._futures[job_id] = Future()
+        with self._wakeup:
+            self._wakeup.notify()
+        return job_id
+
+    def future(self, job_id: int) -> Future:
+        """Future resolving to the job's LocalArchiveClient result dict."""
+        with self._lock:
+            future = self._futures.get(job_id)
+            if future is None:
+                future = self._futures[job_id] = Future()
+
+        if not future.done():
+            job = self.db.get_capture_job(job_id)
+            if job and job["status"] in ("done", "failed", "cancelled"):
+                self._resolve(job_id, self._job_result(job))
+        return future
+
+    def capture(
+        self,
+        url: str,
+        format: ArchiveFormat = "monolith",
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Capture a URL on the pool and wait for the result (drop-in for
+        LocalArchiveClient.archive_url).
+
+        Returns:
+            LocalArchiveClient result dict
+        """
+        if not self._running:
+            raise RuntimeError("Capture pool is not running")
+        job_id = self.submit(url, format, timeout=timeout)
+        return self.future(job_id).result()
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a queued or running capture.
+
+        Returns:
+            True if the job was queued or running
+        """
+        with self._lock:
+            event = self._cancel_events.get(job_id)
+        if event:
+            event.set()  # The worker records the cancellation
+            return True
+
+        job = self.db.get_capture_job(job_id)
+        if not job or job["status"] != "queued":
+            return False
+
+        result = {"status": "cancelled", "url": job["url"], "error": "Cancelled", "message": "Capture was cancelled"}
+        self.db.update_capture_job(
+            job_id, status="cancelled", error=result["error"],
+            result=json.dumps(result), finished_at=datetime.now().isoformat(),
+        )
+        self._resolve(job_id, result)
+        return True
+
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Get a job, with live progress for running captures."""
+        job = self.db.get_capture_job(job_id)
+        if job and job_id in self._progress:
+            job["progress"] = self._progress[job_id]
+        return job
+
+    def get_status(self) -> Dict[str, Any]:
+        """Pool state for status displays."""
+        running = self.db.get_capture_jobs(status="running", limit=self.max_workers)
+        for job in running:
+            job["progress"] = self._progress.get(job["id"], job["progress"])
+        return {
+            "running": self._running,
+            "workers": self.max_workers,
+            "queued": self.db.count_capture_jobs("queued"),
+            "active": [
+                {"id": job["id"], "url": job["url"], "format": job["format"], "progress": job["progress"]}
+                for job in running
+            ],
+        }
+
+    # Internals
+
+    def _worker_loop(self):
+        while self._running:
+            try:
+                job = self.db.claim_capture_job()
+            except Exception as e:
+                logger.error(f"[CapturePool] Failed to claim job: {e}", exc_info=True)
+                job = None
+
+            if job is None:
+                with self._wakeup:
+                    if self._running:
+                        self._wakeup.wait(timeout=30)  # Also picks up jobs queued by other processes
+                continue
+
+            self._run_job(job)
+
+    def _run_job(self, job: Dict[str, Any]):
+        job_id = job["id"]
+        cancel = threading.Event()
+        with self._lock:
+            self._cancel_events[job_id] = cancel
+
+        last_write = [0.0]
+
+        def progress(line: str):
+            if not line:
+                return
+            self._progress[job_id] = line
+            now = time.monotonic()
+            if now - last_write[0] >= PROGRESS_WRITE_INTERVAL:
+                last_write[0] = now
+                self.db.update_capture_job(job_id, progress=line[:500])
+            if self.on_progress:
+                self.on_progress(job_id, line)
+
+        try:
+            try:
+                result = self.local.archive_url(
+                    job["url"],
+                    format=job["format"],
+                    timeout=job["timeout"] or DEFAULT_TIMEOUTS[job["format"]],
+                    progress=progress,
+                    cancel=cancel,
+                )
+            except Exception as e:
+                logger.error(f"[CapturePool] Capture of {job['url']} crashed: {e}", exc_info=True)
+                result = {"status": "error", "url": job["url"], "error": str(e)}
+
+            with self._lock:
+                self._cancel_events.pop(job_id, None)
+            self._progress.pop(job_id, None)
+
+            if result["status"] == "cancelled" and not self._running and job["link_id"] is not None:
+                # Shutting down: run it again after the restart
+                self.db.update_capture_job(job_id, status="queued", progress=None)
+                return
+
+            self._finish(job, result)
+
+        except Exception as e:
+            logger.error(f"[CapturePool] Failed to record capture job {job_id}: {e}", exc_info=True)
+            self._resolve(job_id, {"status": "error", "url": job["url"], "error": str(e)})
+
+    def _finish(self, job: Dict[str, Any], result: Dict[str, Any]):
+        status = {"archived": "done", "cancelled": "cancelled"}.get(result["status"], "failed")
+        self.db.update_capture_job(
+            job["id"],
+            status=status,
+            result=json.dumps(result),
+            error=result.get("error") if status != "done" else None,
+            progress=None,
+            finished_at=datetime.now().isoformat(),
+        )
+
+        if job["link_id"] is not None and status != "cancelled":
+            ArchivingService(self.db, local_client=self.local).record_result(
+                job["link_id"], f"local_{job['format']}", result
+            )
+
+        self._resolve(job["id"], result)
+
+    def _resolve(self, job_id: int, result: Dict[str, Any]):
+        with self._lock:
+            future = self._futures.pop(job_id, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _job_result(job: Dict[str, Any]) -> Dict[str, Any]:
+        if job["result"]:
+            return json.loads(job["result"])
+        return {"status": "error", "url": job["url"], "error": job["error"] or job["status"]}
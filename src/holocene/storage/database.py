@@ -6,10 +6,11 @@ import unicodedata
 import logging
 import threading
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from datetime import datetime, timedelta
 from ..core.models import Activity
 from . import migrations
+from .profiler import ProfiledConnection, QueryProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +139,36 @@ def generate_normalized_key(title: str, first_author: str, year: Optional[int])
     return f"{norm_title}|{norm_author}|{year_str}"
 
 
+def collection_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Current collection sizes and health.
+
+    Exact counts from the tables, so writes that bypass the rollup triggers
+    (restores, manual SQL) can't make them drift; use the daily rollups for
+    per-day series. Takes a bare connection for callers without a Database
+    (e.g. LaneyToolHandler).
+
+    Args:
+        conn: Connection to the Holocene database
+
+    Returns:
+        Dict with books, papers, links, favorites, enriched_books,
+        classified_books and dead_links
+    """
+    row = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM books),
+            (SELECT COUNT(*) FROM papers),
+            (SELECT COUNT(*) FROM links),
+            (SELECT COUNT(*) FROM mercadolivre_favorites),
+            (SELECT COUNT(*) FROM books WHERE enriched_at IS NOT NULL),
+            (SELECT COUNT(*) FROM books WHERE classified_at IS NOT NULL),
+            (SELECT COUNT(*) FROM links WHERE COALESCE(status, 'alive') != 'alive')
+    """).fetchone()
+    keys = ('books', 'papers', 'links', 'favorites', 'enriched_books', 'classified_books', 'dead_links')
+    return dict(zip(keys, row))
+
+
 class Database:
     """SQLite database manager for Holocene.
 
@@ -146,11 +177,18 @@ class Database:
     - Connections are created on-demand when first accessed from a thread
     - WAL mode allows multiple readers + one writer concurrently
     - Foreign keys enabled on every connection
+    - With a QueryProfiler, every statement is timed (see storage/profiler.py)
     """
 
-    def __init__(self, db_path: Path):
-        """Initialize database connection."""
+    def __init__(self, db_path: Path, profiler: Optional[QueryProfiler] = None):
+        """Initialize database connection.
+
+        Args:
+            db_path: Path to the SQLite file
+            profiler: Times every statement on this database's connections (default: off)
+        """
         self.db_path = Path(db_path)
+        self.profiler = profiler
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._local = threading.local()  # Thread-local storage for connections
         self._lock = threading.RLock()  # Lock for schema initialization
@@ -172,8 +210,11 @@ class Database:
             self._local.conn = sqlite3.connect(
                 str(self.db_path),
                 timeout=30.0,  # Wait up to 30s for locks
-                check_same_thread=True  # Each thread has its own connection
+                check_same_thread=True,  # Each thread has its own connection
+                factory=ProfiledConnection if self.profiler else sqlite3.Connection,
             )
+            if self.profiler:
+                self._local.conn.profiler = self.profiler
             self._local.conn.row_factory = sqlite3.Row
 
             # CRITICAL: Enable foreign keys on EVERY connection
@@ -1166,6 +1207,66 @@ class Database:
         cursor.execute("SELECT id FROM links WHERE url = ?", (url,))
         return cursor.fetchone()[0]
 
+    def get_existing_link_urls(self, urls: List[str]) -> set:
+        """Get which of the given URLs are already in the links table.
+
+        Uses the url index in batches instead of loading every link.
+
+        Args:
+            urls: URLs to look up
+
+        Returns:
+            Set of the URLs that already exist
+        """
+        cursor = self.conn.cursor()
+        existing = set()
+        urls = list(set(urls))
+
+        for i in range(0, len(urls), 500):
+            batch = urls[i:i + 500]
+            placeholders = ','.join('?' * len(batch))
+            cursor.execute(f"SELECT url FROM links WHERE url IN ({placeholders})", batch)
+            existing.update(row[0] for row in cursor.fetchall())
+
+        return existing
+
+    def touch_links(self, links: List[Dict]):
+        """Mark existing links as seen again (and update titles), without unwrapping URLs.
+
+        Args:
+            links: Dicts with url and optional title
+        """
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "UPDATE links SET last_seen = ?, title = COALESCE(?, title) WHERE url = ?",
+            [(now, link.get('title') or None, link['url']) for link in links]
+        )
+        self.conn.commit()
+
+    def get_import_state(self, source: str) -> Dict:
+        """Get the saved incremental-import state for a source ({} if none)."""
+        import json
+
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT state FROM import_state WHERE source = ?", (source,))
+        row = cursor.fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def set_import_state(self, source: str, state: Dict):
+        """Save the incremental-import state for a source."""
+        import json
+
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO import_state (source, state, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(source) DO UPDATE SET
+                state = excluded.state,
+                updated_at = excluded.updated_at
+        """, (source, json.dumps(state), datetime.now().isoformat()))
+        self.conn.commit()
+
     def get_links(
         self,
         archived: Optional[bool] = None,
@@ -1197,6 +1298,41 @@ class Database:
 
         return [dict(row) for row in rows]
 
+    def search_links_ranked(self, keywords: List[str], limit: int = 20) -> List[Dict]:
+        """
+        Search all links by title and URL using the links_fts index.
+
+        Keywords are OR-ed prefix terms; results are ranked by BM25 with
+        title matches weighted above URL matches.
+
+        Args:
+            keywords: List of keywords to search
+            limit: Maximum results
+
+        Returns:
+            List of link dicts (best first), each with a "score" (higher is better)
+        """
+        terms = []
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if any(ch.isalnum() for ch in keyword):
+                terms.append('"' + keyword.replace('"', '""') + '"*')
+
+        if not terms:
+            return []
+
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT l.*, -bm25(links_fts, 3.0, 2.0) AS score
+            FROM links_fts
+            JOIN links l ON l.id = links_fts.rowid
+            WHERE links_fts MATCH ?
+            ORDER BY score DESC
+            LIMIT ?
+        """, (" OR ".join(terms), limit))
+
+        return [dict(row) for row in cursor.fetchall()]
+
     def update_link_archive_status(self, url: str, archived: bool, archive_url: str = None, archive_date: str = None):
         """Update archive status for a link (successful archive)."""
         cursor = self.conn.cursor()
@@ -1454,6 +1590,189 @@ class Database:
 
         return [dict(row) for row in rows]
 
+    def get_links_needing_archive(
+        self,
+        service: str,
+        limit: int = 50,
+        max_attempts: int = 3,
+        exclude_ids: Optional[List[int]] = None,
+    ) -> List[Dict]:
+        """Get links that still need a snapshot from a given service.
+
+        Skips links that already have a successful or pending snapshot for
+        the service, and failed ones that are backing off or out of attempts.
+
+        Args:
+            service: Service name ('local_monolith', 'internet_archive', etc.)
+            limit: Maximum links to return
+            max_attempts: Give up on a link after this many failed attempts
+            exclude_ids: Link IDs to skip (e.g., already in flight)
+
+        Returns:
+            List of dicts with id and url, oldest links first
+        """
+        cursor = self.conn.cursor()
+        now = datetime.now().isoformat()
+
+        query = """
+            SELECT l.id, l.url FROM links l
+            WHERE NOT EXISTS (
+                SELECT 1 FROM archive_snapshots s
+                WHERE s.link_id = l.id AND s.service = ?
+                  AND (s.status IN ('success', 'pending')
+                       OR (s.status = 'failed'
+                           AND (s.attempts >= ? OR s.next_retry_after > ?)))
+            )
+        """
+        params = [service, max_attempts, now]
+
+        if exclude_ids:
+            placeholders = ','.join('?' * len(exclude_ids))
+            query += f" AND l.id NOT IN ({placeholders})"
+            params.extend(exclude_ids)
+
+        query += " ORDER BY l.id LIMIT ?"
+        params.append(limit)
+
+        cursor.execute(query, params)
+        return [{'id': row[0], 'url': row[1]} for row in cursor.fetchall()]
+
+    def delete_archive_snapshot(self, snapshot_id: int):
+        """Delete an archive snapshot row (e.g., a resolved 'pending' marker)."""
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM archive_snapshots WHERE id = ?", (snapshot_id,))
+        self.conn.commit()
+
+    def clear_pending_snapshots(self, service: Optional[str] = None) -> int:
+        """Delete 'pending' snapshot markers left behind by an interrupted run.
+
+        Args:
+            service: Only clear this service (None = all services)
+
+        Returns:
+            Number of rows deleted
+        """
+        cursor = self.conn.cursor()
+        if service:
+            cursor.execute(
+                "DELETE FROM archive_snapshots WHERE status = 'pending' AND service = ?",
+                (service,)
+            )
+        else:
+            cursor.execute("DELETE FROM archive_snapshots WHERE status = 'pending'")
+        self.conn.commit()
+        return cursor.rowcount
+
+    def get_git_repo_states(self) -> Dict[str, Dict]:
+        """Get the indexed ref state of every known git repo.
+
+        Returns:
+            Dict of repo path -> {name, ref_tips, refs_mtime, last_indexed}
+        """
+        import json
+
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT path, name, ref_tips, refs_mtime, last_indexed FROM git_repos")
+        return {
+            row['path']: {
+                'name': row['name'],
+                'ref_tips': json.loads(row['ref_tips'] or '[]'),
+                'refs_mtime': row['refs_mtime'],
+                'last_indexed': row['last_indexed'],
+            }
+            for row in cursor.fetchall()
+        }
+
+    def index_git_commits(
+        self,
+        repo_path: str,
+        name: str,
+        commits: List[Dict],
+        ref_tips: List[str],
+        refs_mtime: Optional[float],
+    ) -> int:
+        """Record new commits for a repo and the ref state they were read at.
+
+        Args:
+            repo_path: Repository path
+            name: Repository name
+            commits: Dicts with hash, author, date, committed_at, subject
+            ref_tips: Commit hashes of all refs when the commits were read
+            refs_mtime: Ref files fingerprint when the commits were read
+
+        Returns:
+            Number of commits that weren't indexed yet
+        """
+        import json
+
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO git_repos (path, name, ref_tips, refs_mtime, last_indexed)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                name = excluded.name,
+                ref_tips = excluded.ref_tips,
+                refs_mtime = excluded.refs_mtime,
+                last_indexed = excluded.last_indexed
+        """, (repo_path, name, json.dumps(ref_tips), refs_mtime, datetime.now().isoformat()))
+
+        before = self.conn.total_changes
+        cursor.executemany("""
+            INSERT OR IGNORE INTO git_commits (repo_path, hash, author, date, committed_at, subject)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (repo_path, c['hash'], c['author'], c['date'], c['committed_at'], c['subject'])
+            for c in commits
+        ])
+        added = self.conn.total_changes - before
+
+        self.conn.commit()
+        return added
+
+    def remove_git_repos(self, repo_paths: List[str]):
+        """Drop repos (and their indexed commits) that no longer exist on disk."""
+        if not repo_paths:
+            return
+        cursor = self.conn.cursor()
+        placeholders = ','.join('?' * len(repo_paths))
+        cursor.execute(f"DELETE FROM git_commits WHERE repo_path IN ({placeholders})", repo_paths)
+        cursor.execute(f"DELETE FROM git_repos WHERE path IN ({placeholders})", repo_paths)
+        self.conn.commit()
+
+    def get_git_commits_since(
+        self,
+        since: datetime,
+        repo_paths: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """Get indexed commits since a date, newest first.
+
+        Args:
+            since: Start time (naive = local time, like git log --since)
+            repo_paths: Only these repos (None = all indexed repos)
+
+        Returns:
+            List of dicts with repo_path, repo_name, hash, author, date, subject
+        """
+        cursor = self.conn.cursor()
+        query = """
+            SELECT c.repo_path, r.name AS repo_name, c.hash, c.author, c.date, c.subject
+            FROM git_commits c
+            JOIN git_repos r ON r.path = c.repo_path
+            WHERE c.committed_at >= ?
+        """
+        params = [int(since.timestamp())]
+
+        if repo_paths is not None:
+            if not repo_paths:
+                return []
+            placeholders = ','.join('?' * len(repo_paths))
+            query += f" AND c.repo_path IN ({placeholders})"
+            params.extend(repo_paths)
+
+        query += " ORDER BY c.committed_at DESC"
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
     def insert_book(
         self,
         title: str,
@@ -2342,6 +2661,509 @@ class Database:
         )
         self.conn.commit()
 
+    def update_mercadolivre_enrichment(self, rows: List[Dict], commit: bool = True):
+        """Store product page data for several favorites at once.
+
+        Args:
+            rows: Dicts with item_id, description, original_price, specifications
+                (JSON string), seller_nickname, seller_reputation, reviews_rating,
+                reviews_total, warranty, free_shipping, enriched_at, cached_html_path
+            commit: Commit immediately (False lets the caller group this with
+                other writes in one transaction)
+        """
+        if not rows:
+            return
+
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            """
+            UPDATE mercadolivre_favorites
+            SET description = :description,
+                original_price = :original_price,
+                specifications = :specifications,
+                seller_nickname = :seller_nickname,
+                seller_reputation = :seller_reputation,
+                reviews_rating = :reviews_rating,
+                reviews_total = :reviews_total,
+                warranty = :warranty,
+                free_shipping = :free_shipping,
+                enriched_at = :enriched_at,
+                cached_html_path = COALESCE(:cached_html_path, cached_html_path)
+            WHERE item_id = :item_id
+            """,
+            rows,
+        )
+        if commit:
+            self.conn.commit()
+
+    # ========================================================================
+    # Crawl frontier
+    # ========================================================================
+
+    def enqueue_crawl_urls(self, job: str, entries: List[tuple], refresh: bool = False) -> int:
+        """Add (key, url) pairs to a crawl job's frontier.
+
+        New keys are queued. Failed keys are re-queued with a fresh attempt
+        count, and finished keys only when refresh is set. Keys being
+        crawled right now are left alone.
+
+        Args:
+            job: Crawl job name
+            entries: List of (key, url) tuples
+            refresh: Also re-queue keys that were already crawled
+
+        Returns:
+            Number of entries queued
+        """
+        from urllib.parse import urlparse
+
+        now = datetime.now().isoformat()
+        requeue = "('failed', 'done')" if refresh else "('failed')"
+
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            f"""
+            INSERT INTO crawl_frontier (job, key, url, host, status, added_at, updated_at)
+            VALUES (?, ?, ?, ?, 'pending', ?, ?)
+            ON CONFLICT(job, key) DO UPDATE SET
+                url = excluded.url,
+                host = excluded.host,
+                status = 'pending',
+                attempts = 0,
+                next_attempt_at = NULL,
+                last_error = NULL,
+                updated_at = excluded.updated_at
+            WHERE crawl_frontier.status IN {requeue}
+            """,
+            [(job, key, url, urlparse(url).netloc.lower(), now, now) for key, url in entries],
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def claim_crawl_entries(self, job: str, limit: int) -> List[Dict]:
+        """Take due pending entries from a crawl frontier, marking them in_progress.
+
+        Args:
+            job: Crawl job name
+            limit: Maximum entries to claim
+
+        Returns:
+            List of frontier row dicts, oldest first
+        """
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT * FROM crawl_frontier
+            WHERE job = ? AND status = 'pending'
+              AND (next_attempt_at IS NULL OR next_attempt_at <= ?)
+            ORDER BY id
+            LIMIT ?
+        """, (job, now, limit))
+        entries = [dict(row) for row in cursor.fetchall()]
+
+        if entries:
+            cursor.executemany(
+                "UPDATE crawl_frontier SET status = 'in_progress', updated_at = ? WHERE id = ?",
+                [(now, entry["id"]) for entry in entries],
+            )
+            self.conn.commit()
+
+        return entries
+
+    def complete_crawl_entries(self, outcomes: List[Dict], commit: bool = True):
+        """Record crawl outcomes in the frontier.
+
+        Args:
+            outcomes: Dicts with id, status, attempts, next_attempt_at, etag,
+                last_modified, last_status, last_error
+            commit: Commit immediately
+        """
+        if not outcomes:
+            return
+
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            """
+            UPDATE crawl_frontier
+            SET status = :status,
+                attempts = :attempts,
+                next_attempt_at = :next_attempt_at,
+                etag = COALESCE(:etag, etag),
+                last_modified = COALESCE(:last_modified, last_modified),
+                last_status = :last_status,
+                last_error = :last_error,
+                updated_at = :updated_at
+            WHERE id = :id
+            """,
+            [{**outcome, "updated_at": now} for outcome in outcomes],
+        )
+        if commit:
+            self.conn.commit()
+
+    def reset_crawl_in_progress(self, job: str, ids: Optional[List[int]] = None) -> int:
+        """Put in_progress entries back to pending (after an interrupted crawl).
+
+        Args:
+            job: Crawl job name
+            ids: Only these entries (default: all in_progress entries of the job)
+
+        Returns:
+            Number of entries reset
+        """
+        cursor = self.conn.cursor()
+        if ids is None:
+            cursor.execute(
+                "UPDATE crawl_frontier SET status = 'pending' WHERE job = ? AND status = 'in_progress'",
+                (job,),
+            )
+        else:
+            cursor.executemany(
+                "UPDATE crawl_frontier SET status = 'pending' WHERE job = ? AND id = ? AND status = 'in_progress'",
+                [(job, entry_id) for entry_id in ids],
+            )
+        count = cursor.rowcount
+        self.conn.commit()
+        return count
+
+    def get_crawl_stats(self, job: str) -> Dict[str, int]:
+        """Count a crawl job's frontier entries by status.
+
+        Args:
+            job: Crawl job name
+
+        Returns:
+            Dict of status -> count (plus "due": pending entries ready now)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT status, COUNT(*) FROM crawl_frontier WHERE job = ? GROUP BY status",
+            (job,),
+        )
+        stats = {"pending": 0, "in_progress": 0, "done": 0, "failed": 0}
+        stats.update({row[0]: row[1] for row in cursor.fetchall()})
+
+        cursor.execute("""
+            SELECT COUNT(*) FROM crawl_frontier
+            WHERE job = ? AND status = 'pending'
+              AND (next_attempt_at IS NULL OR next_attempt_at <= ?)
+        """, (job, datetime.now().isoformat()))
+        stats["due"] = cursor.fetchone()[0]
+        return stats
+
+    # ========================================================================
+    # Scheduler
+    # ========================================================================
+
+    def get_scheduled_job(self, name: str) -> Optional[Dict]:
+        """Get the persisted state of a scheduler job.
+
+        Args:
+            name: Job name
+
+        Returns:
+            Dict with last_run_at, last_error, run_count, or None if never run
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM scheduler_jobs WHERE name = ?", (name,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def record_scheduled_job_run(self, name: str, started_at: str, error: Optional[str] = None):
+        """Record that a scheduler job ran.
+
+        Args:
+            name: Job name
+            started_at: ISO timestamp the run started
+            error: Error message if the run failed
+        """
+        now = datetime.now().isoformat()
+        self.conn.execute("""
+            INSERT INTO scheduler_jobs (name, last_run_at, last_error, run_count, updated_at)
+            VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                last_run_at = excluded.last_run_at,
+                last_error = excluded.last_error,
+                run_count = scheduler_jobs.run_count + 1,
+                updated_at = excluded.updated_at
+        """, (name, started_at, error, now))
+        self.conn.commit()
+
+    # ========================================================================
+    # Daily Rollups
+    # ========================================================================
+
+    def get_daily_rollups(self, since: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Get daily counters maintained by the rollup triggers.
+
+        Args:
+            since: First day to include (YYYY-MM-DD), None for all days
+
+        Returns:
+            Dict of day -> {metric: count}, days in ascending order
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT day, metric, count FROM daily_rollups
+            WHERE day >= ?
+            ORDER BY day
+        """, (since or '',))
+
+        rollups: Dict[str, Dict[str, int]] = {}
+        for day, metric, count in cursor.fetchall():
+            rollups.setdefault(day, {})[metric] = count
+        return rollups
+
+    def get_rollup_totals(self, since: Optional[str] = None) -> Dict[str, int]:
+        """Sum daily counters per metric.
+
+        Args:
+            since: First day to include (YYYY-MM-DD), None for all time
+
+        Returns:
+            Dict of metric -> total
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT metric, SUM(count) FROM daily_rollups
+            WHERE day >= ?
+            GROUP BY metric
+        """, (since or '',))
+        return {metric: total for metric, total in cursor.fetchall()}
+
+    def get_collection_counts(self) -> Dict[str, int]:
+        """Current collection sizes and health (see collection_counts())."""
+        return collection_counts(self.conn)
+
+    # ========================================================================
+    # Capture Jobs
+    # ========================================================================
+
+    def add_capture_job(
+        self,
+        url: str,
+        format: str,
+        link_id: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> int:
+        """Queue a local capture for the capture workers.
+
+        Args:
+            url: URL to capture
+            format: 'monolith' or 'warc'
+            link_id: Link to record the result for (None = caller waits for it)
+            timeout: Capture timeout in seconds (None = format default)
+
+        Returns:
+            Job ID
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO capture_jobs (url, format, link_id, timeout, status, created_at)
+            VALUES (?, ?, ?, ?, 'queued', ?)
+        """, (url, format, link_id, timeout, datetime.now().isoformat()))
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def claim_capture_job(self) -> Optional[Dict]:
+        """Mark the oldest queued capture job running and return it.
+
+        Returns:
+            Job dict, or None if nothing is queued
+        """
+        cursor = self.conn.cursor()
+        while True:
+            cursor.execute("SELECT id FROM capture_jobs WHERE status = 'queued' ORDER BY id LIMIT 1")
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            cursor.execute("""
+                UPDATE capture_jobs
+                SET status = 'running', started_at = ?, attempts = attempts + 1
+                WHERE id = ? AND status = 'queued'
+            """, (datetime.now().isoformat(), row[0]))
+            self.conn.commit()
+            if cursor.rowcount:  # Otherwise another worker got it first
+                return self.get_capture_job(row[0])
+
+    def update_capture_job(self, job_id: int, **fields):
+        """Update capture job columns (status, progress, result, error, finished_at).
+
+        Args:
+            job_id: Job ID
+            **fields: Column values to set
+        """
+        allowed = {'status', 'progress', 'result', 'error', 'finished_at'}
+        unknown = set(fields) - allowed
+        if unknown:
+            raise ValueError(f"Unknown capture job fields: {', '.join(sorted(unknown))}")
+
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        self.conn.execute(
+            f"UPDATE capture_jobs SET {assignments} WHERE id = ?",
+            (*fields.values(), job_id),
+        )
+        self.conn.commit()
+
+    def get_capture_job(self, job_id: int) -> Optional[Dict]:
+        """Get a capture job by ID."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM capture_jobs WHERE id = ?", (job_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def get_capture_jobs(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """List capture jobs, newest first.
+
+        Args:
+            status: Only jobs with this status
+            limit: Maximum jobs to return
+        """
+        cursor = self.conn.cursor()
+        if status:
+            cursor.execute(
+                "SELECT * FROM capture_jobs WHERE status = ? ORDER BY id DESC LIMIT ?", (status, limit)
+            )
+        else:
+            cursor.execute("SELECT * FROM capture_jobs ORDER BY id DESC LIMIT ?", (limit,))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def count_capture_jobs(self, status: str) -> int:
+        """Count capture jobs with a status."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM capture_jobs WHERE status = ?", (status,))
+        return cursor.fetchone()[0]
+
+    def reset_interrupted_capture_jobs(self) -> Dict[str, int]:
+        """Recover capture jobs left over from a previous run (call before starting workers).
+
+        Jobs recording into a link are queued again. Jobs whose caller was
+        waiting for the result are cancelled - that caller is gone.
+
+        Returns:
+            Dict with requeued and cancelled counts
+        """
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            UPDATE capture_jobs SET status = 'queued', started_at = NULL, progress = NULL
+            WHERE status = 'running' AND link_id IS NOT NULL
+        """)
+        requeued = cursor.rowcount
+        cursor.execute("""
+            UPDATE capture_jobs SET status = 'cancelled', error = 'Interrupted by restart', finished_at = ?
+            WHERE status IN ('queued', 'running') AND link_id IS NULL
+        """, (now,))
+        cancelled = cursor.rowcount
+        self.conn.commit()
+        return {'requeued': requeued, 'cancelled': cancelled}
+
+    # ========================================================================
+    # Paper full-text analysis
+    # ========================================================================
+
+    def get_unanalyzed_papers(self, limit: Optional[int] = None, exclude_ids=()) -> List[Dict]:
+        """Get papers with a local PDF whose full text hasn't been analyzed, oldest first.
+
+        Args:
+            limit: Max results
+            exclude_ids: Paper IDs to skip (e.g. already being analyzed)
+
+        Returns:
+            List of paper dicts
+        """
+        query = """
+            SELECT * FROM papers
+            WHERE full_text_analyzed = 0
+              AND local_pdf_path IS NOT NULL AND local_pdf_path != ''
+        """
+        params: List[Any] = []
+        exclude_ids = list(exclude_ids)
+        if exclude_ids:
+            query += f" AND id NOT IN ({','.join('?' * len(exclude_ids))})"
+            params.extend(exclude_ids)
+        query += " ORDER BY added_at ASC, id ASC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def update_paper_analysis(
+        self,
+        paper_id: int,
+        summary: str,
+        analysis_pages: Optional[int],
+        total_pages: Optional[int],
+        full_text_analyzed: bool = True,
+        abstract: Optional[str] = None,
+    ) -> bool:
+        """Save the result of analyzing a paper's PDF.
+
+        Args:
+            paper_id: Paper ID
+            summary: Markdown summary
+            analysis_pages: Pages the summary is based on
+            total_pages: Pages in the PDF
+            full_text_analyzed: Whether the whole PDF was read
+            abstract: Abstract found in the PDF (only fills an empty abstract)
+
+        Returns:
+            True if the paper exists
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            UPDATE papers
+            SET summary = ?,
+                analysis_pages = ?,
+                total_pages = ?,
+                full_text_analyzed = ?,
+                last_analyzed_at = ?,
+                abstract = COALESCE(NULLIF(abstract, ''), ?)
+            WHERE id = ?
+        """, (
+            summary, analysis_pages, total_pages, 1 if full_text_analyzed else 0,
+            datetime.now().isoformat(), abstract, paper_id,
+        ))
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def get_paper_chunk_summaries(self, pdf_hash: str, chunk_chars: int) -> Dict[int, str]:
+        """Cached chunk summaries of a PDF (chunk index -> summary)."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT chunk_index, summary FROM paper_chunks WHERE pdf_hash = ? AND chunk_chars = ?",
+            (pdf_hash, chunk_chars),
+        )
+        return {row["chunk_index"]: row["summary"] for row in cursor.fetchall()}
+
+    def save_paper_chunk_summary(
+        self,
+        pdf_hash: str,
+        chunk_chars: int,
+        chunk_index: int,
+        summary: str,
+        sections: Optional[str] = None,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        chars: Optional[int] = None,
+        model: Optional[str] = None,
+    ):
+        """Cache one chunk's summary (replaces an existing one)."""
+        self.conn.execute("""
+            INSERT OR REPLACE INTO paper_chunks (
+                pdf_hash, chunk_chars, chunk_index, sections, start_page, end_page,
+                chars, summary, model, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            pdf_hash, chunk_chars, chunk_index, sections, start_page, end_page,
+            chars, summary, model, datetime.now().isoformat(),
+        ))
+        self.conn.commit()
+
     # ========================================================================
     # Inventory Management
     # ========================================================================
@@ -0,0 +1,368 @@
+"""Streaming collection exports (CSV, JSONL, Parquet).
+
+Rows are read from the cursor in fetchmany() batches and written as they
+arrive, so exporting 100k+ links runs in constant memory:
+
+    with open("links.csv.gz", "wb") as f:
+        export_collection(conn, "links", f, fmt="csv", compress=True)
+
+iter_export() yields the same bytes chunk by chunk, for HTTP responses.
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+FETCH_SIZE = 1000  # Rows per fetchmany() batch
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """What to export from one collection table."""
+
+    table: str
+    columns: Tuple[Tuple[str, str, str], ...]  # (column, CSV header, type: int/str)
+    search_columns: Tuple[str, ...]  # LIKE-matched by the query filter
+    order_by: str
+
+    @property
+    def names(self) -> List[str]:
+        return [column for column, _, _ in self.columns]
+
+    @property
+    def headers(self) -> List[str]:
+        return [header for _, header, _ in self.columns]
+
+
+COLLECTIONS = {
+    "books": ExportSpec(
+        table="books",
+        columns=(
+            ("id", "ID", "int"),
+            ("title", "Title", "str"),
+            ("author", "Authors", "str"),
+            ("isbn", "ISBN", "str"),
+            ("publication_year", "Year", "int"),
+            ("publisher", "Publisher", "str"),
+            ("dewey_decimal", "Dewey", "str"),
+            ("cutter_number", "Cutter", "str"),
+            ("call_number", "Call Number", "str"),
+            ("subjects", "Subjects", "str"),
+            ("enriched_summary", "Summary", "str"),
+            ("created_at", "Added", "str"),
+        ),
+        search_columns=("title", "author", "subjects"),
+        order_by="title",
+    ),
+    "links": ExportSpec(
+        table="links",
+        columns=(
+            ("id", "ID", "int"),
+            ("url", "URL", "str"),
+            ("title", "Title", "str"),
+            ("source", "Source", "str"),
+            ("trust_tier", "Trust Tier", "str"),
+            ("created_at", "Created", "str"),
+            ("archive_url", "Archive URL", "str"),
+            ("last_checked", "Last Checked", "str"),
+            ("status_code", "Status", "int"),
+        ),
+        search_columns=("url", "title"),
+        order_by="created_at DESC",
+    ),
+    "papers": ExportSpec(
+        table="papers",
+        columns=(
+            ("id", "ID", "int"),
+            ("title", "Title", "str"),
+            ("authors", "Authors", "str"),
+            ("doi", "DOI", "str"),
+            ("arxiv_id", "arXiv ID", "str"),
+            ("publication_date", "Published", "str"),
+            ("abstract", "Abstract", "str"),
+            ("url", "URL", "str"),
+            ("added_at", "Added", "str"),
+        ),
+        search_columns=("title", "authors", "abstract"),
+        order_by="added_at DESC",
+    ),
+}
+
+
+def iter_batches(
+    conn,
+    collection: str,
+    query: Optional[str] = None,
+    limit: Optional[int] = None,
+    fetch_size: int = FETCH_SIZE,
+) -> Iterator[List[tuple]]:
+    """
+    Read a collection in fetchmany() batches.
+
+    Args:
+        conn: sqlite3 connection
+        collection: Key of COLLECTIONS
+        query: Optional substring filter over the search columns
+        limit: Max rows (None = all)
+        fetch_size: Rows per batch
+
+    Yields:
+        Lists of row tuples, in the collection's export order
+    """
+    spec = COLLECTIONS[collection]
+    sql = f"SELECT {', '.join(spec.names)} FROM {spec.table}"
+    params: list = []
+    if query:
+        sql += " WHERE " + " OR ".join(f"{column} LIKE ?" for column in spec.search_columns)
+        params += [f"%{query}%"] * len(spec.search_columns)
+    sql += f" ORDER BY {spec.order_by} LIMIT ?"
+    params.append(limit if limit else -1)
+
+    cursor = conn.execute(sql, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                return
+            yield [tuple(row) for row in rows]
+    finally:
+        cursor.close()
+
+
+class _CsvWriter:
+    def __init__(self, stream: BinaryIO, spec: ExportSpec):
+        self.text = io.TextIOWrapper(stream, encoding="utf-8", newline="", write_through=True)
+        self.writer = csv.writer(self.text)
+        self.writer.writerow(spec.headers)
+
+    def write(self, rows: List[tuple]):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.text.flush()
+        self.text.detach()  # Leave the underlying stream open
+
+
+class _JsonlWriter:
+    def __init__(self, stream: BinaryIO, spec: ExportSpec):
+        self.stream = stream
+        self.names = spec.names
+
+    def write(self, rows: List[tuple]):
+        lines = "".join(json.dumps(dict(zip(self.names, row)), ensure_ascii=False) + "\n" for row in rows)
+        self.stream.write(lines.encode("utf-8"))
+
+    def close(self):
+        pass
+
+
+def _coerce(value, kind: str):
+    """Make loosely-typed SQLite values fit the Parquet column type."""
+    if value is None or value == "":
+        return None
+    if kind == "int":
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    return str(value)
+
+
+class _ParquetWriter:
+    def __init__(self, stream: BinaryIO, spec: ExportSpec, compression: str):
+        if not HAS_PYARROW:
+            raise ImportError("Parquet export requires pyarrow (pip install holocene[parquet])")
+        self.types = [kind for _, _, kind in spec.columns]
+        self.schema = pa.schema([
+            (column, pa.int64() if kind == "int" else pa.string())
+            for column, _, kind in spec.columns
+        ])
+        # One row group per batch
+        self.writer = pq.ParquetWriter(stream, self.schema, compression=compression)
+
+    def write(self, rows: List[tuple]):
+        arrays = [
+            pa.array([_coerce(value, kind) for value in column], type=field.type)
+            for column, kind, field in zip(zip(*rows), self.types, self.schema)
+        ]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def _export_steps(
+    conn,
+    collection: str,
+    out: BinaryIO,
+    fmt: str,
+    query: Optional[str],
+    limit: Optional[int],
+    compress: bool,
+) -> Iterator[int]:
+    """Write the export to `out` one batch at a time, yielding the running row count."""
+    if collection not in COLLECTIONS:
+        raise ValueError(f"Unknown collection: {collection} (expected one of {', '.join(COLLECTIONS)})")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(EXPORT_FORMATS)})")
+
+    spec = COLLECTIONS[collection]
+    if fmt == "parquet":
+        # Parquet compresses internally; gzip selects its codec instead of wrapping the file
+        stream = out
+        writer = _ParquetWriter(stream, spec, compression="gzip" if compress else "snappy")
+    else:
+        stream = gzip.GzipFile(fileobj=out, mode="wb") if compress else out
+        writer = _CsvWriter(stream, spec) if fmt == "csv" else _JsonlWriter(stream, spec)
+
+    count = 0
+    try:
+        for batch in iter_batches(conn, collection, query, limit):
+            writer.write(batch)
+            count += len(batch)
+            yield count
+    finally:
+        writer.close()
+        if stream is not out:
+            stream.close()
+
+
+def export_collection(
+    conn,
+    collection: str,
+    out: BinaryIO,
+    fmt: str = "csv",
+    query: Optional[str] = None,
+    limit: Optional[int] = None,
+    compress: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Stream a collection to a binary file object.
+
+    Args:
+        conn: sqlite3 connection
+        collection: 'books', 'links' or 'papers'
+        out: Binary file object to write to (left open)
+        fmt: 'csv', 'jsonl' or 'parquet'
+        query: Optional substring filter
+        limit: Max rows (None = all)
+        compress: gzip the output (Parquet: gzip codec)
+        progress: Called with the running row count after each batch
+
+    Returns:
+        Number of rows exported
+    """
+    count = 0
+    for count in _export_steps(conn, collection, out, fmt, query, limit, compress):
+        if progress:
+            progress(count)
+    return count
+
+
+def export_to_path(
+    conn,
+    collection: str,
+    path: Path,
+    fmt: Optional[str] = None,
+    query: Optional[str] = None,
+    limit: Optional[int] = None,
+    compress: Optional[bool] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Stream a collection to a file, guessing format and gzip from the name if not given.
+
+    Returns:
+        Number of rows exported
+    """
+    path = Path(path)
+    suffixes = [s.lstrip(".") for s in path.suffixes]
+    if compress is None:
+        compress = bool(suffixes) and suffixes[-1] == "gz"
+    if fmt is None:
+        fmt = next((s for s in reversed(suffixes) if s in EXPORT_FORMATS), "csv")
+
+    try:
+        with open(path, "wb") as f:
+            return export_collection(conn, collection, f, fmt, query, limit, compress, progress)
+    except BaseException:
+        path.unlink(missing_ok=True)  # Don't leave a truncated export behind
+        raise
+
+
+class _ChunkSink(io.RawIOBase):
+    """Collects written bytes until taken (for streaming responses)."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_export(
+    conn,
+    collection: str,
+    fmt: str = "csv",
+    query: Optional[str] = None,
+    limit: Optional[int] = None,
+    compress: bool = False,
+) -> Iterator[bytes]:
+    """
+    Stream a collection as byte chunks (one per batch), e.g. for an HTTP response.
+
+    Yields:
+        Encoded export data
+    """
+    sink = _ChunkSink()
+    for _ in _export_steps(conn, collection, sink, fmt, query, limit, compress):
+        chunk = sink.take()
+        if chunk:
+            yield chunk
+    tail = sink.take()  # Trailers written on close (gzip, Parquet footer)
+    if tail:
+        yield tail
+
+
+def export_filename(collection: str, fmt: str = "csv", compress: bool = False) -> str:
+    """Timestamped file name for an export, e.g. links_export_20250101_120000.csv.gz."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    name = f"{collection}_export_{timestamp}.{fmt}"
+    return name + ".gz" if compress and fmt != "parquet" else name
+
+
+def export_mimetype(fmt: str, compress: bool = False) -> str:
+    """Content type for an export response."""
+    if compress and fmt != "parquet":
+        return "application/gzip"
+    return {
+        "csv": "text/csv",
+        "jsonl": "application/x-ndjson",
+        "parquet": "application/vnd.apache.parquet",
+    }[fmt]
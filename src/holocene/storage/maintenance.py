@@ -0,0 +1,336 @@
+"""Routine maintenance for holocene.db.
+
+holod keeps the database open for weeks. Without maintenance the WAL file
+grows whenever a long reader blocks the automatic checkpoint, query plans
+go stale as tables grow, freed pages are never returned to the filesystem,
+and log-like tables (laney_messages, api_cache, archive_snapshots,
+capture_jobs) grow without bound. DatabaseMaintenance covers each:
+
+- checkpoint(): PRAGMA wal_checkpoint(TRUNCATE) once the WAL passes
+  wal_checkpoint_mb, so the -wal file shrinks back to zero bytes
+- optimize(): PRAGMA optimize, plus a full ANALYZE when asked (or when the
+  database has never been analyzed)
+- incremental_vacuum(): returns free pages to the filesystem (needs
+  auto_vacuum = INCREMENTAL, set by migration 30)
+- apply_retention(): per-table RETENTION_POLICIES, deleting old rows or
+  moving them to an archive database (data_dir/holocene-archive.db)
+
+    maintenance = DatabaseMaintenance(db, config.maintenance, archive_path)
+    report = maintenance.run(analyze=True)
+    print(report["reclaimed_bytes"])
+"""
+
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+
+@dataclass
+class RetentionPolicy:
+    """How old rows of one table are cleaned up.
+
+    Rows whose age_column is older than the table's retention days (and that
+    match where, if set) are deleted, or copied to the archive database
+    first when archive is set.
+    """
+
+    table: str
+    age_column: str
+    where: Optional[str] = None  # Extra SQL condition on the table's columns
+    archive: bool = False
+    description: str = ""
+
+
+RETENTION_POLICIES = {
+    "laney_messages": RetentionPolicy(
+        table="laney_messages",
+        age_column="created_at",
+        where="conversation_id IN (SELECT id FROM laney_conversations WHERE is_active = 0)",
+        archive=True,
+        description="Messages of closed conversations move to the archive database",
+    ),
+    "api_cache": RetentionPolicy(
+        table="api_cache",
+        age_column="created_at",
+        where="(last_hit_at IS NULL OR last_hit_at < :cutoff)",
+        description="Cached API responses not hit within the retention period",
+    ),
+    "archive_snapshots": RetentionPolicy(
+        table="archive_snapshots",
+        age_column="updated_at",
+        where=(
+            "status = 'failed' AND EXISTS (SELECT 1 FROM archive_snapshots newer "
+            "WHERE newer.link_id = archive_snapshots.link_id "
+            "AND newer.service = archive_snapshots.service "
+            "AND newer.id > archive_snapshots.id)"
+        ),
+        description="Failed attempts superseded by a later attempt for the same link and service",
+    ),
+    "capture_jobs": RetentionPolicy(
+        table="capture_jobs",
+        age_column="created_at",
+        where="status IN ('done', 'failed', 'cancelled')",
+        description="Finished local capture jobs",
+    ),
+}
+
+
+class DatabaseMaintenance:
+    """Checkpoints, optimizes, vacuums and prunes a Holocene database."""
+
+    def __init__(self, db, settings, archive_path: Optional[Path] = None):
+        """
+        Initialize maintenance.
+
+        Args:
+            db: Database instance (work runs on the calling thread's connection)
+            settings: MaintenanceConfig (thresholds and retention_days)
+            archive_path: Database that archived rows are moved to
+                (default: holocene-archive.db next to the database)
+        """
+        self.db = db
+        self.settings = settings
+        self.archive_path = Path(archive_path) if archive_path else db.db_path.with_name("holocene-archive.db")
+
+    # Inspection
+
+    def wal_size(self) -> int:
+        """Size of the -wal file in bytes (0 if there is none)."""
+        try:
+            return os.path.getsize(f"{self.db.db_path}-wal")
+        except OSError:
+            return 0
+
+    def page_stats(self) -> Dict[str, Any]:
+        """
+        Page and page-cache figures for the database.
+
+        Returns:
+            Dict with page_size, page_count, freelist_count, file_bytes,
+            free_bytes, wal_bytes, auto_vacuum, journal_mode,
+            cache_pages and cache_bytes (the connection's page cache limit)
+        """
+        conn = self.db.conn
+        page_size = _pragma(conn, "page_size")
+        page_count = _pragma(conn, "page_count")
+        freelist_count = _pragma(conn, "freelist_count")
+        cache_size = _pragma(conn, "cache_size")
+
+        # Negative cache_size is a limit in KiB rather than pages
+        cache_bytes = -cache_size * 1024 if cache_size < 0 else cache_size * page_size
+
+        return {
+            "page_size": page_size,
+            "page_count": page_count,
+            "freelist_count": freelist_count,
+            "file_bytes": page_size * page_count,
+            "free_bytes": page_size * freelist_count,
+            "wal_bytes": self.wal_size(),
+            "auto_vacuum": AUTO_VACUUM_MODES.get(_pragma(conn, "auto_vacuum"), "unknown"),
+            "journal_mode": _pragma(conn, "journal_mode"),
+            "cache_pages": cache_bytes // page_size if page_size else 0,
+            "cache_bytes": cache_bytes,
+        }
+
+    # Maintenance steps
+
+    def checkpoint(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Checkpoint the WAL and truncate it, if it has grown past the threshold.
+
+        Args:
+            force: Checkpoint regardless of the WAL size
+
+        Returns:
+            Dict with checkpointed (bool), busy (a reader kept the WAL from
+            being reset), wal_bytes_before and wal_bytes_after
+        """
+        before = self.wal_size()
+        threshold = self.settings.wal_checkpoint_mb * 1024 * 1024
+        if not force and before < threshold:
+            return {"checkpointed": False, "busy": False, "wal_bytes_before": before, "wal_bytes_after": before}
+
+        busy, log_frames, checkpointed_frames = self.db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        after = self.wal_size()
+        if busy:
+            logger.warning(
+                f"WAL checkpoint blocked by a reader ({checkpointed_frames}/{log_frames} frames copied, "
+                f"WAL still {after / 1024 / 1024:.1f} MB)"
+            )
+        else:
+            logger.info(f"WAL checkpointed: {before / 1024 / 1024:.1f} MB -> {after / 1024 / 1024:.1f} MB")
+
+        return {
+            "checkpointed": not busy,
+            "busy": bool(busy),
+            "wal_bytes_before": before,
+            "wal_bytes_after": after,
+        }
+
+    def optimize(self, analyze: bool = False) -> Dict[str, Any]:
+        """
+        Refresh query planner statistics.
+
+        PRAGMA optimize re-analyzes only the tables whose statistics are
+        stale, so it is cheap to run often; a full ANALYZE runs when asked,
+        or when the database has no statistics yet.
+
+        Args:
+            analyze: Also run a full ANALYZE
+
+        Returns:
+            Dict with analyzed (bool)
+        """
+        conn = self.db.conn
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone()
+        if analyze or not has_stats:
+            conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
+        conn.commit()
+        return {"analyzed": bool(analyze or not has_stats)}
+
+    def incremental_vacuum(self, pages: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Return free pages to the filesystem.
+
+        Args:
+            pages: Most pages to free (default: settings.vacuum_pages, 0 = all)
+
+        Returns:
+            Dict with pages_freed and bytes_freed (both 0 unless
+            auto_vacuum is incremental)
+        """
+        conn = self.db.conn
+        if _pragma(conn, "auto_vacuum") != 2:
+            logger.debug("auto_vacuum is not incremental - skipping incremental vacuum")
+            return {"pages_freed": 0, "bytes_freed": 0}
+
+        pages = self.settings.vacuum_pages if pages is None else pages
+        before = _pragma(conn, "freelist_count")
+        # incremental_vacuum frees one page per step, and execute() only steps once;
+        # executescript() runs it to completion (committing any open transaction first)
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages)})" if pages else "PRAGMA incremental_vacuum")
+        freed = before - _pragma(conn, "freelist_count")
+        return {"pages_freed": freed, "bytes_freed": freed * _pragma(conn, "page_size")}
+
+    def apply_retention(self, dry_run: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Apply RETENTION_POLICIES with the configured retention_days.
+
+        Tables missing from retention_days (or set to 0) keep everything.
+
+        Args:
+            dry_run: Count the rows that would be removed, without removing them
+
+        Returns:
+            Dict mapping table name to {'days', 'removed', 'archived'}
+        """
+        conn = self.db.conn
+        results = {}
+        for table, days in self.settings.retention_days.items():
+            policy = RETENTION_POLICIES.get(table)
+            if policy is None:
+                logger.warning(f"No retention policy for table {table} - skipping")
+                continue
+            if not days or days <= 0:
+                continue
+
+            cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+            condition = f"{policy.age_column} < :cutoff"
+            if policy.where:
+                condition += f" AND {policy.where}"
+            params = {"cutoff": cutoff}
+
+            if dry_run:
+                count = conn.execute(f"SELECT COUNT(*) FROM main.{table} WHERE {condition}", params).fetchone()[0]
+                results[table] = {"days": days, "removed": count, "archived": count if policy.archive else 0}
+                continue
+
+            archived = self._archive_rows(table, condition, params) if policy.archive else 0
+            removed = conn.execute(f"DELETE FROM main.{table} WHERE {condition}", params).rowcount
+            conn.commit()
+
+            if removed:
+                logger.info(f"Retention: removed {removed} row(s) from {table} older than {days} days")
+            results[table] = {"days": days, "removed": removed, "archived": archived}
+
+        if not dry_run and results.get("laney_messages", {}).get("removed"):
+            conn.execute("""
+                UPDATE laney_conversations
+                SET message_count = (SELECT COUNT(*) FROM laney_messages m WHERE m.conversation_id = laney_conversations.id)
+                WHERE is_active = 0
+            """)
+            conn.commit()
+
+        return results
+
+    def run(self, analyze: bool = False, retention: bool = True, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Run every maintenance step and report what changed.
+
+        Args:
+            analyze: Run a full ANALYZE instead of only PRAGMA optimize
+            retention: Apply retention policies
+            dry_run: Only report what retention would remove (nothing is changed)
+
+        Returns:
+            Dict with before and after (page_stats()), retention,
+            checkpoint, vacuum, optimize and reclaimed_bytes (database
+            plus WAL file size freed on disk)
+        """
+        before = self.page_stats()
+        report: Dict[str, Any] = {"before": before}
+
+        report["retention"] = self.apply_retention(dry_run=dry_run) if retention else {}
+        if not dry_run:
+            report["vacuum"] = self.incremental_vacuum()
+            report["optimize"] = self.optimize(analyze=analyze)
+            report["checkpoint"] = self.checkpoint(force=True)
+
+        after = self.page_stats()
+        report["after"] = after
+        report["reclaimed_bytes"] = max(
+            0, (before["file_bytes"] + before["wal_bytes"]) - (after["file_bytes"] + after["wal_bytes"])
+        )
+        return report
+
+    # Internals
+
+    def _archive_rows(self, table: str, condition: str, params: Dict[str, Any]) -> int:
+        """Copy matching rows into the same-named table of the archive database."""
+        conn = self.db.conn
+        conn.commit()  # ATTACH can't run inside a transaction
+        conn.execute("ATTACH DATABASE ? AS archive", (str(self.archive_path),))
+        try:
+            # Plain copy of the columns: no foreign keys to tables the archive doesn't have.
+            # The unique id index makes a re-run after an interrupted pass harmless.
+            conn.execute(f"CREATE TABLE IF NOT EXISTS archive.{table} AS SELECT * FROM main.{table} WHERE 0")
+            conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS archive.idx_{table}_id ON {table}(id)")
+            archived = conn.execute(
+                f"INSERT OR IGNORE INTO archive.{table} SELECT * FROM main.{table} WHERE {condition}", params
+            ).rowcount
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("DETACH DATABASE archive")
+
+        if archived:
+            logger.info(f"Retention: archived {archived} row(s) from {table} to {self.archive_path.name}")
+        return archived
+
+
+def _pragma(conn: sqlite3.Connection, name: str):
+    """Value of a single-valued PRAGMA."""
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
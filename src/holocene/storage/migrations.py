@@ -471,6 +471,527 @@ MIGRATIONS: List[Dict] = [
             CREATE INDEX IF NOT EXISTS idx_adventures_active ON laney_adventures(status) WHERE status = 'exploring';
         """,
     },
+    {
+        'version': 19,
+        'name': 'add_git_commit_index',
+        'description': 'Local git commit index so activity summaries are queries, not git log runs',
+        'up': """
+            -- Git repos seen by GitScanner, with the ref state last indexed
+            CREATE TABLE IF NOT EXISTS git_repos (
+                path TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                ref_tips TEXT DEFAULT '[]',  -- JSON: commit hashes of all refs at last index
+                refs_mtime REAL,  -- Fingerprint of .git ref files (skip git entirely if unchanged)
+                last_indexed TEXT
+            );
+
+            -- Commits from all refs of indexed repos
+            CREATE TABLE IF NOT EXISTS git_commits (
+                repo_path TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                author TEXT,
+                date TEXT,  -- Author date as git prints it (%ai)
+                committed_at INTEGER NOT NULL,  -- Committer unix time (what git log --since filters on)
+                subject TEXT,
+                PRIMARY KEY (repo_path, hash),
+                FOREIGN KEY (repo_path) REFERENCES git_repos(path) ON DELETE CASCADE
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_git_commits_time ON git_commits(committed_at);
+        """,
+    },
+    {
+        'version': 20,
+        'name': 'add_import_state',
+        'description': 'Per-source high-water marks so periodic imports only read what changed',
+        'up': """
+            -- Import state - one row per source (e.g., 'bookmarks')
+            CREATE TABLE IF NOT EXISTS import_state (
+                source TEXT PRIMARY KEY,
+                state TEXT NOT NULL DEFAULT '{}',  -- JSON: per-file mtime/size/hash/high-water mark
+                updated_at TEXT NOT NULL
+            );
+        """,
+    },
+    {
+        'version': 21,
+        'name': 'add_page_content_cache',
+        'description': 'Full-text page cache shared by URL fetchers (text stored once per content hash)',
+        'up': """
+            -- Cleaned page text, deduplicated by content hash
+            CREATE TABLE IF NOT EXISTS page_texts (
+                content_hash TEXT PRIMARY KEY,  -- sha256 of text
+                text TEXT NOT NULL,
+                length INTEGER NOT NULL
+            );
+
+            -- Per-URL fetch state and validators for conditional requests
+            CREATE TABLE IF NOT EXISTS page_cache (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                byte_capped INTEGER DEFAULT 0,  -- Download hit the size cap
+                fetched_at TEXT NOT NULL,
+                validated_at TEXT NOT NULL,
+                FOREIGN KEY (content_hash) REFERENCES page_texts(content_hash)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_page_cache_hash ON page_cache(content_hash);
+        """,
+    },
+    {
+        'version': 22,
+        'name': 'add_links_fts',
+        'description': 'FTS5 index over link titles and URLs for ranked research search',
+        'up': """
+            -- External-content index: stores only the token index, rows live in links
+            CREATE VIRTUAL TABLE IF NOT EXISTS links_fts USING fts5(
+                title, url,
+                content='links', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+
+            -- Keep the index in sync with links
+            CREATE TRIGGER IF NOT EXISTS links_fts_insert AFTER INSERT ON links BEGIN
+                INSERT INTO links_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS links_fts_delete AFTER DELETE ON links BEGIN
+                INSERT INTO links_fts(links_fts, rowid, title, url)
+                VALUES ('delete', old.id, old.title, old.url);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS links_fts_update AFTER UPDATE OF title, url ON links BEGIN
+                INSERT INTO links_fts(links_fts, rowid, title, url)
+                VALUES ('delete', old.id, old.title, old.url);
+                INSERT INTO links_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+            END;
+
+            -- Index existing links
+            INSERT INTO links_fts(links_fts) VALUES ('rebuild');
+        """,
+    },
+    {
+        'version': 23,
+        'name': 'add_crawl_frontier',
+        'description': 'Persistent crawl frontier and Mercado Livre enrichment columns',
+        'up': """
+            -- Enrichment columns used to be added by the CLI on every run;
+            -- handled in apply_migration_23() because they may already exist
+        """,
+        'requires_column_check': True,
+    },
+    {
+        'version': 24,
+        'name': 'add_scheduler_jobs',
+        'description': 'Last-run times of holod scheduler jobs, so schedules survive restarts',
+        'up': """
+            CREATE TABLE IF NOT EXISTS scheduler_jobs (
+                name TEXT PRIMARY KEY,  -- e.g. 'link_status_checker.batch_check'
+                last_run_at TEXT,
+                last_error TEXT,  -- NULL if the last run succeeded
+                run_count INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            );
+        """,
+    },
+    {
+        'version': 25,
+        'name': 'add_topic_index',
+        'description': 'Trigger-maintained keyword index of books, links and papers for the curiosity engine',
+        'up': """
+            CREATE TABLE IF NOT EXISTS topic_index (
+                id INTEGER PRIMARY KEY,
+                item_type TEXT NOT NULL,  -- 'book', 'link', 'paper'
+                item_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                text TEXT NOT NULL,  -- What keywords are extracted from
+                keywords TEXT,  -- Space-separated; NULL until tokenized by TopicIndex.refresh()
+                UNIQUE(item_type, item_id)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_topic_index_type ON topic_index(item_type, id);
+            CREATE INDEX IF NOT EXISTS idx_topic_index_pending ON topic_index(id) WHERE keywords IS NULL;
+
+            -- Books (title + subjects)
+            CREATE TRIGGER IF NOT EXISTS topic_index_books_insert AFTER INSERT ON books
+            WHEN new.title IS NOT NULL BEGIN
+                INSERT INTO topic_index(item_type, item_id, title, text)
+                VALUES ('book', new.id, new.title, new.title || ' ' || COALESCE(new.subjects, ''))
+                ON CONFLICT(item_type, item_id) DO UPDATE
+                SET title = excluded.title, text = excluded.text, keywords = NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_books_update AFTER UPDATE OF title, subjects ON books
+            WHEN new.title IS NOT NULL BEGIN
+                INSERT INTO topic_index(item_type, item_id, title, text)
+                VALUES ('book', new.id, new.title, new.title || ' ' || COALESCE(new.subjects, ''))
+                ON CONFLICT(item_type, item_id) DO UPDATE
+                SET title = excluded.title, text = excluded.text, keywords = NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_books_delete AFTER DELETE ON books BEGIN
+                DELETE FROM topic_index WHERE item_type = 'book' AND item_id = old.id;
+            END;
+
+            -- Links (non-empty titles only)
+            CREATE TRIGGER IF NOT EXISTS topic_index_links_insert AFTER INSERT ON links
+            WHEN new.title IS NOT NULL AND new.title != '' BEGIN
+                INSERT INTO topic_index(item_type, item_id, title, text)
+                VALUES ('link', new.id, new.title, new.title)
+                ON CONFLICT(item_type, item_id) DO UPDATE
+                SET title = excluded.title, text = excluded.text, keywords = NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_links_update AFTER UPDATE OF title ON links
+            WHEN new.title IS NOT NULL AND new.title != '' BEGIN
+                INSERT INTO topic_index(item_type, item_id, title, text)
+                VALUES ('link', new.id, new.title, new.title)
+                ON CONFLICT(item_type, item_id) DO UPDATE
+                SET title = excluded.title, text = excluded.text, keywords = NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_links_untitle AFTER UPDATE OF title ON links
+            WHEN new.title IS NULL OR new.title = '' BEGIN
+                DELETE FROM topic_index WHERE item_type = 'link' AND item_id = old.id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_links_delete AFTER DELETE ON links BEGIN
+                DELETE FROM topic_index WHERE item_type = 'link' AND item_id = old.id;
+            END;
+
+            -- Papers
+            CREATE TRIGGER IF NOT EXISTS topic_index_papers_insert AFTER INSERT ON papers
+            WHEN new.title IS NOT NULL BEGIN
+                INSERT INTO topic_index(item_type, item_id, title, text)
+                VALUES ('paper', new.id, new.title, new.title)
+                ON CONFLICT(item_type, item_id) DO UPDATE
+                SET title = excluded.title, text = excluded.text, keywords = NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_papers_update AFTER UPDATE OF title ON papers
+            WHEN new.title IS NOT NULL BEGIN
+                INSERT INTO topic_index(item_type, item_id, title, text)
+                VALUES ('paper', new.id, new.title, new.title)
+                ON CONFLICT(item_type, item_id) DO UPDATE
+                SET title = excluded.title, text = excluded.text, keywords = NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_papers_untitle AFTER UPDATE OF title ON papers
+            WHEN new.title IS NULL BEGIN
+                DELETE FROM topic_index WHERE item_type = 'paper' AND item_id = old.id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topic_index_papers_delete AFTER DELETE ON papers BEGIN
+                DELETE FROM topic_index WHERE item_type = 'paper' AND item_id = old.id;
+            END;
+
+            -- Queue existing items; keywords are filled in on the next refresh
+            INSERT OR IGNORE INTO topic_index(item_type, item_id, title, text)
+            SELECT 'book', id, title, title || ' ' || COALESCE(subjects, '') FROM books WHERE title IS NOT NULL;
+            INSERT OR IGNORE INTO topic_index(item_type, item_id, title, text)
+            SELECT 'link', id, title, title FROM links WHERE title IS NOT NULL AND title != '';
+            INSERT OR IGNORE INTO topic_index(item_type, item_id, title, text)
+            SELECT 'paper', id, title, title FROM papers WHERE title IS NOT NULL;
+        """,
+    },
+    {
+        'version': 26,
+        'name': 'add_daily_rollups',
+        'description': 'Trigger-maintained daily counters for digests and stats',
+        'up': """
+            -- One row per (day, metric). Counts are net changes for that day, for
+            -- per-day activity series; current totals still come from COUNT(*).
+            CREATE TABLE IF NOT EXISTS daily_rollups (
+                day TEXT NOT NULL,  -- YYYY-MM-DD, local time
+                metric TEXT NOT NULL,  -- e.g. 'books.added', 'links.dead'
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, metric)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_daily_rollups_metric ON daily_rollups(metric, day);
+
+            -- Digest "last 24h" lists read these instead of scanning the tables
+            CREATE INDEX IF NOT EXISTS idx_books_created_at ON books(created_at);
+            CREATE INDEX IF NOT EXISTS idx_papers_added_at ON papers(added_at);
+            CREATE INDEX IF NOT EXISTS idx_links_created_at ON links(created_at);
+
+            -- Additions and removals
+            CREATE TRIGGER IF NOT EXISTS rollup_books_insert AFTER INSERT ON books BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'books.added', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_books_delete AFTER DELETE ON books BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'books.removed', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_papers_insert AFTER INSERT ON papers BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'papers.added', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_papers_delete AFTER DELETE ON papers BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'papers.removed', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_links_insert AFTER INSERT ON links BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'links.added', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_links_delete AFTER DELETE ON links BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'links.removed', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_favorites_insert AFTER INSERT ON mercadolivre_favorites BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'favorites.added', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_favorites_delete AFTER DELETE ON mercadolivre_favorites BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'favorites.removed', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            -- Enrichment and classification (first time only; deleting takes them back)
+            CREATE TRIGGER IF NOT EXISTS rollup_books_enriched AFTER UPDATE OF enriched_at ON books
+            WHEN old.enriched_at IS NULL AND new.enriched_at IS NOT NULL BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'books.enriched', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_books_classified AFTER UPDATE OF classified_at ON books
+            WHEN old.classified_at IS NULL AND new.classified_at IS NOT NULL BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'books.classified', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_books_delete_enriched AFTER DELETE ON books
+            WHEN old.enriched_at IS NOT NULL BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'books.enriched', -1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_books_delete_classified AFTER DELETE ON books
+            WHEN old.classified_at IS NOT NULL BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'books.classified', -1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            -- Link health: checks run, and net change in links that aren't 'alive'
+            CREATE TRIGGER IF NOT EXISTS rollup_links_checked AFTER UPDATE OF last_checked ON links
+            WHEN new.last_checked IS NOT old.last_checked BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'links.checked', 1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_links_health AFTER UPDATE OF status ON links
+            WHEN (COALESCE(new.status, 'alive') != 'alive') != (COALESCE(old.status, 'alive') != 'alive') BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'links.dead', CASE WHEN COALESCE(new.status, 'alive') != 'alive' THEN 1 ELSE -1 END)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS rollup_links_delete_dead AFTER DELETE ON links
+            WHEN COALESCE(old.status, 'alive') != 'alive' BEGIN
+                INSERT INTO daily_rollups(day, metric, count) VALUES (date('now', 'localtime'), 'links.dead', -1)
+                ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            END;
+
+            -- Backfill from existing rows (link checks only count from here on). Rows for a
+            -- day that already has a counter are added to it, never dropped.
+            INSERT INTO daily_rollups(day, metric, count)
+            SELECT substr(created_at, 1, 10), 'books.added', COUNT(*) FROM books WHERE true GROUP BY 1
+            ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            INSERT INTO daily_rollups(day, metric, count)
+            SELECT substr(added_at, 1, 10), 'papers.added', COUNT(*) FROM papers WHERE true GROUP BY 1
+            ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            INSERT INTO daily_rollups(day, metric, count)
+            SELECT substr(created_at, 1, 10), 'links.added', COUNT(*) FROM links WHERE true GROUP BY 1
+            ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            INSERT INTO daily_rollups(day, metric, count)
+            SELECT substr(created_at, 1, 10), 'favorites.added', COUNT(*) FROM mercadolivre_favorites WHERE true GROUP BY 1
+            ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            INSERT INTO daily_rollups(day, metric, count)
+            SELECT substr(enriched_at, 1, 10), 'books.enriched', COUNT(*) FROM books
+            WHERE enriched_at IS NOT NULL GROUP BY 1
+            ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            INSERT INTO daily_rollups(day, metric, count)
+            SELECT substr(classified_at, 1, 10), 'books.classified', COUNT(*) FROM books
+            WHERE classified_at IS NOT NULL GROUP BY 1
+            ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+            INSERT INTO daily_rollups(day, metric, count)
+            SELECT substr(COALESCE(last_checked, created_at), 1, 10), 'links.dead', COUNT(*) FROM links
+            WHERE COALESCE(status, 'alive') != 'alive' GROUP BY 1
+            ON CONFLICT(day, metric) DO UPDATE SET count = count + excluded.count;
+        """,
+    },
+    {
+        'version': 27,
+        'name': 'add_capture_jobs',
+        'description': 'Persistent queue for local monolith/WARC capture workers',
+        'up': """
+            CREATE TABLE IF NOT EXISTS capture_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                format TEXT NOT NULL,  -- 'monolith' or 'warc'
+                link_id INTEGER,  -- Set: result is recorded in archive_snapshots and the job survives restarts
+                timeout INTEGER,
+                status TEXT NOT NULL DEFAULT 'queued',  -- queued, running, done, failed, cancelled
+                attempts INTEGER NOT NULL DEFAULT 0,
+                progress TEXT,  -- Last line of tool output
+                result TEXT,  -- JSON result from LocalArchiveClient
+                error TEXT,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                FOREIGN KEY (link_id) REFERENCES links(id) ON DELETE CASCADE
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_capture_jobs_status ON capture_jobs(status, id);
+        """,
+    },
+    {
+        'version': 28,
+        'name': 'add_search_index',
+        'description': 'Trigram full-text index of books, papers, links and inventory items for fuzzy search',
+        'up': """
+            -- rowid = item id * 8 + type code (1 book, 2 paper, 3 link, 4 item), so
+            -- triggers update one row by rowid instead of scanning the table
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+                primary_text, secondary_text, tertiary_text, tokenize = 'trigram'
+            );
+
+            -- Books: title, author, subjects
+            CREATE TRIGGER IF NOT EXISTS search_index_books_insert AFTER INSERT ON books BEGIN
+                INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 1, new.title, new.author, new.subjects);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_books_update AFTER UPDATE OF title, author, subjects ON books BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 1;
+                INSERT INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 1, new.title, new.author, new.subjects);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_books_delete AFTER DELETE ON books BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 1;
+            END;
+
+            -- Papers: title, authors, journal
+            CREATE TRIGGER IF NOT EXISTS search_index_papers_insert AFTER INSERT ON papers BEGIN
+                INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 2, new.title, new.authors, new.journal);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_papers_update AFTER UPDATE OF title, authors, journal ON papers BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 2;
+                INSERT INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 2, new.title, new.authors, new.journal);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_papers_delete AFTER DELETE ON papers BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 2;
+            END;
+
+            -- Links: (clean) title, URL
+            CREATE TRIGGER IF NOT EXISTS search_index_links_insert AFTER INSERT ON links BEGIN
+                INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 3, COALESCE(NULLIF(new.clean_title, ''), new.title), new.url, NULL);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_links_update AFTER UPDATE OF title, clean_title, url ON links BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 3;
+                INSERT INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 3, COALESCE(NULLIF(new.clean_title, ''), new.title), new.url, NULL);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_links_delete AFTER DELETE ON links BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 3;
+            END;
+
+            -- Inventory items: name, description, category
+            CREATE TRIGGER IF NOT EXISTS search_index_items_insert AFTER INSERT ON items BEGIN
+                INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 4, new.name, new.description, new.category);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_items_update AFTER UPDATE OF name, description, category ON items BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 4;
+                INSERT INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+                VALUES (new.id * 8 + 4, new.name, new.description, new.category);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS search_index_items_delete AFTER DELETE ON items BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 8 + 4;
+            END;
+
+            -- Existing items
+            INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+            SELECT id * 8 + 1, title, author, subjects FROM books;
+            INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+            SELECT id * 8 + 2, title, authors, journal FROM papers;
+            INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+            SELECT id * 8 + 3, COALESCE(NULLIF(clean_title, ''), title), url, NULL FROM links;
+            INSERT OR REPLACE INTO search_index(rowid, primary_text, secondary_text, tertiary_text)
+            SELECT id * 8 + 4, name, description, category FROM items;
+        """,
+        # Handled in apply_migration_28(): the trigram tokenizer needs SQLite 3.34+
+        'requires_column_check': True,
+    },
+    {
+        'version': 29,
+        'name': 'add_paper_chunks',
+        'description': 'Cache of per-chunk paper summaries for full-text analysis, keyed by PDF hash',
+        'up': """
+            -- One row per chunk of a PDF's text; chunk boundaries depend on chunk_chars.
+            -- Keyed by file content, so renamed or re-downloaded PDFs reuse their summaries.
+            CREATE TABLE IF NOT EXISTS paper_chunks (
+                pdf_hash TEXT NOT NULL,  -- SHA-256 of the PDF file
+                chunk_chars INTEGER NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                sections TEXT,  -- Comma-separated section names (abstract, methods, ...)
+                start_page INTEGER,
+                end_page INTEGER,
+                chars INTEGER,
+                summary TEXT NOT NULL,  -- LLM notes for this chunk (map step)
+                model TEXT,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (pdf_hash, chunk_chars, chunk_index)
+            );
+        """,
+    },
+    {
+        'version': 30,
+        'name': 'enable_incremental_vacuum',
+        'description': 'Switch auto_vacuum to INCREMENTAL so maintenance can return free pages to the filesystem',
+        'requires_column_check': True,  # Needs a VACUUM outside a transaction
+        'up': """
+            PRAGMA auto_vacuum = INCREMENTAL;
+            VACUUM;
+        """,
+    },
+]
+
+# Mercado Livre page enrichment columns (migration 23)
+ML_ENRICHMENT_COLUMNS = [
+    ("description", "TEXT"),
+    ("original_price", "REAL"),
+    ("specifications", "TEXT"),  # JSON
+    ("seller_nickname", "TEXT"),
+    ("seller_reputation", "TEXT"),
+    ("reviews_rating", "REAL"),
+    ("reviews_total", "INTEGER"),
+    ("warranty", "TEXT"),
+    ("free_shipping", "BOOLEAN"),
+    ("enriched_at", "TEXT"),
+    ("cached_html_path", "TEXT"),
+    ("brightdata_blocked", "BOOLEAN DEFAULT 0"),
 ]
 
 
@@ -704,6 +1225,105 @@ def apply_migration_6(conn: sqlite3.Connection):
     logger.info(f"Migrated {migrated_count} books to metadata JSON")
 
 
+def apply_migration_23(conn: sqlite3.Connection):
+    """Special handler for migration 23 (crawl frontier + ML enrichment columns).
+
+    Args:
+        conn: SQLite connection
+    """
+    cursor = conn.cursor()
+
+    for column, column_type in ML_ENRICHMENT_COLUMNS:
+        if not column_exists(conn, 'mercadolivre_favorites', column):
+            logger.info(f"Adding {column} column to mercadolivre_favorites")
+            cursor.execute(f"ALTER TABLE mercadolivre_favorites ADD COLUMN {column} {column_type}")
+
+    # One row per URL to crawl, per job; survives restarts so crawls resume
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_frontier (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job TEXT NOT NULL,              -- e.g. 'mercadolivre_enrich'
+            key TEXT NOT NULL,              -- Job-specific ID (ML item_id)
+            url TEXT NOT NULL,
+            host TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',  -- pending, in_progress, done, failed
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TEXT,           -- Retry backoff
+            etag TEXT,                      -- Validators for conditional GETs
+            last_modified TEXT,
+            last_status INTEGER,            -- Last HTTP status
+            last_error TEXT,
+            added_at TEXT NOT NULL,
+            updated_at TEXT,
+            UNIQUE(job, key)
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_crawl_frontier_due
+        ON crawl_frontier(job, status, next_attempt_at)
+    """)
+
+
+def apply_migration_28(conn: sqlite3.Connection):
+    """Special handler for migration 28 (trigram search index).
+
+    FTS5's trigram tokenizer needs SQLite 3.34+. On older builds the index
+    is skipped and SearchIndex falls back to substring matching.
+
+    Args:
+        conn: SQLite connection
+    """
+    migration = next(m for m in MIGRATIONS if m['version'] == 28)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp.search_index_probe USING fts5(text, tokenize = 'trigram')")
+        cursor.execute("DROP TABLE temp.search_index_probe")
+    except sqlite3.OperationalError as e:
+        logger.warning(f"SQLite {sqlite3.sqlite_version} has no FTS5 trigram tokenizer ({e}) - search index skipped")
+        return
+
+    for statement in split_statements(migration['up']):
+        cursor.execute(statement)
+
+
+def apply_migration_30(conn: sqlite3.Connection):
+    """Special handler for migration 30 (incremental auto-vacuum).
+
+    A new auto_vacuum mode only takes effect after a VACUUM, which can't run
+    inside a transaction and rewrites the whole file, so it is skipped when
+    the mode is already set.
+
+    Args:
+        conn: SQLite connection
+    """
+    cursor = conn.cursor()
+    if cursor.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return
+
+    logger.info("Rebuilding database with auto_vacuum = INCREMENTAL (one-time, may take a while)")
+    conn.commit()
+    cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    cursor.execute("VACUUM")
+
+
+def split_statements(sql: str) -> List[str]:
+    """Split a migration script into statements.
+
+    Splits on semicolons, but keeps going until sqlite considers the
+    statement complete, so trigger bodies (BEGIN ...; ... END) stay whole.
+    """
+    statements = []
+    buffer = ""
+    for piece in sql.split(';'):
+        buffer += piece + ';'
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip().rstrip(';').strip()
+            if statement.replace(';', '').strip():
+                statements.append(statement)
+            buffer = ""
+    return statements
+
+
 def apply_migrations(conn: sqlite3.Connection, target_version: Optional[int] = None):
     """Apply pending migrations to database.
 
@@ -751,14 +1371,17 @@ def apply_migrations(conn: sqlite3.Connection, target_version: Optional[int] = N
                     apply_migration_5(conn)
                 elif version == 6:
                     apply_migration_6(conn)
+                elif version == 23:
+                    apply_migration_23(conn)
+                elif version == 28:
+                    apply_migration_28(conn)
+                elif version == 30:
+                    apply_migration_30(conn)
             else:
                 # Execute migration SQL
                 cursor = conn.cursor()
-                # Split by semicolon and execute each statement
-                for statement in migration['up'].split(';'):
-                    statement = statement.strip()
-                    if statement:
-                        cursor.execute(statement)
+                for statement in split_statements(migration['up']):
+                    cursor.execute(statement)
 
             # Record migration
             cursor = conn.cursor()
@@ -0,0 +1,465 @@
+"""Query profiler for the Database layer.
+
+Times every statement run through a profiled connection, keyed by
+normalized SQL (literals and IN lists collapsed, whitespace squeezed), so
+the same query from different call sites adds up:
+
+- Per-statement call counts, rows, total/max time and a latency histogram
+- Who ran it: the plugin, scheduled job or API endpoint that set the
+  thread's caller (query_caller()), else the thread name
+- A slow-query log (slow_query_ms) with the EXPLAIN QUERY PLAN of each
+  slow statement
+
+Only execute() is timed; fetching is left unwrapped apart from counting
+rows, so a SELECT is recorded with its row count when the cursor is
+exhausted, closed or reused rather than when execute() returns.
+
+    profiler = QueryProfiler(slow_query_ms=100)
+    db = Database(path, profiler=profiler)
+    with query_caller("plugin:book_enricher"):
+        db.get_books()
+    profiler.snapshot(top=10)
+    profiler.prometheus()
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+# Histogram bucket upper bounds, in milliseconds
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+# Distinct statements tracked; later ones are counted under OTHER_SQL
+MAX_STATEMENTS = 2000
+OTHER_SQL = "<other>"
+
+# Seconds a captured query plan is reused before EXPLAIN runs again
+PLAN_TTL = 600
+
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT", "REPLACE")
+
+_COMMENT = re.compile(r"--[^\n]*")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+_callers = threading.local()
+
+
+@contextmanager
+def query_caller(name: Optional[str]):
+    """Attribute queries run by this thread inside the block to name.
+
+    Blocks nest; the innermost name wins. None leaves the current name.
+    """
+    push_caller(name)
+    try:
+        yield
+    finally:
+        pop_caller()
+
+
+def push_caller(name: Optional[str]):
+    """Start attributing this thread's queries to name (see query_caller())."""
+    stack = getattr(_callers, "stack", None)
+    if stack is None:
+        stack = _callers.stack = []
+    stack.append(name or (stack[-1] if stack else None))
+
+
+def pop_caller():
+    """Undo the last push_caller() on this thread."""
+    stack = getattr(_callers, "stack", None)
+    if stack:
+        stack.pop()
+
+
+def current_caller() -> str:
+    """Name queries on this thread are attributed to."""
+    stack = getattr(_callers, "stack", None)
+    if stack and stack[-1]:
+        return stack[-1]
+    return f"thread:{threading.current_thread().name}"
+
+
+@lru_cache(maxsize=4096)
+def normalize_sql(sql: str) -> str:
+    """Collapse literals, IN lists, comments and whitespace so equivalent queries share a key."""
+    text = _COMMENT.sub(" ", sql)
+    text = _STRING.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _IN_LIST.sub("(?, ...)", text)
+    return _SPACE.sub(" ", text).strip()
+
+
+def query_id(normalized: str) -> str:
+    """Short stable ID for a normalized statement (used as a metric label)."""
+    return hashlib.sha1(normalized.encode()).hexdigest()[:10]
+
+
+class QueryStats:
+    """Running totals for one normalized statement."""
+
+    __slots__ = ("sql", "calls", "rows", "total_ms", "max_ms", "slow", "buckets", "callers")
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.calls = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow = 0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)  # Last one is +Inf
+        self.callers = Counter()
+
+    def add(self, duration_ms: float, rows: int, caller: str, slow: bool):
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.slow += slow
+        self.callers[caller] += 1
+        for i, bound in enumerate(BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": query_id(self.sql),
+            "sql": self.sql,
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "slow": self.slow,
+            "histogram": {
+                **{f"le_{bound}ms": count for bound, count in zip(BUCKETS_MS, self.buckets)},
+                "inf": self.buckets[-1],
+            },
+            "callers": dict(self.callers.most_common(5)),
+        }
+
+
+class QueryProfiler:
+    """Collects statement timings from profiled connections (thread-safe)."""
+
+    def __init__(self, slow_query_ms: float = 100, slow_log_size: int = 100, explain: bool = True):
+        """
+        Initialize profiler.
+
+        Args:
+            slow_query_ms: Statements taking at least this long go to the slow-query log
+            slow_log_size: Slow queries kept (oldest dropped first)
+            explain: Capture EXPLAIN QUERY PLAN for slow queries
+        """
+        self.slow_query_ms = slow_query_ms
+        self.explain = explain
+        self._lock = threading.Lock()
+        self._stats: Dict[str, QueryStats] = {}
+        self._callers: Dict[str, List[float]] = {}  # caller -> [calls, total_ms]
+        self._slow_log = deque(maxlen=slow_log_size)
+        self._plans: Dict[str, tuple] = {}  # normalized SQL -> (captured at, plan)
+        self.started_at = datetime.now()
+
+    def record(
+        self,
+        sql: str,
+        duration: float,
+        rows: int = 0,
+        connection: Optional[sqlite3.Connection] = None,
+        parameters: Any = None,
+    ):
+        """
+        Record one statement.
+
+        Args:
+            sql: SQL as executed
+            duration: Seconds spent in execute()
+            rows: Rows returned (SELECT) or changed (INSERT/UPDATE/DELETE)
+            connection: Connection to EXPLAIN a slow statement on (same thread)
+            parameters: The statement's parameters, for EXPLAIN
+        """
+        normalized = normalize_sql(sql)
+        duration_ms = duration * 1000
+        caller = current_caller()
+        slow = duration_ms >= self.slow_query_ms
+
+        with self._lock:
+            stats = self._stats.get(normalized)
+            if stats is None:
+                if len(self._stats) >= MAX_STATEMENTS:
+                    normalized = OTHER_SQL
+                    stats = self._stats.setdefault(OTHER_SQL, QueryStats(OTHER_SQL))
+                else:
+                    stats = self._stats[normalized] = QueryStats(normalized)
+            stats.add(duration_ms, rows, caller, slow)
+
+            totals = self._callers.setdefault(caller, [0, 0.0])
+            totals[0] += 1
+            totals[1] += duration_ms
+
+        if slow:
+            plan = self._plan(normalized, sql, parameters, connection) if self.explain else None
+            with self._lock:
+                self._slow_log.append({
+                    "at": datetime.now().isoformat(timespec="seconds"),
+                    "id": query_id(normalized),
+                    "sql": normalized,
+                    "duration_ms": round(duration_ms, 2),
+                    "rows": rows,
+                    "caller": caller,
+                    "plan": plan,
+                })
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
+            self._callers.clear()
+            self._slow_log.clear()
+            self._plans.clear()
+            self.started_at = datetime.now()
+
+    # Reports
+
+    def snapshot(self, top: int = 20, sort: str = "total_ms") -> Dict[str, Any]:
+        """
+        Statements, callers and slow queries recorded so far.
+
+        Args:
+            top: Statements returned
+            sort: Statement field to sort by (total_ms, calls, max_ms, avg_ms, rows, slow)
+
+        Returns:
+            Dict with since, totals, statements, callers and slow_queries (newest first)
+        """
+        with self._lock:
+            statements = [stats.to_dict() for stats in self._stats.values()]
+            callers = [
+                {"caller": caller, "calls": int(calls), "total_ms": round(total_ms, 2)}
+                for caller, (calls, total_ms) in self._callers.items()
+            ]
+            slow_queries = list(reversed(self._slow_log))
+
+        statements.sort(key=lambda s: s.get(sort, 0), reverse=True)
+        callers.sort(key=lambda c: c["total_ms"], reverse=True)
+        return {
+            "since": self.started_at.isoformat(timespec="seconds"),
+            "slow_query_ms": self.slow_query_ms,
+            "totals": {
+                "statements": len(statements),
+                "calls": sum(s["calls"] for s in statements),
+                "total_ms": round(sum(s["total_ms"] for s in statements), 2),
+                "slow": sum(s["slow"] for s in statements),
+            },
+            "statements": statements[:top],
+            "callers": callers,
+            "slow_queries": slow_queries,
+        }
+
+    def summary(self, top: int = 5) -> Dict[str, Any]:
+        """Short form of snapshot() for /status: totals and the most expensive statements."""
+        snapshot = self.snapshot(top=top)
+        return {
+            "since": snapshot["since"],
+            "totals": snapshot["totals"],
+            "top_statements": [
+                {key: s[key] for key in ("id", "sql", "calls", "total_ms", "avg_ms", "max_ms")}
+                for s in snapshot["statements"]
+            ],
+            "top_callers": snapshot["callers"][:top],
+        }
+
+    def prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        with self._lock:
+            stats = list(self._stats.values())
+            callers = {caller: tuple(totals) for caller, totals in self._callers.items()}
+            state = [(s.sql, list(s.buckets), s.total_ms, s.calls, s.rows, s.slow) for s in stats]
+
+        lines = [
+            "# HELP holocene_db_query_duration_seconds Time spent executing a statement",
+            "# TYPE holocene_db_query_duration_seconds histogram",
+        ]
+        for sql, buckets, total_ms, calls, _, _ in state:
+            label = f'query="{query_id(sql)}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS_MS, buckets):
+                cumulative += count
+                lines.append(f'holocene_db_query_duration_seconds_bucket{{{label},le="{bound / 1000:g}"}} {cumulative}')
+            lines.append(f'holocene_db_query_duration_seconds_bucket{{{label},le="+Inf"}} {calls}')
+            lines.append(f"holocene_db_query_duration_seconds_sum{{{label}}} {total_ms / 1000:.6f}")
+            lines.append(f"holocene_db_query_duration_seconds_count{{{label}}} {calls}")
+
+        lines += ["# HELP holocene_db_query_rows_total Rows returned or changed", "# TYPE holocene_db_query_rows_total counter"]
+        lines += [f'holocene_db_query_rows_total{{query="{query_id(sql)}"}} {rows}' for sql, _, _, _, rows, _ in state]
+
+        lines += ["# HELP holocene_db_slow_queries_total Statements slower than slow_query_ms", "# TYPE holocene_db_slow_queries_total counter"]
+        lines += [f'holocene_db_slow_queries_total{{query="{query_id(sql)}"}} {slow}' for sql, _, _, _, _, slow in state]
+
+        lines += ["# HELP holocene_db_query_info Normalized SQL of each query ID", "# TYPE holocene_db_query_info gauge"]
+        lines += [f'holocene_db_query_info{{query="{query_id(sql)}",sql="{_escape_label(sql[:200])}"}} 1' for sql, *_ in state]
+
+        lines += ["# HELP holocene_db_caller_seconds_total Statement time per plugin, job or endpoint", "# TYPE holocene_db_caller_seconds_total counter"]
+        lines += [
+            f'holocene_db_caller_seconds_total{{caller="{_escape_label(caller)}"}} {total_ms / 1000:.6f}'
+            for caller, (_, total_ms) in callers.items()
+        ]
+        lines += ["# HELP holocene_db_caller_queries_total Statements run per plugin, job or endpoint", "# TYPE holocene_db_caller_queries_total counter"]
+        lines += [
+            f'holocene_db_caller_queries_total{{caller="{_escape_label(caller)}"}} {int(calls)}'
+            for caller, (calls, _) in callers.items()
+        ]
+        return "\n".join(lines) + "\n"
+
+    # Internals
+
+    def _plan(self, normalized: str, sql: str, parameters: Any, connection) -> Optional[List[str]]:
+        """EXPLAIN QUERY PLAN lines for a statement (cached per normalized SQL for PLAN_TTL)."""
+        if connection is None or not sql.lstrip().upper().startswith(EXPLAINABLE):
+            return None
+
+        with self._lock:
+            cached = self._plans.get(normalized)
+        if cached and time.monotonic() - cached[0] < PLAN_TTL:
+            return cached[1]
+
+        try:
+            # A plain cursor, so the EXPLAIN itself isn't profiled
+            cursor = sqlite3.Cursor(connection)
+            rows = cursor.execute(f"EXPLAIN QUERY PLAN {sql}", parameters or ()).fetchall()
+            cursor.close()
+        except (sqlite3.Error, ValueError):
+            return None
+
+        plan = [row[-1] for row in rows]
+        with self._lock:
+            self._plans[normalized] = (time.monotonic(), plan)
+        return plan
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that reports each statement's time and row count to the connection's profiler."""
+
+    _pending = None  # [sql, parameters, seconds] of an unfinished SELECT
+    _rows = 0  # Rows fetched from it so far
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        started = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        except Exception:
+            self.connection.profiler.record(sql, time.perf_counter() - started)
+            raise
+
+        elapsed = time.perf_counter() - started
+        if self.description is None:
+            self.connection.profiler.record(sql, elapsed, max(self.rowcount, 0), self.connection, parameters)
+        else:
+            self._pending = [sql, parameters, elapsed]
+            self._rows = 0
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        started = time.perf_counter()
+        try:
+            super().executemany(sql, seq_of_parameters)
+        finally:
+            self.connection.profiler.record(sql, time.perf_counter() - started, max(self.rowcount, 0))
+        return self
+
+    def executescript(self, sql_script):
+        self._finish()
+        started = time.perf_counter()
+        try:
+            super().executescript(sql_script)
+        finally:
+            self.connection.profiler.record(sql_script, time.perf_counter() - started)
+        return self
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is None:
+            self._finish()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._rows += len(rows)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._finish()
+            raise
+        self._rows += 1
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+    def _finish(self):
+        """Record the pending SELECT, if any, with the rows fetched from it."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            sql, parameters, elapsed = pending
+            self.connection.profiler.record(sql, elapsed, self._rows, self.connection, parameters)
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection whose cursors (including execute() shortcuts) are profiled.
+
+    Pass as sqlite3.connect(factory=ProfiledConnection), then set profiler.
+    """
+
+    profiler: QueryProfiler = None
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
@@ -0,0 +1,215 @@
+"""Tests for the concurrent archive scheduler."""
+
+import threading
+import time
+from pathlib import Path
+import tempfile
+
+import pytest
+
+from holocene.storage.database import Database
+from holocene.storage.archiving import ArchivingService
+from holocene.storage.archive_scheduler import ArchiveScheduler
+
+
+class FakeLocalClient:
+    """Local archive client that 'archives' after a short delay."""
+
+    def __init__(self, delay=0.05, fail_urls=()):
+        self.delay = delay
+        self.fail_urls = set(fail_urls)
+        self.calls = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def archive_url(self, url, format="monolith", timeout=60):
+        with self.lock:
+            self.calls.append(url)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if url in self.fail_urls:
+            return {"status": "error", "url": url, "error": "boom"}
+        return {
+            "status": "archived",
+            "url": url,
+            "local_path": f"/tmp/{len(self.calls)}.html",
+            "file_size": 100,
+            "archive_date": "2025-01-01T00:00:00",
+        }
+
+    def get_available_formats(self):
+        return ["monolith"]
+
+
+class FakeSlowIAClient:
+    """IA client that blocks until released."""
+
+    access_key = None
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def save_url(self, url, force=False):
+        self.release.wait(5)
+        return {"status": "archived", "snapshot_url": f"https://web.archive.org/{url}"}
+
+
+class FakeArchiveBoxClient:
+    """ArchiveBox client with a configurable queue depth."""
+
+    available = True
+
+    def __init__(self, pending=0):
+        self.pending = pending
+        self.added = []
+
+    def get_queue_status(self):
+        return {"available": True, "pending_count": self.pending, "failed_count": 0}
+
+    def archive_url(self, url, timeout=180):
+        self.added.append(url)
+        return {"status": "archived", "snapshot_id": "1.0", "archive_url": "http://ab/1.0"}
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database with some links."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(Path(tmpdir) / "test.db")
+        for i in range(6):
+            db.insert_link(f"https://example{i}.com/page", source="test")
+        yield db
+        db.close()
+
+
+def wait_until(predicate, timeout=5.0):
+    """Poll until predicate is true or timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def count_snapshots(db, service, status):
+    cursor = db.conn.cursor()
+    cursor.execute(
+        "SELECT COUNT(*) FROM archive_snapshots WHERE service = ? AND status = ?",
+        (service, status),
+    )
+    return cursor.fetchone()[0]
+
+
+def test_scheduler_drains_backlog_with_concurrency_cap(temp_db):
+    """Test all links get archived and the per-backend cap is respected."""
+    local = FakeLocalClient()
+    archiving = ArchivingService(temp_db, local_client=local)
+    scheduler = ArchiveScheduler(
+        archiving, services=["local_monolith"], concurrency={"local_monolith": 2}
+    )
+    scheduler.start()
+
+    try:
+        scheduler.fill()
+        assert wait_until(lambda: count_snapshots(temp_db, "local_monolith", "success") == 6)
+    finally:
+        scheduler.stop()
+
+    assert local.max_active <= 2
+    assert len(local.calls) == 6  # Each link archived exactly once
+    assert count_snapshots(temp_db, "local_monolith", "pending") == 0
+    assert scheduler.get_status()["services"]["local_monolith"]["succeeded"] == 6
+
+
+def test_slow_backend_does_not_block_others(temp_db):
+    """Test a stuck IA pool doesn't hold up local captures."""
+    local = FakeLocalClient(delay=0)
+    ia = FakeSlowIAClient()
+    archiving = ArchivingService(temp_db, local_client=local, ia_client=ia)
+    scheduler = ArchiveScheduler(archiving, services=["local_monolith", "internet_archive"])
+    scheduler.start()
+
+    try:
+        scheduler.fill()
+        assert wait_until(lambda: count_snapshots(temp_db, "local_monolith", "success") == 6)
+        # IA captures still queued/in flight, and visible as pending
+        assert count_snapshots(temp_db, "internet_archive", "success") == 0
+        assert count_snapshots(temp_db, "internet_archive", "pending") > 0
+    finally:
+        ia.release.set()
+        scheduler.stop()
+
+
+def test_submit_dedups_in_flight(temp_db):
+    """Test the same link/service can't be queued twice."""
+    local = FakeLocalClient(delay=0.2)
+    archiving = ArchivingService(temp_db, local_client=local)
+    scheduler = ArchiveScheduler(archiving, services=["local_monolith"])
+    scheduler.start()
+
+    try:
+        assert scheduler.submit(1, "https://example0.com/page", "local_monolith") is True
+        assert scheduler.submit(1, "https://example0.com/page", "local_monolith") is False
+    finally:
+        scheduler.stop()
+
+    assert local.calls == ["https://example0.com/page"]
+
+
+def test_failures_back_off(temp_db):
+    """Test failed captures are recorded and not immediately retried."""
+    local = FakeLocalClient(delay=0, fail_urls={"https://example0.com/page"})
+    archiving = ArchivingService(temp_db, local_client=local)
+    scheduler = ArchiveScheduler(archiving, services=["local_monolith"])
+    scheduler.start()
+
+    try:
+        scheduler.fill()
+        assert wait_until(lambda: count_snapshots(temp_db, "local_monolith", "success") == 5)
+        assert wait_until(lambda: count_snapshots(temp_db, "local_monolith", "failed") == 1)
+        assert scheduler.fill() == 0
+    finally:
+        scheduler.stop()
+
+    assert local.calls.count("https://example0.com/page") == 1
+
+
+def test_archivebox_queue_depth_limits_adds(temp_db):
+    """Test ArchiveBox is only fed up to its free queue capacity."""
+    archivebox = FakeArchiveBoxClient(pending=19)
+    archiving = ArchivingService(
+        temp_db, local_client=FakeLocalClient(), archivebox_client=archivebox
+    )
+    scheduler = ArchiveScheduler(
+        archiving, services=["archivebox"], archivebox_max_queue=20
+    )
+    scheduler.start()
+
+    try:
+        assert scheduler.fill() == 1
+        assert wait_until(lambda: count_snapshots(temp_db, "archivebox", "success") == 1)
+
+        archivebox.pending = 25
+        scheduler._archivebox_checked_at = 0  # Expire cached status
+        scheduler.queue_check_interval = 0
+        assert scheduler.fill() == 0
+    finally:
+        scheduler.stop()
+
+
+def test_start_clears_stale_pending(temp_db):
+    """Test pending markers from a crashed run don't hide links."""
+    temp_db.add_archive_snapshot(link_id=1, service="local_monolith", status="pending")
+    assert len(temp_db.get_links_needing_archive("local_monolith")) == 5
+
+    archiving = ArchivingService(temp_db, local_client=FakeLocalClient())
+    scheduler = ArchiveScheduler(archiving, services=["local_monolith"])
+    scheduler.start()
+    scheduler.stop()
+
+    assert len(temp_db.get_links_needing_archive("local_monolith")) == 6
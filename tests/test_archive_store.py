@@ -0,0 +1,195 @@
+"""Tests for the content-addressed archive store."""
+
+import base64
+import gzip
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from holocene.storage.database import Database
+from holocene.storage.archive_store import (
+    ArchiveStore,
+    chunk_content,
+    blob_ref,
+    parse_blob_ref,
+    is_blob_ref,
+)
+from holocene.integrations.local_archive import LocalArchiveClient
+
+
+def make_page(seed: int, asset: bytes, lines: int = 3000) -> bytes:
+    """Build a monolith-like page: many text lines plus an embedded asset."""
+    rng = random.Random(seed)
+    body = b"".join(
+        f"<p>line {i} {rng.random():.12f}</p>\n".encode() for i in range(lines)
+    )
+    image = b'<img src="data:image/png;base64,' + base64.b64encode(asset) + b'">\n'
+    return b"<html><head></head><body>\n" + body + image + body + b"</body></html>\n"
+
+
+@pytest.fixture
+def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield ArchiveStore(Path(tmpdir) / "store")
+
+
+@pytest.fixture
+def asset():
+    return random.Random(42).randbytes(40_000)
+
+
+def test_chunks_concatenate_to_original(asset):
+    """Test chunking is lossless and isolates embedded assets."""
+    page = make_page(1, asset)
+    chunks = list(chunk_content(page))
+
+    assert b"".join(chunks) == page
+    assert any(chunk.startswith(b"data:image/png;base64,") for chunk in chunks)
+
+
+def test_put_get_roundtrip(store, asset):
+    """Test stored content reads back byte-identical."""
+    page = make_page(1, asset)
+    result = store.put(page, media_type="text/html")
+
+    assert result["ref"] == blob_ref(result["blob_id"])
+    assert store.get(result["blob_id"]) == page
+    assert b"".join(store.iter_chunks(result["blob_id"])) == page
+    assert store.info(result["blob_id"])["media_type"] == "text/html"
+
+
+def test_identical_capture_stores_nothing_new(store, asset):
+    """Test re-storing the same capture writes no chunks."""
+    page = make_page(1, asset)
+    first = store.put(page)
+    second = store.put(page)
+
+    assert second["blob_id"] == first["blob_id"]
+    assert second["new_chunks"] == 0
+    assert second["stored_bytes"] == 0
+
+
+def test_shared_asset_and_similar_snapshot_dedup(store, asset):
+    """Test a lightly edited snapshot reuses most chunks, including the asset."""
+    page = make_page(1, asset)
+    edited = page.replace(b"<p>line 10 ", b"<p>line ten ", 1)
+
+    first = store.put(page)
+    second = store.put(edited)
+
+    assert second["blob_id"] != first["blob_id"]
+    assert second["new_chunks"] < second["chunks"] / 2
+    assert second["stored_bytes"] < first["stored_bytes"] / 2
+    assert store.get(second["blob_id"]) == edited
+
+
+def test_read_range(store, asset):
+    """Test byte ranges spanning chunk boundaries."""
+    page = make_page(1, asset)
+    blob_id = store.put(page)["blob_id"]
+
+    for start, end in [(0, 10), (5000, 90_000), (len(page) - 7, len(page)), (100, None)]:
+        expected = page[start:end]
+        assert store.read_range(blob_id, start, end) == expected
+
+    assert store.read_range(blob_id, len(page), len(page) + 10) == b""
+
+
+def test_gc_removes_unreferenced(store, asset):
+    """Test GC deletes dead blobs and their unique chunks but keeps shared ones."""
+    page = make_page(1, asset)
+    other = make_page(2, asset)  # Different text, same asset
+
+    keep = store.put(page)["blob_id"]
+    drop = store.put(other)["blob_id"]
+
+    # Nothing is collected inside the grace period
+    assert store.gc({keep})["blobs_deleted"] == 0
+
+    old = time.time() - store.GC_GRACE_SECONDS - 10
+    for path in list(store.blob_dir.rglob("*")) + list(store.chunk_dir.rglob("*")):
+        os.utime(path, (old, old))
+
+    dry = store.gc({keep}, dry_run=True)
+    assert dry["blobs_deleted"] == 1
+    assert store.exists(drop)
+
+    result = store.gc({keep})
+    assert result["blobs_deleted"] == 1
+    assert result["chunks_deleted"] > 0
+    assert not store.exists(drop)
+    assert store.get(keep) == page  # Shared asset chunk survived
+
+
+def test_gc_against_archive_snapshots(store, asset):
+    """Test GC uses blob references in archive_snapshots as roots."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(Path(tmpdir) / "test.db")
+        link_id = db.insert_link("https://example.com/page", source="test")
+
+        live = store.put(make_page(1, asset))
+        dead = store.put(make_page(2, asset))
+        db.add_archive_snapshot(
+            link_id=link_id, service="local_monolith", snapshot_url=live["ref"], status="success"
+        )
+
+        old = time.time() - store.GC_GRACE_SECONDS - 10
+        for path in store.blob_dir.rglob("*.json"):
+            os.utime(path, (old, old))
+
+        result = store.gc_against_db(db)
+        db.close()
+
+    assert result["blobs_deleted"] == 1
+    assert store.exists(live["blob_id"])
+    assert not store.exists(dead["blob_id"])
+
+
+def test_blob_refs():
+    """Test blob reference helpers."""
+    ref = blob_ref("a" * 64)
+    assert is_blob_ref(ref)
+    assert not is_blob_ref("/home/user/.holocene/archives/monolith/x.html")
+    assert not is_blob_ref(None)
+    assert parse_blob_ref(ref) == "a" * 64
+    with pytest.raises(ValueError):
+        parse_blob_ref("https://example.com")
+
+
+def test_local_client_ingests_capture(asset):
+    """Test LocalArchiveClient moves finished captures into the store."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = LocalArchiveClient(archive_dir=Path(tmpdir))
+
+        html_path = Path(tmpdir) / "page.html"
+        html_path.write_bytes(make_page(1, asset))
+        result = client._finalize(html_path, "monolith")
+
+        assert is_blob_ref(result["local_path"])
+        assert not html_path.exists()
+        assert client.store.get(parse_blob_ref(result["local_path"])) == make_page(1, asset)
+
+        # WARCs are stored decompressed so chunks can dedup
+        warc_path = Path(tmpdir) / "page.warc.gz"
+        warc_path.write_bytes(gzip.compress(b"WARC/1.0\r\n" * 1000))
+        result = client._finalize(warc_path, "warc")
+        assert client.store.get(parse_blob_ref(result["local_path"])) == b"WARC/1.0\r\n" * 1000
+        assert result["file_size"] == 10_000
+
+
+def test_local_client_without_store(asset):
+    """Test use_store=False keeps standalone files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = LocalArchiveClient(archive_dir=Path(tmpdir), use_store=False)
+        path = Path(tmpdir) / "page.html"
+        path.write_bytes(b"<html></html>")
+
+        result = client._finalize(path, "monolith")
+
+        assert client.store is None
+        assert result["local_path"] == str(path)
+        assert path.exists()
@@ -0,0 +1,174 @@
+"""Tests for the multiplexed SSH transport and batched ArchiveBox adds.
+
+A fake `ssh` shim stands in for OpenSSH + ArchiveBox: it logs each
+invocation (new connection vs. reuse of the control socket) and emulates
+`archivebox add` / `archivebox list` against a JSON index file.
+"""
+
+import json
+import stat
+import sys
+
+import pytest
+
+from holocene.integrations.archivebox import ArchiveBoxClient
+from holocene.integrations.ssh_transport import SSHTransport
+
+FAKE_SSH = '''\
+#!{python}
+import json, os, shlex, sys, time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LOG = os.path.join(HERE, "ssh.log")
+INDEX = os.path.join(HERE, "index.json")
+
+def log(event, **data):
+    with open(LOG, "a") as f:
+        f.write(json.dumps({{"event": event, **data}}) + "\\n")
+
+def load_index():
+    if not os.path.exists(INDEX):
+        return {{}}
+    with open(INDEX) as f:
+        return json.load(f)
+
+def save_index(index):
+    with open(INDEX + ".tmp", "w") as f:
+        json.dump(index, f)
+    os.replace(INDEX + ".tmp", INDEX)
+
+args = sys.argv[1:]
+options = {{}}
+while args and args[0] in ("-o", "-O"):
+    flag, value = args[0], args[1]
+    if flag == "-O":
+        options["control"] = value
+    else:
+        key, _, val = value.partition("=")
+        options[key] = val
+    args = args[2:]
+
+socket = options["ControlPath"].replace("%C", "hash")
+if options.get("control") == "exit":
+    log("exit")
+    if os.path.exists(socket):
+        os.remove(socket)
+    sys.exit(0)
+
+target, command = args[0], " ".join(args[1:])
+if os.path.exists(socket):
+    log("reuse", command=command)
+else:
+    log("connect", command=command)
+    open(socket, "w").close()
+
+if command == "echo ok":
+    print("ok")
+    sys.exit(0)
+
+tokens = shlex.split(command)
+archivebox_args = tokens[len(tokens) - tokens[::-1].index("archivebox"):]
+action = archivebox_args[0]
+
+if action == "add":
+    urls = [a for a in archivebox_args[1:] if not a.startswith("--")]
+    stdin = "" if urls else sys.stdin.read()
+    urls = urls or stdin.split()
+    log("add", urls=urls, stdin=bool(stdin))
+    for i, url in enumerate(urls):
+        if "slow" in url:
+            time.sleep(1.0)
+        if "fail" in url:
+            print("[X] Failed to archive " + url, file=sys.stderr)
+            continue
+        index = load_index()
+        index[url] = "1700000000.%d" % (len(index) + 1)
+        save_index(index)
+        print('[+] [2024-01-01 00:00:00] "Title"')
+        print("    " + url)
+        print("    > ./archive/" + index[url])
+elif action == "list" and "--filter-type=exact" in archivebox_args:
+    wanted = archivebox_args[archivebox_args.index("--filter-type=exact") + 1:]
+    index = load_index()
+    print(json.dumps([
+        {{"url": url, "timestamp": index[url], "is_archived": True, "title": "Title"}}
+        for url in wanted if url in index
+    ]))
+elif action == "list":
+    print("0")
+'''
+
+
+@pytest.fixture
+def fake_ssh(tmp_path):
+    shim = tmp_path / "ssh"
+    shim.write_text(FAKE_SSH.format(python=sys.executable))
+    shim.chmod(shim.stat().st_mode | stat.S_IEXEC)
+    return shim
+
+
+def ssh_log(fake_ssh):
+    log = fake_ssh.parent / "ssh.log"
+    return [json.loads(line) for line in log.read_text().splitlines()] if log.exists() else []
+
+
+@pytest.fixture
+def client(fake_ssh, tmp_path):
+    transport = SSHTransport("archivebox", "holocene", ssh_command=str(fake_ssh),
+                             control_dir=str(tmp_path))
+    client = ArchiveBoxClient(ssh_host="archivebox", transport=transport, poll_interval=0.05)
+    yield client
+    client.close()
+
+
+def test_commands_share_one_connection(client, fake_ssh):
+    """Test the connectivity check opens the connection and later commands reuse it."""
+    assert client.available
+    client.archive_url("https://example.com/a")
+    client.get_queue_status()
+    client.close()
+
+    events = [entry["event"] for entry in ssh_log(fake_ssh)]
+    assert events.count("connect") == 1
+    assert events[0] == "connect"
+    assert events.count("reuse") == 3  # add + pending and incomplete counts
+    assert events[-1] == "exit"
+
+
+def test_batched_add_uses_one_command(client, fake_ssh):
+    """Test archive_urls sends every URL through stdin of a single add."""
+    urls = ["https://example.com/1", "https://example.com/fail", "https://example.com/2"]
+
+    results = client.archive_urls(urls)
+
+    adds = [entry for entry in ssh_log(fake_ssh) if entry["event"] == "add"]
+    assert len(adds) == 1
+    assert adds[0]["urls"] == urls and adds[0]["stdin"]
+
+    assert results["https://example.com/1"]["status"] == "archived"
+    assert results["https://example.com/1"]["snapshot_id"] == "1700000000.1"
+    assert results["https://example.com/2"]["snapshot_id"] == "1700000000.2"
+    assert results["https://example.com/fail"]["status"] == "error"
+
+
+def test_submit_urls_resolves_each_url_as_it_finishes(client):
+    """Test polling resolves a finished URL's future before the batch completes."""
+    futures = client.submit_urls(["https://example.com/quick", "https://example.com/slow"])
+
+    quick = futures["https://example.com/quick"].result(timeout=0.9)
+    assert quick["status"] == "archived"
+    assert not futures["https://example.com/slow"].done()
+
+    slow = futures["https://example.com/slow"].result(timeout=5)
+    assert slow["status"] == "archived"
+    assert slow["snapshot_id"] == "1700000000.2"
+
+
+def test_unavailable_host(tmp_path):
+    """Test a failed connectivity check marks the client unavailable."""
+    transport = SSHTransport("nowhere", ssh_command=str(tmp_path / "missing-ssh"),
+                             control_dir=str(tmp_path))
+    client = ArchiveBoxClient(transport=transport)
+
+    assert not client.available
+    assert client.archive_urls(["https://example.com"])["https://example.com"]["status"] == "error"
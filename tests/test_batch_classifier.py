@@ -0,0 +1,163 @@
+"""Tests for batched Dewey/UDC classification."""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from holocene.core.channels import ChannelManager
+from holocene.research.batch_classifier import (
+    BatchClassifier,
+    validate_dewey_number,
+    validate_udc_number,
+)
+from holocene.research.dewey_classifier import generate_cutter_number
+from holocene.storage.database import Database
+
+
+class FakeLLM:
+    """Answers each prompt with answer(book) for every book listed in it."""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.prompts = []
+
+    def simple_prompt(self, prompt, system=None, **kwargs):
+        books = json.loads(prompt.split("Books:\n", 1)[1].split("\n\nReturn ONLY", 1)[0])
+        self.prompts.append(books)
+        answers = [self.answer(book) for book in books]
+        return json.dumps([answer for answer in answers if answer])
+
+
+def make_config(batch_size=2, retries=2):
+    config = Mock()
+    config.llm.primary = "test-model"
+    config.classification.generate_cutter_numbers = True
+    config.classification.generate_full_call_numbers = True
+    config.classification.cutter_length = 3
+    config.classification.batch_size = batch_size
+    config.classification.batch_retries = retries
+    config.classification.batch_delay = 0.2
+    return config
+
+
+def make_books(count):
+    return [{"id": i, "title": f"Geostatistics {i}", "author": "Isaaks, Edward"} for i in range(1, count + 1)]
+
+
+def test_validate_numbers():
+    """Test class numbers are checked against the DDC and UDC schedules."""
+    assert validate_dewey_number("550.182") == "550.182"
+    assert validate_dewey_number("DDC 641.3373") == "641.3373"
+    for bad in ("55", "550.18a", "W550", "045", None):
+        with pytest.raises(ValueError):
+            validate_dewey_number(bad)
+
+    assert validate_udc_number("550.8") == "550.8"
+    assert validate_udc_number('821.134.3(81)"19"') == '821.134.3(81)"19"'
+    assert validate_udc_number("51:53") == "51:53"
+    for bad in ("42", "abc", ""):
+        with pytest.raises(ValueError):
+            validate_udc_number(bad)
+
+
+def test_classifies_several_books_per_prompt():
+    """Test books share prompts and get locally computed Cutter and call numbers."""
+    llm = FakeLLM(lambda book: {"id": book["id"], "number": "550.182", "label": "Geostatistics", "confidence": "high"})
+    batch = BatchClassifier(llm, make_config(batch_size=2))
+
+    results = batch.classify_books(make_books(5))
+
+    assert batch.prompts_sent == 3
+    assert sorted(results) == [1, 2, 3, 4, 5]
+    assert results[1]["dewey_number"] == "550.182"
+    cutter = generate_cutter_number("Isaaks, Edward")
+    assert results[1]["cutter_number"] == cutter
+    assert results[1]["call_number"] == f"550.182 {cutter}g"
+    assert results[1]["classification_system"] == "Dewey"
+
+
+def test_retries_only_rejected_books():
+    """Test missing and invalid answers are retried on their own, with the reason."""
+    def answer(book):
+        if book.get("previous_answer_rejected"):
+            return {"id": book["id"], "number": "551", "confidence": "medium"}
+        if book["id"] == 2:
+            return {"id": 2, "number": "forty-two"}
+        if book["id"] == 3:
+            return None
+        return {"id": book["id"], "number": "550"}
+
+    llm = FakeLLM(answer)
+    batch = BatchClassifier(llm, make_config(batch_size=4))
+
+    results = batch.classify_books(make_books(4))
+
+    assert len(llm.prompts) == 2
+    retried = llm.prompts[1]
+    assert [book["id"] for book in retried] == [2, 3]
+    assert "not a DDC number" in retried[0]["previous_answer_rejected"]
+    assert {book_id: result["dewey_number"] for book_id, result in results.items()} == {
+        1: "550", 2: "551", 3: "551", 4: "550",
+    }
+    assert results[2]["dewey_label"] == "Science"  # Main class label when none is given
+
+
+def test_gives_up_after_retries():
+    """Test a book that never gets a valid answer ends with an error result."""
+    llm = FakeLLM(lambda book: {"id": book["id"], "number": "550.8" if book["id"] == 1 else "abc"})
+    batch = BatchClassifier(llm, make_config(batch_size=5, retries=1), system="UDC")
+
+    results = batch.classify_books(make_books(2))
+
+    assert batch.prompts_sent == 2
+    assert results[1]["udc_number"] == "550.8"
+    assert "not valid UDC notation" in results[2]["error"]
+
+
+def test_plugin_coalesces_added_books():
+    """Test a burst of books.added events is classified as one batch."""
+    from holocene.plugins.book_classifier import BookClassifierPlugin
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(Path(tmpdir) / "test.db")
+        book_ids = []
+        for i in range(3):
+            book_id = db.insert_book(f"Book {i}", author="Doe, Jane")
+            db.update_book_enrichment(book_id, "A summary", ["tag"])
+            book_ids.append(book_id)
+
+        llm = FakeLLM(lambda book: {"id": book["id"], "number": "550"})
+        config = make_config(batch_size=10)
+        config.llm.api_key = None  # on_load() must not build a real DeweyClassifier
+        classifier = SimpleNamespace(batch_classifier=lambda size: BatchClassifier(llm, config, batch_size=size))
+        core = SimpleNamespace(
+            config=config,
+            db=db,
+            channels=ChannelManager(),
+            run_in_background=lambda task, callback, error_handler, **kw: task(),
+        )
+
+        plugin = BookClassifierPlugin(core)
+        plugin.on_load()
+        plugin.classifier = classifier
+        plugin.enable()
+
+        completed = []
+        core.channels.subscribe('classification.complete', lambda msg: completed.append(msg.data['book_id']))
+        for book_id in book_ids:
+            core.channels.publish('books.added', {'book_id': book_id})
+
+        deadline = time.monotonic() + 5
+        while len(completed) < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        plugin.disable()
+
+        assert sorted(completed) == sorted(book_ids)
+        assert len(llm.prompts) == 1
+        assert db.get_book(book_ids[0])["udc_classification"] == "550"
+        db.close()
@@ -0,0 +1,197 @@
+"""Tests for the local capture worker pool and resource-limited captures.
+
+A fake `monolith` script on PATH stands in for the real tool: it prints
+progress lines and sleeps between them when the URL contains "slow".
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from holocene.integrations.capture_process import ResourceLimits, run_capture
+from holocene.integrations.local_archive import LocalArchiveClient
+from holocene.storage.capture_pool import CapturePool
+from holocene.storage.database import Database
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fake tools are POSIX scripts")
+
+FAKE_MONOLITH = '''\
+#!{python}
+import sys, time
+
+url = sys.argv[sys.argv.index("-o") - 1]
+output = sys.argv[sys.argv.index("-o") + 1]
+for i in range(3):
+    print("fetching part %d" % i, file=sys.stderr, flush=True)
+    if "slow" in url:
+        time.sleep(0.5)
+with open(output, "w") as f:
+    f.write("<html>" + url + "</html>")
+'''
+
+
+@pytest.fixture
+def fake_tools(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monolith = bin_dir / "monolith"
+    monolith.write_text(FAKE_MONOLITH.format(python=sys.executable))
+    monolith.chmod(monolith.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return bin_dir
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        yield database
+        database.close()
+
+
+@pytest.fixture
+def client(fake_tools, tmp_path):
+    return LocalArchiveClient(archive_dir=tmp_path / "archives", limits=ResourceLimits(memory_mb=2048))
+
+
+def add_link(db, url):
+    cursor = db.conn.cursor()
+    cursor.execute(
+        "INSERT INTO links (url, title, source, first_seen, last_seen, created_at) "
+        "VALUES (?, 'Title', 'test', datetime('now'), datetime('now'), datetime('now'))",
+        (url,),
+    )
+    db.conn.commit()
+    return cursor.lastrowid
+
+
+def test_run_capture_applies_limits_and_streams(tmp_path):
+    """Test the child runs under the rlimits and its output arrives line by line."""
+    lines = []
+    script = "import resource; print(resource.getrlimit(resource.RLIMIT_AS)[0]); print(resource.getrlimit(resource.RLIMIT_CPU)[0])"
+
+    result = run_capture(
+        [sys.executable, "-c", script],
+        timeout=10,
+        limits=ResourceLimits(memory_mb=2048, cpu_seconds=30),
+        on_output=lines.append,
+    )
+
+    assert result.returncode == 0
+    assert lines == [str(2048 * 1024 * 1024), "30"]
+
+
+def test_pool_captures_and_records_link_result(db, client):
+    """Test a link capture runs on a worker, streams progress and records its snapshot."""
+    progress = []
+    link_id = add_link(db, "https://example.com/a")
+    pool = CapturePool(db, client, max_workers=1, on_progress=lambda job_id, line: progress.append(line))
+    pool.start()
+    try:
+        job_id = pool.submit("https://example.com/a", "monolith", link_id=link_id)
+        result = pool.future(job_id).result(timeout=10)
+    finally:
+        pool.stop()
+
+    assert result["status"] == "archived"
+    assert result["local_path"]
+    assert "fetching part 2" in progress
+    assert db.get_capture_job(job_id)["status"] == "done"
+
+    cursor = db.conn.cursor()
+    cursor.execute("SELECT service, status FROM archive_snapshots WHERE link_id = ?", (link_id,))
+    assert [tuple(row) for row in cursor.fetchall()] == [("local_monolith", "success")]
+
+
+def test_submit_local_returns_future_without_waiting(db, client):
+    """Test ArchivingService.submit_local hands back the pool's future for async callers."""
+    from holocene.storage.archiving import ArchivingService
+
+    link_id = add_link(db, "https://example.com/slow")
+    pool = CapturePool(db, client, max_workers=1)
+    archiving = ArchivingService(db, capture_pool=pool)
+    assert archiving.submit_local("https://example.com/slow") is None  # Pool not running
+
+    pool.start()
+    try:
+        future = archiving.submit_local("https://example.com/slow")
+        assert not future.done()
+        raw = future.result(timeout=10)
+    finally:
+        pool.stop()
+
+    result = archiving.record_local(link_id, "https://example.com/slow", raw)
+    assert result["success"] is True
+    assert result["services"]["local_monolith"]["status"] == "success"
+
+
+def test_cancel_running_capture(db, client):
+    """Test cancelling kills the running capture and leaves no partial file."""
+    pool = CapturePool(db, client, max_workers=1)
+    pool.start()
+    try:
+        job_id = pool.submit("https://example.com/slow", "monolith")
+        deadline = time.monotonic() + 5
+        while db.get_capture_job(job_id)["status"] != "running" and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert pool.cancel(job_id)
+        result = pool.future(job_id).result(timeout=5)
+    finally:
+        pool.stop()
+
+    assert result["status"] == "cancelled"
+    assert db.get_capture_job(job_id)["status"] == "cancelled"
+    assert not list(client.archive_dir.rglob("*.html"))
+
+
+def test_worker_count_limits_concurrency(db, client):
+    """Test no more captures run at once than there are workers."""
+    pool = CapturePool(db, client, max_workers=2)
+    peak = [0]
+    stop = threading.Event()
+
+    def watch():
+        while not stop.is_set():
+            peak[0] = max(peak[0], db.count_capture_jobs("running"))
+            time.sleep(0.02)
+
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    pool.start()
+    try:
+        job_ids = [pool.submit(f"https://example.com/slow/{i}", "monolith") for i in range(4)]
+        results = [pool.future(job_id).result(timeout=15) for job_id in job_ids]
+    finally:
+        stop.set()
+        watcher.join()
+        pool.stop()
+
+    assert all(result["status"] == "archived" for result in results)
+    assert peak[0] == 2
+
+
+def test_interrupted_jobs_recovered_on_start(db, client):
+    """Test link captures survive a restart and waiting-caller captures are cancelled."""
+    link_id = add_link(db, "https://example.com/resumed")
+    resumed = db.add_capture_job("https://example.com/resumed", "monolith", link_id=link_id)
+    orphaned = db.add_capture_job("https://example.com/orphaned", "monolith")
+    db.claim_capture_job()  # Both were running when the previous holod died
+    db.claim_capture_job()
+
+    pool = CapturePool(db, client, max_workers=1)
+    pool.start()
+    try:
+        result = pool.future(resumed).result(timeout=10)
+    finally:
+        pool.stop()
+
+    assert result["status"] == "archived"
+    assert db.get_capture_job(resumed)["status"] == "done"
+    assert db.get_capture_job(orphaned)["status"] == "cancelled"
@@ -0,0 +1,118 @@
+"""Tests for batched inventory categorization."""
+
+import json
+import re
+import threading
+
+from holocene.core.taxonomy import InventoryTaxonomy
+from holocene.core.categorizer import (
+    batch_suggest_categories,
+    match_category_by_alias,
+    _build_taxonomy_reference,
+)
+
+
+class FakeLLM:
+    """Answers every numbered item with a fixed category."""
+
+    def __init__(self, category="E-TEST", confidence=0.8, skip_ids=(), raw=None):
+        self.category = category
+        self.confidence = confidence
+        self.skip_ids = set(skip_ids)
+        self.raw = raw
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def simple_prompt(self, prompt, model=None, system=None, temperature=0.7):
+        with self.lock:
+            self.calls.append({"prompt": prompt, "system": system})
+        if self.raw is not None:
+            return self.raw
+        ids = [int(n) for n in re.findall(r"^(\d+)\. ", prompt, re.MULTILINE)]
+        answers = [
+            {"id": i, "category": self.category, "confidence": self.confidence, "reasoning": "fake"}
+            for i in ids if i not in self.skip_ids
+        ]
+        return "```json\n" + json.dumps(answers) + "\n```"
+
+
+def test_alias_match_picks_specific_category():
+    """Test unambiguous aliases categorize without the LLM."""
+    taxonomy = InventoryTaxonomy()
+
+    assert match_category_by_alias("Dial indicator with magnetic base", taxonomy) == ("T-MEAS-IND", "indicator")
+    assert match_category_by_alias("Furadeira de impacto 650W", taxonomy)[0] == "T-CUT-DRL"
+
+
+def test_alias_match_rejects_vague_or_conflicting_titles():
+    """Test top-level-only, ambiguous and conflicting matches go to the LLM."""
+    taxonomy = InventoryTaxonomy()
+
+    assert match_category_by_alias("Tools organizer", taxonomy) is None  # Top-level only
+    assert match_category_by_alias("Cordless saw", taxonomy) is None  # Alias shared by categories
+    assert match_category_by_alias("Micrometer and caliper set", taxonomy) is None  # Two categories
+    assert match_category_by_alias("Ind 5 pack", taxonomy) is None  # Bare code "IND" isn't an alias
+
+
+def test_items_batched_into_few_prompts():
+    """Test many items go to the LLM in batches, with a shared system prompt."""
+    taxonomy = InventoryTaxonomy()
+    code = sorted(taxonomy.canonical_map)[-1]
+    llm = FakeLLM(category=code)
+    items = [{"title": f"Mystery gadget {i}"} for i in range(60)]
+
+    results = batch_suggest_categories(items, taxonomy, llm, batch_size=25)
+
+    assert len(llm.calls) == 3
+    assert len({call["system"] for call in llm.calls}) == 1
+    assert [r["item"] for r in results] == items
+    assert all(r["category"] == code and r["method"] == "llm" for r in results)
+
+
+def test_alias_matches_skip_llm():
+    """Test obvious items never reach the LLM."""
+    taxonomy = InventoryTaxonomy()
+    llm = FakeLLM()
+    items = [{"title": "Dial indicator 0.01mm"}, {"title": ""}]
+
+    results = batch_suggest_categories(items, taxonomy, llm)
+
+    assert llm.calls == []
+    assert results[0]["category"] == "T-MEAS-IND"
+    assert results[0]["method"] == "alias"
+    assert results[1]["reasoning"] == "No title provided"
+
+
+def test_batch_answers_validated_per_item():
+    """Test missing answers, invalid codes and low confidence are handled per item."""
+    taxonomy = InventoryTaxonomy()
+    llm = FakeLLM(category="NOT-A-CODE", skip_ids={2})
+    items = [{"title": "Thing one"}, {"title": "Thing two"}]
+
+    results = batch_suggest_categories(items, taxonomy, llm)
+    assert results[0]["category"] is None
+    assert results[0]["reasoning"].startswith("Invalid category")
+    assert results[1]["reasoning"] == "No answer for this item"
+
+    code = sorted(taxonomy.canonical_map)[0]
+    low = batch_suggest_categories(items, taxonomy, FakeLLM(category=code, confidence=0.2))
+    assert [r["category"] for r in low] == [None, None]
+    assert low[0]["confidence"] == 0.2
+
+
+def test_unparseable_batch_marks_items_failed():
+    """Test a garbage response fails the batch without raising."""
+    taxonomy = InventoryTaxonomy()
+    results = batch_suggest_categories(
+        [{"title": "Thing"}], taxonomy, FakeLLM(raw="Sorry, I can't help with that.")
+    )
+
+    assert results[0]["category"] is None
+    assert results[0]["reasoning"].startswith("Error during categorization")
+
+
+def test_taxonomy_reference_cached():
+    """Test the taxonomy reference is built once per taxonomy."""
+    taxonomy = InventoryTaxonomy()
+
+    assert _build_taxonomy_reference(taxonomy) is _build_taxonomy_reference(taxonomy)
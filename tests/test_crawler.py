@@ -0,0 +1,295 @@
+"""Tests for the resumable crawler and Mercado Livre enrichment job."""
+
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from holocene.storage.database import Database
+from holocene.storage.migrations import apply_migration_23
+from holocene.integrations import mercadolivre
+from holocene.integrations.crawler import Crawler, HostThrottle
+from holocene.integrations.http_fetcher import HTTPFetcher
+from holocene.integrations.mercadolivre import (
+    ENRICH_JOB,
+    parse_product_page,
+    queue_enrichment,
+    save_enrichment,
+)
+
+PRODUCT_PAGE = """<html><head>
+<meta content="Paquímetro digital &amp; estojo" property="og:description">
+<script type="application/ld+json">
+{"@type": "Product", "name": "Paquímetro Digital 150mm", "image": ["https://img/1.jpg"],
+ "offers": {"price": "89.90", "priceCurrency": "BRL", "availability": "https://schema.org/InStock"},
+ "aggregateRating": {"ratingValue": "4.7", "reviewCount": "120"}}
+</script>
+<script type="application/ld+json">
+{"@type": "BreadcrumbList", "itemListElement": [
+  {"item": {"name": "Ferramentas"}}, {"item": {"name": "Paquímetros"}}]}
+</script></head>
+<body><a class="ui-pdp-seller__link">Loja <b>Oficial</b></a><p>Frete grátis</p></body></html>"""
+
+
+class ShopHandler(BaseHTTPRequestHandler):
+    """Serves /item/<id>; /item/gone -> 404, /item/busy -> 503. ETag "v1"."""
+
+    requests = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with ShopHandler.lock:
+            ShopHandler.requests.append((self.path, self.headers.get("If-None-Match")))
+            ShopHandler.active += 1
+            ShopHandler.max_active = max(ShopHandler.max_active, ShopHandler.active)
+        try:
+            time.sleep(0.05)
+            if self.path.endswith("/gone"):
+                self._status(404)
+            elif self.path.endswith("/busy"):
+                self._status(503)
+            elif self.headers.get("If-None-Match") == '"v1"':
+                self._status(304)
+            else:
+                body = PRODUCT_PAGE.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                self.wfile.write(body)
+        finally:
+            with ShopHandler.lock:
+                ShopHandler.active -= 1
+
+    def _status(self, code):
+        self.send_response(code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    ShopHandler.requests = []
+    ShopHandler.max_active = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ShopHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def workspace():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        db = Database(root / "test.db")
+        fetcher = HTTPFetcher(
+            config=SimpleNamespace(data_dir=root),
+            cache_dir=root / "cache",
+            cache_enabled=True,
+        )
+        yield db, fetcher
+        db.close()
+
+
+def add_favorites(db, base_url, item_ids):
+    for i, item_id in enumerate(item_ids):
+        db.conn.execute(
+            "INSERT INTO mercadolivre_favorites (item_id, title, url, bookmarked_date, first_synced, created_at) "
+            "VALUES (?, ?, ?, ?, '2024-01-01', '2024-01-01')",
+            (item_id, f"Item {item_id}", f"{base_url}/item/{item_id}", f"2024-01-{i + 1:02d}"),
+        )
+    db.conn.commit()
+
+
+def make_crawler(db, fetcher, **kwargs):
+    options = {"concurrency": 3, "delay": 0, "jitter": 0, "batch_size": 2}
+    options.update(kwargs)
+    return Crawler(
+        db, ENRICH_JOB, fetcher,
+        parse=mercadolivre._parse_for_enrichment,
+        save=save_enrichment,
+        **options,
+    )
+
+
+def frontier(db):
+    rows = db.conn.execute("SELECT key, status, attempts, next_attempt_at FROM crawl_frontier ORDER BY key")
+    return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+
+def test_parse_uses_json_ld_without_tree(monkeypatch):
+    """Test product data comes from JSON-LD and meta tags without BeautifulSoup."""
+    def no_soup(html):
+        raise AssertionError("soup should not be built")
+
+    monkeypatch.setattr(mercadolivre, "make_soup", no_soup)
+    data = parse_product_page(PRODUCT_PAGE, "https://ml/item")
+
+    assert data["title"] == "Paquímetro Digital 150mm"
+    assert data["price"] == 89.90
+    assert data["availability"] is True
+    assert data["image_url"] == "https://img/1.jpg"
+    assert data["reviews"] == {"rating_average": 4.7, "total": 120}
+    assert data["category_path"] == "Ferramentas > Paquímetros"
+    assert data["description"] == "Paquímetro digital & estojo"
+    assert data["seller_info"] == {"nickname": "Loja Oficial"}
+    assert data["shipping"] == {"free_shipping": True}
+
+
+def test_parse_falls_back_to_html():
+    """Test title and price are scraped when there is no JSON-LD."""
+    html = ('<h1 class="ui-pdp-title">Micrômetro</h1>'
+            '<span class="andes-money-amount__fraction">1.234</span>')
+
+    data = parse_product_page(html, "https://ml/item")
+
+    assert data["title"] == "Micrômetro"
+    assert data["price"] == 1234.0
+    assert "shipping" not in data
+
+
+def test_crawl_enriches_in_batches(server, workspace):
+    """Test queued favorites are fetched concurrently and written to the DB."""
+    db, fetcher = workspace
+    add_favorites(db, server, ["A1", "A2", "A3", "A4", "A5"])
+
+    assert queue_enrichment(db) == 5
+    stats = make_crawler(db, fetcher).run()
+
+    assert stats["fetched"] == stats["saved"] == 5
+    assert ShopHandler.max_active > 1
+    assert set(frontier(db).values()) == {("done", 0, None)}
+
+    row = db.get_mercadolivre_favorite("A3")
+    assert row["description"] == "Paquímetro digital & estojo"
+    assert row["reviews_rating"] == 4.7
+    assert row["free_shipping"] == 1
+    assert row["enriched_at"]
+    assert row["cached_html_path"] == str(Path("cache") / "A3.html")
+
+    # Enriched favorites aren't queued again
+    assert queue_enrichment(db) == 0
+
+
+def test_refresh_uses_conditional_gets(server, workspace):
+    """Test re-crawls send the stored ETag and 304s skip parsing and writes."""
+    db, fetcher = workspace
+    add_favorites(db, server, ["B1"])
+    queue_enrichment(db)
+    make_crawler(db, fetcher).run()
+
+    assert queue_enrichment(db, refresh=True) == 1
+    stats = make_crawler(db, fetcher).run()
+
+    assert stats["not_modified"] == 1
+    assert stats["saved"] == 0
+    assert ShopHandler.requests[-1] == ("/item/B1", '"v1"')
+
+
+def test_cached_html_reused_on_first_crawl(server, workspace):
+    """Test a page already in the HTML cache isn't fetched again."""
+    db, fetcher = workspace
+    add_favorites(db, server, ["C1"])
+    fetcher.cache_dir.mkdir(parents=True, exist_ok=True)
+    (fetcher.cache_dir / "C1.html").write_text(PRODUCT_PAGE, encoding="utf-8")
+
+    queue_enrichment(db)
+    stats = make_crawler(db, fetcher).run()
+
+    assert stats["cached"] == 1
+    assert ShopHandler.requests == []
+    assert db.get_mercadolivre_favorite("C1")["reviews_total"] == 120
+
+
+def test_failures_retry_or_give_up(server, workspace):
+    """Test 5xx responses are retried later and 404s fail immediately."""
+    db, fetcher = workspace
+    add_favorites(db, server, ["busy", "gone", "ok"])
+    queue_enrichment(db)
+
+    stats = make_crawler(db, fetcher).run()
+
+    entries = frontier(db)
+    assert stats == {**stats, "saved": 1, "retrying": 1, "failed": 1}
+    assert entries["gone"][:2] == ("failed", 1)
+    assert entries["busy"][:2] == ("pending", 1)
+    assert entries["busy"][2] is not None  # Backoff scheduled
+    assert db.get_crawl_stats(ENRICH_JOB)["due"] == 0
+
+    # Asking again re-queues the failed entry with a fresh attempt count
+    assert queue_enrichment(db, item_ids=["gone"]) == 1
+    assert frontier(db)["gone"][:2] == ("pending", 0)
+
+
+def test_interrupted_crawl_resumes(server, workspace):
+    """Test entries left in_progress by a crash are crawled by the next run."""
+    db, fetcher = workspace
+    add_favorites(db, server, ["D1", "D2", "D3"])
+    queue_enrichment(db)
+    db.claim_crawl_entries(ENRICH_JOB, 2)  # Claimed, then the process died
+
+    stats = make_crawler(db, fetcher).run()
+
+    assert stats["saved"] == 3
+    assert db.get_crawl_stats(ENRICH_JOB)["done"] == 3
+
+
+def test_stop_event_leaves_work_pending(server, workspace):
+    """Test stopping mid-crawl puts unstarted entries back to pending."""
+    db, fetcher = workspace
+    add_favorites(db, server, ["E1", "E2", "E3", "E4"])
+    queue_enrichment(db)
+    stop = threading.Event()
+    crawler = make_crawler(db, fetcher, concurrency=1, delay=0.3)
+
+    def stop_after_first(result):
+        stop.set()
+
+    crawler.run(stop_event=stop, on_result=stop_after_first)
+
+    stats = db.get_crawl_stats(ENRICH_JOB)
+    assert stats["done"] >= 1
+    assert stats["in_progress"] == 0
+    assert stats["done"] + stats["pending"] == 4
+
+
+def test_host_throttle_spaces_requests_per_host():
+    """Test same-host requests are spaced and other hosts aren't delayed."""
+    throttle = HostThrottle(delay=0.15)
+
+    start = time.monotonic()
+    for _ in range(3):
+        throttle.wait("a.example")
+    same_host = time.monotonic() - start
+
+    start = time.monotonic()
+    throttle.wait("b.example")
+    other_host = time.monotonic() - start
+
+    assert same_host >= 0.29
+    assert other_host < 0.05
+
+
+def test_migration_tolerates_existing_columns():
+    """Test enrichment columns added by older CLI runs don't break the migration."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE mercadolivre_favorites (id INTEGER PRIMARY KEY, item_id TEXT, description TEXT)")
+
+    apply_migration_23(conn)
+    apply_migration_23(conn)
+
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(mercadolivre_favorites)")}
+    assert {"description", "enriched_at", "cached_html_path", "brightdata_blocked"} <= columns
+    assert conn.execute("SELECT COUNT(*) FROM crawl_frontier").fetchone()[0] == 0
@@ -0,0 +1,159 @@
+"""Tests for the trigger-maintained daily rollups and digest built from them."""
+
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from holocene.plugins.proactive_laney import ProactiveLaneyPlugin
+from holocene.storage import migrations
+from holocene.storage.database import Database
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        yield database
+        database.close()
+
+
+def add_link(db, url, title="A link"):
+    now = datetime.now().isoformat()
+    cursor = db.conn.execute("""
+        INSERT INTO links (url, title, source, first_seen, last_seen, created_at)
+        VALUES (?, ?, 'test', ?, ?, ?)
+    """, (url, title, now, now, now))
+    db.conn.commit()
+    return cursor.lastrowid
+
+
+def table_count(db, table):
+    return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_triggers_count_changes(db):
+    """Test additions, removals, enrichment, classification and link health are counted."""
+    book_ids = [db.insert_book(f"Book {i}") for i in range(3)]
+    db.add_paper("A paper")
+    link_ids = [add_link(db, f"https://example.com/{i}") for i in range(4)]
+
+    db.update_book_enrichment(book_ids[0], "Summary", ["tag"])
+    db.update_book_enrichment(book_ids[0], "Better summary", ["tag"])  # Counted once
+    db.update_book_classification(book_ids[1], "551.21")
+
+    # Link health transitions: dead, dead again (no change), recovered, deleted while dead
+    def set_status(link_id, status):
+        db.conn.execute(
+            "UPDATE links SET status = ?, last_checked = ? WHERE id = ?",
+            (status, datetime.now().isoformat(), link_id),
+        )
+    set_status(link_ids[0], "not_found")
+    set_status(link_ids[1], "timeout")
+    set_status(link_ids[1], "dns_error")
+    set_status(link_ids[2], "dead")
+    set_status(link_ids[2], "alive")
+    db.conn.execute("DELETE FROM links WHERE id = ?", (link_ids[0],))
+    db.conn.execute("DELETE FROM books WHERE id = ?", (book_ids[1],))
+    db.conn.commit()
+
+    counts = db.get_collection_counts()
+    assert counts["books"] == table_count(db, "books") == 2
+    assert counts["papers"] == table_count(db, "papers") == 1
+    assert counts["links"] == table_count(db, "links") == 3
+    assert counts["enriched_books"] == 1
+    assert counts["classified_books"] == 0  # Classified book was deleted
+    assert counts["dead_links"] == 1  # Only link 1
+
+    today = date.today().isoformat()
+    day = db.get_daily_rollups(since=today)[today]
+    assert day["books.added"] == 3
+    assert day["books.removed"] == 1
+    assert day["links.checked"] == 5
+
+
+def test_backfill_matches_tables(db):
+    """Test the migration seeds the rollups from existing rows."""
+    db.insert_book("Old book")
+    db.add_paper("Old paper")
+    link_id = add_link(db, "https://example.com/old")
+    db.conn.execute("UPDATE links SET status = 'forbidden' WHERE id = ?", (link_id,))
+    # Pretend the rows predate the rollups
+    db.conn.execute("DROP TABLE daily_rollups")
+    db.conn.execute("DELETE FROM schema_version WHERE version >= 26")
+    db.conn.commit()
+
+    migrations.apply_migrations(db.conn)
+
+    totals = db.get_rollup_totals()
+    assert (totals["books.added"], totals["papers.added"], totals["links.added"], totals["links.dead"]) == (1, 1, 1, 1)
+
+
+def test_collection_counts_ignore_rollup_drift(db):
+    """Test totals stay exact when a write path skips the rollup triggers."""
+    db.insert_book("Counted book")
+    db.conn.execute("DROP TRIGGER rollup_books_insert")
+    db.insert_book("Restored book")
+    db.conn.execute("DELETE FROM daily_rollups WHERE metric = 'books.added'")
+    db.conn.commit()
+
+    assert db.get_collection_counts()["books"] == table_count(db, "books") == 2
+
+
+@pytest.fixture
+def plugin(db):
+    config = SimpleNamespace(email=None, llm=SimpleNamespace(api_key=None))
+    laney = ProactiveLaneyPlugin(SimpleNamespace(config=config, db=db))
+    laney.on_load()
+    return laney
+
+
+def test_digest_uses_rollups(db, plugin):
+    """Test the digest reports rollup counts and the day's activity."""
+    db.insert_book("Volcanoes of the World")
+    add_link(db, "https://example.com/lava", "Lava")
+
+    digest = plugin._generate_digest()
+
+    assert digest["stats"]["books"] == 1
+    assert digest["stats"]["links"] == 1
+    assert digest["activity"]["links.added"] == 1
+    assert [b["title"] for b in digest["recent_books"]] == ["Volcanoes of the World"]
+    assert digest["has_content"]
+
+
+def test_prepared_digest_sent_once(db, plugin):
+    """Test the send job uses the digest prepared ahead of time, then regenerates."""
+    sent = []
+    plugin._send_email = lambda to_addr, subject, body: sent.append(body)
+
+    plugin._prepare_digest()
+    generated = []
+    original = plugin._generate_digest
+    plugin._generate_digest = lambda: generated.append(1) or original()
+
+    plugin._send_daily_digest()
+    assert generated == []
+    plugin._send_daily_digest()
+    assert generated == [1]
+    assert len(sent) == 2
+
+
+def test_stale_prepared_digest_ignored(plugin):
+    """Test a digest prepared on an earlier day isn't sent."""
+    plugin._prepared_digest = {"generated_at": "2000-01-01T07:30:00"}
+    assert plugin._take_prepared_digest() is None
+
+
+def test_stats_commands_reachable():
+    """Test the lazy stats group exposes activity and archives (no shadowing group in main.py)."""
+    from click.testing import CliRunner
+    from holocene.cli.main import cli
+
+    result = CliRunner().invoke(cli, ["stats", "--help"])
+
+    assert result.exit_code == 0
+    assert "activity" in result.output
+    assert "archives" in result.output
@@ -0,0 +1,135 @@
+"""Tests for database maintenance (checkpoint, vacuum, retention)."""
+
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from holocene.config.loader import MaintenanceConfig
+from holocene.storage.database import Database
+from holocene.storage.maintenance import DatabaseMaintenance
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        yield database
+        database.close()
+
+
+def days_ago(days):
+    return (datetime.now() - timedelta(days=days)).isoformat()
+
+
+def test_migration_enables_incremental_vacuum(db):
+    """Test new databases use auto_vacuum = INCREMENTAL and vacuum returns free pages."""
+    maintenance = DatabaseMaintenance(db, MaintenanceConfig())
+    assert maintenance.page_stats()["auto_vacuum"] == "incremental"
+
+    db.conn.execute("CREATE TABLE filler (data TEXT)")
+    db.conn.executemany("INSERT INTO filler VALUES (?)", [("x" * 2000,) for _ in range(200)])
+    db.conn.commit()
+    db.conn.execute("DROP TABLE filler")
+    db.conn.commit()
+
+    free_before = maintenance.page_stats()["freelist_count"]
+    result = maintenance.incremental_vacuum()
+
+    assert free_before > 0
+    assert result["pages_freed"] == free_before
+    assert maintenance.page_stats()["freelist_count"] == 0
+
+
+def test_checkpoint_truncates_wal_past_threshold(db):
+    """Test the WAL is only checkpointed once it passes wal_checkpoint_mb."""
+    db.conn.execute("CREATE TABLE filler (data TEXT)")
+    db.conn.executemany("INSERT INTO filler VALUES (?)", [("x" * 2000,) for _ in range(600)])
+    db.conn.commit()
+
+    maintenance = DatabaseMaintenance(db, MaintenanceConfig(wal_checkpoint_mb=1000))
+    assert maintenance.wal_size() > 1024 * 1024
+    assert maintenance.checkpoint()["checkpointed"] is False
+
+    maintenance.settings.wal_checkpoint_mb = 1
+    result = maintenance.checkpoint()
+    assert result["checkpointed"] is True
+    assert result["wal_bytes_after"] == 0
+
+
+def test_retention_deletes_and_archives(db):
+    """Test each policy removes only old, eligible rows, archiving Laney messages."""
+    cursor = db.conn.cursor()
+    cursor.execute(
+        "INSERT INTO laney_conversations (chat_id, created_at, updated_at, is_active, message_count) VALUES (1, ?, ?, 0, 2)",
+        (days_ago(500), days_ago(500)),
+    )
+    closed = cursor.lastrowid
+    cursor.execute(
+        "INSERT INTO laney_conversations (chat_id, created_at, updated_at, is_active, message_count) VALUES (1, ?, ?, 1, 1)",
+        (days_ago(500), days_ago(1)),
+    )
+    active = cursor.lastrowid
+    for conversation_id, age in [(closed, 400), (closed, 10), (active, 400)]:
+        cursor.execute(
+            "INSERT INTO laney_messages (conversation_id, role, content, created_at) VALUES (?, 'user', 'hi', ?)",
+            (conversation_id, days_ago(age)),
+        )
+
+    cursor.executemany(
+        "INSERT INTO api_cache (cache_type, cache_key, response, created_at, last_hit_at) VALUES ('wiki', ?, '{}', ?, ?)",
+        [("stale", days_ago(100), None), ("hot", days_ago(100), days_ago(1)), ("new", days_ago(1), None)],
+    )
+    db.conn.commit()
+
+    link_id = db.insert_link("https://example.com", source="test")
+    old_failure = db.add_archive_snapshot(link_id, "internet_archive", status="failed")
+    last_failure = db.add_archive_snapshot(link_id, "internet_archive", status="failed")
+    db.conn.execute("UPDATE archive_snapshots SET updated_at = ?", (days_ago(200),))
+    db.conn.commit()
+
+    maintenance = DatabaseMaintenance(db, MaintenanceConfig())
+    preview = maintenance.apply_retention(dry_run=True)
+    assert preview["laney_messages"]["removed"] == 1
+    assert db.conn.execute("SELECT COUNT(*) FROM laney_messages").fetchone()[0] == 3
+
+    results = maintenance.apply_retention()
+
+    assert results["laney_messages"] == {"days": 365, "removed": 1, "archived": 1}
+    assert results["api_cache"]["removed"] == 1
+    assert results["archive_snapshots"]["removed"] == 1
+
+    remaining = db.conn.execute("SELECT conversation_id, created_at FROM laney_messages").fetchall()
+    assert len(remaining) == 2
+    assert db.conn.execute("SELECT message_count FROM laney_conversations WHERE id = ?", (closed,)).fetchone()[0] == 1
+    keys = {row[0] for row in db.conn.execute("SELECT cache_key FROM api_cache")}
+    assert keys == {"hot", "new"}
+    ids = {row[0] for row in db.conn.execute("SELECT id FROM archive_snapshots")}
+    assert ids == {last_failure}
+    assert old_failure not in ids
+
+    archive = sqlite3.connect(maintenance.archive_path)
+    assert archive.execute("SELECT conversation_id FROM laney_messages").fetchall() == [(closed,)]
+    archive.close()
+
+    # A second pass finds nothing left to do
+    assert maintenance.apply_retention()["laney_messages"]["removed"] == 0
+
+
+def test_run_reports_reclaimed_space(db):
+    """Test a full pass frees the pages left by deleted rows and reports them."""
+    rows = [("wiki", f"key{i}", "x" * 4000, days_ago(200)) for i in range(300)]
+    db.conn.executemany("INSERT INTO api_cache (cache_type, cache_key, response, created_at) VALUES (?, ?, ?, ?)", rows)
+    db.conn.commit()
+    DatabaseMaintenance(db, MaintenanceConfig()).checkpoint(force=True)
+
+    report = DatabaseMaintenance(db, MaintenanceConfig()).run(analyze=True)
+
+    assert report["retention"]["api_cache"]["removed"] == 300
+    assert report["vacuum"]["pages_freed"] > 0
+    assert report["after"]["page_count"] < report["before"]["page_count"]
+    assert report["reclaimed_bytes"] > 300 * 4000 * 0.9
+    assert report["optimize"]["analyzed"] is True
+    assert db.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
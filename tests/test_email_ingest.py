@@ -0,0 +1,263 @@
+"""Tests for IMAP IDLE email ingestion."""
+
+import re
+import socketserver
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from holocene.config.loader import EmailConfig
+from holocene.integrations.imap_client import IMAPMailbox
+from holocene.plugins.email_handler import EmailHandlerPlugin
+from holocene.storage.database import Database
+
+
+class FakeMailStore:
+    """Messages by UID, with seen flags; wakes IDLE sessions on delivery."""
+
+    def __init__(self):
+        self.messages = {}  # uid -> [raw, seen]
+        self.next_uid = 1
+        self.commands = []
+        self.idlers = []
+        self.idle_extra = ""  # Sent in the same write as the IDLE continuation
+        self.lock = threading.Lock()
+
+    def deliver(self, raw: bytes):
+        with self.lock:
+            self.messages[self.next_uid] = [raw, False]
+            self.next_uid += 1
+            count = len(self.messages)
+            idlers = list(self.idlers)
+        for wfile in idlers:
+            try:
+                wfile.write(f"* {count} EXISTS\r\n".encode())
+                wfile.flush()
+            except OSError:
+                pass
+
+
+class FakeIMAPHandler(socketserver.StreamRequestHandler):
+    """Just enough IMAP4rev1 (+IDLE) for imaplib and IMAPMailbox."""
+
+    def send(self, text):
+        self.wfile.write(text.encode() if isinstance(text, str) else text)
+        self.wfile.flush()
+
+    def handle(self):
+        store = self.server.store
+        self.send("* OK Fake IMAP ready\r\n")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            tag, _, rest = line.decode().rstrip("\r\n").partition(" ")
+            command, _, args = rest.partition(" ")
+            command = command.upper()
+            store.commands.append(rest)
+
+            if command == "CAPABILITY":
+                self.send("* CAPABILITY IMAP4rev1 IDLE\r\n")
+            elif command == "LOGIN":
+                pass
+            elif command == "SELECT":
+                self.send(f"* {len(store.messages)} EXISTS\r\n* OK [UIDVALIDITY 7] UIDs valid\r\n")
+            elif command == "UID" and args.upper().startswith("SEARCH"):
+                self.send(f"* SEARCH {' '.join(map(str, self._search(args)))}\r\n")
+            elif command == "UID" and args.upper().startswith("FETCH"):
+                uid_set = args.split()[1]
+                for uid in sorted(int(u) for u in uid_set.split(",")):
+                    with store.lock:
+                        entry = store.messages.get(uid)
+                    if entry:
+                        entry[1] = True
+                        seq = list(store.messages).index(uid) + 1
+                        self.send(f"* {seq} FETCH (UID {uid} RFC822 {{{len(entry[0])}}}\r\n".encode() + entry[0] + b")\r\n")
+            elif command == "IDLE":
+                self.send("+ idling\r\n" + store.idle_extra)
+                with store.lock:
+                    store.idlers.append(self.wfile)
+                done = self.rfile.readline()
+                with store.lock:
+                    store.idlers.remove(self.wfile)
+                if not done:
+                    return
+            elif command == "LOGOUT":
+                self.send(f"* BYE\r\n{tag} OK LOGOUT completed\r\n")
+                return
+            self.send(f"{tag} OK {command} completed\r\n")
+
+    def _search(self, args):
+        store = self.server.store
+        match = re.search(r"UID (\d+):\*", args)
+        with store.lock:
+            uids = [uid for uid, (_, seen) in store.messages.items() if not seen]
+            if match:
+                low = int(match.group(1))
+                newest = max(store.messages) if store.messages else None
+                # Like real servers, "n:*" includes the newest message even below n
+                uids = [uid for uid in uids if uid >= low or uid == newest]
+        return uids
+
+
+@pytest.fixture
+def imap_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeIMAPHandler)
+    server.daemon_threads = True
+    server.store = FakeMailStore()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_email(sender, subject, body):
+    msg = EmailMessage()
+    msg["From"] = sender
+    msg["To"] = "laney@example.org"
+    msg["Subject"] = subject
+    msg["Message-ID"] = f"<{subject.replace(' ', '-')}@example.org>"
+    msg.set_content(body)
+    return msg.as_bytes()
+
+
+def make_mailbox(server):
+    return IMAPMailbox("127.0.0.1", server.server_address[1], "laney", "secret", use_ssl=False, timeout=5)
+
+
+def test_fetch_batches_and_high_water_mark(imap_server):
+    """Test unseen messages are fetched in batched UID FETCHes, newest UIDs only."""
+    store = imap_server.store
+    for i in range(5):
+        store.deliver(make_email("a@example.org", f"Note {i}", "hello"))
+    mailbox = make_mailbox(imap_server)
+    mailbox.connect()
+
+    uids = mailbox.search_new()
+    fetched = list(mailbox.fetch(uids, batch_size=2))
+
+    assert uids == [1, 2, 3, 4, 5]
+    assert [uid for uid, _ in fetched] == uids
+    assert b"Subject: Note 3" in fetched[3][1]
+    assert len([c for c in store.commands if c.startswith("UID FETCH")]) == 3
+    assert mailbox.uidvalidity == 7
+
+    # Nothing above the mark, even though "6:*" matches the newest message
+    assert mailbox.search_new(last_uid=5) == []
+    mailbox.close()
+
+
+def test_idle_wakes_on_new_mail(imap_server):
+    """Test IDLE returns as soon as the server announces a message."""
+    mailbox = make_mailbox(imap_server)
+    mailbox.connect()
+    assert mailbox.supports_idle
+
+    assert mailbox.idle(timeout=0.2) is False  # Nothing happened
+
+    threading.Timer(0.2, imap_server.store.deliver, [make_email("a@example.org", "Ping", "hi")]).start()
+    start = time.monotonic()
+    assert mailbox.idle(timeout=10) is True
+    assert time.monotonic() - start < 5
+
+    # Connection still usable after IDLE
+    assert mailbox.search_new() == [1]
+    mailbox.close()
+
+
+def test_idle_sees_update_buffered_with_continuation(imap_server):
+    """Test an update that arrives with the IDLE continuation isn't left in the buffer."""
+    imap_server.store.idle_extra = "* 1 EXISTS\r\n"
+    mailbox = make_mailbox(imap_server)
+    mailbox.connect()
+
+    start = time.monotonic()
+    assert mailbox.idle(timeout=10) is True
+    assert time.monotonic() - start < 5
+    mailbox.close()
+
+
+def test_interrupt_wakes_blocked_idle(imap_server):
+    """Test interrupt() from another thread breaks out of IDLE."""
+    mailbox = make_mailbox(imap_server)
+    mailbox.connect()
+    threading.Timer(0.2, mailbox.interrupt).start()
+
+    with pytest.raises(Exception):
+        mailbox.idle(timeout=10)
+
+
+@pytest.fixture
+def email_plugin(imap_server):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(Path(tmpdir) / "test.db")
+        executor = ThreadPoolExecutor(max_workers=4)
+        config = SimpleNamespace(email=EmailConfig(
+            enabled=True,
+            address="laney@example.org",
+            imap_server="127.0.0.1",
+            imap_port=imap_server.server_address[1],
+            imap_ssl=False,
+            username="laney",
+            password="secret",
+        ))
+        core = SimpleNamespace(config=config, db=db, run_in_background=lambda task, *a, **kw: executor.submit(task))
+        plugin = EmailHandlerPlugin(core)
+        plugin.on_load()
+        plugin.replies = []
+        plugin._send_reply = lambda to, subject, body, message_id, thread_id=None: plugin.replies.append(to)
+
+        yield plugin, db
+
+        plugin.disable()
+        executor.shutdown(wait=True)
+        db.close()
+
+
+def test_plugin_ingests_pushed_emails(imap_server, email_plugin):
+    """Test URL emails are archived, including ones arriving during IDLE."""
+    plugin, db = email_plugin
+    store = imap_server.store
+    store.deliver(make_email("a@example.org", "Links", "https://example.com/one"))
+    store.deliver(make_email("b@example.org", "More links", "https://example.com/two"))
+
+    def link_count():
+        return db.conn.execute("SELECT COUNT(*) FROM links").fetchone()[0]
+
+    plugin.enable()
+    deadline = time.monotonic() + 5
+    while link_count() < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert link_count() == 2
+
+    store.deliver(make_email("a@example.org", "Later", "https://example.com/three"))
+    deadline = time.monotonic() + 5
+    while link_count() < 3 and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert link_count() == 3
+    assert sorted(plugin.replies) == ["a@example.org", "a@example.org", "b@example.org"]
+    assert plugin.stats["emails_processed"] == 3
+    assert db.get_import_state("email_imap:laney@example.org") == {"uidvalidity": 7, "last_uid": 3}
+    # One login for everything
+    assert len([c for c in store.commands if c.startswith("LOGIN")]) == 1
+
+
+def test_scheduled_check_runs_handlers_inline(imap_server, email_plugin):
+    """Test polling mode handles emails on the job's own thread, not the pool it runs on."""
+    plugin, db = email_plugin
+    plugin.core.run_in_background = lambda *a, **kw: pytest.fail("handlers queued behind the job")
+    imap_server.store.deliver(make_email("a@example.org", "Links", "https://example.com/one"))
+
+    plugin._scheduled_check()
+
+    assert db.conn.execute("SELECT COUNT(*) FROM links").fetchone()[0] == 1
+    assert plugin.replies == ["a@example.org"]
+    assert plugin.stats["errors"] == 0
@@ -0,0 +1,158 @@
+"""Tests for the priority-aware, multi-pool background executor."""
+
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from holocene.core.executor import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    BackgroundExecutor,
+    CancellationToken,
+    TaskCancelled,
+)
+
+
+@pytest.fixture
+def executor():
+    pool = BackgroundExecutor({"io": 1, "llm": 2, "cpu": 1, "interactive": 1})
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def block(pool_executor, pool, owner=None):
+    """Occupy one worker of a pool until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def task():
+        started.set()
+        release.wait(5)
+
+    pool_executor.submit(task, pool=pool, owner=owner)
+    assert started.wait(2)
+    return release
+
+
+def test_priority_order(executor):
+    """Test queued tasks run by priority, FIFO among equals."""
+    order = []
+    release = block(executor, "io")
+
+    futures = [
+        executor.submit(lambda: order.append("low"), priority=PRIORITY_LOW),
+        executor.submit(lambda: order.append("normal-1")),
+        executor.submit(lambda: order.append("high"), priority=PRIORITY_HIGH),
+        executor.submit(lambda: order.append("normal-2")),
+    ]
+    release.set()
+    for future in futures:
+        future.result(timeout=2)
+
+    assert order == ["high", "normal-1", "normal-2", "low"]
+
+
+def test_bulk_backlog_does_not_delay_interactive_pool(executor):
+    """Test a saturated llm pool leaves interactive work unaffected."""
+    release = threading.Event()
+    for _ in range(500):
+        executor.submit(lambda: release.wait(5), pool="llm", owner="book_enricher")
+
+    start = time.monotonic()
+    answer = executor.submit(lambda: "answer", pool="interactive", priority=PRIORITY_HIGH).result(timeout=2)
+
+    assert answer == "answer"
+    assert time.monotonic() - start < 0.5
+    assert executor.get_metrics()["llm"]["queued"] == 498
+    release.set()
+
+
+def test_plugin_quota_shares_workers(executor):
+    """Test one plugin's backlog can't hold every worker while another plugin waits."""
+    blockers = [block(executor, "llm", owner="blocker") for _ in range(2)]
+    release = threading.Event()
+    running = []
+
+    def task(owner):
+        running.append(owner)
+        release.wait(5)
+
+    for _ in range(5):
+        executor.submit(lambda: task("enricher"), pool="llm", owner="enricher")
+    executor.submit(lambda: task("classifier"), pool="llm", owner="classifier")
+
+    for blocker in blockers:
+        blocker.set()
+    time.sleep(0.2)
+
+    # 2 workers with a 0.5 quota: one per plugin while the other has work queued
+    assert sorted(running) == ["classifier", "enricher"]
+    release.set()
+
+
+def test_cancellation_token(executor):
+    """Test a cancelled token drops its queued task and cancels child tokens."""
+    release = block(executor, "io")
+    token = CancellationToken()
+    queued = executor.submit(lambda: "never", token=token)
+    token.cancel()
+    release.set()
+
+    with pytest.raises(CancelledError):
+        queued.result(timeout=2)
+
+    parent = CancellationToken()
+    child = parent.child()
+    parent.cancel()
+    assert child.cancelled and child.wait(0)
+    with pytest.raises(TaskCancelled):
+        child.raise_if_cancelled()
+
+
+def test_shutdown_cancels_running_tasks_token():
+    """Test shutdown cancels the token a long-running task is polling."""
+    shutdown_event = threading.Event()
+    executor = BackgroundExecutor({"io": 1}, shutdown_token=CancellationToken(event=shutdown_event))
+    token = executor.shutdown_token.child()
+    future = executor.submit(lambda: token.wait(10), token=token)
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    executor.shutdown(wait=True)
+
+    assert future.result(timeout=1) is True
+    assert time.monotonic() - start < 1
+    assert shutdown_event.is_set()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_callbacks_and_metrics(executor):
+    """Test callbacks, error handlers and per-pool metrics."""
+    results, errors = [], []
+
+    def fail():
+        raise ValueError("boom")
+
+    executor.submit(lambda: 42, callback=results.append).result(timeout=2)
+    with pytest.raises(ValueError):
+        executor.submit(fail, error_handler=errors.append, owner="tester").result(timeout=2)
+
+    assert results == [42]
+    assert isinstance(errors[0], ValueError)
+
+    metrics = executor.get_metrics()["io"]
+    assert metrics["submitted"] == 2
+    assert metrics["completed"] == 1
+    assert metrics["failed"] == 1
+    assert metrics["queued"] == 0
+    assert set(metrics["wait_ms"]) == {"avg", "p95", "max"}
+
+
+def test_cpu_pool_runs_in_process(executor):
+    """Test the cpu pool runs picklable tasks in a worker process."""
+    import os
+
+    assert executor.submit(os.getpid, pool="cpu").result(timeout=30) != os.getpid()
@@ -0,0 +1,133 @@
+"""Tests for streaming collection exports."""
+
+import csv
+import gzip
+import io
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from holocene.storage.database import Database
+from holocene.storage.export import export_collection, export_to_path, iter_batches, iter_export
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        now = datetime.now().isoformat()
+        database.conn.executemany("""
+            INSERT INTO links (url, title, source, first_seen, last_seen, created_at, status_code)
+            VALUES (?, ?, 'test', ?, ?, ?, 200)
+        """, [
+            (f"https://example.com/{i}", f"Basalt note {i}" if i % 2 else f"Café, \"quoted\"\n{i}", now, now, f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}")
+            for i in range(2500)
+        ])
+        database.conn.commit()
+        yield database
+        database.close()
+
+
+def test_batches_are_bounded(db):
+    """Test rows come out in fetchmany-sized batches, in export order."""
+    batches = list(iter_batches(db.conn, "links", fetch_size=1000))
+
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert batches[0][0][1] == "https://example.com/2499"  # Newest first
+
+
+def test_csv_export_with_progress(db):
+    """Test CSV export writes every row and reports progress per batch."""
+    out = io.BytesIO()
+    progress = []
+
+    count = export_collection(db.conn, "links", out, progress=progress.append)
+
+    rows = list(csv.reader(io.StringIO(out.getvalue().decode("utf-8"))))
+    assert count == 2500
+    assert progress == [1000, 2000, 2500]
+    assert rows[0][:3] == ["ID", "URL", "Title"]
+    assert len(rows) == 2501
+    assert rows[2][2] == 'Café, "quoted"\n2498'  # Commas, quotes and newlines survive
+
+
+def test_query_and_limit(db):
+    """Test the text filter and limit are applied in SQL."""
+    out = io.BytesIO()
+    count = export_collection(db.conn, "links", out, fmt="jsonl", query="Basalt", limit=10)
+
+    records = [json.loads(line) for line in out.getvalue().decode("utf-8").splitlines()]
+    assert count == len(records) == 10
+    assert all(r["title"].startswith("Basalt") for r in records)
+    assert records[0]["status_code"] == 200
+
+
+def test_gzip_file_and_stream_match(db, tmp_path):
+    """Test gzip files (format from the name) and streamed chunks hold the same data."""
+    path = tmp_path / "links.jsonl.gz"
+    assert export_to_path(db.conn, "links", path) == 2500
+
+    chunks = list(iter_export(db.conn, "links", "jsonl", compress=True))
+
+    assert len(chunks) > 1
+    from_file = gzip.decompress(path.read_bytes())
+    assert gzip.decompress(b"".join(chunks)) == from_file
+    assert len(from_file.splitlines()) == 2500
+
+
+def test_failed_export_removes_file(db, tmp_path):
+    """Test a failed export doesn't leave a partial file."""
+    path = tmp_path / "books.csv"
+    with pytest.raises(ValueError):
+        export_to_path(db.conn, "books", path, fmt="xlsx")
+    assert not path.exists()
+
+
+def test_parquet_export(db, tmp_path):
+    """Test Parquet export writes typed columns (needs pyarrow)."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "links.parquet"
+
+    export_to_path(db.conn, "links", path)
+
+    table = pq.read_table(path)
+    assert table.num_rows == 2500
+    assert table.column("status_code")[0].as_py() == 200
+
+
+def test_parquet_without_pyarrow_names_extra(monkeypatch):
+    """Test the CLI points at the parquet extra when pyarrow is missing."""
+    from click.testing import CliRunner
+    from holocene.cli import export_commands
+
+    monkeypatch.setattr(export_commands, "HAS_PYARROW", False)
+    result = CliRunner().invoke(export_commands.export, ["links", "--format", "parquet"])
+
+    assert result.exit_code == 1
+    assert "pip install holocene[parquet]" in result.output
+
+
+def test_laney_export_tool_has_no_cap(db, tmp_path):
+    """Test the Laney tool exports everything, not the first 500."""
+    from holocene.llm.laney_tools import LaneyToolHandler
+
+    handler = LaneyToolHandler(db.db_path, documents_dir=tmp_path)
+    result = handler.export_links_csv()
+
+    assert result["count"] == 2500
+    assert Path(result["file_path"]) in handler.created_documents
+
+
+def test_laney_collection_report_totals(db, tmp_path):
+    """Test the report's totals match Database.get_collection_counts."""
+    from holocene.llm.laney_tools import LaneyToolHandler
+
+    handler = LaneyToolHandler(db.db_path, documents_dir=tmp_path)
+    result = handler.generate_collection_report(include_books=False, include_papers=False, include_links=False)
+    handler.close()
+
+    assert result["total_links"] == db.get_collection_counts()["links"] == 2500
+    assert "- **Total Links:** 2500" in Path(result["file_path"]).read_text()
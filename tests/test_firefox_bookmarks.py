@@ -1,5 +1,6 @@
 """Tests for Firefox bookmark import functionality."""
 
+import json
 import sqlite3
 import tempfile
 from pathlib import Path
@@ -176,3 +177,91 @@ def test_firefox_locked_database(firefox_places_db):
 
     finally:
         conn.close()
+
+
+def test_read_firefox_bookmarks_modified_after(firefox_places_db):
+    """Test only bookmarks modified past the high-water mark are read."""
+    conn = sqlite3.connect(firefox_places_db)
+    conn.execute("UPDATE moz_bookmarks SET lastModified = 1800000000000000 WHERE guid = 'bookmark2'")
+    conn.commit()
+    conn.close()
+
+    reader = BookmarksReader()
+    bookmarks = reader._read_firefox_bookmarks(firefox_places_db, modified_after=1700000000000000)
+
+    assert [b.url for b in bookmarks] == ["https://github.com"]
+
+
+def test_read_changed_bookmarks_incremental(firefox_places_db, monkeypatch):
+    """Test unchanged sources are skipped and changed ones yield only the delta."""
+    reader = BookmarksReader()
+    monkeypatch.setattr(reader, "_get_firefox_paths", lambda: [firefox_places_db])
+
+    bookmarks, state = reader.read_changed_bookmarks(browser="firefox")
+    assert len(bookmarks) == 3
+
+    # Nothing changed - the database isn't even copied
+    monkeypatch.setattr(
+        reader, "_read_firefox_bookmarks",
+        lambda *a, **k: pytest.fail("unchanged places.sqlite was read"),
+    )
+    bookmarks, state = reader.read_changed_bookmarks(browser="firefox", state=state)
+    assert bookmarks == []
+    monkeypatch.undo()
+    monkeypatch.setattr(reader, "_get_firefox_paths", lambda: [firefox_places_db])
+
+    conn = sqlite3.connect(firefox_places_db)
+    conn.execute("INSERT INTO moz_places (id, url, title) VALUES (4, 'https://example.com', 'Example')")
+    conn.execute(
+        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded, lastModified, guid) "
+        "VALUES (6, 1, 4, 'Example', 1800000000000000, 1800000000000000, 'bookmark4')"
+    )
+    conn.commit()
+    conn.close()
+
+    bookmarks, state = reader.read_changed_bookmarks(browser="firefox", state=state)
+    assert [b.url for b in bookmarks] == ["https://example.com"]
+    assert state[str(firefox_places_db)]["high_water"] == 1800000000000000
+
+
+def test_read_changed_chrome_bookmarks(tmp_path, monkeypatch):
+    """Test Chrome JSON imports use date_added as the high-water mark."""
+    path = tmp_path / "Bookmarks"
+
+    def write(children):
+        path.write_text(json.dumps({"roots": {"bookmark_bar": {"type": "folder", "children": children}}}))
+
+    first = {"type": "url", "name": "Python", "url": "https://python.org", "date_added": "13300000000000000"}
+    write([first])
+
+    reader = BookmarksReader()
+    reader.bookmarks_paths = [path]
+
+    bookmarks, state = reader.read_changed_bookmarks(browser="auto", state={})
+    assert [b.url for b in bookmarks] == ["https://python.org"]
+
+    # Rewritten with identical content (new mtime): hash matches, nothing returned
+    write([first])
+    bookmarks, state = reader.read_changed_bookmarks(browser="auto", state=state)
+    assert bookmarks == []
+
+    second = {"type": "url", "name": "GitHub", "url": "https://github.com", "date_added": "13300000000000001"}
+    write([first, second])
+    bookmarks, state = reader.read_changed_bookmarks(browser="auto", state=state)
+    assert [b.url for b in bookmarks] == ["https://github.com"]
+
+
+def test_read_changed_bookmarks_logs_unreadable_file(tmp_path, caplog):
+    """Test a corrupt bookmarks file is skipped with a warning naming it."""
+    path = tmp_path / "Bookmarks"
+    path.write_text("{not json")
+
+    reader = BookmarksReader()
+    reader.bookmarks_paths = [path]
+
+    with caplog.at_level("WARNING", logger="holocene.integrations.bookmarks"):
+        bookmarks, state = reader.read_changed_bookmarks(browser="auto", state={})
+
+    assert bookmarks == []
+    assert str(path) not in state
+    assert str(path) in caplog.text
@@ -354,3 +354,23 @@ def test_multi_field_handles_none():
     )
 
     assert len(results) >= 1
+
+
+def test_bounded_edit_distance():
+    """Test bounded edit distance is exact within the bound and capped beyond it."""
+    assert fuzzy_search.bounded_edit_distance("kitten", "sitting", 3) == 3
+    assert fuzzy_search.bounded_edit_distance("kitten", "sitting", 2) == 3  # Exceeds: max + 1
+    assert fuzzy_search.bounded_edit_distance("python", "python", 1) == 0
+    assert fuzzy_search.bounded_edit_distance("short", "much longer text", 2) == 3
+
+
+def test_token_match_ratio():
+    """Test token matching tolerates typos, prefixes, word order and long texts."""
+    title = "Fluent Python: Clear, Concise, and Effective Programming"
+
+    assert fuzzy_search.token_match_ratio("python", title) == 1.0
+    assert fuzzy_search.token_match_ratio("pyton", title) > 0.8  # Typo
+    assert fuzzy_search.token_match_ratio("effect", title) == 0.9  # Prefix
+    assert fuzzy_search.token_match_ratio("programming fluent", title) == 1.0
+    assert fuzzy_search.token_match_ratio("haskell", title) == 0.0
+    assert fuzzy_search.token_match_ratio("cafe", "Café Society") == 1.0  # Accents ignored
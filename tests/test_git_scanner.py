@@ -0,0 +1,154 @@
+"""Tests for the incremental git scanner and commit index."""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from holocene.storage.database import Database
+from holocene.integrations.git_scanner import GitScanner, GitRepo
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def git(path, *args):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Tester",
+        "GIT_AUTHOR_EMAIL": "t@example.com",
+        "GIT_COMMITTER_NAME": "Tester",
+        "GIT_COMMITTER_EMAIL": "t@example.com",
+    }
+    subprocess.run(["git", "-C", str(path), *args], check=True, capture_output=True, env=env)
+
+
+def make_repo(root: Path, name: str, commits: int) -> Path:
+    path = root / name
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    for i in range(commits):
+        commit(path, f"{name} commit {i}")
+    return path
+
+
+def commit(path: Path, message: str):
+    git(path, "commit", "-q", "--allow-empty", "-m", message)
+
+
+@pytest.fixture
+def workspace():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        scan = root / "code"
+        scan.mkdir()
+        db = Database(root / "test.db")
+        yield scan, db
+        db.close()
+
+
+def test_index_matches_git_log(workspace):
+    """Test indexed activity equals the direct git log scan."""
+    scan, db = workspace
+    make_repo(scan, "alpha", 3)
+    make_repo(scan, "beta", 1)
+    (scan / "not-a-repo").mkdir()
+
+    since = datetime.now() - timedelta(days=1)
+    direct = GitScanner(scan).get_activity_since(since)
+    indexed = GitScanner(scan, db=db).get_activity_since(since)
+
+    assert indexed["commits_by_repo"] == direct["commits_by_repo"] == {"alpha": 3, "beta": 1}
+    assert indexed["total_repos_scanned"] == 2
+
+
+def test_unchanged_repos_skip_git(workspace):
+    """Test a second refresh doesn't run git in unchanged repos."""
+    scan, db = workspace
+    make_repo(scan, "alpha", 2)
+    make_repo(scan, "beta", 2)
+    scanner = GitScanner(scan, db=db)
+
+    first = scanner.refresh_index()
+    assert first["checked"] == 2
+    assert first["new_commits"] == 4
+
+    second = scanner.refresh_index()
+    assert second["checked"] == 0
+    assert second["new_commits"] == 0
+
+
+def test_only_new_commits_ingested(workspace, monkeypatch):
+    """Test refresh reads only commits after the indexed tips, on any branch."""
+    scan, db = workspace
+    alpha = make_repo(scan, "alpha", 5)
+    make_repo(scan, "beta", 1)
+    scanner = GitScanner(scan, db=db)
+    scanner.refresh_index()
+
+    commit(alpha, "on main")
+    git(alpha, "checkout", "-q", "-b", "feature")
+    commit(alpha, "on feature")
+
+    seen = []
+    original = GitRepo.get_new_commits
+
+    def spy(self, known_tips):
+        commits = original(self, known_tips)
+        seen.append((self.name, len(commits)))
+        return commits
+
+    monkeypatch.setattr(GitRepo, "get_new_commits", spy)
+    result = scanner.refresh_index()
+
+    assert seen == [("alpha", 2)]
+    assert result["new_commits"] == 2
+    subjects = {c["subject"] for c in scanner.get_indexed_commits_since(datetime.now() - timedelta(days=1))}
+    assert {"on main", "on feature"} <= subjects
+
+
+def test_rewritten_history_reindexes(workspace):
+    """Test an amended commit (old tip gone from refs) is still picked up."""
+    scan, db = workspace
+    alpha = make_repo(scan, "alpha", 2)
+    scanner = GitScanner(scan, db=db)
+    scanner.refresh_index()
+
+    git(alpha, "commit", "-q", "--amend", "--allow-empty", "-m", "amended")
+    scanner.refresh_index()
+
+    subjects = [c["subject"] for c in scanner.get_indexed_commits_since(datetime.now() - timedelta(days=1))]
+    assert "amended" in subjects
+
+
+def test_repo_discovery_follows_directory_changes(workspace):
+    """Test repos are rediscovered when the scan directory changes."""
+    scan, db = workspace
+    make_repo(scan, "alpha", 1)
+    scanner = GitScanner(scan, db=db)
+    assert [r.name for r in scanner.scan_repos()] == ["alpha"]
+    assert scanner.scan_repos() is scanner.scan_repos()  # Cached
+
+    make_repo(scan, "beta", 1)
+    os.utime(scan, ns=(0, scan.stat().st_mtime_ns + 1_000_000))  # Coarse-mtime filesystems
+    assert sorted(r.name for r in scanner.scan_repos()) == ["alpha", "beta"]
+    scanner.refresh_index()
+
+    shutil.rmtree(scan / "beta")
+    os.utime(scan, ns=(0, scan.stat().st_mtime_ns + 2_000_000))
+    scanner.refresh_index()
+
+    assert list(db.get_git_repo_states()) == [str(scan / "alpha")]
+
+
+def test_empty_repo(workspace):
+    """Test a repo without commits indexes cleanly."""
+    scan, db = workspace
+    make_repo(scan, "empty", 0)
+    scanner = GitScanner(scan, db=db)
+
+    assert scanner.refresh_index()["new_commits"] == 0
+    assert scanner.get_activity_since(datetime.now() - timedelta(days=1))["total_commits"] == 0
@@ -0,0 +1,115 @@
+"""Import-time regression checks for the `holo` CLI.
+
+Every `holo` invocation (including cron jobs) pays for importing
+holocene.cli.main, so command groups and package exports load lazily.
+These tests run in fresh interpreters so earlier tests' imports don't
+hide regressions.
+
+The wall-clock budget check depends on the machine and a warm disk cache,
+so it only runs with HOLOCENE_BENCHMARKS=1; raise the budget on slow
+machines with HOLOCENE_IMPORT_BUDGET_MS.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from holocene.cli.lazy_group import LazyGroup
+
+IMPORT_BUDGET_MS = float(os.environ.get("HOLOCENE_IMPORT_BUDGET_MS", 400))
+
+# Must not be imported just to start the CLI
+HEAVY_MODULES = [
+    "requests",
+    "holocene.core.holocene_core",
+    "holocene.daemon",
+    "holocene.llm.laney_tools",
+    "holocene.integrations.mercadolivre",
+    "holocene.research.orchestrator",
+    "rich.markdown",
+]
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, timeout=60, check=True,
+    )
+
+
+def loaded_heavy_modules(code: str) -> list:
+    probe = f"{code}\nimport sys\nprint([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    return eval(run_python(probe).stdout.strip().splitlines()[-1])
+
+
+def test_cli_import_skips_heavy_modules():
+    """Test importing the CLI doesn't load command groups or their integrations."""
+    assert loaded_heavy_modules("import holocene.cli.main") == []
+
+
+def test_subcommand_loads_only_its_group():
+    """Test running one command group doesn't import the others."""
+    code = (
+        "from click.testing import CliRunner\n"
+        "from holocene.cli.main import cli\n"
+        "assert CliRunner().invoke(cli, ['stats', '--help']).exit_code == 0"
+    )
+    assert loaded_heavy_modules(code) == []
+
+
+@pytest.mark.skipif(
+    not os.environ.get("HOLOCENE_BENCHMARKS"), reason="timing benchmark (set HOLOCENE_BENCHMARKS=1)"
+)
+def test_cli_import_within_budget():
+    """Test `import holocene.cli.main` stays within the startup budget (best of 3)."""
+    timings = []
+    for _ in range(3):
+        stderr = run_python("import holocene.cli.main").stderr
+        match = re.search(r"\|\s*(\d+) \| holocene\.cli\.main$", stderr, re.MULTILINE)
+        timings.append(int(match.group(1)) / 1000)
+
+    assert min(timings) < IMPORT_BUDGET_MS, (
+        f"holocene.cli.main took {min(timings):.0f}ms to import (budget {IMPORT_BUDGET_MS:.0f}ms); "
+        f"run `python -X importtime -c 'import holocene.cli.main'` to find the new import"
+    )
+
+
+def test_lazy_group_commands():
+    """Test lazy commands are listed, loaded on use, and optional ones degrade cleanly."""
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={
+            "stats": "holocene.cli.stats_commands:stats",
+            "fancy": "holocene.cli.no_such_module:fancy",
+        },
+        optional_subcommands={"fancy": "fancy-extra"},
+    )
+    def cli():
+        pass
+
+    @cli.command()
+    def local():
+        pass
+
+    runner = CliRunner()
+    assert cli.list_commands(None) == ["fancy", "local", "stats"]
+    assert runner.invoke(cli, ["stats", "--help"]).exit_code == 0
+
+    result = runner.invoke(cli, ["fancy", "--anything"])
+    assert result.exit_code != 0
+    assert "pip install holocene[fancy-extra]" in result.output
+
+
+def test_lazy_package_exports():
+    """Test package exports resolve on access and unknown names still fail."""
+    import holocene.research as research
+
+    assert research.ArxivClient.__name__ == "ArxivClient"
+    assert "ArxivClient" in dir(research)
+    with pytest.raises(AttributeError):
+        research.NoSuchClient
@@ -0,0 +1,77 @@
+"""Tests for journel project reading."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from holocene.integrations.journel import JournelReader, _parse_cache
+
+
+def write_project(path: Path, project_id: str, status: str = "in-progress", priority: str = "medium"):
+    path.write_text(
+        f"---\nid: {project_id}\nname: {project_id}\nstatus: {status}\npriority: {priority}\n"
+        f"completion: 10\n---\n\nNotes\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def journel_dir(tmp_path):
+    projects = tmp_path / "projects"
+    projects.mkdir()
+    write_project(projects / "alpha.md", "alpha", priority="high")
+    write_project(projects / "beta.md", "beta")
+    write_project(projects / "done.md", "done", status="completed")
+    (projects / "broken.md").write_text("no frontmatter", encoding="utf-8")
+    yield tmp_path
+    _parse_cache.clear()
+
+
+def test_get_active_projects(journel_dir):
+    """Test active projects are returned sorted by priority."""
+    reader = JournelReader(journel_path=journel_dir)
+    assert [p.id for p in reader.get_active_projects()] == ["alpha", "beta"]
+
+
+def test_unchanged_files_not_reparsed(journel_dir, monkeypatch):
+    """Test repeated reads reuse parses and only re-parse changed files."""
+    reader = JournelReader(journel_path=journel_dir)
+    reader.get_active_projects()
+
+    parsed = []
+    original = JournelReader._parse_project_content
+
+    def spy(self, data):
+        parsed.append(data)
+        return original(self, data)
+
+    monkeypatch.setattr(JournelReader, "_parse_project_content", spy)
+
+    # A new reader instance still benefits from the process-wide cache
+    assert [p.id for p in JournelReader(journel_path=journel_dir).get_active_projects()] == ["alpha", "beta"]
+    assert parsed == []
+
+    # Touched but identical: hashed, not re-parsed
+    beta = journel_dir / "projects" / "beta.md"
+    stat = beta.stat()
+    os.utime(beta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reader.get_active_projects()
+    assert parsed == []
+
+    # Real change: re-parsed, and the new status is visible
+    write_project(beta, "beta", status="completed")
+    os.utime(beta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+    assert [p.id for p in reader.get_active_projects()] == ["alpha"]
+    assert len(parsed) == 1
+
+
+def test_deleted_files_dropped(journel_dir):
+    """Test deleted project files disappear from results and the cache."""
+    reader = JournelReader(journel_path=journel_dir)
+    reader.get_active_projects()
+
+    (journel_dir / "projects" / "alpha.md").unlink()
+
+    assert [p.id for p in reader.get_active_projects()] == ["beta"]
+    assert journel_dir / "projects" / "alpha.md" not in _parse_cache
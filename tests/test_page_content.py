@@ -0,0 +1,193 @@
+"""Tests for the shared page content extraction service."""
+
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import tempfile
+
+import pytest
+import requests
+
+from holocene.storage.database import Database
+from holocene.integrations.page_content import (
+    PageContentService,
+    extract_text,
+    fetch_capped,
+)
+
+PAGE = b"""<html><head><title>Test Page</title><style>body { color: red }</style>
+<script>var tracking = 1;</script></head>
+<body><header>Site header</header><nav>Menu</nav>
+<h1>Main Title</h1><p>First paragraph with <b>bold</b> text.</p>
+<p>Second &amp; last paragraph.</p>
+<footer>Copyright</footer></body></html>"""
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves /page (with ETag), /text, /big and /binary; counts requests."""
+
+    etag = '"v1"'
+    body = PAGE
+    requests = []
+
+    def do_GET(self):
+        PageHandler.requests.append((self.path, self.headers.get("If-None-Match")))
+        path = self.path.split("?")[0]
+
+        if path == "/page":
+            if self.headers.get("If-None-Match") == PageHandler.etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(PageHandler.body, "text/html; charset=utf-8", {"ETag": PageHandler.etag})
+        elif path == "/text":
+            self._send(b"  line one  \n\n line two\n", "text/plain")
+        elif path == "/big":
+            self._send(b"<p>" + b"x" * 200_000 + b"</p>", "text/html")
+        elif path == "/binary":
+            self._send(b"\x89PNG...", "image/png")
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def _send(self, body, content_type, headers=None):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    PageHandler.requests = []
+    PageHandler.etag = '"v1"'
+    PageHandler.body = PAGE
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        yield database
+        database.close()
+
+
+def test_extract_text_drops_boilerplate():
+    """Test scripts, styles and page chrome are removed."""
+    text = extract_text(PAGE.decode())
+
+    assert text.splitlines() == [
+        "Test Page",
+        "Main Title",
+        "First paragraph with bold text.",
+        "Second & last paragraph.",
+    ]
+
+
+def test_any_length_served_from_one_fetch(server, db):
+    """Test different max_length values reuse the cached full text."""
+    service = PageContentService(conn=db.conn)
+
+    short = service.get_text(f"{server}/page", max_length=10)
+    full = service.get_text(f"{server}/page", max_length=8000)
+
+    assert short["content"] == "Test Page\n"
+    assert short["truncated"] is True
+    assert short["cached"] is False
+    assert full["content"].endswith("Second & last paragraph.")
+    assert full["truncated"] is False
+    assert full["cached"] == "session"
+    assert len(PageHandler.requests) == 1
+
+
+def test_persistent_cache_shared_across_instances(server, db):
+    """Test a new service instance reads the stored text from the database."""
+    PageContentService(conn=db.conn).get_text(f"{server}/page")
+
+    result = PageContentService(conn=db.conn).get_text(f"{server}/page", max_length=20)
+
+    assert result["cached"] == "persistent"
+    assert len(PageHandler.requests) == 1
+
+
+def test_stale_entries_revalidate_with_etag(server, db):
+    """Test stale pages send If-None-Match and a 304 keeps the cached text."""
+    service = PageContentService(conn=db.conn, fresh_for=timedelta(0))
+
+    service.get_text(f"{server}/page")
+    result = service.get_text(f"{server}/page")
+
+    assert result["cached"] == "revalidated"
+    assert PageHandler.requests[-1] == ("/page", '"v1"')
+
+    # Content changed upstream: new ETag, new text
+    PageHandler.etag = '"v2"'
+    PageHandler.body = PAGE.replace(b"Main Title", b"New Title")
+    result = service.get_text(f"{server}/page")
+
+    assert result["cached"] is False
+    assert "New Title" in result["content"]
+
+
+def test_text_stored_once_per_content_hash(server, db):
+    """Test identical text from different URLs shares one stored copy."""
+    service = PageContentService(conn=db.conn)
+    service.get_text(f"{server}/page")
+    service.get_text(f"{server}/page?utm_source=x")
+
+    assert db.conn.execute("SELECT COUNT(*) FROM page_cache").fetchone()[0] == 2
+    assert db.conn.execute("SELECT COUNT(*) FROM page_texts").fetchone()[0] == 1
+
+
+def test_plain_text_and_unsupported_types(server):
+    """Test text/plain is cleaned and binary content is rejected."""
+    service = PageContentService()
+
+    assert service.get_text(f"{server}/text")["content"] == "line one\nline two"
+    with pytest.raises(ValueError, match="Unsupported content type"):
+        service.get_text(f"{server}/binary")
+
+
+def test_download_is_capped(server):
+    """Test streaming downloads stop at max_bytes."""
+    response, body, capped = fetch_capped(f"{server}/big", max_bytes=1000, timeout=5)
+
+    assert capped is True
+    assert len(body) == 1000
+
+    result = PageContentService(max_bytes=1000).get_text(f"{server}/big")
+    assert result["truncated"] is True
+
+
+def test_body_of_exactly_max_bytes_is_not_capped(server):
+    """Test a body that fits the cap exactly is complete, whatever the chunking."""
+    _, body, capped = fetch_capped(f"{server}/page", max_bytes=len(PAGE), timeout=5)
+
+    assert capped is False
+    assert body.encode() == PAGE
+
+    _, _, capped = fetch_capped(f"{server}/page", max_bytes=len(PAGE) - 1, timeout=5)
+    assert capped is True
+
+    # The cap falls on a chunk boundary, with more of the body still to come
+    _, body, capped = fetch_capped(f"{server}/big", max_bytes=64 * 1024, timeout=5)
+    assert capped is True
+    assert len(body) == 64 * 1024
+
+
+def test_http_errors_raise(server):
+    """Test HTTP errors surface as request exceptions."""
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetch_capped(f"{server}/missing", timeout=5)
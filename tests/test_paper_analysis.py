@@ -0,0 +1,224 @@
+"""Tests for the full-text paper analysis pipeline."""
+
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from holocene.core.channels import ChannelManager
+from holocene.research import paper_analysis
+from holocene.research.paper_analysis import PaperAnalyzer, detect_heading, iter_chunks, iter_pages, iter_pages_with
+from holocene.storage.database import Database
+
+
+def make_pdf(path, pages):
+    """Write a minimal PDF with one line of Helvetica text per list entry."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        ops = ["BT", "/F1 10 Tf", "14 TL", "50 800 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops)
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(out)
+    return path
+
+
+PAPER_PAGES = [
+    ["Kriging in Practice", "Abstract", "We compare kriging variants on drillhole data."],
+    ["1. Introduction", "Geostatistics estimates grades."] + [f"Context sentence {i}." for i in range(20)],
+    ["2. Methods", "Ordinary kriging with a spherical variogram."] + [f"Method detail {i}." for i in range(20)],
+    ["3. Results", "Errors dropped by 12 percent.", "References", "[1] Isaaks and Srivastava, 1989."],
+]
+
+
+class FakeLLM:
+    """Notes for map prompts, a summary for reduce prompts."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def simple_prompt(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        if prompt.startswith("Below is part"):
+            return f"- notes {len(self.prompts)}"
+        if prompt.startswith("Merge these notes"):
+            return "- merged notes"
+        return "## Summary\nKriging variants compared."
+
+
+def make_config(chunk_chars=400):
+    config = Mock()
+    config.llm.primary = "test-model"
+    config.papers.chunk_chars = chunk_chars
+    config.papers.analysis_workers = 1
+    config.papers.analysis_max_attempts = 2
+    return config
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        yield database
+        database.close()
+
+
+def test_detect_heading():
+    """Test section headings are recognized and sentences are not."""
+    assert detect_heading("2.1 Materials and Methods") == ("methods", "")
+    assert detect_heading("REFERENCES") == ("references", "")
+    assert detect_heading("Appendix B") == ("appendix", "")
+    assert detect_heading("Abstract—We present a method.") == ("abstract", "We present a method.")
+    assert detect_heading("Methods used by earlier studies were slow.") is None
+    assert detect_heading("The results") is None
+
+
+def test_chunks_follow_sections_and_size(tmp_path):
+    """Test pages stream into bounded chunks, with references kept apart."""
+    pdf = make_pdf(tmp_path / "paper.pdf", PAPER_PAGES)
+    pages = list(iter_pages(pdf))
+    chunks = list(iter_chunks(pages, chunk_chars=400))
+
+    assert [number for number, _ in pages] == [1, 2, 3, 4]
+    assert all(len(chunk.text) <= 400 for chunk in chunks)
+    assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+    assert chunks[0].abstract == "We compare kriging variants on drillhole data."
+    assert chunks[-1].sections == ["references"] and chunks[-1].skipped
+    assert not any(chunk.skipped for chunk in chunks[:-1])
+    assert "methods" in [section for chunk in chunks for section in chunk.sections]
+
+
+def test_analysis_caches_chunk_summaries(tmp_path, db):
+    """Test chunk summaries are cached by PDF hash and references are never sent."""
+    pdf = make_pdf(tmp_path / "paper.pdf", PAPER_PAGES)
+    paper_id = db.add_paper("Kriging in Practice")
+    db.conn.execute("UPDATE papers SET local_pdf_path = ? WHERE id = ?", (str(pdf), paper_id))
+    db.conn.commit()
+
+    llm = FakeLLM()
+    analyzer = PaperAnalyzer(llm, make_config(), db=db)
+    first = analyzer.analyze_paper(db.get_paper(paper_id))
+
+    map_prompts = [prompt for prompt in llm.prompts if prompt.startswith("Below is part")]
+    assert len(map_prompts) == first["chunks"] - 1  # All but the references chunk
+    assert not any("Isaaks and Srivastava" in prompt for prompt in llm.prompts)
+    assert first["cached_chunks"] == 0
+    assert first["total_pages"] == first["analysis_pages"] == 4
+
+    paper = db.get_paper(paper_id)
+    assert paper["full_text_analyzed"] == 1
+    assert paper["summary"].startswith("## Summary")
+    assert paper["abstract"] == "We compare kriging variants on drillhole data."
+    assert db.get_unanalyzed_papers() == []
+
+    # Same file under another name: only the reduce step runs again
+    llm.prompts.clear()
+    copy = tmp_path / "renamed.pdf"
+    copy.write_bytes(pdf.read_bytes())
+    second = analyzer.analyze_pdf(copy)
+    assert second["cached_chunks"] == len(map_prompts)
+    assert len(llm.prompts) == 1
+
+
+def test_pages_extracted_on_cpu_pool(tmp_path):
+    """Test batched extraction in worker processes matches inline extraction."""
+    from holocene.core.executor import BackgroundExecutor
+
+    pdf = make_pdf(tmp_path / "paper.pdf", PAPER_PAGES)
+    executor = BackgroundExecutor({"cpu": 1})
+    submitted = []
+
+    def submit(task):
+        submitted.append(task)
+        return executor.submit(task, pool="cpu")
+
+    try:
+        assert list(iter_pages_with(submit, pdf, total_pages=4, batch_pages=3)) == list(iter_pages(pdf))
+        assert len(submitted) == 2
+
+        inline = PaperAnalyzer(FakeLLM(), make_config()).analyze_pdf(pdf)
+        pooled = PaperAnalyzer(FakeLLM(), make_config(), submit=submit).analyze_pdf(pdf)
+    finally:
+        executor.shutdown()
+
+    assert pooled == inline
+    assert executor.get_metrics()["cpu"]["completed"] == 3
+
+
+def test_reduce_condenses_in_rounds(tmp_path, monkeypatch):
+    """Test notes too long for one reduce prompt are merged in groups first."""
+    monkeypatch.setattr(paper_analysis, "REDUCE_CHARS", 100)
+    pdf = make_pdf(tmp_path / "paper.pdf", PAPER_PAGES)
+    llm = FakeLLM()
+
+    result = PaperAnalyzer(llm, make_config(chunk_chars=200)).analyze_pdf(pdf)
+
+    assert any(prompt.startswith("Merge these notes") for prompt in llm.prompts)
+    assert result["summary"].startswith("## Summary")
+
+
+def test_plugin_drains_backlog(tmp_path, db):
+    """Test the plugin works through the backlog and gives up on broken papers."""
+    from holocene.plugins.paper_analyzer import PaperAnalyzerPlugin
+
+    good = []
+    for i in range(2):
+        paper_id = db.add_paper(f"Paper {i}")
+        pdf = make_pdf(tmp_path / f"paper{i}.pdf", PAPER_PAGES[:2] + [[f"Unique text {i}"]])
+        db.conn.execute("UPDATE papers SET local_pdf_path = ? WHERE id = ?", (str(pdf), paper_id))
+        good.append(paper_id)
+    broken = db.add_paper("Missing PDF")
+    db.conn.execute("UPDATE papers SET local_pdf_path = ? WHERE id = ?", (str(tmp_path / "gone.pdf"), broken))
+    db.conn.commit()
+
+    config = make_config()
+    config.llm.api_key = None
+    core = SimpleNamespace(
+        config=config,
+        db=db,
+        channels=ChannelManager(),
+        run_in_background=lambda task, callback, error_handler, **kw: _run(task, callback, error_handler),
+    )
+    plugin = PaperAnalyzerPlugin(core)
+    plugin.on_load()
+    plugin.analyzer = PaperAnalyzer(FakeLLM(), config, db=db)
+
+    analyzed = []
+    core.channels.subscribe('papers.analyzed', lambda msg: analyzed.append(msg.data['paper_id']))
+    plugin._fill_workers()
+
+    assert sorted(analyzed) == good
+    assert plugin.failed_count == 2  # analysis_max_attempts
+    assert [paper["id"] for paper in db.get_unanalyzed_papers()] == [broken]
+
+
+def _run(task, callback, error_handler):
+    """Synchronous stand-in for the core executor."""
+    try:
+        result = task()
+    except Exception as e:
+        error_handler(e)
+    else:
+        callback(result)
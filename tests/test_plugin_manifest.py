@@ -0,0 +1,148 @@
+"""Tests for manifest-based plugin discovery and concurrent enabling."""
+
+import sys
+import textwrap
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from holocene.core.plugin_registry import PluginRegistry, read_manifest
+
+PLUGIN_TEMPLATE = '''
+import time
+from holocene.core.plugin import Plugin
+
+PLUGIN_MANIFEST = {{
+    "name": "{name}",
+    "class": "TestPlugin",
+    "version": "1.0.0",
+    "description": "Test plugin",
+    "runs_on": {runs_on!r},
+    "requires": {requires!r},
+    {extra}
+}}
+
+
+class TestPlugin(Plugin):
+    def get_metadata(self):
+        return PLUGIN_MANIFEST
+
+    def on_enable(self):
+        self.core.events.append(("start", self.name, time.monotonic()))
+        time.sleep({sleep})
+        self.core.events.append(("end", self.name, time.monotonic()))
+'''
+
+
+def write_plugin(plugin_dir, name, runs_on=("both",), requires=(), sleep=0, extra=""):
+    source = PLUGIN_TEMPLATE.format(
+        name=name, runs_on=list(runs_on), requires=list(requires), sleep=sleep, extra=extra,
+    )
+    (plugin_dir / f"{name}.py").write_text(textwrap.dedent(source))
+    return f"holocene.plugins.{name}"
+
+
+@pytest.fixture
+def core():
+    config = SimpleNamespace(email=SimpleNamespace(enabled=False), llm=SimpleNamespace(api_key="key"))
+    return SimpleNamespace(config=config, events=[])
+
+
+@pytest.fixture
+def cleanup_modules():
+    before = set(sys.modules)
+    yield
+    for name in set(sys.modules) - before:
+        if name.startswith("holocene.plugins.manifest_test_"):
+            del sys.modules[name]
+
+
+def test_read_manifest(tmp_path):
+    """Test manifests are read from source without running the module."""
+    write_plugin(tmp_path, "manifest_test_read", runs_on=["rei"], extra='"enabled_by": "email.enabled",')
+    path = tmp_path / "manifest_test_read.py"
+    path.write_text(path.read_text() + "\nraise RuntimeError('imported')\n")
+
+    manifest = read_manifest(path)
+
+    assert manifest["name"] == "manifest_test_read"
+    assert manifest["class"] == "TestPlugin"
+    assert manifest["enabled_by"] == "email.enabled"
+
+
+def test_discovery_imports_only_matching_plugins(tmp_path, core, cleanup_modules):
+    """Test device- and config-filtered plugins are never imported, the rest only on load."""
+    matching = write_plugin(tmp_path, "manifest_test_matching", extra='"enabled_by": ["email.enabled", "llm.api_key"],')
+    other_device = write_plugin(tmp_path, "manifest_test_rei_only", runs_on=["rei"])
+    disabled = write_plugin(tmp_path, "manifest_test_disabled", extra='"enabled_by": "email.enabled",')
+
+    registry = PluginRegistry(core, device="wmut")
+    registry.discover_plugins(tmp_path)
+
+    assert list(registry._manifests) == ["manifest_test_matching"]
+    assert matching not in sys.modules
+
+    registry.load_all()
+
+    assert matching in sys.modules
+    assert other_device not in sys.modules
+    assert disabled not in sys.modules
+    assert registry.get_plugin("manifest_test_matching") is not None
+
+
+def test_enable_all_runs_independent_plugins_concurrently(tmp_path, core, cleanup_modules):
+    """Test independent plugins enable in parallel and dependents wait for their deps."""
+    write_plugin(tmp_path, "manifest_test_a", sleep=0.3)
+    write_plugin(tmp_path, "manifest_test_b", sleep=0.3)
+    write_plugin(tmp_path, "manifest_test_c", requires=["manifest_test_a", "manifest_test_b"])
+
+    registry = PluginRegistry(core, device="wmut")
+    registry.discover_plugins(tmp_path)
+    registry.load_all()
+
+    start = time.monotonic()
+    registry.enable_all()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.55  # Serial would take 0.6s
+    assert all(plugin["enabled"] for plugin in registry.list_plugins())
+
+    times = {(kind, name): t for kind, name, t in core.events}
+    assert times[("start", "manifest_test_c")] >= times[("end", "manifest_test_a")]
+    assert times[("start", "manifest_test_c")] >= times[("end", "manifest_test_b")]
+
+
+def test_startup_timings_reported(tmp_path, core, cleanup_modules):
+    """Test import, load and enable times are recorded per plugin."""
+    write_plugin(tmp_path, "manifest_test_timed", sleep=0.05)
+
+    registry = PluginRegistry(core, device="wmut")
+    registry.discover_plugins(tmp_path)
+    registry.load_all()
+    registry.enable_all()
+
+    [plugin] = registry.list_plugins()
+    assert set(plugin["startup_ms"]) == {"import_ms", "load_ms", "enable_ms"}
+    assert plugin["startup_ms"]["enable_ms"] >= 50
+
+
+def test_failed_dependency_is_not_enabled(tmp_path, core, cleanup_modules):
+    """Test a plugin isn't enabled when its dependency fails to enable."""
+    write_plugin(tmp_path, "manifest_test_broken")
+    write_plugin(tmp_path, "manifest_test_dependent", requires=["manifest_test_broken"])
+
+    registry = PluginRegistry(core, device="wmut")
+    registry.discover_plugins(tmp_path)
+    registry.load_all()
+
+    broken = registry.get_plugin("manifest_test_broken")
+
+    def fail():
+        raise RuntimeError("no network")
+
+    broken.on_enable = fail
+    registry.enable_all()
+
+    assert not broken.enabled
+    assert not registry.get_plugin("manifest_test_dependent").enabled
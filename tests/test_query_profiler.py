@@ -0,0 +1,119 @@
+"""Tests for the Database query profiler."""
+
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from holocene.core.executor import BackgroundExecutor
+from holocene.storage.database import Database
+from holocene.storage.profiler import QueryProfiler, normalize_sql, query_caller, query_id
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db", profiler=QueryProfiler(slow_query_ms=10_000))
+        yield database
+        database.close()
+
+
+def statement(profiler, sql):
+    key = query_id(normalize_sql(sql))
+    return next(s for s in profiler.snapshot(top=1000)["statements"] if s["id"] == key)
+
+
+def test_normalize_sql():
+    """Test literals, IN lists, comments and whitespace don't split statements."""
+    assert normalize_sql("SELECT * FROM books\n  WHERE id = 42 AND title = 'It''s'") == (
+        "SELECT * FROM books WHERE id = ? AND title = ?"
+    )
+    assert normalize_sql("SELECT 1 FROM t WHERE id IN (?, ?, ?) -- lookup") == normalize_sql(
+        "SELECT 1 FROM t WHERE id IN (?,?)"
+    )
+    assert normalize_sql("SELECT * FROM sqlite_stat1") == "SELECT * FROM sqlite_stat1"
+
+
+def test_times_statements_and_counts_rows(db):
+    """Test SELECT rows are counted as they are fetched, and writes by rowcount."""
+    profiler = db.profiler
+    for i in range(5):
+        db.insert_book(f"Book {i}", author="Doe, Jane")
+    db.conn.execute("UPDATE books SET author = 'Roe, Rick' WHERE id > 2")
+
+    rows = db.conn.execute("SELECT id FROM books WHERE author = ?", ("Roe, Rick",)).fetchall()
+    assert len(rows) == 3
+    cursor = db.conn.execute("SELECT id FROM books WHERE author = ?", ("Doe, Jane",))
+    assert len(list(cursor)) == 2
+    db.conn.execute("SELECT id FROM books").fetchone()  # Unfinished: recorded when the cursor goes away
+
+    select = statement(profiler, "SELECT id FROM books WHERE author = ?")
+    assert select["calls"] == 2
+    assert select["rows"] == 5
+    assert sum(select["histogram"].values()) == 2
+    assert statement(profiler, "UPDATE books SET author = 'x' WHERE id > 1")["rows"] == 3
+    assert statement(profiler, "SELECT id FROM books")["rows"] == 1
+
+
+def test_slow_queries_capture_plan(db):
+    """Test slow statements are logged with their EXPLAIN QUERY PLAN and caller."""
+    db.profiler.slow_query_ms = 0
+    db.insert_book("Geostatistics", author="Isaaks, Edward")
+
+    with query_caller("api:GET /books"):
+        db.conn.execute("SELECT * FROM books WHERE title LIKE ? ORDER BY RANDOM()", ("%stat%",)).fetchall()
+
+    entry = next(e for e in db.profiler.snapshot()["slow_queries"] if "RANDOM" in e["sql"])
+    assert entry["caller"] == "api:GET /books"
+    assert entry["rows"] == 1
+    assert any(line.startswith("SCAN") for line in entry["plan"])
+    assert any("TEMP B-TREE" in line for line in entry["plan"])
+
+
+def test_attributes_background_work_to_plugins(db):
+    """Test queries run by a plugin's background task are attributed to the plugin."""
+    executor = BackgroundExecutor({"io": 1})
+    done = threading.Event()
+
+    def task():
+        db.conn.execute("SELECT COUNT(*) FROM links").fetchone()
+        done.set()
+
+    executor.submit(task, owner="link_status_checker").result(timeout=5)
+    executor.shutdown()
+
+    callers = {c["caller"] for c in db.profiler.snapshot()["callers"]}
+    assert "plugin:link_status_checker" in callers
+    assert statement(db.profiler, "SELECT COUNT(*) FROM links")["callers"] == {"plugin:link_status_checker": 1}
+
+
+def test_prometheus_output(db):
+    """Test the Prometheus exposition has cumulative buckets per query."""
+    for _ in range(3):
+        db.conn.execute("SELECT COUNT(*) FROM books").fetchall()
+
+    text = db.profiler.prometheus()
+    key = query_id("SELECT COUNT(*) FROM books")
+
+    assert "# TYPE holocene_db_query_duration_seconds histogram" in text
+    assert f'holocene_db_query_duration_seconds_bucket{{query="{key}",le="+Inf"}} 3' in text
+    assert f'holocene_db_query_duration_seconds_count{{query="{key}"}} 3' in text
+    assert f'holocene_db_query_info{{query="{key}",sql="SELECT COUNT(*) FROM books"}} 1' in text
+    assert 'holocene_db_caller_queries_total{caller="thread:MainThread"}' in text
+
+
+def test_database_without_profiler_uses_plain_connections():
+    """Test profiling is off unless a profiler is passed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        assert database.profiler is None
+        assert type(database.conn).__name__ == "Connection"
+        database.close()
+
+
+def test_profiler_off_by_default():
+    """Test holod only profiles when the config turns it on."""
+    from holocene.config.loader import ProfilerConfig
+
+    assert ProfilerConfig().enabled is False
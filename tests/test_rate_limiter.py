@@ -203,3 +203,151 @@ def test_url_without_scheme():
     # Should not raise
     limiter.wait_for_token("example.com/page")
     assert limiter.can_proceed("example.com/page2") is False  # Rate limited
+
+
+def test_token_bucket_reserve_does_not_block():
+    """Test that reservations return a future start time immediately."""
+    bucket = rate_limiter.TokenBucket(rate=2.0, capacity=1.0)
+
+    start = time.monotonic()
+    first = bucket.reserve()
+    second = bucket.reserve()
+    third = bucket.reserve()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.05  # Never sleeps
+    assert first <= time.monotonic()
+    # Each further reservation is queued 0.5s behind the previous one
+    assert 0.4 < second - first < 0.6
+    assert 0.9 < third - first < 1.1
+
+
+def test_domain_rate_limiter_reserve():
+    """Test per-domain reservations are independent."""
+    limiter = rate_limiter.DomainRateLimiter(default_rate=1.0)
+    now = time.monotonic()
+
+    limiter.reserve("https://a.example.com/1")
+    queued = limiter.reserve("https://a.example.com/2")
+    other = limiter.reserve("https://b.example.com/1")
+
+    assert queued - now > 0.9
+    assert other - now < 0.05
+
+
+def test_domain_rate_limiter_async_acquire():
+    """Test asyncio acquire waits without blocking the event loop."""
+    import asyncio
+
+    limiter = rate_limiter.DomainRateLimiter(default_rate=4.0)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("https://example.com/") for _ in range(6)))
+        elapsed = time.monotonic() - start
+        task.cancel()
+        return elapsed, ticks
+
+    elapsed, ticks = asyncio.run(run())
+
+    # 4 immediate (capacity), 2 more at 0.25s intervals
+    assert 0.4 < elapsed < 0.8
+    assert ticks >= 5  # Event loop kept running while waiting
+
+
+def test_domain_rate_limiter_lru_eviction():
+    """Test bucket table is bounded to max_domains."""
+    limiter = rate_limiter.DomainRateLimiter(default_rate=10.0, max_domains=2)
+
+    limiter.can_proceed("https://one.com/")
+    limiter.can_proceed("https://two.com/")
+    limiter.can_proceed("https://one.com/")  # Touch one.com so two.com is LRU
+    limiter.can_proceed("https://three.com/")
+
+    assert list(limiter.buckets) == ["one.com", "three.com"]
+    assert set(limiter.get_stats()) == {"one.com", "three.com"}
+
+
+def test_domain_rate_limiter_backoff_and_recovery():
+    """Test 429 halves the domain rate and successes recover it."""
+    limiter = rate_limiter.DomainRateLimiter(default_rate=4.0)
+    url = "https://api.example.com/items"
+
+    limiter.record_response(url, 429)
+    assert limiter.buckets["api.example.com"].rate == 2.0
+
+    limiter.record_response(url, 503)
+    assert limiter.buckets["api.example.com"].rate == 1.0
+
+    # Other domains unaffected
+    limiter.can_proceed("https://other.example.com/")
+    assert limiter.buckets["other.example.com"].rate == 4.0
+
+    for _ in range(20):
+        limiter.record_response(url, 200)
+    assert limiter.buckets["api.example.com"].rate == 4.0
+
+    stats = limiter.get_stats()["api.example.com"]
+    assert stats["throttled"] == 2
+    assert stats["base_rate"] == 4.0
+
+
+def test_domain_rate_limiter_retry_after_blocks_domain():
+    """Test Retry-After blocks the domain for the given time."""
+    limiter = rate_limiter.DomainRateLimiter(default_rate=10.0)
+    url = "https://api.example.com/items"
+
+    limiter.record_response(url, 429, retry_after="2")
+
+    assert limiter.can_proceed(url) is False
+    assert limiter.reserve(url) - time.monotonic() > 1.9
+
+
+def test_domain_rate_limiter_wait_metrics():
+    """Test wait time is recorded per domain."""
+    limiter = rate_limiter.DomainRateLimiter(default_rate=1.0)
+
+    limiter.reserve("https://example.com/1")
+    limiter.reserve("https://example.com/2")
+
+    stats = limiter.get_stats()["example.com"]
+    assert stats["requests"] == 2
+    assert stats["delayed"] == 1
+    assert 0.9 < stats["max_wait"] <= 1.0
+    assert 0.45 < stats["avg_wait"] <= 0.5
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds and HTTP-date forms."""
+    from email.utils import format_datetime
+    from datetime import datetime, timedelta, timezone
+
+    assert rate_limiter.parse_retry_after("120") == 120.0
+    assert rate_limiter.parse_retry_after(None) is None
+    assert rate_limiter.parse_retry_after("soon") is None
+
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    parsed = rate_limiter.parse_retry_after(format_datetime(future, usegmt=True))
+    assert 25 < parsed <= 30
+
+
+def test_ensure_global_limiter():
+    """Test ensure_global_limiter installs once and then reuses."""
+    rate_limiter.set_global_limiter(None)
+
+    limiter = rate_limiter.ensure_global_limiter(default_rate=3.0)
+    assert rate_limiter.get_global_limiter() is limiter
+    assert rate_limiter.ensure_global_limiter(default_rate=9.0) is limiter
+    assert limiter.default_rate == 3.0
+
+    # Clean up
+    rate_limiter.set_global_limiter(None)
@@ -0,0 +1,225 @@
+"""Tests for the parallel research orchestrator and ranked link search."""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from holocene.storage.database import Database
+from holocene.storage.migrations import split_statements
+from holocene.research.orchestrator import ResearchOrchestrator
+
+
+def add_link(db, url, title, last_seen="2024-01-01"):
+    """Insert a link directly (insert_link resolves redirects over the network)."""
+    db.conn.execute(
+        "INSERT INTO links (url, title, source, first_seen, last_seen, created_at) VALUES (?, ?, 'test', ?, ?, ?)",
+        (url, title, last_seen, last_seen, last_seen),
+    )
+    db.conn.commit()
+
+
+class FakeLLM:
+    def __init__(self, fail_on=None):
+        self.prompts = []
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+
+    def simple_prompt(self, prompt, model=None, temperature=0.7):
+        with self.lock:
+            self.prompts.append(prompt)
+        if self.fail_on and self.fail_on in prompt:
+            raise RuntimeError("boom")
+        return f"summary {len(self.prompts)}"
+
+
+class FakeBudget:
+    def __init__(self, remaining=1000):
+        self.remaining = remaining
+        self.used = 0
+
+    def remaining_budget(self):
+        return self.remaining
+
+    def increment_usage(self, count=1):
+        self.used += count
+
+
+class SlowClient:
+    """Remote client stub that records when it ran."""
+
+    def __init__(self, results, delay=0.2):
+        self.results = results
+        self.delay = delay
+        self.started = None
+
+    def _run(self):
+        self.started = time.time()
+        time.sleep(self.delay)
+        return self.results
+
+
+class FakeCrossref(SlowClient):
+    def search(self, query, limit=20):
+        return {"message": {"items": self._run()}}
+
+    def parse_paper(self, item):
+        return {"title": item["title"], "doi": item.get("doi"), "authors": [], "abstract": item.get("abstract")}
+
+
+class FakeOpenAlex(SlowClient):
+    def search(self, query, limit=20):
+        return {"results": self._run()}
+
+    def parse_paper(self, work):
+        return {"title": work["title"], "doi": work.get("doi"), "authors": [], "abstract": None}
+
+
+class FakeArxiv(SlowClient):
+    def search(self, query, max_results=10):
+        self.query = query
+        return self._run()
+
+
+class FakeWikipedia(SlowClient):
+    def get_summary(self, title):
+        return self._run()
+
+
+@pytest.fixture
+def orchestrator():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = ResearchOrchestrator.__new__(ResearchOrchestrator)
+        orch.config = SimpleNamespace(data_dir=Path(tmpdir))
+        orch.db = Database(Path(tmpdir) / "test.db")
+        orch.llm_client = FakeLLM()
+        orch.budget_tracker = FakeBudget()
+        orch.report_gen = SimpleNamespace(save=lambda report, output_dir: output_dir / "report.md")
+        orch.wikipedia = FakeWikipedia({"title": "Kriging", "extract": "Interpolation.", "url": "https://w/k"})
+        orch.crossref = FakeCrossref([{"title": "Kriging methods", "doi": "10.1/ABC"}])
+        orch.openalex = FakeOpenAlex([{"title": "kriging methods", "doi": "10.1/abc"}, {"title": "Variograms"}])
+        orch.arxiv = FakeArxiv([{"title": "Neural kriging", "url": "https://arxiv.org/abs/1"}])
+        yield orch
+        orch.db.close()
+
+
+def test_split_statements_keeps_trigger_bodies():
+    """Test migration scripts split on ';' except inside BEGIN ... END."""
+    statements = split_statements("""
+        CREATE TABLE a (x);
+        CREATE TRIGGER t AFTER INSERT ON a BEGIN
+            INSERT INTO a VALUES (1);
+            INSERT INTO a VALUES (2);
+        END;
+    """)
+
+    assert len(statements) == 2
+    assert statements[1].endswith("END")
+
+
+def test_ranked_search_sees_all_links(orchestrator):
+    """Test link search isn't limited to the most recent links."""
+    db = orchestrator.db
+    add_link(db, "https://example.com/old-kriging", "Kriging tutorial", last_seen="2001-01-01")
+    for i in range(1100):
+        add_link(db, f"https://example.com/{i}", f"Unrelated page {i}", last_seen="2024-06-01")
+    add_link(db, "https://kriging.org/", "Homepage")
+
+    results = orchestrator._search_links("Kriging for beginners")
+
+    # Title hits outrank URL-only hits
+    assert [r["url"] for r in results] == ["https://example.com/old-kriging", "https://kriging.org/"]
+
+
+def test_ranked_search_tracks_updates(orchestrator):
+    """Test the index follows title changes and deletions."""
+    db = orchestrator.db
+    add_link(db, "https://a.example/", "Geostatistics notes")
+    add_link(db, "https://b.example/", "Geostatistics book")
+
+    db.conn.execute("UPDATE links SET title = 'Cooking' WHERE url = 'https://a.example/'")
+    db.conn.execute("DELETE FROM links WHERE url = 'https://b.example/'")
+    db.conn.commit()
+
+    assert db.search_links_ranked(["geostatistics"]) == []
+    assert [r["url"] for r in db.search_links_ranked(["cook"])] == ["https://a.example/"]
+    assert db.search_links_ranked(['"', "of"]) == []
+
+
+def test_remote_sources_fetched_concurrently(orchestrator):
+    """Test remote lookups overlap each other and are merged without duplicates."""
+    start = time.time()
+    sources = orchestrator._gather_sources("kriging", include_wikipedia=True, include_academic=True)
+    elapsed = time.time() - start
+
+    assert elapsed < 0.6  # Four 0.2s lookups, not run back to back
+    assert sources["wikipedia"]["title"] == "Kriging"
+    assert [p["title"] for p in sources["academic"]] == ["Kriging methods", "Variograms", "Neural kriging"]
+    assert orchestrator.arxiv.query == "all:kriging"
+
+
+def test_failing_source_is_skipped(orchestrator):
+    """Test one failing remote source doesn't abort the research."""
+    def broken(query, limit=20):
+        raise ConnectionError("offline")
+
+    orchestrator.crossref.search = broken
+    sources = orchestrator._gather_sources("kriging", include_academic=True)
+
+    assert [p["source"] for p in sources["academic"]] == ["OpenAlex", "OpenAlex", "arXiv"]
+
+
+def test_summaries_fit_call_budget(orchestrator):
+    """Test per-source summaries plus the merge call never exceed the budget."""
+    for i in range(30):
+        add_link(orchestrator.db, f"https://example.com/kriging-{i}", f"Kriging part {i}")
+    sources = orchestrator._gather_sources("kriging", include_wikipedia=True, include_academic=True)
+
+    analysis, calls = orchestrator._analyze_sources("kriging", sources, call_budget=6)
+
+    assert calls == 6  # 5 batches (20 links, wikipedia, academic) + merge
+    assert len(orchestrator.llm_client.prompts) == 6
+    assert "## Source Summaries" in orchestrator.llm_client.prompts[-1]
+    assert analysis == "summary 6"
+
+
+def test_small_budget_falls_back_to_single_call(orchestrator):
+    """Test a budget too small for per-source calls makes one analysis call."""
+    add_link(orchestrator.db, "https://example.com/kriging", "Kriging")
+    sources = orchestrator._gather_sources("kriging", include_wikipedia=True, include_academic=True)
+
+    _, calls = orchestrator._analyze_sources("kriging", sources, call_budget=2)
+
+    assert calls == 1
+    assert len(orchestrator.llm_client.prompts) == 1
+
+
+def test_failed_summary_still_merges(orchestrator):
+    """Test a failed summary call is dropped and counted."""
+    orchestrator.llm_client = FakeLLM(fail_on="(Wikipedia)")
+    add_link(orchestrator.db, "https://example.com/kriging", "Kriging")
+    sources = orchestrator._gather_sources("kriging", include_wikipedia=True)
+
+    _, calls = orchestrator._analyze_sources("kriging", sources, call_budget=10)
+
+    assert calls == 3
+    assert "### Wikipedia" not in orchestrator.llm_client.prompts[-1]
+    assert "### Web sources" in orchestrator.llm_client.prompts[-1]
+
+
+def test_research_respects_daily_budget(orchestrator):
+    """Test research records calls used and stops at the daily remaining budget."""
+    add_link(orchestrator.db, "https://example.com/kriging", "Kriging")
+    orchestrator.budget_tracker = FakeBudget(remaining=0)
+
+    orchestrator.research("kriging", include_academic=False)
+
+    assert orchestrator.llm_client.prompts == []
+    assert orchestrator.budget_tracker.used == 0
+
+    orchestrator.budget_tracker = FakeBudget()
+    orchestrator.research("kriging", include_wikipedia=True)
+    assert orchestrator.budget_tracker.used == len(orchestrator.llm_client.prompts) == 3
@@ -144,3 +144,58 @@ def test_is_safe_for_external_api():
         metadata={"domain": "app.internal.com"},
     )
     assert sanitizer.is_safe_for_external_api(unsafe_activity2) is False
+
+
+def test_domain_patterns_match_like_fnmatch():
+    """Test compiled domain matching agrees with fnmatch semantics."""
+    sanitizer = PrivacySanitizer(
+        blacklist_domains=["*.vale.com", "Mail.Google.com", "intranet-?.corp", "*secret*"],
+    )
+
+    assert sanitizer.should_block_domain("a.b.vale.com") is True  # * spans dots
+    assert sanitizer.should_block_domain("vale.com") is False
+    assert sanitizer.should_block_domain("MAIL.google.com ") is True
+    assert sanitizer.should_block_domain("google.com") is False
+    assert sanitizer.should_block_domain("intranet-1.corp") is True
+    assert sanitizer.should_block_domain("topsecretstuff.org") is True
+    assert sanitizer.should_block_domain("example.org") is False
+
+
+def test_should_block_path_prefix_and_glob():
+    """Test path blocking by prefix and by wildcard."""
+    sanitizer = PrivacySanitizer(blacklist_paths=["/work/proprietary", "*.key"])
+
+    assert sanitizer.should_block_path("/work/proprietary/data.csv") is True
+    assert sanitizer.should_block_path("/home/me/server.key") is True
+    assert sanitizer.should_block_path("/work/public/data.csv") is False
+
+
+def test_redact_keywords_single_pass():
+    """Test overlapping keywords redact the longest match, once."""
+    sanitizer = PrivacySanitizer(blacklist_keywords=["secret", "top secret", "red", "a.b"])
+
+    assert sanitizer.redact_keywords("TOP SECRET plan") == "[REDACTED] plan"
+    # Keywords aren't matched inside earlier redactions, and are regex-escaped
+    assert sanitizer.redact_keywords("Red flag on axb") == "[REDACTED] flag on axb"
+
+
+def test_sanitize_activities_batch():
+    """Test batch sanitization keeps order and drops blocked activities."""
+    sanitizer = PrivacySanitizer(
+        blacklist_keywords=["tonnage"],
+        blacklist_paths=["/work/proprietary"],
+    )
+    activities = [
+        Activity(description="Tonnage model", tags=["tonnage", "mining"],
+                 activity_type=ActivityType.CODING, context=Context.WORK),
+        Activity(description="Read /work/proprietary/x", activity_type=ActivityType.CODING,
+                 context=Context.WORK),
+        Activity(description="Open source fix", activity_type=ActivityType.CODING,
+                 context=Context.OPEN_SOURCE),
+    ]
+
+    sanitized = sanitizer.sanitize_activities(activities)
+
+    assert [a.description for a in sanitized] == ["[REDACTED] model", "Open source fix"]
+    assert sanitized[0].tags == ["mining"]
+    assert activities[0].description == "Tonnage model"  # Originals untouched
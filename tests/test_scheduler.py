@@ -0,0 +1,205 @@
+"""Tests for the central job scheduler."""
+
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from holocene.core import Plugin, PRIORITY_LOW
+from holocene.core.executor import BackgroundExecutor
+from holocene.core.scheduler import CronTrigger, IntervalTrigger, Scheduler
+from holocene.storage.database import Database
+
+
+@pytest.fixture
+def executor():
+    pool = BackgroundExecutor({"io": 4, "llm": 1})
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_cron_next_fire():
+    """Test cron expressions resolve to the next matching minute."""
+    daily = CronTrigger("0 8 * * *")
+    assert daily.next_fire(datetime(2024, 1, 1, 7, 59, 30)) == datetime(2024, 1, 1, 8, 0)
+    assert daily.next_fire(datetime(2024, 1, 1, 8, 0)) == datetime(2024, 1, 2, 8, 0)
+
+    # Weekdays only: Saturday 2024-01-06 -> Monday 09:00
+    office = CronTrigger("*/15 9-17 * * 1-5")
+    assert office.next_fire(datetime(2024, 1, 6, 12, 0)) == datetime(2024, 1, 8, 9, 0)
+    assert office.next_fire(datetime(2024, 1, 8, 9, 7)) == datetime(2024, 1, 8, 9, 15)
+
+    # Month rollover and Sunday as 7
+    assert CronTrigger("30 6 1 * *").next_fire(datetime(2024, 12, 15)) == datetime(2025, 1, 1, 6, 30)
+    assert CronTrigger("0 0 * * 7").next_fire(datetime(2024, 1, 1)) == datetime(2024, 1, 7, 0, 0)
+
+
+def test_cron_day_fields_match_either():
+    """Test restricted day-of-month and day-of-week fire on either, like cron."""
+    trigger = CronTrigger("0 12 13 * 5")  # The 13th, and every Friday
+
+    assert trigger.next_fire(datetime(2024, 1, 1)) == datetime(2024, 1, 5, 12, 0)  # Friday
+    assert trigger.next_fire(datetime(2024, 1, 12, 13, 0)) == datetime(2024, 1, 13, 12, 0)
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "61 * * * *", "0 0 31 2 *", "*/0 * * * *"])
+def test_cron_rejects_bad_expressions(expression):
+    """Test malformed or impossible expressions raise ValueError."""
+    with pytest.raises(ValueError):
+        CronTrigger(expression).next_fire(datetime(2024, 1, 1))
+
+
+def test_interval_jobs_run_and_stop(executor):
+    """Test interval jobs fire repeatedly on the executor until removed."""
+    scheduler = Scheduler(executor.submit)
+    runs = []
+    scheduler.add_job("tick", lambda: runs.append(threading.current_thread().name), IntervalTrigger(0.05))
+
+    assert wait_for(lambda: len(runs) >= 3)
+    assert all(name != "holocene-scheduler" for name in runs)
+
+    assert scheduler.remove_job("tick") is True
+    count = len(runs)
+    time.sleep(0.2)
+    assert len(runs) <= count + 1  # At most the run already dispatched
+    scheduler.shutdown()
+
+
+def test_busy_job_is_not_overlapped(executor):
+    """Test a job still running when due is skipped, not run twice at once."""
+    scheduler = Scheduler(executor.submit)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.2)
+        with lock:
+            active[0] -= 1
+
+    job = scheduler.add_job("slow", slow, IntervalTrigger(0.03))
+    assert wait_for(lambda: job.skipped >= 2)
+    scheduler.shutdown()
+
+    assert peak[0] == 1
+
+
+def test_failures_are_recorded(executor):
+    """Test a failing job keeps its schedule and records the error."""
+    scheduler = Scheduler(executor.submit)
+
+    def broken():
+        raise RuntimeError("boom")
+
+    job = scheduler.add_job("broken", broken, IntervalTrigger(0.05))
+    assert wait_for(lambda: job.run_count >= 2)
+    scheduler.shutdown()
+
+    assert job.last_error == "RuntimeError: boom"
+    assert scheduler.get_jobs() == []
+
+
+def test_last_run_persisted_across_restarts(executor):
+    """Test schedules resume from the persisted last run, with misfire handling."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(Path(tmpdir) / "test.db")
+        now = datetime.now()
+        db.record_scheduled_job_run("hourly", (now - timedelta(minutes=20)).isoformat())
+        db.record_scheduled_job_run("digest", (now - timedelta(days=1, hours=1)).isoformat())
+        db.record_scheduled_job_run("stale", (now - timedelta(days=3)).isoformat())
+
+        scheduler = Scheduler(lambda f, **kw: None, db=db)
+        hourly = scheduler.add_job("hourly", lambda: None, IntervalTrigger(3600))
+        # Yesterday's run was an hour before this time: today's run was missed
+        cron = CronTrigger(f"{(now - timedelta(hours=1)).minute} {(now - timedelta(hours=1)).hour} * * *")
+        digest = scheduler.add_job("digest", lambda: None, cron, misfire_grace=4 * 3600)
+        stale = scheduler.add_job("stale", lambda: None, IntervalTrigger(3600), misfire_grace=60)
+        scheduler.shutdown()
+
+        # Keeps cadence: 40 minutes left, not a fresh hour
+        assert abs((hourly.next_run - now - timedelta(minutes=40)).total_seconds()) < 5
+        assert hourly.run_count == 1
+        # Missed within grace: caught up now
+        assert digest.next_run <= datetime.now()
+        # Missed beyond grace: skipped to the next slot
+        assert stale.next_run > now + timedelta(minutes=59)
+
+        # Runs are recorded
+        scheduler = Scheduler(executor.submit, db=db)
+        scheduler.add_job("fresh", lambda: None, IntervalTrigger(0.05))
+        assert wait_for(lambda: (db.get_scheduled_job("fresh") or {}).get("run_count", 0) >= 1)
+        scheduler.shutdown()
+        db.close()
+
+
+def test_jitter_delays_runs():
+    """Test jitter only ever pushes run times later."""
+    scheduler = Scheduler(lambda f, **kw: None)
+    before = datetime.now()
+    job = scheduler.add_job("jittery", lambda: None, IntervalTrigger(60, initial_delay=10), jitter=5)
+    scheduler.shutdown()
+
+    delay = (job.next_run - before).total_seconds()
+    assert 10 <= delay <= 15.5
+
+
+def test_plugin_jobs_removed_on_disable(executor):
+    """Test jobs registered by a plugin are namespaced and cleaned up."""
+    class TickPlugin(Plugin):
+        def get_metadata(self):
+            return {"name": "ticker", "version": "1.0.0", "description": "", "runs_on": ["both"], "requires": []}
+
+        def on_enable(self):
+            self.schedule("tick", lambda: None, IntervalTrigger(3600))
+
+    scheduler = Scheduler(executor.submit)
+    plugin = TickPlugin(SimpleNamespace(scheduler=scheduler))
+
+    plugin.enable()
+    assert [job["name"] for job in scheduler.get_jobs()] == ["ticker.tick"]
+
+    plugin.disable()
+    assert scheduler.get_jobs() == []
+    scheduler.shutdown()
+
+
+def test_plugin_jobs_run_as_the_plugin(executor):
+    """Test plugin jobs are submitted with the plugin as owner, on their pool and priority."""
+    submitted = []
+
+    def submit(fn, **kwargs):
+        submitted.append(kwargs)
+        return executor.submit(fn, **kwargs)
+
+    class DigestPlugin(Plugin):
+        def get_metadata(self):
+            return {"name": "digest", "version": "1.0.0", "description": "", "runs_on": ["both"], "requires": []}
+
+        def on_enable(self):
+            self.job = self.schedule("write", lambda: None, IntervalTrigger(0.05), pool="llm", priority=PRIORITY_LOW)
+
+    scheduler = Scheduler(submit)
+    plugin = DigestPlugin(SimpleNamespace(scheduler=scheduler))
+    plugin.enable()
+
+    assert wait_for(lambda: plugin.job.run_count >= 1)
+    scheduler.shutdown()
+
+    assert submitted[0] == {"pool": "llm", "priority": PRIORITY_LOW, "owner": "digest"}
+    assert executor.get_metrics()["llm"]["completed"] >= 1
+    assert plugin.job.to_dict()["owner"] == "digest"
@@ -0,0 +1,121 @@
+"""Tests for the trigger-maintained trigram search index."""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from holocene.core.search_index import SearchIndex
+from holocene.storage.database import Database
+
+
+def has_trigram_tokenizer():
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(text, tokenize = 'trigram')")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        yield database
+        database.close()
+
+
+def add_book(db, title, author=None):
+    cursor = db.conn.execute(
+        "INSERT INTO books (title, author, created_at) VALUES (?, ?, datetime('now'))", (title, author)
+    )
+    db.conn.commit()
+    return cursor.lastrowid
+
+
+def add_link(db, url, title):
+    cursor = db.conn.execute(
+        "INSERT INTO links (url, title, source, first_seen, last_seen, created_at) "
+        "VALUES (?, ?, 'test', datetime('now'), datetime('now'), datetime('now'))",
+        (url, title),
+    )
+    db.conn.commit()
+    return cursor.lastrowid
+
+
+@pytest.fixture
+def library(db):
+    ids = {
+        "fluent": add_book(db, "Fluent Python: Clear, Concise, and Effective Programming", "Luciano Ramalho"),
+        "sicp": add_book(db, "Structure and Interpretation of Computer Programs", "Harold Abelson"),
+        "geology": add_book(db, "Principles of Geology", "Charles Lyell"),
+    }
+    ids["link"] = add_link(db, "https://docs.python.org/3/tutorial/", "The Python Tutorial")
+    return ids
+
+
+def test_typo_tolerant_ranking(db, library):
+    """Test misspelled queries find the right item, best match first."""
+    index = SearchIndex(db)
+
+    hits = index.search("fluent pyton", item_type="book")
+    assert hits[0]["item_id"] == library["fluent"]
+    assert hits[0]["score"] > 0.8
+
+    assert index.search("structre interpretation", item_type="book")[0]["item_id"] == library["sicp"]
+    assert index.search("geolgy", item_type="book")[0]["item_id"] == library["geology"]
+    assert index.search("haskell monads") == []
+
+
+def test_field_weights_and_types(db, library):
+    """Test secondary fields match at reduced weight and item types are kept apart."""
+    index = SearchIndex(db)
+
+    [by_author] = index.search("ramalho", item_type="book")
+    assert by_author["item_id"] == library["fluent"]
+    assert by_author["score"] == pytest.approx(0.7)
+
+    types = {(hit["item_type"], hit["item_id"]) for hit in index.search("python")}
+    assert ("book", library["fluent"]) in types
+    assert ("link", library["link"]) in types
+
+
+@pytest.mark.skipif(not has_trigram_tokenizer(), reason="SQLite without FTS5 trigram tokenizer")
+def test_index_follows_updates_and_deletes(db, library):
+    """Test the triggers keep the index current without a rebuild."""
+    index = SearchIndex(db)
+    assert index.available
+
+    db.conn.execute("UPDATE books SET title = 'Principles of Sedimentology' WHERE id = ?", (library["geology"],))
+    db.conn.execute("DELETE FROM books WHERE id = ?", (library["sicp"],))
+    db.conn.commit()
+    new_id = add_book(db, "Python Cookbook", "David Beazley")
+
+    assert index.search("geology", item_type="book") == []
+    assert index.search("sedimentolgy", item_type="book")[0]["item_id"] == library["geology"]
+    assert index.search("structure interpretation", item_type="book") == []
+    assert index.search("pyhton cookbok", item_type="book")[0]["item_id"] == new_id
+
+    assert index.rebuild() == 4  # 3 books + 1 link
+
+
+def test_search_rows_returns_full_rows(db, library):
+    """Test search_rows loads the matching rows in score order."""
+    rows = SearchIndex(db).search_rows("principls geology", "book")
+
+    assert rows[0]["id"] == library["geology"]
+    assert rows[0]["author"] == "Charles Lyell"
+    assert rows[0]["_score"] > 0.8
+
+
+def test_fallback_without_index(db, library):
+    """Test search still works (by substring scan) when the index is missing."""
+    db.conn.execute("DROP TABLE IF EXISTS search_index")
+    index = SearchIndex(db)
+
+    assert not index.available
+    assert index.search("fluent pyton", item_type="book")[0]["item_id"] == library["fluent"]
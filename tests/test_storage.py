@@ -139,3 +139,30 @@ def test_count_activities(temp_db):
     # Count in date range
     recent = temp_db.count_activities(start_date=now - timedelta(hours=1, minutes=30))
     assert recent == 2
+
+
+def test_get_existing_link_urls(temp_db):
+    """Test set-based URL lookup against the links table."""
+    now = datetime.now().isoformat()
+    for url in ["https://a.com", "https://b.com"]:
+        temp_db.conn.execute(
+            "INSERT INTO links (url, source, first_seen, last_seen, created_at) VALUES (?, 'test', ?, ?, ?)",
+            (url, now, now, now),
+        )
+    temp_db.conn.commit()
+
+    urls = ["https://a.com", "https://c.com"] + [f"https://x{i}.com" for i in range(1200)]
+    assert temp_db.get_existing_link_urls(urls) == {"https://a.com"}
+
+    temp_db.touch_links([{"url": "https://b.com", "title": "B"}])
+    assert temp_db.conn.execute("SELECT title FROM links WHERE url = 'https://b.com'").fetchone()[0] == "B"
+
+
+def test_import_state_roundtrip(temp_db):
+    """Test incremental-import state is saved per source."""
+    assert temp_db.get_import_state("bookmarks") == {}
+
+    temp_db.set_import_state("bookmarks", {"/path/Bookmarks": {"high_water": 5}})
+    temp_db.set_import_state("bookmarks", {"/path/Bookmarks": {"high_water": 7}})
+
+    assert temp_db.get_import_state("bookmarks") == {"/path/Bookmarks": {"high_water": 7}}
@@ -0,0 +1,119 @@
+"""Tests for the curiosity engine's topic keyword index."""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from holocene.core.topic_index import TopicIndex, jaccard, topic_keywords
+from holocene.storage.database import Database
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        yield database
+        database.close()
+
+
+def add_link(db, url, title):
+    now = datetime.now().isoformat()
+    cursor = db.conn.execute("""
+        INSERT INTO links (url, title, source, first_seen, last_seen, created_at)
+        VALUES (?, ?, 'test', ?, ?, ?)
+    """, (url, title, now, now, now))
+    db.conn.commit()
+    return cursor.lastrowid
+
+
+def add_book(db, title, subjects=None):
+    cursor = db.conn.execute(
+        "INSERT INTO books (title, subjects, created_at) VALUES (?, ?, ?)",
+        (title, subjects, datetime.now().isoformat()),
+    )
+    db.conn.commit()
+    return cursor.lastrowid
+
+
+def index_rows(db):
+    return {
+        (row[0], row[1]): (row[2], row[3])
+        for row in db.conn.execute("SELECT item_type, item_id, text, keywords FROM topic_index")
+    }
+
+
+def test_topic_keywords():
+    """Test tokenization drops stopwords, punctuation and short words."""
+    assert topic_keywords("The Role of Volcanic Ash in Soil Formation!") == {"volcanic", "ash", "soil"}
+    assert jaccard(topic_keywords("volcanic soil"), topic_keywords("volcanic glass")) == pytest.approx(1 / 3)
+    assert jaccard(frozenset(), topic_keywords("volcanic soil")) == 0.0
+
+
+def test_triggers_keep_index_in_sync(db):
+    """Test inserts, retitles and deletes are mirrored into topic_index."""
+    link_id = add_link(db, "https://example.com/a", "Volcanic soils of Java")
+    untitled_id = add_link(db, "https://example.com/b", "")
+    book_id = add_book(db, "Igneous Petrology", "Geology; Minerals")
+
+    rows = index_rows(db)
+    assert rows[("link", link_id)] == ("Volcanic soils of Java", None)
+    assert ("link", untitled_id) not in rows
+    assert rows[("book", book_id)][0] == "Igneous Petrology Geology; Minerals"
+
+    index = TopicIndex(db)
+    assert index.refresh() == 2
+    assert index_rows(db)[("link", link_id)][1] == "java soils volcanic"
+    assert index.refresh() == 0
+
+    # Retitle queues the row again; titling a link adds it
+    db.conn.execute("UPDATE links SET title = 'Basalt weathering' WHERE id = ?", (link_id,))
+    db.conn.execute("UPDATE links SET title = 'Tidal pools' WHERE id = ?", (untitled_id,))
+    db.conn.execute("UPDATE books SET subjects = 'Volcanoes' WHERE id = ?", (book_id,))
+    db.conn.commit()
+    rows = index_rows(db)
+    assert rows[("link", link_id)] == ("Basalt weathering", None)
+    assert rows[("link", untitled_id)] == ("Tidal pools", None)
+    assert rows[("book", book_id)] == ("Igneous Petrology Volcanoes", None)
+    assert index.refresh() == 3
+
+    # Deletes and cleared titles drop out
+    db.conn.execute("DELETE FROM links WHERE id = ?", (link_id,))
+    db.conn.execute("UPDATE links SET title = '' WHERE id = ?", (untitled_id,))
+    db.conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
+    db.conn.commit()
+    assert index_rows(db) == {}
+
+
+def test_sample_distinct_items(db):
+    """Test sampling returns distinct items of the requested type."""
+    for i in range(50):
+        add_link(db, f"https://example.com/{i}", f"Link number {i}")
+    add_book(db, "Only book")
+
+    index = TopicIndex(db)
+    sample = index.sample("link", 10)
+    ids = [item["id"] for item in sample]
+    assert 5 <= len(ids) <= 10
+    assert len(set(ids)) == len(ids)
+    assert all(item["type"] == "link" for item in sample)
+    # Untokenized rows still get keywords
+    assert all(item["keywords"] for item in sample)
+
+    assert [item["title"] for item in index.sample("book", 10)] == ["Only book"]
+    assert index.sample("paper", 10) == []
+
+
+def test_dissimilar_items_prefer_new_topics(db):
+    """Test items sharing keywords with recent topics rank last."""
+    add_link(db, "https://example.com/1", "Volcanic soil chemistry")
+    add_link(db, "https://example.com/2", "Medieval bookbinding techniques")
+    add_book(db, "Volcanic soil fertility")
+    TopicIndex(db).refresh()
+
+    items = TopicIndex(db).dissimilar_items(["Volcanic soil formation"], limit=3)
+
+    assert items[0]["title"] == "Medieval bookbinding techniques"
+    assert set(items[0]) == {"type", "id", "title"}
+    assert len(items) == 3